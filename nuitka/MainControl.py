@@ -52,8 +52,8 @@ from nuitka.utils.FileOperations import (
     removeDirectory
 )
 
-from . import ModuleRegistry, Options, TreeXML
-from .build import SconsInterface
+from . import ModuleRegistry, Options, Tracing, TreeXML
+from .build import NativeBuild, SconsInterface
 from .codegen import CodeGeneration, ConstantCodes
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
@@ -226,6 +226,13 @@ def getResultFullpath(main_module):
     return result
 
 
+# Files kept by the native build, their time stamps decide about rebuilds.
+_native_build_extensions = (".c", ".h", ".o", ".os", ".obj", ".bin", ".S", ".cpp")
+
+# Generated files written by this compilation.
+_written_filenames = set()
+
+
 def cleanSourceDirectory(source_dir):
     if os.path.isdir(source_dir):
         for path, _filename in listDir(source_dir):
@@ -233,13 +240,37 @@ def cleanSourceDirectory(source_dir):
                 path       = path,
                 extensions = (".c", ".h", ".o", ".os", ".obj",
                               ".bin", ".res", ".rc", ".S", ".cpp",
-                              ".manifest")
+                              ".manifest", ".gcda")
             ):
+                if Options.isNativeBuild() and \
+                   hasFilenameExtension(path, _native_build_extensions):
+                    continue
+
+                # Scons decides about rebuilds of the PGO object files by their
+                # contents and profile, these are not compiled again otherwise.
+                if Options.isPgoMode() and \
+                   path.endswith((".pgo-generate.o", ".pgo-use.o")):
+                    continue
+
                 deleteFile(path, must_exist = True)
     else:
         makePath(source_dir)
 
 
+def _cleanStaleSourceFiles(source_dir):
+    """ Remove generated files, which this compilation did not write.
+
+    For the native build, the source directory is not cleaned, but e.g. the
+    files of no longer included modules must not be compiled anymore.
+    """
+
+    for path, filename in listDir(source_dir):
+        if filename.startswith(("module.", "__")) and \
+           hasFilenameExtension(path, (".c", ".cpp", ".h", ".bin")) and \
+           path not in _written_filenames:
+            deleteFile(path, must_exist = True)
+
+
 def pickSourceFilenames(source_dir, modules):
     collision_filenames = set()
     seen_filenames = set()
@@ -470,7 +501,7 @@ def makeSourceDirectory(main_module):
     )
 
 
-def runScons(main_module, quiet):
+def runScons(main_module, quiet, pgo_mode = None):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches, pylint: disable=too-many-branches
 
@@ -520,6 +551,9 @@ def runScons(main_module, quiet):
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+
     if Options.shallDisableConsoleWindow():
         options["win_disable_console"] = "true"
 
@@ -587,31 +621,55 @@ def runScons(main_module, quiet):
     if abiflags:
         options["abiflags"] = abiflags
 
+    # The native build does not know about the profile data files of PGO.
+    if Options.isNativeBuild() and pgo_mode is None:
+        native_build_key = NativeBuild.getNativeBuildKey(options)
+
+        result = NativeBuild.runNativeBuild(
+            source_dir = options["source_dir"],
+            key        = native_build_key,
+            quiet      = quiet
+        )
+
+        if result is not None:
+            return result, options
+
+        # Let Scons record the build description for the next time.
+        options["native_build_key"] = native_build_key
+
     return SconsInterface.runScons(options, quiet), options
 
 
-def writeSourceCode(filename, source_code):
+def _writeGeneratedFile(filename, contents, mode):
     # Prevent accidental overwriting. When this happens the collision detection
     # or something else has failed.
-    assert not os.path.isfile(filename), filename
+    assert filename not in _written_filenames, filename
+    _written_filenames.add(filename)
+
+    # For the native build, unchanged files keep their time stamps, so their
+    # object files are up to date.
+    if os.path.isfile(filename):
+        assert Options.isNativeBuild(), filename
+
+        with open(filename, 'r' + mode[1:]) as input_file:
+            if input_file.read() == contents:
+                return
+
+    with open(filename, mode) as output_file:
+        output_file.write(contents)
 
+
+def writeSourceCode(filename, source_code):
     if python_version >= 300:
-        with open(filename, "wb") as output_file:
-            output_file.write(source_code.encode("latin1"))
+        _writeGeneratedFile(filename, source_code.encode("latin1"), "wb")
     else:
-        with open(filename, 'w') as output_file:
-            output_file.write(source_code)
+        _writeGeneratedFile(filename, source_code, 'w')
 
 
 def writeBinaryData(filename, binary_data):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not os.path.isfile(filename), filename
-
     assert type(binary_data) is bytes
 
-    with open(filename, "wb") as output_file:
-        output_file.write(binary_data)
+    _writeGeneratedFile(filename, binary_data, "wb")
 
 
 def callExecPython(args, clean_path, add_path):
@@ -698,6 +756,9 @@ def compileTree(main_module):
             ),
             binary_data = ConstantCodes.stream_data.getBytes()
         )
+
+        if Options.isNativeBuild():
+            _cleanStaleSourceFiles(source_dir)
     else:
         source_dir = getSourceDirectoryPath(main_module)
 
@@ -717,15 +778,85 @@ def compileTree(main_module):
     if Options.shallNotDoExecCCompilerCall():
         return True, {}
 
-    # Run the Scons to build things.
+    # Run the Scons to build things. For PGO, this is the instrumented binary,
+    # which is built again after the training run.
     result, options = runScons(
         main_module = main_module,
-        quiet       = not Options.isShowScons()
+        quiet       = not Options.isShowScons(),
+        pgo_mode    = "generate" if Options.isPgoMode() else None
     )
 
     return result, options
 
 
+def _runPgoTraining(main_module):
+    """ Execute the instrumented binary for a training run.
+
+    The profile data files ".gcda" are written next to the object files
+    when the program exits, and copied for the object files of the build
+    using them. Previous ones are removed, so they cannot mismatch with
+    changed code. In standalone mode, the program runs in the complete dist
+    folder.
+    """
+
+    source_dir = getSourceDirectoryPath(main_module)
+
+    for path, _filename in listDir(source_dir):
+        if hasFilenameExtension(path, (".gcda",)):
+            deleteFile(path, must_exist = True)
+
+    binary_filename = os.path.abspath(getResultFullpath(main_module))
+
+    if Options.getPgoExecutable() is not None:
+        args = [Options.getPgoExecutable(), binary_filename]
+    else:
+        args = [binary_filename]
+
+    args += Options.getPgoArgs()
+
+    if Options.isStandaloneMode():
+        cwd = getStandaloneDirectoryPath(main_module)
+    else:
+        cwd = None
+
+    if Options.isShowProgress():
+        info("PGO: Running training with '%s'." % ' '.join(args))
+
+    Tracing.flushStdout()
+    exit_code = subprocess.call(args, shell = False, cwd = cwd)
+
+    if exit_code != 0:
+        warning(
+            "PGO: Training run exited with code %d, using its profile anyway." % (
+                exit_code
+            )
+        )
+
+    for path, _filename in listDir(source_dir):
+        if path.endswith(".pgo-generate.gcda"):
+            shutil.copy(
+                path,
+                path[:-len(".pgo-generate.gcda")] + ".pgo-use.gcda"
+            )
+
+
+def _compilePgoUse(main_module):
+    """ Build again with profile guided optimization.
+
+    The instrumented binary built by "compileTree" is executed for a training
+    run first, then the same generated C code is compiled using the gathered
+    profile. Object files with unchanged profile are not compiled again.
+    """
+
+    _runPgoTraining(main_module)
+
+    return runScons(
+        main_module = main_module,
+        quiet       = not Options.isShowScons(),
+        pgo_mode    = "use"
+    )
+
+
 def handleSyntaxError(e):
     # Syntax or indentation errors, output them to the user and abort. If
     # we are not in full compat, and user has not specified the Python
@@ -865,6 +996,23 @@ def main():
                     target_filename
                 )
 
+        if Options.isPgoMode():
+            result, options = _compilePgoUse(
+                main_module = main_module
+            )
+
+            if not result:
+                sys.exit(1)
+
+            # On MacOS, the binary in the dist folder has its DLL paths
+            # changed, the rebuilt one needs that too.
+            if Options.isStandaloneMode() and Utils.getOS() == "Darwin":
+                copyUsedDLLs(
+                    source_dir              = getSourceDirectoryPath(main_module),
+                    dist_dir                = getStandaloneDirectoryPath(main_module),
+                    standalone_entry_points = standalone_entry_points
+                )
+
         # Remove the source directory (now build directory too) if asked to.
         if Options.isRemoveBuildDir():
             removeDirectory(
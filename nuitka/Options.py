@@ -19,6 +19,7 @@
 
 import logging
 import os
+import shlex
 import sys
 from optparse import SUPPRESS_HELP, OptionGroup, OptionParser
 
@@ -403,6 +404,20 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is."""
 )
 
+codegen_group.add_option(
+    "--whole-program",
+    action  = "store_true",
+    dest    = "whole_program",
+    default = False,
+    help    = """\
+Assume the compiled modules are the whole program. Module variables that are
+assigned only once, with no writes from other modules, no attribute writes
+to modules, and no dynamic access to module dictionaries anywhere, are then
+known in other modules too, e.g. "from config import DEBUG" can remove code
+guarded by "DEBUG". Do not use this, if uncompiled code changes attributes
+of compiled modules. Defaults to off."""
+)
+
 parser.add_option_group(codegen_group)
 
 outputdir_group = OptionGroup(
@@ -645,6 +660,55 @@ Use link time optimizations if available and usable (g++ 4.6 and higher).
 Defaults to off."""
 )
 
+c_compiler_group.add_option(
+    "--pgo",
+    action  = "store_true",
+    dest    = "pgo",
+    default = False,
+    help    = """\
+Use profile guided optimization of the C compiler (gcc only). An instrumented
+binary is built first and executed for a training run, then the binary is
+rebuilt using the gathered profile. Not for modules. Defaults to off."""
+)
+
+c_compiler_group.add_option(
+    "--pgo-args",
+    action  = "store",
+    dest    = "pgo_args",
+    metavar = "PGO_ARGS",
+    default = "",
+    help    = """\
+Arguments to pass to the program for the training run of "--pgo", e.g. the
+options that make it execute its own tests. Default empty."""
+)
+
+c_compiler_group.add_option(
+    "--pgo-executable",
+    action  = "store",
+    dest    = "pgo_executable",
+    metavar = "PGO_EXECUTABLE",
+    default = None,
+    help    = """\
+Command to execute for the training run of "--pgo" instead of the program
+itself. It gets the path of the instrumented binary as its first argument,
+followed by "--pgo-args". Default is to run the compiled program directly."""
+)
+
+c_compiler_group.add_option(
+    "--native-build",
+    action  = "store_true",
+    dest    = "native_build",
+    default = False,
+    help    = """\
+Use the native build backend. This depends on an earlier Scons run in the
+same build directory: The first build with this option uses Scons, which
+records the commands it executes, and later builds with the same options,
+environment and modules run them directly with timestamp based rebuild
+checks, avoiding the start up time of Scons. Otherwise it falls back to
+Scons, which records again. Not used with "--pgo", and not for Windows.
+Defaults to off."""
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(
@@ -874,6 +938,11 @@ Error, '--recurse-not-to' takes only module names, not directory path '%s'.""" %
                 no_case_module
             )
 
+    if options.pgo and not options.executable:
+        sys.exit("""\
+Error, conflicting options, profile guided optimization needs to run the
+program for training, cannot use "--pgo" for modules.""")
+
     scons_python = getPythonPathForScons()
 
     if scons_python is not None and not os.path.exists(scons_python):
@@ -1064,6 +1133,22 @@ def isLto():
     return options.lto
 
 
+def isPgoMode():
+    return options.pgo
+
+
+def getPgoArgs():
+    return shlex.split(options.pgo_args)
+
+
+def getPgoExecutable():
+    return options.pgo_executable
+
+
+def isNativeBuild():
+    return options.native_build
+
+
 def isClang():
     return options.clang
 
@@ -1084,6 +1169,10 @@ def isFullCompat():
     return not options.improved
 
 
+def isWholeProgramMode():
+    return options.whole_program
+
+
 def isShowProgress():
     return options.show_progress
 
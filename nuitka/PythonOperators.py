@@ -31,7 +31,7 @@ binary_operator_functions = {
     "Sub"       : operator.sub,
     "Pow"       : operator.pow,
     "Mult"      : operator.mul,
-    "FloorDiv"  : operator.div if python_version < 300 else operator.floordiv,
+    "FloorDiv"  : operator.floordiv,
     "TrueDiv"   : operator.truediv,
     "Mod"       : operator.mod,
     "LShift"    : operator.lshift,
@@ -44,7 +44,7 @@ binary_operator_functions = {
     "ISub"      : operator.isub,
     "IPow"      : operator.ipow,
     "IMult"     : operator.imul,
-    "IFloorDiv" : operator.idiv if python_version < 300 else operator.ifloordiv,
+    "IFloorDiv" : operator.ifloordiv,
     "ITrueDiv"  : operator.itruediv,
     "IMod"      : operator.imod,
     "ILShift"   : operator.ilshift,
@@ -69,6 +69,7 @@ unary_operator_functions = {
     "USub"   : operator.neg,
     "Invert" : operator.invert,
     "Repr"   : repr,
+    "Abs"    : abs,
     # Boolean not is treated an unary operator.
     "Not"    : operator.not_,
 }
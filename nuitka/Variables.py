@@ -35,7 +35,7 @@ class Variable(object):
     # state and cache some decisions as attributes, pylint: disable=too-many-instance-attributes
     __slots__ = (
         "variable_name", "owner", "version_number", "shared_users", "shared_scopes",
-        "traces", "users", "writers"
+        "traces", "users", "writers", "shared_by_value"
     )
 
     @InstanceCounters.counted_init
@@ -56,6 +56,7 @@ class Variable(object):
         # Derived from all traces.
         self.users = None
         self.writers = None
+        self.shared_by_value = None
 
     __del__ = InstanceCounters.counted_del()
 
@@ -141,6 +142,61 @@ class Variable(object):
 
         return False
 
+    def isSharedByValue(self):
+        """ Is this a shared variable, that closures only see one value of.
+
+        That is the case, if only its owner assigns it, and only once, and
+        all closures are created after that. Then closures can take the
+        value itself, and no cell object is needed.
+        """
+
+        if not complete:
+            return None
+
+        if self.shared_by_value is None:
+            self.shared_by_value = self._isSharedByValue()
+
+        return self.shared_by_value
+
+    def _isSharedByValue(self):
+        if not self.isLocalVariable() or not self.isSharedTechnically():
+            return False
+
+        owner = self.owner.getEntryPoint()
+
+        value_trace = None
+
+        for trace in self.traces:
+            if trace.isAssignTrace() or trace.isInitTrace():
+                if value_trace is not None or \
+                   trace.owner.getEntryPoint() is not owner:
+                    return False
+
+                value_trace = trace
+            # Deleting it, by the owner or via "nonlocal".
+            elif trace.isUninitTrace() and trace.getPrevious() is not None:
+                return False
+
+        if value_trace is None:
+            return False
+
+        for trace in self.traces:
+            if trace is value_trace or \
+               trace.owner.getEntryPoint() is not owner:
+                continue
+
+            # Before the assignment, no closure may be created.
+            if trace.isUninitTrace():
+                if trace.hasClosureUsages():
+                    return False
+            # Other traces, e.g. from merges or loops, must not have been
+            # able to see it unassigned, which also excludes assignments
+            # in loops.
+            elif _getValueSourceTraces(trace, set()) != set([value_trace]):
+                return False
+
+        return True
+
     def addTrace(self, variable_trace):
         self.traces.add(variable_trace)
 
@@ -163,6 +219,7 @@ class Variable(object):
 
         self.writers = writers
         self.users = users
+        self.shared_by_value = None
 
     def hasWritesOutsideOf(self, user):
         if not complete:
@@ -195,6 +252,24 @@ class Variable(object):
 
         return None
 
+    def getAssignSources(self):
+        """ Values assigned to the variable, None if used otherwise. """
+
+        result = []
+
+        for trace in self.traces:
+            if trace.isAssignTrace():
+                result.append(trace.getAssignNode().getAssignSource())
+            elif trace.isUninitTrace():
+                if trace.hasDefiniteUsages() or trace.hasPotentialUsages():
+                    return None
+            elif trace.isMergeTrace():
+                pass
+            else:
+                return None
+
+        return result
+
     def getTypeShapes(self):
         result = set()
 
@@ -218,6 +293,36 @@ class Variable(object):
         return result
 
 
+def _getValueSourceTraces(trace, visited):
+    """ Assignment and initial traces, that provide the value of a trace. """
+
+    if trace in visited:
+        return set()
+
+    visited.add(trace)
+
+    if trace.isAssignTrace() or trace.isInitTrace() or trace.isUninitTrace():
+        return set([trace])
+
+    # Loop merges are not marked as finished, but their previous traces
+    # are complete after optimization.
+    previous = trace.previous
+
+    # Unknown traces of closure takers have no previous.
+    if previous is None:
+        return set([trace])
+
+    if type(previous) is not tuple:
+        previous = (previous,)
+
+    result = set()
+
+    for previous_trace in previous:
+        result.update(_getValueSourceTraces(previous_trace, visited))
+
+    return result
+
+
 class LocalVariable(Variable):
     __slots__ = ()
 
@@ -288,7 +393,7 @@ class ModuleVariable(Variable):
 
 
 class TempVariable(Variable):
-    __slots__ = ()
+    __slots__ = ("frame_visible",)
 
     def __init__(self, owner, variable_name):
         Variable.__init__(
@@ -297,6 +402,10 @@ class TempVariable(Variable):
             variable_name = variable_name
         )
 
+        # Replacing a local variable of an in-lined function, its value is
+        # then attached to the frame.
+        self.frame_visible = False
+
     def __repr__(self):
         return "<TempVariable '%s' of '%s'>" % (
             self.getName(),
@@ -309,6 +418,12 @@ class TempVariable(Variable):
     def isTempVariable(self):
         return True
 
+    def markAsFrameVisible(self):
+        self.frame_visible = True
+
+    def isFrameVisible(self):
+        return self.frame_visible
+
 
 def updateVariablesFromCollection(old_collection, new_collection):
     # After removing/adding traces, we need to pre-compute the users state
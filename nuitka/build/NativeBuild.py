@@ -0,0 +1,261 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Native build backend.
+
+Scons decides about the compiler, its options and the commands to run, which
+takes seconds of dependency scanning and environment probing. When asked for,
+it records these commands in a build description. Later builds with the same
+options execute them directly, with a simple job scheduler and timestamp based
+rebuild checks, so compilation starts almost immediately.
+
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from logging import info
+
+from nuitka import Options, Tracing
+from nuitka.Version import getNuitkaVersion
+
+from .SconsInterface import getSconsDataPath
+
+# Environment variables that influence the commands Scons creates.
+_relevant_environment_variables = (
+    "CC",
+    "CXX",
+    "CPPFLAGS",
+    "CCFLAGS",
+    "CXXFLAGS",
+    "LDFLAGS",
+    "PATH",
+)
+
+
+def getNativeBuildKey(options):
+    """ Key for the build description, changes with anything Scons uses. """
+
+    key = hashlib.md5()
+
+    key.update(getNuitkaVersion().encode("utf8"))
+
+    for key_name, value in sorted(options.items()):
+        key.update(("%s=%s\n" % (key_name, value)).encode("utf8"))
+
+    for variable_name in _relevant_environment_variables:
+        key.update(
+            ("%s=%s\n" % (variable_name, os.environ.get(variable_name))).encode("utf8")
+        )
+
+    key.update(
+        str(os.path.getmtime(os.path.join(getSconsDataPath(), "SingleExe.scons"))).encode("utf8")
+    )
+
+    return key.hexdigest()
+
+
+def _getGeneratedSourceFiles(source_dir):
+    # Must match the source discovery of the Scons file.
+    return sorted(
+        filename
+        for filename in
+        os.listdir(source_dir)
+        if filename.endswith((".c", ".cpp"))
+        if filename.startswith(("module.", "__"))
+    )
+
+
+def _loadBuildDescription(source_dir, key):
+    description_filename = os.path.join(source_dir, "native-build.json")
+
+    if not os.path.isfile(description_filename):
+        return None
+
+    try:
+        with open(description_filename) as description_file:
+            description = json.load(description_file)
+    except ValueError:
+        return None
+
+    if description["key"] != key:
+        return None
+
+    # Different modules are not covered by the commands.
+    if description["generated"] != _getGeneratedSourceFiles(source_dir):
+        return None
+
+    return description
+
+
+def _provideStaticFiles(description):
+    for source_file, target_file in description["static_files"]:
+        if os.path.islink(target_file):
+            if os.readlink(target_file) == source_file:
+                continue
+
+            os.unlink(target_file)
+        elif os.path.exists(target_file):
+            continue
+
+        try:
+            os.symlink(source_file, target_file)
+        except OSError:
+            shutil.copy(source_file, target_file)
+
+    # Only write changed files, their time stamps decide about rebuilds.
+    for filename, contents in description["files"].items():
+        if os.path.isfile(filename):
+            with open(filename) as input_file:
+                if input_file.read() == contents:
+                    continue
+
+        with open(filename, 'w') as output_file:
+            output_file.write(contents)
+
+
+def _getNewestIncludeTime(source_dir):
+    result = 0
+
+    include_dirs = (
+        source_dir,
+        os.path.join(getSconsDataPath(), "include"),
+    )
+
+    for include_dir in include_dirs:
+        for dirpath, _dirnames, filenames in os.walk(include_dir):
+            for filename in filenames:
+                if filename.endswith(".h"):
+                    result = max(
+                        result,
+                        os.path.getmtime(os.path.join(dirpath, filename))
+                    )
+
+    return result
+
+
+def _isUpToDate(target, sources, newest_include_time):
+    if not os.path.exists(target):
+        return False
+
+    target_time = os.path.getmtime(target)
+
+    if target_time < newest_include_time:
+        return False
+
+    for source in sources:
+        if os.path.getmtime(source) > target_time:
+            return False
+
+    return True
+
+
+def _runJobs(commands, job_limit, env, quiet):
+    """ Execute shell commands, with at most job_limit running at once.
+
+    The commands are started in the order given, which is the longest job
+    first order from the Scons file. Returns success of all commands, after
+    a failure no more commands are started.
+    """
+
+    pending = list(reversed(commands))
+    running = []
+    success = True
+
+    while running or (pending and success):
+        while pending and success and len(running) < job_limit:
+            command = pending.pop()
+
+            if not quiet:
+                Tracing.printLine(command)
+
+            running.append(
+                subprocess.Popen(command, shell = True, env = env)
+            )
+
+        for process in running:
+            if process.poll() is not None:
+                running.remove(process)
+
+                if process.returncode != 0:
+                    success = False
+
+                break
+        else:
+            time.sleep(0.005)
+
+    return success
+
+
+def runNativeBuild(source_dir, key, quiet):
+    """ Build using a build description recorded by a previous Scons run.
+
+    Returns None if no usable description exists, and Scons has to be used,
+    otherwise the success of the build.
+    """
+
+    description = _loadBuildDescription(source_dir, key)
+
+    if description is None:
+        return None
+
+    if Options.isShowProgress():
+        info("Native build: Using recorded build description.")
+
+    old_cwd = os.getcwd()
+    os.chdir(description["cwd"])
+
+    try:
+        _provideStaticFiles(description)
+
+        newest_include_time = _getNewestIncludeTime(source_dir)
+
+        compile_commands = [
+            compile_step["command"]
+            for compile_step in
+            description["compile"]
+            if not _isUpToDate(
+                target              = compile_step["target"],
+                sources             = [compile_step["source"]],
+                newest_include_time = newest_include_time
+            )
+        ]
+
+        env = dict(os.environ)
+        env["PATH"] = description["path"]
+
+        Tracing.flushStdout()
+
+        if not _runJobs(compile_commands, Options.getJobLimit(), env, quiet):
+            return False
+
+        link_step = description["link"]
+
+        if compile_commands or not _isUpToDate(
+                target              = link_step["target"],
+                sources             = link_step["sources"],
+                newest_include_time = 0
+            ):
+            if not _runJobs([link_step["command"]], 1, env, quiet):
+                return False
+
+        return True
+    finally:
+        os.chdir(old_cwd)
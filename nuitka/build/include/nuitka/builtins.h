@@ -46,6 +46,52 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN( PyObject *name )
     return result;
 }
 
+#if PYTHON_VERSION >= 360
+/* Cache of a module variable lookup site. The value is borrowed, it is valid
+ * as long as neither the module nor the built-in dictionary changed, which
+ * their version tags tell, and no value was written to a dictionary entry
+ * directly.
+ */
+struct Nuitka_ModuleVariableCache
+{
+    uint64_t module_version;
+    uint64_t builtins_version;
+    uint64_t entry_writes;
+
+    PyObject *value;
+};
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED( PyDictObject *module_dict, Nuitka_StringObject *var_name, struct Nuitka_ModuleVariableCache *cache )
+{
+    if ( likely( cache->value != NULL ) &&
+         cache->module_version == module_dict->ma_version_tag &&
+         cache->builtins_version == dict_builtin->ma_version_tag &&
+         cache->entry_writes == dict_entry_writes )
+    {
+        CHECK_OBJECT( cache->value );
+        return cache->value;
+    }
+
+    PyObject *result = GET_STRING_DICT_VALUE( module_dict, var_name );
+
+    if ( result == NULL )
+    {
+        result = GET_STRING_DICT_VALUE( dict_builtin, var_name );
+    }
+
+    // Only values are cached, for errors speed does not matter.
+    if ( result != NULL )
+    {
+        cache->module_version = module_dict->ma_version_tag;
+        cache->builtins_version = dict_builtin->ma_version_tag;
+        cache->entry_writes = dict_entry_writes;
+        cache->value = result;
+    }
+
+    return result;
+}
+#endif
+
 extern void _initBuiltinModule();
 
 #define NUITKA_DECLARE_BUILTIN( name ) extern PyObject *_python_original_builtin_value_##name;
@@ -79,6 +79,15 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION( PyObject *function_object,
 // Function call variant with no arguments provided at all.
 extern PyObject *CALL_FUNCTION_NO_ARGS( PyObject *called );
 
+// Function call variant with positional argument values followed by keyword
+// argument values, the names of which are given as a tuple.
+extern PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES( PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names );
+
+// Same, but with the keyword argument dictionary, and if not NULL the positional
+// argument tuple, given for use with other callables than compiled ones. These
+// are for constant arguments, where these need not be created.
+extern PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES_KWDICT( PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names, PyObject *pos_args, PyObject *named_args );
+
 // Function call variants with positional arguments tuple.
 NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *function_object, PyObject *positional_args )
 {
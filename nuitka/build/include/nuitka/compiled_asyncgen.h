@@ -34,27 +34,26 @@ struct Nuitka_AsyncgenObject {
     PyObject *m_name;
 
     PyObject *m_qualname;
-    PyObject *m_yieldfrom;
 
-    Fiber m_yielder_context;
-    Fiber m_caller_context;
+    // The value currently awaited.
+    PyObject *m_yieldfrom;
 
     // Weak references are supported for async generator objects in CPython.
     PyObject *m_weakrefs;
 
     int m_running;
-    int m_awaiting;
 
     void *m_code;
 
-    PyObject *m_yielded;
-
     PyObject *m_exception_type, *m_exception_value;
     PyTracebackObject *m_exception_tb;
 
     struct Nuitka_FrameObject *m_frame;
     PyCodeObject *m_code_object;
 
+    // Nested frame, e.g. of a contraction, that an "await" was done in.
+    PyFrameObject *m_resume_frame;
+
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
@@ -67,6 +66,13 @@ struct Nuitka_AsyncgenObject {
     // It is closed.
     bool m_closed;
 
+    // The label index to resume after yield or await.
+    int m_yield_return_index;
+
+    // The storage of local variables that must survive yields and awaits. It
+    // is allocated together with the object, after the closure.
+    void *m_heap_storage;
+
     // Closure variables given, if any, we reference cells here.
     Py_ssize_t m_closure_given;
     struct Nuitka_CellObject *m_closure[1];
@@ -74,76 +80,43 @@ struct Nuitka_AsyncgenObject {
 
 extern PyTypeObject Nuitka_Asyncgen_Type;
 
-typedef void (*asyncgen_code)( struct Nuitka_AsyncgenObject * );
+// The async generator code is called with the value sent in, and returns the
+// wrapped value yielded, or NULL when finished or for an "await", see
+// "m_yieldfrom".
+typedef PyObject *(*asyncgen_code)( struct Nuitka_AsyncgenObject *, PyObject * );
 
-extern PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size );
 
 static inline bool Nuitka_Asyncgen_Check( PyObject *object )
 {
     return Py_TYPE( object ) == &Nuitka_Asyncgen_Type;
 }
 
-extern PyObject *ASYNCGEN_AWAIT( struct Nuitka_AsyncgenObject *asyngen, PyObject *awaitable );
-extern PyObject *ASYNCGEN_AWAIT_IN_HANDLER( struct Nuitka_AsyncgenObject *asyngen, PyObject *awaitable );
+// Start an "await" of the async generator. The async generator code returns
+// to its caller after this, and the iteration of the awaitable is done there,
+// until the async generator code is resumed with the final value.
+extern bool ASYNCGEN_AWAIT_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *awaitable );
 
-extern PyObject *ASYNCGEN_ASYNC_MAKE_ITERATOR( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value );
-extern PyObject *ASYNCGEN_ASYNC_ITERATOR_NEXT( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value );
+// The same for the awaits of "async for" to get the iterator and its values.
+extern bool ASYNCGEN_ASYNC_MAKE_ITERATOR_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value );
+extern bool ASYNCGEN_ASYNC_ITERATOR_NEXT_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value );
 
+// Wrap a value yielded by the async generator, taking over the reference.
 extern PyObject *Nuitka_AsyncGenValueWrapperNew( PyObject *value );
 
-static inline PyObject *ASYNCGEN_YIELD( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
-{
-    CHECK_OBJECT( value );
-
-    asyncgen->m_yielded = Nuitka_AsyncGenValueWrapperNew( value );
-    Py_DECREF( value );
-
-    Nuitka_Frame_MarkAsNotExecuting( asyncgen->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &asyncgen->m_yielder_context, &asyncgen->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( asyncgen->m_frame );
-
-    // Check for thrown exception.
-    if (unlikely( asyncgen->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            asyncgen->m_exception_type,
-            asyncgen->m_exception_value,
-            asyncgen->m_exception_tb
-        );
-
-        asyncgen->m_exception_type = NULL;
-        asyncgen->m_exception_value = NULL;
-        asyncgen->m_exception_tb = NULL;
-
-        return NULL;
-    }
-
-    CHECK_OBJECT( asyncgen->m_yielded );
-    return asyncgen->m_yielded;
-}
-
-static inline PyObject *ASYNCGEN_YIELD_IN_HANDLER( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
+// When yielding or awaiting from an exception handler, the exception preserved
+// to the frame is restored, while the current one is put there.
+static inline void SAVE_ASYNCGEN_EXCEPTION( struct Nuitka_AsyncgenObject *asyncgen )
 {
-    CHECK_OBJECT( value );
-
-    asyncgen->m_yielded = Nuitka_AsyncGenValueWrapperNew( value );
-    Py_DECREF( value );
-
-    /* When yielding from an exception handler in Python3, the exception
-     * preserved to the frame is restore, while the current one is put there.
-     */
     PyThreadState *thread_state = PyThreadState_GET();
 
-    PyObject *saved_exception_type = thread_state->exc_type;
-    PyObject *saved_exception_value = thread_state->exc_value;
-    PyObject *saved_exception_traceback = thread_state->exc_traceback;
+    PyObject *saved_exception_type = EXC_TYPE(thread_state);
+    PyObject *saved_exception_value = EXC_VALUE(thread_state);
+    PyObject *saved_exception_traceback = EXC_TRACEBACK(thread_state);
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    EXC_TYPE(thread_state) = thread_state->frame->f_exc_type;
+    EXC_VALUE(thread_state) = thread_state->frame->f_exc_value;
+    EXC_TRACEBACK(thread_state) = thread_state->frame->f_exc_traceback;
 
 #if _DEBUG_EXCEPTIONS
     PRINT_STRING("YIELD exit:\n");
@@ -153,59 +126,30 @@ static inline PyObject *ASYNCGEN_YIELD_IN_HANDLER( struct Nuitka_AsyncgenObject
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
 
-#if _DEBUG_ASYNCGEN
-    PRINT_STRING("ASYNCGEN_YIELD_FROM_HANDLER:");
-    PRINT_NEW_LINE();
-#endif
-
-    Nuitka_Frame_MarkAsNotExecuting( asyncgen->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &asyncgen->m_yielder_context, &asyncgen->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( asyncgen->m_frame );
-
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
+// When returning from yield or await, the exception of the frame is
+// preserved, and the one that enters should be there.
+static inline void RESTORE_ASYNCGEN_EXCEPTION( struct Nuitka_AsyncgenObject *asyncgen )
+{
+    PyThreadState *thread_state = PyThreadState_GET();
 
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
+    PyObject *saved_exception_type = EXC_TYPE(thread_state);
+    PyObject *saved_exception_value = EXC_VALUE(thread_state);
+    PyObject *saved_exception_traceback = EXC_TRACEBACK(thread_state);
 
 #if _DEBUG_EXCEPTIONS
     PRINT_STRING("YIELD return:\n");
     PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
 #endif
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    EXC_TYPE(thread_state) = thread_state->frame->f_exc_type;
+    EXC_VALUE(thread_state) = thread_state->frame->f_exc_value;
+    EXC_TRACEBACK(thread_state) = thread_state->frame->f_exc_traceback;
 
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-    // Check for thrown exception.
-    if (unlikely( asyncgen->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            asyncgen->m_exception_type,
-            asyncgen->m_exception_value,
-            asyncgen->m_exception_tb
-        );
-
-        asyncgen->m_exception_type = NULL;
-        asyncgen->m_exception_value = NULL;
-        asyncgen->m_exception_tb = NULL;
-
-        return NULL;
-    }
-
-    assert( asyncgen->m_yielded != NULL );
-
-    return asyncgen->m_yielded;
 }
 
 #endif
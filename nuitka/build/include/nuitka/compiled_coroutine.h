@@ -34,20 +34,18 @@ struct Nuitka_CoroutineObject {
     PyObject *m_name;
 
     PyObject *m_qualname;
-    PyObject *m_yieldfrom;
 
-    Fiber m_yielder_context;
-    Fiber m_caller_context;
+    // The value currently awaited.
+    PyObject *m_yieldfrom;
 
     // Weak references are supported for coroutine objects in CPython.
     PyObject *m_weakrefs;
 
     int m_running;
-    int m_awaiting;
 
     void *m_code;
 
-    PyObject *m_yielded;
+    // The value returned, becomes the value of "StopIteration".
     PyObject *m_returned;
 
     PyObject *m_exception_type, *m_exception_value;
@@ -56,9 +54,19 @@ struct Nuitka_CoroutineObject {
     struct Nuitka_FrameObject *m_frame;
     PyCodeObject *m_code_object;
 
+    // Nested frame, e.g. of a contraction, that an "await" was done in.
+    PyFrameObject *m_resume_frame;
+
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
+    // The label index to resume after await.
+    int m_yield_return_index;
+
+    // The storage of local variables that must survive awaits. It is
+    // allocated together with the object, after the closure.
+    void *m_heap_storage;
+
     // Closure variables given, if any, we reference cells here.
     Py_ssize_t m_closure_given;
     struct Nuitka_CellObject *m_closure[1];
@@ -66,9 +74,11 @@ struct Nuitka_CoroutineObject {
 
 extern PyTypeObject Nuitka_Coroutine_Type;
 
-typedef void (*coroutine_code)( struct Nuitka_CoroutineObject * );
+// The coroutine code is called with the value sent in, and returns NULL when
+// finished or for an "await", see "m_yieldfrom".
+typedef PyObject *(*coroutine_code)( struct Nuitka_CoroutineObject *, PyObject * );
 
-extern PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size );
 
 static inline bool Nuitka_Coroutine_Check( PyObject *object )
 {
@@ -82,118 +92,61 @@ struct Nuitka_CoroutineWrapperObject {
 
 extern PyTypeObject Nuitka_CoroutineWrapper_Type;
 
-extern PyObject *COROUTINE_AWAIT( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable );
-extern PyObject *COROUTINE_AWAIT_IN_HANDLER( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable );
-
-extern PyObject *COROUTINE_ASYNC_MAKE_ITERATOR( struct Nuitka_CoroutineObject *coroutine, PyObject *value );
-extern PyObject *COROUTINE_ASYNC_ITERATOR_NEXT( struct Nuitka_CoroutineObject *coroutine, PyObject *value );
-
-static inline PyObject *COROUTINE_YIELD( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
-{
-    CHECK_OBJECT( value );
-
-    coroutine->m_yielded = value;
-
-    Nuitka_Frame_MarkAsNotExecuting( coroutine->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &coroutine->m_yielder_context, &coroutine->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( coroutine->m_frame );
-
-    // Check for thrown exception.
-    if (unlikely( coroutine->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            coroutine->m_exception_type,
-            coroutine->m_exception_value,
-            coroutine->m_exception_tb
-        );
-
-        coroutine->m_exception_type = NULL;
-        coroutine->m_exception_value = NULL;
-        coroutine->m_exception_tb = NULL;
+// Start an "await" of the coroutine. The coroutine code returns to its caller
+// after this, and the iteration of the awaitable is done there, until the
+// coroutine code is resumed with the final value.
+extern bool COROUTINE_AWAIT_START( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable );
 
-        return NULL;
-    }
+// The same for the awaits of "async for" to get the iterator and its values.
+extern bool COROUTINE_ASYNC_MAKE_ITERATOR_START( struct Nuitka_CoroutineObject *coroutine, PyObject *value );
+extern bool COROUTINE_ASYNC_ITERATOR_NEXT_START( struct Nuitka_CoroutineObject *coroutine, PyObject *value );
 
-    CHECK_OBJECT( coroutine->m_yielded );
-    return coroutine->m_yielded;
-}
-
-static inline PyObject *COROUTINE_YIELD_IN_HANDLER( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
+// When awaiting from an exception handler, the exception preserved to the
+// frame is restored, while the current one is put there.
+static inline void SAVE_COROUTINE_EXCEPTION( struct Nuitka_CoroutineObject *coroutine )
 {
-    CHECK_OBJECT( value );
-
-    coroutine->m_yielded = value;
-
-    /* When yielding from an exception handler in Python3, the exception
-     * preserved to the frame is restore, while the current one is put there.
-     */
     PyThreadState *thread_state = PyThreadState_GET();
 
-    PyObject *saved_exception_type = thread_state->exc_type;
-    PyObject *saved_exception_value = thread_state->exc_value;
-    PyObject *saved_exception_traceback = thread_state->exc_traceback;
+    PyObject *saved_exception_type = EXC_TYPE(thread_state);
+    PyObject *saved_exception_value = EXC_VALUE(thread_state);
+    PyObject *saved_exception_traceback = EXC_TRACEBACK(thread_state);
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    EXC_TYPE(thread_state) = thread_state->frame->f_exc_type;
+    EXC_VALUE(thread_state) = thread_state->frame->f_exc_value;
+    EXC_TRACEBACK(thread_state) = thread_state->frame->f_exc_traceback;
 
 #if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD exit:\n");
+    PRINT_STRING("AWAIT exit:\n");
     PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
 #endif
 
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
 
-    Nuitka_Frame_MarkAsNotExecuting( coroutine->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &coroutine->m_yielder_context, &coroutine->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( coroutine->m_frame );
-
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
+// When returning from await, the exception of the frame is preserved, and
+// the one that enters should be there.
+static inline void RESTORE_COROUTINE_EXCEPTION( struct Nuitka_CoroutineObject *coroutine )
+{
+    PyThreadState *thread_state = PyThreadState_GET();
 
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
+    PyObject *saved_exception_type = EXC_TYPE(thread_state);
+    PyObject *saved_exception_value = EXC_VALUE(thread_state);
+    PyObject *saved_exception_traceback = EXC_TRACEBACK(thread_state);
 
 #if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD return:\n");
+    PRINT_STRING("AWAIT return:\n");
     PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
 #endif
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    EXC_TYPE(thread_state) = thread_state->frame->f_exc_type;
+    EXC_VALUE(thread_state) = thread_state->frame->f_exc_value;
+    EXC_TRACEBACK(thread_state) = thread_state->frame->f_exc_traceback;
 
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-    // Check for thrown exception.
-    if (unlikely( coroutine->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            coroutine->m_exception_type,
-            coroutine->m_exception_value,
-            coroutine->m_exception_tb
-        );
-
-        coroutine->m_exception_type = NULL;
-        coroutine->m_exception_value = NULL;
-        coroutine->m_exception_tb = NULL;
-
-        return NULL;
-    }
-
-    return coroutine->m_yielded;
 }
 
 #if PYTHON_VERSION >= 360
@@ -77,6 +77,9 @@ struct Nuitka_FunctionObject {
     // A kind of uuid for the function object, used in comparisons.
     long m_counter;
 
+    // Which closure taken objects are values, not cells, or NULL for none.
+    bool const *m_closure_values;
+
     // Closure taken objects, for use in __closure__ and for accessing it.
     Py_ssize_t m_closure_given;
     struct Nuitka_CellObject *m_closure[1];
@@ -109,6 +112,10 @@ extern bool parseArgumentsMethodPos( struct Nuitka_FunctionObject const *functio
 
 extern PyObject *Nuitka_CallFunctionPosArgsKwArgs( struct Nuitka_FunctionObject const *function, PyObject **args, Py_ssize_t args_size, PyObject *kw );
 
+// Call with positional argument values followed by keyword argument values,
+// whose names are given as a tuple of strings.
+extern PyObject *Nuitka_CallFunctionVectorcall( struct Nuitka_FunctionObject const *function, PyObject **args, Py_ssize_t args_size, PyObject *kw_names );
+
 // These are fast calls of known compiled methods, without an actual object
 // of that kind. The object is that first argument, "self" or whatever, to
 // which the function would be bound.
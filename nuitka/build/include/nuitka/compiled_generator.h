@@ -27,8 +27,6 @@
 // Another cornerstone of the integration into CPython. Try to behave as well as
 // normal generator objects do or even better.
 
-#include "fibers.h"
-
 // Status of the generator object.
 #ifdef __cplusplus
 enum Generator_Status {
@@ -54,6 +52,9 @@ struct Nuitka_GeneratorObject {
 
 #if PYTHON_VERSION >= 350
     PyObject *m_qualname;
+#endif
+#if PYTHON_VERSION >= 330
+    // The value currently yielded from.
     PyObject *m_yieldfrom;
 #endif
 
@@ -73,15 +74,12 @@ struct Nuitka_GeneratorObject {
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+    // The label index to resume after yield.
     int m_yield_return_index;
-#else
-    Fiber m_yielder_context;
-    Fiber m_caller_context;
 
-    // The yielded value, NULL is case of exception.
-    PyObject *m_yielded;
-#endif
+    // The storage of local variables that must survive yields. It is
+    // allocated together with the object, after the closure.
+    void *m_heap_storage;
 
     /* Closure variables given, if any, we reference cells here. The last
      * part is dynamically allocated, the array size differs per generator.
@@ -92,16 +90,14 @@ struct Nuitka_GeneratorObject {
 
 extern PyTypeObject Nuitka_Generator_Type;
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+// The generator code is called with the value sent in, and returns the value
+// yielded, or NULL when finished or for "yield from", see "m_yieldfrom".
 typedef PyObject *(*generator_code)( struct Nuitka_GeneratorObject *, PyObject * );
-#else
-typedef void (*generator_code)( struct Nuitka_GeneratorObject * );
-#endif
 
 #if PYTHON_VERSION < 350
-extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyCodeObject *code_object, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size );
 #else
-extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size );
 #endif
 
 extern PyObject *Nuitka_Generator_qiter( struct Nuitka_GeneratorObject *generator, bool *finished );
@@ -116,51 +112,11 @@ static inline PyObject *Nuitka_Generator_GetName( PyObject *object )
     return ((struct Nuitka_GeneratorObject *)object)->m_name;
 }
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-
-static inline PyObject *GENERATOR_YIELD( struct Nuitka_GeneratorObject *generator, PyObject *value )
-{
-    CHECK_OBJECT( value );
-
-    generator->m_yielded = value;
-
-    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
-
-    // Check for thrown exception.
-    if (unlikely( generator->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            generator->m_exception_type,
-            generator->m_exception_value,
-            generator->m_exception_tb
-        );
-
-        generator->m_exception_type = NULL;
-        generator->m_exception_value = NULL;
-        generator->m_exception_tb = NULL;
-
-        return NULL;
-    }
-
-    CHECK_OBJECT( generator->m_yielded );
-    return generator->m_yielded;
-}
-
 #if PYTHON_VERSION >= 300
-static inline PyObject *GENERATOR_YIELD_IN_HANDLER( struct Nuitka_GeneratorObject *generator, PyObject *value )
+// When yielding from an exception handler in Python3, the exception preserved
+// to the frame is restored, while the current one is put there.
+static inline void SAVE_GENERATOR_EXCEPTION( struct Nuitka_GeneratorObject *generator )
 {
-    CHECK_OBJECT( value );
-
-    generator->m_yielded = value;
-
-    /* When yielding from an exception handler in Python3, the exception
-     * preserved to the frame is restore, while the current one is put there.
-     */
     PyThreadState *thread_state = PyThreadState_GET();
 
     PyObject *saved_exception_type = EXC_TYPE(thread_state);
@@ -179,60 +135,38 @@ static inline PyObject *GENERATOR_YIELD_IN_HANDLER( struct Nuitka_GeneratorObjec
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
 
-    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
-
-    // Return to the calling context.
-    swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
-
-    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
-
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
+// When returning from yield, the exception of the frame is preserved, and
+// the one that enters should be there.
+static inline void RESTORE_GENERATOR_EXCEPTION( struct Nuitka_GeneratorObject *generator )
+{
+    PyThreadState *thread_state = PyThreadState_GET();
 
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
+    PyObject *saved_exception_type = EXC_TYPE(thread_state);
+    PyObject *saved_exception_value = EXC_VALUE(thread_state);
+    PyObject *saved_exception_traceback = EXC_TRACEBACK(thread_state);
 
 #if _DEBUG_EXCEPTIONS
     PRINT_STRING("YIELD return:\n");
     PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
 #endif
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
+    EXC_TYPE(thread_state) = thread_state->frame->f_exc_type;
+    EXC_VALUE(thread_state) = thread_state->frame->f_exc_value;
+    EXC_TRACEBACK(thread_state) = thread_state->frame->f_exc_traceback;
 
     thread_state->frame->f_exc_type = saved_exception_type;
     thread_state->frame->f_exc_value = saved_exception_value;
     thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-    // Check for thrown exception.
-    if (unlikely( generator->m_exception_type ))
-    {
-        RESTORE_ERROR_OCCURRED(
-            generator->m_exception_type,
-            generator->m_exception_value,
-            generator->m_exception_tb
-        );
-
-        generator->m_exception_type = NULL;
-        generator->m_exception_value = NULL;
-        generator->m_exception_tb = NULL;
-
-        return NULL;
-    }
-
-    return generator->m_yielded;
 }
 #endif
 
 #if PYTHON_VERSION >= 330
-extern PyObject *GENERATOR_YIELD_FROM( struct Nuitka_GeneratorObject *generator, PyObject *target );
-extern PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *generator, PyObject *target );
-#endif
-
+// Start a "yield from" of the generator. The generator code returns to its
+// caller after this, and the iteration of the value is done there, until
+// the generator code is resumed with the final value.
+extern bool GENERATOR_YIELD_FROM_START( struct Nuitka_GeneratorObject *generator, PyObject *target );
 #endif
 
 #endif
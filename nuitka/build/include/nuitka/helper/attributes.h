@@ -129,128 +129,136 @@ static PyObject *LOOKUP_INSTANCE( PyObject *source, PyObject *attr_name )
 }
 #endif
 
-NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE( PyObject *source, PyObject *attr_name )
+// Generic attribute lookup for a descriptor found on the type, "descr" is a
+// borrowed reference or NULL if the type has no such attribute.
+NUITKA_MAY_BE_UNUSED static PyObject *_LOOKUP_ATTRIBUTE_GENERIC( PyObject *source, PyTypeObject *type, PyObject *attr_name, PyObject *descr )
 {
-    /* Note: There are 2 specializations of this function, that need to be
-     * updated in line with this: LOOKUP_ATTRIBUTE_[DICT|CLASS]_SLOT
-     */
-
-    CHECK_OBJECT( source );
-    CHECK_OBJECT( attr_name );
-
-    PyTypeObject *type = Py_TYPE( source );
+    descrgetfunc func = NULL;
 
-    if ( type->tp_getattro == PyObject_GenericGetAttr )
+    if ( descr != NULL )
     {
-        // Unfortunately this is required, although of cause rarely necessary.
-        if (unlikely( type->tp_dict == NULL ))
-        {
-            if (unlikely( PyType_Ready( type ) < 0 ))
-            {
-                return NULL;
-            }
-        }
-
-        PyObject *descr = _PyType_Lookup( type, attr_name );
-        descrgetfunc func = NULL;
-
-        if ( descr != NULL )
-        {
-            Py_INCREF( descr );
+        Py_INCREF( descr );
 
 #if PYTHON_VERSION < 300
-            if ( PyType_HasFeature( Py_TYPE( descr ), Py_TPFLAGS_HAVE_CLASS ) )
-            {
+        if ( PyType_HasFeature( Py_TYPE( descr ), Py_TPFLAGS_HAVE_CLASS ) )
+        {
 #endif
-                func = Py_TYPE( descr )->tp_descr_get;
+            func = Py_TYPE( descr )->tp_descr_get;
 
-                if ( func != NULL && PyDescr_IsData( descr ) )
-                {
-                    PyObject *result = func( descr, source, (PyObject *)type );
-                    Py_DECREF( descr );
+            if ( func != NULL && PyDescr_IsData( descr ) )
+            {
+                PyObject *result = func( descr, source, (PyObject *)type );
+                Py_DECREF( descr );
 
-                    return result;
-                }
-#if PYTHON_VERSION < 300
+                return result;
             }
-#endif
+#if PYTHON_VERSION < 300
         }
+#endif
+    }
 
-        Py_ssize_t dictoffset = type->tp_dictoffset;
-        PyObject *dict = NULL;
+    Py_ssize_t dictoffset = type->tp_dictoffset;
+    PyObject *dict = NULL;
 
-        if ( dictoffset != 0 )
+    if ( dictoffset != 0 )
+    {
+        // Negative dictionary offsets have special meaning.
+        if ( dictoffset < 0 )
         {
-            // Negative dictionary offsets have special meaning.
-            if ( dictoffset < 0 )
-            {
-                Py_ssize_t tsize;
-                size_t size;
+            Py_ssize_t tsize;
+            size_t size;
 
-                tsize = ((PyVarObject *)source)->ob_size;
-                if (tsize < 0)
-                    tsize = -tsize;
-                size = _PyObject_VAR_SIZE( type, tsize );
+            tsize = ((PyVarObject *)source)->ob_size;
+            if (tsize < 0)
+                tsize = -tsize;
+            size = _PyObject_VAR_SIZE( type, tsize );
 
-                dictoffset += (long)size;
-            }
-
-            PyObject **dictptr = (PyObject **) ((char *)source + dictoffset);
-            dict = *dictptr;
+            dictoffset += (long)size;
         }
 
-        if ( dict != NULL )
-        {
-            CHECK_OBJECT( dict );
-
-            Py_INCREF( dict );
-
-            PyObject *result = PyDict_GetItem( dict, attr_name );
+        PyObject **dictptr = (PyObject **) ((char *)source + dictoffset);
+        dict = *dictptr;
+    }
 
-            if ( result != NULL )
-            {
-                Py_INCREF( result );
-                Py_XDECREF( descr );
-                Py_DECREF( dict );
+    if ( dict != NULL )
+    {
+        CHECK_OBJECT( dict );
 
-                CHECK_OBJECT( result );
-                return result;
-            }
+        Py_INCREF( dict );
 
-            Py_DECREF( dict );
-        }
+        PyObject *result = PyDict_GetItem( dict, attr_name );
 
-        if ( func != NULL )
+        if ( result != NULL )
         {
-            PyObject *result = func( descr, source, (PyObject *)type );
-            Py_DECREF( descr );
+            Py_INCREF( result );
+            Py_XDECREF( descr );
+            Py_DECREF( dict );
 
             CHECK_OBJECT( result );
             return result;
         }
 
-        if ( descr != NULL )
-        {
-            CHECK_OBJECT( descr );
-            return descr;
-        }
+        Py_DECREF( dict );
+    }
+
+    if ( func != NULL )
+    {
+        PyObject *result = func( descr, source, (PyObject *)type );
+        Py_DECREF( descr );
+
+        CHECK_OBJECT( result );
+        return result;
+    }
+
+    if ( descr != NULL )
+    {
+        CHECK_OBJECT( descr );
+        return descr;
+    }
 
 #if PYTHON_VERSION < 300
-        PyErr_Format(
-            PyExc_AttributeError,
-            "'%s' object has no attribute '%s'",
-            type->tp_name,
-            PyString_AS_STRING( attr_name )
-        );
+    PyErr_Format(
+        PyExc_AttributeError,
+        "'%s' object has no attribute '%s'",
+        type->tp_name,
+        PyString_AS_STRING( attr_name )
+    );
 #else
-        PyErr_Format(
-            PyExc_AttributeError,
-            "'%s' object has no attribute '%U'",
-            type->tp_name,
-            attr_name
-        );
+    PyErr_Format(
+        PyExc_AttributeError,
+        "'%s' object has no attribute '%U'",
+        type->tp_name,
+        attr_name
+    );
 #endif
-        return NULL;
+    return NULL;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE( PyObject *source, PyObject *attr_name )
+{
+    /* Note: There are 2 specializations of this function, that need to be
+     * updated in line with this: LOOKUP_ATTRIBUTE_[DICT|CLASS]_SLOT
+     */
+
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+    if ( type->tp_getattro == PyObject_GenericGetAttr )
+    {
+        // Unfortunately this is required, although of cause rarely necessary.
+        if (unlikely( type->tp_dict == NULL ))
+        {
+            if (unlikely( PyType_Ready( type ) < 0 ))
+            {
+                return NULL;
+            }
+        }
+
+        PyObject *descr = _PyType_Lookup( type, attr_name );
+
+        return _LOOKUP_ATTRIBUTE_GENERIC( source, type, attr_name, descr );
     }
 #if PYTHON_VERSION < 300
     else if ( type->tp_getattro == PyInstance_Type.tp_getattro )
@@ -289,6 +297,84 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE( PyObject *source, PyObje
     }
 }
 
+/* Attribute lookup with an inline cache of the call site. For types with a
+ * valid version tag, the type lookup result is kept, also when the type has
+ * no such attribute, and only the instance dictionary is checked then. Any
+ * change of the type or its bases gives it a new version tag.
+ */
+struct Nuitka_AttributeCache
+{
+    PyTypeObject *type;
+    unsigned int version_tag;
+
+    // Borrowed, the type holds it as long as its version tag is unchanged.
+    PyObject *descr;
+};
+
+#if _NUITKA_EXPERIMENTAL_ATTRIBUTE_CACHE_STATS
+extern unsigned long attribute_cache_hits;
+extern unsigned long attribute_cache_misses;
+
+extern void printAttributeCacheStats( void );
+
+#define COUNT_ATTRIBUTE_CACHE( counter ) counter += 1
+#else
+#define COUNT_ATTRIBUTE_CACHE( counter )
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_CACHED( PyObject *source, PyObject *attr_name, struct Nuitka_AttributeCache *cache )
+{
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+    if ( type->tp_getattro != PyObject_GenericGetAttr )
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+
+    PyObject *descr;
+
+    if ( cache->type == type &&
+         PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) &&
+         cache->version_tag == type->tp_version_tag )
+    {
+        COUNT_ATTRIBUTE_CACHE( attribute_cache_hits );
+
+        descr = cache->descr;
+    }
+    else
+    {
+        COUNT_ATTRIBUTE_CACHE( attribute_cache_misses );
+
+        // Unfortunately this is required, although of cause rarely necessary.
+        if (unlikely( type->tp_dict == NULL ))
+        {
+            if (unlikely( PyType_Ready( type ) < 0 ))
+            {
+                return NULL;
+            }
+        }
+
+        descr = _PyType_Lookup( type, attr_name );
+
+        // The type lookup assigns the version tag, if the type can have one.
+        if ( PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+        {
+            cache->type = type;
+            cache->version_tag = type->tp_version_tag;
+            cache->descr = descr;
+        }
+        else
+        {
+            cache->type = NULL;
+        }
+    }
+
+    return _LOOKUP_ATTRIBUTE_GENERIC( source, type, attr_name, descr );
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT( PyObject *source )
 {
     CHECK_OBJECT( source );
@@ -101,6 +101,8 @@ NUITKA_MAY_BE_UNUSED static PyObject *UNARY_NOT( PyObject *object )
 
 typedef enum
 {
+    // Only given by helpers, that also raised an exception.
+    NUITKA_BOOL_EXCEPTION = -1,
     NUITKA_BOOL_FALSE = 0,
     NUITKA_BOOL_TRUE = 1,
     NUITKA_BOOL_UNASSIGNED = 2,
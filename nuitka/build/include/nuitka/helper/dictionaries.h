@@ -212,9 +212,19 @@ NUITKA_MAY_BE_UNUSED static PyObject *GET_DICT_ENTRY_VALUE( Nuitka_DictEntryHand
     return *handle;
 }
 
+#if PYTHON_VERSION >= 360
+// Values written to the entry directly do not change the dictionary version,
+// these writes are counted instead, for caches of dictionary values.
+extern uint64_t dict_entry_writes;
+#endif
+
 NUITKA_MAY_BE_UNUSED static void SET_DICT_ENTRY_VALUE( Nuitka_DictEntryHandle handle, PyObject *value )
 {
     *handle = value;
+
+#if PYTHON_VERSION >= 360
+    dict_entry_writes += 1;
+#endif
 }
 
 NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject *key )
@@ -0,0 +1,116 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_INTS_H__
+#define __NUITKA_HELPER_INTS_H__
+
+// Integer values that keep a C long next to the object, if the value fits
+// into one, so code can use either one without converting.
+
+typedef enum
+{
+    NUITKA_ILONG_UNASSIGNED = 0,
+    NUITKA_ILONG_OBJECT_VALID = 1,
+    NUITKA_ILONG_CLONG_VALID = 2,
+    NUITKA_ILONG_BOTH_VALID = 3
+} nuitka_ilong_validity;
+
+typedef struct
+{
+    nuitka_ilong_validity validity;
+
+    PyObject *ilong_object;
+    long ilong_value;
+} nuitka_ilong;
+
+#define IS_NILONG_OBJECT_VALUE_VALID( value ) (((value)->validity & NUITKA_ILONG_OBJECT_VALID) != 0)
+#define IS_NILONG_C_VALUE_VALID( value ) (((value)->validity & NUITKA_ILONG_CLONG_VALID) != 0)
+
+// Take over the reference to the object, and the C long if it fits.
+NUITKA_MAY_BE_UNUSED static void SET_NILONG_OBJECT_VALUE( nuitka_ilong *dual_value, PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    dual_value->ilong_object = value;
+    dual_value->validity = NUITKA_ILONG_OBJECT_VALID;
+
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( value ) )
+    {
+        dual_value->ilong_value = PyInt_AS_LONG( value );
+        dual_value->validity = NUITKA_ILONG_BOTH_VALID;
+    }
+#else
+    if ( PyLong_CheckExact( value ) )
+    {
+        int overflow;
+        long c_value = PyLong_AsLongAndOverflow( value, &overflow );
+
+        if ( overflow == 0 )
+        {
+            dual_value->ilong_value = c_value;
+            dual_value->validity = NUITKA_ILONG_BOTH_VALID;
+        }
+    }
+#endif
+}
+
+// The object is only created when it is needed.
+NUITKA_MAY_BE_UNUSED static void SET_NILONG_C_VALUE( nuitka_ilong *dual_value, long value )
+{
+    dual_value->ilong_value = value;
+    dual_value->validity = NUITKA_ILONG_CLONG_VALID;
+}
+
+// Make sure there is an object for the value, and return it as a borrowed
+// reference, or NULL with an exception set, if creating it failed.
+NUITKA_MAY_BE_UNUSED static PyObject *ENFORCE_NILONG_OBJECT_VALUE( nuitka_ilong *dual_value )
+{
+    assert( dual_value->validity != NUITKA_ILONG_UNASSIGNED );
+
+    if ( !IS_NILONG_OBJECT_VALUE_VALID( dual_value ) )
+    {
+#if PYTHON_VERSION < 300
+        PyObject *value = PyInt_FromLong( dual_value->ilong_value );
+#else
+        PyObject *value = PyLong_FromLong( dual_value->ilong_value );
+#endif
+
+        if (unlikely( value == NULL ))
+        {
+            return NULL;
+        }
+
+        dual_value->ilong_object = value;
+        dual_value->validity = NUITKA_ILONG_BOTH_VALID;
+    }
+
+    CHECK_OBJECT( dual_value->ilong_object );
+    return dual_value->ilong_object;
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_NILONG_VALUE( nuitka_ilong *dual_value )
+{
+    if ( IS_NILONG_OBJECT_VALUE_VALID( dual_value ) )
+    {
+        Py_DECREF( dual_value->ilong_object );
+    }
+
+    dual_value->validity = NUITKA_ILONG_UNASSIGNED;
+}
+
+#endif
@@ -0,0 +1,111 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_MATHFUNCTIONS_H__
+#define __NUITKA_HELPER_MATHFUNCTIONS_H__
+
+// These do what the "math" module functions do, converting the argument to
+// a C double, and calling the C library function directly.
+
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_SQRT( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    double x = PyFloat_AsDouble( value );
+
+    if (unlikely( x == -1.0 && ERROR_OCCURRED() ))
+    {
+        return NULL;
+    }
+
+    // Only these give "nan" for an argument that is not "nan".
+    if (unlikely( x < 0.0 ))
+    {
+        PyErr_Format( PyExc_ValueError, "math domain error" );
+        return NULL;
+    }
+
+    return PyFloat_FromDouble( sqrt( x ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_FABS( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    double x = PyFloat_AsDouble( value );
+
+    if (unlikely( x == -1.0 && ERROR_OCCURRED() ))
+    {
+        return NULL;
+    }
+
+    return PyFloat_FromDouble( fabs( x ) );
+}
+
+#if PYTHON_VERSION < 300
+
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_FLOOR( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    double x = PyFloat_AsDouble( value );
+
+    if (unlikely( x == -1.0 && ERROR_OCCURRED() ))
+    {
+        return NULL;
+    }
+
+    return PyFloat_FromDouble( floor( x ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_CEIL( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    double x = PyFloat_AsDouble( value );
+
+    if (unlikely( x == -1.0 && ERROR_OCCURRED() ))
+    {
+        return NULL;
+    }
+
+    return PyFloat_FromDouble( ceil( x ) );
+}
+
+#else
+
+// Only used for "float" values, others may have "__floor__" and "__ceil__"
+// methods. Infinity and "nan" are rejected by the conversion to "int".
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_FLOOR( PyObject *value )
+{
+    CHECK_OBJECT( value );
+    assert( PyFloat_CheckExact( value ) );
+
+    return PyLong_FromDouble( floor( PyFloat_AS_DOUBLE( value ) ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *MATH_CEIL( PyObject *value )
+{
+    CHECK_OBJECT( value );
+    assert( PyFloat_CheckExact( value ) );
+
+    return PyLong_FromDouble( ceil( PyFloat_AS_DOUBLE( value ) ) );
+}
+
+#endif
+
+#endif
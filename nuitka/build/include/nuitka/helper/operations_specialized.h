@@ -0,0 +1,278 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_OPERATIONS_SPECIALIZED_H__
+#define __NUITKA_OPERATIONS_SPECIALIZED_H__
+
+/* Binary operations for operand types known at compile time, named after
+ * the type shapes of both operands. These use the type slot or a C level
+ * computation directly, without the dispatch of the generic helpers, which
+ * they still use as a fallback, in case the types are not exactly these.
+ */
+
+#if PYTHON_VERSION < 300
+#define NUITKA_INT_CHECK_EXACT( value ) PyInt_CheckExact( value )
+#define NUITKA_INT_TYPE PyInt_Type
+#define NUITKA_STR_CHECK_EXACT( value ) PyString_CheckExact( value )
+#else
+#define NUITKA_INT_CHECK_EXACT( value ) PyLong_CheckExact( value )
+#define NUITKA_INT_TYPE PyLong_Type
+#define NUITKA_STR_CHECK_EXACT( value ) PyUnicode_CheckExact( value )
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !NUITKA_INT_CHECK_EXACT( operand1 ) || !NUITKA_INT_CHECK_EXACT( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+#if PYTHON_VERSION < 300
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    long i = (long)( (unsigned long)a + b );
+
+    // Detect overflow, in which case the "int" slot creates a "long" object.
+    if (likely(!( (i^a) < 0 && (i^b) < 0 ) ))
+    {
+        return PyInt_FromLong( i );
+    }
+#endif
+
+    return NUITKA_INT_TYPE.tp_as_number->nb_add( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LONG_LONG( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyLong_CheckExact( operand1 ) || !PyLong_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+    return PyLong_Type.tp_as_number->nb_add( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyFloat_CheckExact( operand1 ) || !PyFloat_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+    return PyFloat_FromDouble( PyFloat_AS_DOUBLE( operand1 ) + PyFloat_AS_DOUBLE( operand2 ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_STR( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !NUITKA_STR_CHECK_EXACT( operand1 ) || !NUITKA_STR_CHECK_EXACT( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+#if PYTHON_VERSION < 300
+    return PyString_Type.tp_as_sequence->sq_concat( operand1, operand2 );
+#else
+    return PyUnicode_Concat( operand1, operand2 );
+#endif
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_UNICODE( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyUnicode_CheckExact( operand1 ) || !PyUnicode_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+    return PyUnicode_Concat( operand1, operand2 );
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_LIST( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyList_CheckExact( operand1 ) || !PyList_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+    return PyList_Type.tp_as_sequence->sq_concat( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_TUPLE( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyTuple_CheckExact( operand1 ) || !PyTuple_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_ADD( operand1, operand2 );
+    }
+
+    return PyTuple_Type.tp_as_sequence->sq_concat( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !NUITKA_INT_CHECK_EXACT( operand1 ) || !NUITKA_INT_CHECK_EXACT( operand2 ) ))
+    {
+        return BINARY_OPERATION_MUL( operand1, operand2 );
+    }
+
+    return NUITKA_INT_TYPE.tp_as_number->nb_multiply( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_LONG( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyLong_CheckExact( operand1 ) || !PyLong_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_MUL( operand1, operand2 );
+    }
+
+    return PyLong_Type.tp_as_number->nb_multiply( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyFloat_CheckExact( operand1 ) || !PyFloat_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_MUL( operand1, operand2 );
+    }
+
+    return PyFloat_FromDouble( PyFloat_AS_DOUBLE( operand1 ) * PyFloat_AS_DOUBLE( operand2 ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !NUITKA_INT_CHECK_EXACT( operand1 ) || !NUITKA_INT_CHECK_EXACT( operand2 ) ))
+    {
+        return BINARY_OPERATION_TRUEDIV( operand1, operand2 );
+    }
+
+    return NUITKA_INT_TYPE.tp_as_number->nb_true_divide( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    // Division by zero is left to the slot, for its exception.
+    if (unlikely( !PyFloat_CheckExact( operand1 ) || !PyFloat_CheckExact( operand2 ) || PyFloat_AS_DOUBLE( operand2 ) == 0.0 ))
+    {
+        return BINARY_OPERATION_TRUEDIV( operand1, operand2 );
+    }
+
+    return PyFloat_FromDouble( PyFloat_AS_DOUBLE( operand1 ) / PyFloat_AS_DOUBLE( operand2 ) );
+}
+
+#if PYTHON_VERSION < 300
+// Classic division of float values is true division.
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyFloat_CheckExact( operand1 ) || !PyFloat_CheckExact( operand2 ) || PyFloat_AS_DOUBLE( operand2 ) == 0.0 ))
+    {
+        return BINARY_OPERATION_DIV( operand1, operand2 );
+    }
+
+    return PyFloat_FromDouble( PyFloat_AS_DOUBLE( operand1 ) / PyFloat_AS_DOUBLE( operand2 ) );
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !NUITKA_INT_CHECK_EXACT( operand1 ) || !NUITKA_INT_CHECK_EXACT( operand2 ) ))
+    {
+        return BINARY_OPERATION_REMAINDER( operand1, operand2 );
+    }
+
+#if PYTHON_VERSION < 300
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    // Zero raises, and "-1" may overflow, these are left to the slot.
+    if (likely( b != 0 && b != -1 ))
+    {
+        long r = a % b;
+
+        // Python semantics, the result has the sign of the divisor.
+        if ( r != 0 && ( (b ^ r) < 0 ) )
+        {
+            r += b;
+        }
+
+        return PyInt_FromLong( r );
+    }
+#endif
+
+    return NUITKA_INT_TYPE.tp_as_number->nb_remainder( operand1, operand2 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2 )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (unlikely( !PyFloat_CheckExact( operand1 ) || !PyFloat_CheckExact( operand2 ) ))
+    {
+        return BINARY_OPERATION_REMAINDER( operand1, operand2 );
+    }
+
+    return PyFloat_Type.tp_as_number->nb_remainder( operand1, operand2 );
+}
+
+#undef NUITKA_INT_CHECK_EXACT
+#undef NUITKA_INT_TYPE
+#undef NUITKA_STR_CHECK_EXACT
+
+#endif
@@ -30,6 +30,59 @@ extern PyObject *BUILTIN_XRANGE1( PyObject *high );
 extern PyObject *BUILTIN_XRANGE2( PyObject *low, PyObject *high );
 extern PyObject *BUILTIN_XRANGE3( PyObject *low, PyObject *high, PyObject *step );
 
+/* Loops over ranges, counting with C long values, instead of creating the
+ * range and its iterator. If the values do not fit into a C long, or an object
+ * is needed, the iterator object is used instead. The values given to the loop
+ * are objects still, as loop variables are object variables.
+ */
+typedef struct {
+    long current;
+    long stop;
+    long step;
+    unsigned long remaining;
+
+    PyObject *iterator;
+} nuitka_range_counter;
+
+extern bool MAKE_RANGE_COUNTER( nuitka_range_counter *counter, bool is_xrange, PyObject *low, PyObject *high, PyObject *step );
+
+// Switch to using an iterator object, and return it as a borrowed reference.
+extern PyObject *RANGE_COUNTER_AS_ITERATOR( nuitka_range_counter *counter );
+
+// Returns a new reference, or NULL at the end without an exception set, which
+// is how "ITERATOR_NEXT" signals StopIteration too.
+NUITKA_MAY_BE_UNUSED static PyObject *RANGE_COUNTER_NEXT( nuitka_range_counter *counter )
+{
+    if ( counter->iterator != NULL )
+    {
+        return ITERATOR_NEXT( counter->iterator );
+    }
+
+    if ( counter->remaining == 0 )
+    {
+        return NULL;
+    }
+
+    long value = counter->current;
+
+    counter->remaining -= 1;
+
+    // Not stepping past the last value avoids overflows.
+    if ( counter->remaining != 0 )
+    {
+        counter->current += counter->step;
+    }
+
+    return PyInt_FromLong( value );
+}
+
+NUITKA_MAY_BE_UNUSED static void RELEASE_RANGE_COUNTER( nuitka_range_counter *counter )
+{
+    Py_XDECREF( counter->iterator );
+    counter->iterator = NULL;
+    counter->remaining = 0;
+}
+
 #if PYTHON_VERSION >= 300
 
 /* Python3 range objects */
@@ -0,0 +1,202 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_RICHCOMPARISONS_SPECIALIZED_H__
+#define __NUITKA_HELPER_RICHCOMPARISONS_SPECIALIZED_H__
+
+/* Rich comparisons for operand types known at compile time, named after the
+ * type shapes of both operands. These give a "nuitka_bool" for use in
+ * conditions, without creating or checking a result object, and
+ * "NUITKA_BOOL_EXCEPTION" if an exception was raised. The operation is given
+ * as "Py_LT" etc. and should be a constant, so the C compiler removes the
+ * other cases.
+ */
+
+#define NUITKA_BOOL_FROM( value ) ( ( value ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE )
+
+// Used for other types than expected, and for result objects of slots.
+NUITKA_MAY_BE_UNUSED static nuitka_bool _RICH_COMPARE_NBOOL_OBJECT( PyObject *operand1, PyObject *operand2, int op )
+{
+    PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, op );
+
+    if (unlikely( rich_result == NULL ))
+    {
+        return NUITKA_BOOL_EXCEPTION;
+    }
+
+    nuitka_bool result;
+
+    if ( rich_result == Py_True )
+    {
+        result = NUITKA_BOOL_TRUE;
+    }
+    else if ( rich_result == Py_False || rich_result == Py_None )
+    {
+        result = NUITKA_BOOL_FALSE;
+    }
+    else
+    {
+        int res = CHECK_IF_TRUE( rich_result );
+
+        result = res == -1 ? NUITKA_BOOL_EXCEPTION : NUITKA_BOOL_FROM( res );
+    }
+
+    Py_DECREF( rich_result );
+
+    return result;
+}
+
+// Compare the result of a comparison of C values with zero, as "memcmp" does.
+NUITKA_MAY_BE_UNUSED static nuitka_bool _RICH_COMPARE_NBOOL_CMP( int cmp, int op )
+{
+    switch ( op )
+    {
+        case Py_LT: return NUITKA_BOOL_FROM( cmp < 0 );
+        case Py_LE: return NUITKA_BOOL_FROM( cmp <= 0 );
+        case Py_EQ: return NUITKA_BOOL_FROM( cmp == 0 );
+        case Py_NE: return NUITKA_BOOL_FROM( cmp != 0 );
+        case Py_GT: return NUITKA_BOOL_FROM( cmp > 0 );
+        default: return NUITKA_BOOL_FROM( cmp >= 0 );
+    }
+}
+
+NUITKA_MAY_BE_UNUSED static nuitka_bool RICH_COMPARE_NBOOL_INT_INT( PyObject *operand1, PyObject *operand2, int op )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+#if PYTHON_VERSION < 300
+    if (likely( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) ))
+    {
+        long a = PyInt_AS_LONG( operand1 );
+        long b = PyInt_AS_LONG( operand2 );
+
+        return _RICH_COMPARE_NBOOL_CMP( ( a > b ) - ( a < b ), op );
+    }
+#else
+    if (likely( PyLong_CheckExact( operand1 ) && PyLong_CheckExact( operand2 ) ))
+    {
+        // The slot gives one of the bool singletons, no object is created.
+        PyObject *rich_result = PyLong_Type.tp_richcompare( operand1, operand2, op );
+
+        if (unlikely( rich_result == NULL ))
+        {
+            return NUITKA_BOOL_EXCEPTION;
+        }
+
+        if (likely( rich_result == Py_True || rich_result == Py_False ))
+        {
+            nuitka_bool result = NUITKA_BOOL_FROM( rich_result == Py_True );
+
+            Py_DECREF( rich_result );
+            return result;
+        }
+
+        Py_DECREF( rich_result );
+    }
+#endif
+
+    return _RICH_COMPARE_NBOOL_OBJECT( operand1, operand2, op );
+}
+
+NUITKA_MAY_BE_UNUSED static nuitka_bool RICH_COMPARE_NBOOL_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2, int op )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    if (likely( PyFloat_CheckExact( operand1 ) && PyFloat_CheckExact( operand2 ) ))
+    {
+        double a = PyFloat_AS_DOUBLE( operand1 );
+        double b = PyFloat_AS_DOUBLE( operand2 );
+
+        // Not using "_RICH_COMPARE_NBOOL_CMP" here, "NaN" values are
+        // unordered, and give false for all but "!=".
+        switch ( op )
+        {
+            case Py_LT: return NUITKA_BOOL_FROM( a < b );
+            case Py_LE: return NUITKA_BOOL_FROM( a <= b );
+            case Py_EQ: return NUITKA_BOOL_FROM( a == b );
+            case Py_NE: return NUITKA_BOOL_FROM( a != b );
+            case Py_GT: return NUITKA_BOOL_FROM( a > b );
+            default: return NUITKA_BOOL_FROM( a >= b );
+        }
+    }
+
+    return _RICH_COMPARE_NBOOL_OBJECT( operand1, operand2, op );
+}
+
+NUITKA_MAY_BE_UNUSED static nuitka_bool RICH_COMPARE_NBOOL_STR_STR( PyObject *operand1, PyObject *operand2, int op )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+#if PYTHON_VERSION < 300
+    if (likely( PyString_CheckExact( operand1 ) && PyString_CheckExact( operand2 ) ))
+    {
+        Py_ssize_t len1 = PyString_GET_SIZE( operand1 );
+        Py_ssize_t len2 = PyString_GET_SIZE( operand2 );
+
+        if ( op == Py_EQ || op == Py_NE )
+        {
+            bool equal = operand1 == operand2 || (
+                len1 == len2 &&
+                memcmp( PyString_AS_STRING( operand1 ), PyString_AS_STRING( operand2 ), len1 ) == 0
+            );
+
+            return NUITKA_BOOL_FROM( equal == ( op == Py_EQ ) );
+        }
+
+        int cmp = memcmp(
+            PyString_AS_STRING( operand1 ),
+            PyString_AS_STRING( operand2 ),
+            len1 < len2 ? len1 : len2
+        );
+
+        if ( cmp == 0 )
+        {
+            cmp = ( len1 > len2 ) - ( len1 < len2 );
+        }
+
+        return _RICH_COMPARE_NBOOL_CMP( cmp, op );
+    }
+#else
+    if (likely( PyUnicode_CheckExact( operand1 ) && PyUnicode_CheckExact( operand2 ) ))
+    {
+        // The slot gives one of the bool singletons, no object is created.
+        PyObject *rich_result = PyUnicode_Type.tp_richcompare( operand1, operand2, op );
+
+        if (unlikely( rich_result == NULL ))
+        {
+            return NUITKA_BOOL_EXCEPTION;
+        }
+
+        if (likely( rich_result == Py_True || rich_result == Py_False ))
+        {
+            nuitka_bool result = NUITKA_BOOL_FROM( rich_result == Py_True );
+
+            Py_DECREF( rich_result );
+            return result;
+        }
+
+        Py_DECREF( rich_result );
+    }
+#endif
+
+    return _RICH_COMPARE_NBOOL_OBJECT( operand1, operand2, op );
+}
+
+#endif
@@ -66,6 +66,27 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_CONTAINS_NOT_BOOL( PyObject *element,
     return result == 0;
 }
 
+// Check "element" against "count" values like "in" does for a tuple of them,
+// without creating it. Gives -1 for errors, 1 if found, and 0 otherwise.
+NUITKA_MAY_BE_UNUSED static int SEQUENCE_CONTAINS_ELEMENTS( PyObject *element, PyObject **values, Py_ssize_t count )
+{
+    CHECK_OBJECT( element );
+
+    for( Py_ssize_t i = 0; i < count; i++ )
+    {
+        CHECK_OBJECT( values[ i ] );
+
+        int result = PyObject_RichCompareBool( element, values[ i ], Py_EQ );
+
+        if ( result != 0 )
+        {
+            return result;
+        }
+    }
+
+    return 0;
+}
+
 NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM( PyObject *sequence, Py_ssize_t index, PyObject *value )
 {
     CHECK_OBJECT( sequence );
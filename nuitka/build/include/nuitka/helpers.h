@@ -67,6 +67,7 @@ extern void stopProfiling( void );
 
 
 #include "nuitka/helper/boolean.h"
+#include "nuitka/helper/ints.h"
 #include "nuitka/helper/dictionaries.h"
 #include "nuitka/helper/mappings.h"
 
@@ -91,8 +92,10 @@ static char const *_PyUnicode_AS_STRING( PyObject *unicode )
 #include "nuitka/helper/raising.h"
 
 #include "helper/operations.h"
+#include "helper/operations_specialized.h"
 
 #include "nuitka/helper/richcomparisons.h"
+#include "nuitka/helper/richcomparisons_specialized.h"
 #include "nuitka/helper/sequences.h"
 
 static inline bool Nuitka_Function_Check( PyObject *object );
@@ -437,6 +440,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_VARS( PyObject *source )
 #include "nuitka/helper/rangeobjects.h"
 #include "nuitka/helper/lists.h"
 #include "nuitka/helper/bytearrays.h"
+#include "nuitka/helper/mathfunctions.h"
 
 #include "nuitka/builtins.h"
 
@@ -516,6 +520,24 @@ extern PyObject *BUILTIN_HASH( PyObject *value );
 extern PyObject *BUILTIN_SUM1( PyObject *sequence );
 extern PyObject *BUILTIN_SUM2( PyObject *sequence, PyObject *start );
 
+// For built-in any() and all() functionality.
+extern PyObject *BUILTIN_ANY( PyObject *value );
+extern PyObject *BUILTIN_ALL( PyObject *value );
+
+// For built-in min() and max() functionality.
+extern PyObject *BUILTIN_MIN1( PyObject *value );
+extern PyObject *BUILTIN_MAX1( PyObject *value );
+extern PyObject *BUILTIN_MIN2( PyObject *value1, PyObject *value2 );
+extern PyObject *BUILTIN_MAX2( PyObject *value1, PyObject *value2 );
+
+// For built-in sorted() functionality.
+extern PyObject *BUILTIN_SORTED( PyObject *value );
+
+// For built-in enumerate(), reversed() and zip() functionality.
+extern PyObject *BUILTIN_ENUMERATE( PyObject *value, PyObject *start );
+extern PyObject *BUILTIN_REVERSED( PyObject *value );
+extern PyObject *BUILTIN_ZIP( PyObject **args, Py_ssize_t args_size );
+
 // For built-in bytes() functionality.
 #if PYTHON_VERSION >= 300
 extern PyObject *BUILTIN_BYTES3( PyObject *value, PyObject *encoding, PyObject *errors );
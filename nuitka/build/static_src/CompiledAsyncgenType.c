@@ -112,29 +112,68 @@ static void Nuitka_Asyncgen_release_closure( struct Nuitka_AsyncgenObject *async
     asyncgen->m_closure_given = 0;
 }
 
-#ifdef _NUITKA_MAKECONTEXT_INTS
-static void Nuitka_Asyncgen_entry_point( int address_1, int address_2 )
+static void RAISE_ASYNCGEN_EXCEPTION( struct Nuitka_AsyncgenObject *asyncgen )
 {
-    // Restore the pointer from integers should it be necessary, depending on
-    // the platform. This requires pointers to be no larger that to "int" value.
-    int addresses[2] =
-    {
-        address_1,
-        address_2
-    };
+    CHECK_OBJECT( asyncgen->m_exception_type );
 
-    struct Nuitka_AsyncgenObject *asyncgen = (struct Nuitka_AsyncgenObject *)*(uintptr_t *)&addresses[0];
-#else
-static void Nuitka_Asyncgen_entry_point( struct Nuitka_AsyncgenObject *asyncgen )
-{
-#endif
-    ((asyncgen_code)asyncgen->m_code)( asyncgen );
+    RESTORE_ERROR_OCCURRED(
+        asyncgen->m_exception_type,
+        asyncgen->m_exception_value,
+        asyncgen->m_exception_tb
+    );
 
-    swapFiber( &asyncgen->m_yielder_context, &asyncgen->m_caller_context );
+    asyncgen->m_exception_type = NULL;
+    asyncgen->m_exception_value = NULL;
+    asyncgen->m_exception_tb = NULL;
+
+    assert( ERROR_OCCURRED() );
 }
 
+static PyObject *_Nuitka_Asyncgen_yieldfrom( struct Nuitka_AsyncgenObject *asyncgen, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value, bool close_on_genexit );
 
-static PyObject *_Nuitka_Asyncgen_send( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value, bool closing )
+// Continue the async generator code where it left off, or the object it
+// currently awaits, with the value sent or the exception thrown into it.
+static PyObject *_Nuitka_Asyncgen_resume( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value, bool close_on_genexit )
+{
+    while( 1 )
+    {
+        PyObject *yieldfrom = asyncgen->m_yieldfrom;
+
+        if ( yieldfrom != NULL )
+        {
+            PyObject *yielded = _Nuitka_Asyncgen_yieldfrom( asyncgen, yieldfrom, value, &value, close_on_genexit );
+
+            if ( yielded != NULL )
+            {
+                return yielded;
+            }
+
+            // Done with it, the async generator code continues with the
+            // result as a new reference, or NULL for the error set.
+            asyncgen->m_yieldfrom = NULL;
+            Py_DECREF( yieldfrom );
+        }
+        else if (unlikely( asyncgen->m_exception_type ))
+        {
+            RAISE_ASYNCGEN_EXCEPTION( asyncgen );
+
+            value = NULL;
+        }
+
+        PyObject *yielded = ((asyncgen_code)asyncgen->m_code)( asyncgen, value );
+
+        // An "await" was started, start the iteration of it.
+        if ( yielded == NULL && asyncgen->m_yieldfrom != NULL )
+        {
+            value = Py_None;
+            continue;
+        }
+
+        return yielded;
+    }
+}
+
+static PyObject *_Nuitka_Asyncgen_send( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value, bool close_on_genexit )
 {
     if ( value == NULL ) value = Py_None;
 
@@ -156,20 +195,9 @@ static PyObject *_Nuitka_Asyncgen_send( struct Nuitka_AsyncgenObject *asyncgen,
 
         if ( asyncgen->m_status == status_Unused )
         {
-            // Prepare the asyncgen context to run.
-            int res = prepareFiber( &asyncgen->m_yielder_context, (void *)Nuitka_Asyncgen_entry_point, (uintptr_t)asyncgen );
-
-            if ( res != 0 )
-            {
-                PyErr_Format( PyExc_MemoryError, "async generator cannot be allocated" );
-                return NULL;
-            }
-
             asyncgen->m_status = status_Running;
         }
 
-        asyncgen->m_yielded = value;
-
         // Put the generator back on the frame stack.
         PyFrameObject *return_frame = thread_state->frame;
 #ifndef __NUITKA_NO_ASSERT__
@@ -192,12 +220,21 @@ static PyObject *_Nuitka_Asyncgen_send( struct Nuitka_AsyncgenObject *asyncgen,
             asyncgen->m_frame->m_frame.f_back = return_frame;
 
             thread_state->frame = &asyncgen->m_frame->m_frame;
+
+            Nuitka_Frame_MarkAsExecuting( asyncgen->m_frame );
+
+            // Continue on top of the nested frame the "await" was done in.
+            if ( asyncgen->m_resume_frame )
+            {
+                thread_state->frame = asyncgen->m_resume_frame;
+                asyncgen->m_resume_frame = NULL;
+            }
         }
 
         // Continue the yielder function while preventing recursion.
         asyncgen->m_running = true;
 
-        swapFiber( &asyncgen->m_caller_context, &asyncgen->m_yielder_context );
+        PyObject *yielded = _Nuitka_Asyncgen_resume( asyncgen, value, close_on_genexit );
 
         asyncgen->m_running = false;
 
@@ -206,91 +243,84 @@ static PyObject *_Nuitka_Asyncgen_send( struct Nuitka_AsyncgenObject *asyncgen,
         // Remove the asyncgen from the frame stack.
         if ( asyncgen->m_frame )
         {
-            assert( thread_state->frame == &asyncgen->m_frame->m_frame );
+            // Nested frames are left on top of ours, when suspended in them.
+            if ( yielded != NULL && thread_state->frame != &asyncgen->m_frame->m_frame )
+            {
+                asyncgen->m_resume_frame = thread_state->frame;
+            }
+
+            assert( thread_state->frame == &asyncgen->m_frame->m_frame || thread_state->frame == asyncgen->m_resume_frame );
             assertFrameObject( asyncgen->m_frame );
 
+            Nuitka_Frame_MarkAsNotExecuting( asyncgen->m_frame );
+
             Py_CLEAR( asyncgen->m_frame->m_frame.f_back );
         }
 
         thread_state->frame = return_frame;
 
-        // Generator return does set this.
-        if ( asyncgen->m_status == status_Finished )
+        if ( yielded != NULL )
         {
-            Py_XDECREF( asyncgen->m_frame );
-            asyncgen->m_frame = NULL;
-
-            Nuitka_Asyncgen_release_closure( asyncgen );
-
-            return NULL;
+            return yielded;
         }
-        else if ( asyncgen->m_yielded == NULL )
-        {
-            assert( ERROR_OCCURRED() );
-
-            asyncgen->m_status = status_Finished;
-
-            Py_XDECREF( asyncgen->m_frame );
-            asyncgen->m_frame = NULL;
 
-            Nuitka_Asyncgen_release_closure( asyncgen );
+        asyncgen->m_status = status_Finished;
 
-            assert( ERROR_OCCURRED() );
-
-            PyObject *error_occurred = GET_ERROR_OCCURRED();
+        Py_XDECREF( asyncgen->m_frame );
+        asyncgen->m_frame = NULL;
 
-            if ( error_occurred == PyExc_StopIteration || error_occurred == PyExc_StopAsyncIteration )
-            {
-                PyObject *saved_exception_type, *saved_exception_value;
-                PyTracebackObject *saved_exception_tb;
+        Nuitka_Asyncgen_release_closure( asyncgen );
 
-                FETCH_ERROR_OCCURRED( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
-                NORMALIZE_EXCEPTION( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
+        // Generator return does not set an exception.
+        PyObject *error_occurred = GET_ERROR_OCCURRED();
 
-                if ( error_occurred == PyExc_StopIteration )
-                {
-                    PyErr_Format(
-                        PyExc_RuntimeError,
-                        "async generator raised StopIteration"
-                    );
-                }
-                else
-                {
-                    PyErr_Format(
-                        PyExc_RuntimeError,
-                        "async generator raised StopAsyncIteration"
-                    );
-                }
-                PyObject *exception_type, *exception_value;
-                PyTracebackObject *exception_tb;
+        if ( error_occurred == PyExc_StopIteration || error_occurred == PyExc_StopAsyncIteration )
+        {
+            PyObject *saved_exception_type, *saved_exception_value;
+            PyTracebackObject *saved_exception_tb;
 
-                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            FETCH_ERROR_OCCURRED( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
+            NORMALIZE_EXCEPTION( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
 
-                RAISE_EXCEPTION_WITH_CAUSE(
-                    &exception_type,
-                    &exception_value,
-                    &exception_tb,
-                    saved_exception_value
+            if ( error_occurred == PyExc_StopIteration )
+            {
+                PyErr_Format(
+                    PyExc_RuntimeError,
+                    "async generator raised StopIteration"
                 );
+            }
+            else
+            {
+                PyErr_Format(
+                    PyExc_RuntimeError,
+                    "async generator raised StopAsyncIteration"
+                );
+            }
+            PyObject *exception_type, *exception_value;
+            PyTracebackObject *exception_tb;
 
-                CHECK_OBJECT( exception_value );
-                CHECK_OBJECT( saved_exception_value );
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
 
-                Py_INCREF( saved_exception_value );
-                PyException_SetContext( exception_value, saved_exception_value );
+            RAISE_EXCEPTION_WITH_CAUSE(
+                &exception_type,
+                &exception_value,
+                &exception_tb,
+                saved_exception_value
+            );
 
-                Py_DECREF( saved_exception_type );
-                Py_XDECREF( saved_exception_tb );
+            CHECK_OBJECT( exception_value );
+            CHECK_OBJECT( saved_exception_value );
 
-                RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
-            }
+            Py_INCREF( saved_exception_value );
+            PyException_SetContext( exception_value, saved_exception_value );
 
-            return NULL;
-        }
-        else
-        {
-            return asyncgen->m_yielded;
+            Py_DECREF( saved_exception_type );
+            Py_XDECREF( saved_exception_tb );
+
+            RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
         }
+
+        return NULL;
     }
     else
     {
@@ -321,9 +351,9 @@ PyObject *Nuitka_Asyncgen_close( struct Nuitka_AsyncgenObject *asyncgen, PyObjec
         else
         {
             PyObject *error = GET_ERROR_OCCURRED();
-            assert( error != NULL );
 
-            if ( EXCEPTION_MATCH_GENERATOR( error ) )
+            // A return after catching "GeneratorExit" leaves no exception set.
+            if ( error == NULL || EXCEPTION_MATCH_GENERATOR( error ) )
             {
                 CLEAR_ERROR_OCCURRED();
 
@@ -339,71 +369,8 @@ PyObject *Nuitka_Asyncgen_close( struct Nuitka_AsyncgenObject *asyncgen, PyObjec
     return Py_None;
 }
 
-/* Shared from coroutines. */
-extern bool Nuitka_gen_close_iter( PyObject *yieldfrom );
-
-extern PyObject *const_str_plain_throw;
-
 static PyObject *_Nuitka_Asyncgen_throw2( struct Nuitka_AsyncgenObject *asyncgen, bool close_on_genexit )
 {
-    if ( asyncgen->m_yieldfrom != NULL )
-    {
-        if ( close_on_genexit )
-        {
-            if ( PyErr_GivenExceptionMatches( asyncgen->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                // Asynchronous generators need to close the yield_from.
-                asyncgen->m_running = 1;
-                bool res = Nuitka_gen_close_iter( asyncgen->m_yieldfrom );
-                asyncgen->m_running = 0;
-
-                if ( res == true )
-                {
-                    return _Nuitka_Asyncgen_send( asyncgen, Py_None, false );
-                }
-
-                goto throw_here;
-            }
-        }
-
-        PyObject *meth = PyObject_GetAttr( asyncgen->m_yieldfrom, const_str_plain_throw );
-        if (unlikely( meth == NULL ))
-        {
-            if ( !PyErr_ExceptionMatches( PyExc_AttributeError ) )
-            {
-                return NULL;
-            }
-            CLEAR_ERROR_OCCURRED();
-
-            goto throw_here;
-        }
-
-        asyncgen->m_running = 1;
-        PyObject *ret = PyObject_CallFunctionObjArgs( meth, asyncgen->m_exception_type, asyncgen->m_exception_value, asyncgen->m_exception_tb, NULL );
-        asyncgen->m_running = 0;
-
-        Py_DECREF( meth );
-
-        if (unlikely( ret == NULL ))
-        {
-            PyObject *val;
-
-            if ( _PyGen_FetchStopIterationValue( &val ) == 0 )
-            {
-                ret = _Nuitka_Asyncgen_send( asyncgen, val, false );
-                Py_DECREF( val );
-            }
-            else
-            {
-                ret = _Nuitka_Asyncgen_send( asyncgen, Py_None, false );
-            }
-        }
-
-        return ret;
-    }
-
-throw_here:
-
     if ( (PyObject *)asyncgen->m_exception_tb == Py_None )
     {
         asyncgen->m_exception_tb = NULL;
@@ -459,21 +426,30 @@ throw_here:
         return NULL;
     }
 
-    if ( ( asyncgen->m_exception_tb != NULL ) && ( (PyObject *)asyncgen->m_exception_tb != Py_None ) && ( !PyTraceBack_Check( asyncgen->m_exception_tb ) ) )
+    if ( asyncgen->m_status == status_Running )
     {
-        PyErr_Format( PyExc_TypeError, "throw() third argument must be a traceback object" );
-        return NULL;
+        // The exception is raised in the async generator code, or thrown into
+        // the awaited object first.
+        return _Nuitka_Asyncgen_send( asyncgen, Py_None, close_on_genexit );
     }
-
-    if ( asyncgen->m_status != status_Finished )
+    else if ( asyncgen->m_status == status_Finished )
     {
-        PyObject *result = _Nuitka_Asyncgen_send( asyncgen, Py_None, false );
+        Py_CLEAR( asyncgen->m_exception_type );
+        Py_CLEAR( asyncgen->m_exception_value );
+        Py_CLEAR( asyncgen->m_exception_tb );
 
-        return result;
+        PyErr_SetNone( PyExc_StopAsyncIteration );
+        return NULL;
     }
     else
     {
-        PyErr_SetNone( PyExc_StopAsyncIteration );
+        // Never started, the exception is raised right away.
+        RAISE_ASYNCGEN_EXCEPTION( asyncgen );
+
+        asyncgen->m_status = status_Finished;
+
+        Nuitka_Asyncgen_release_closure( asyncgen );
+
         return NULL;
     }
 }
@@ -655,11 +631,11 @@ static void Nuitka_Asyncgen_tp_dealloc( struct Nuitka_AsyncgenObject *asyncgen )
 
     Py_XDECREF( asyncgen->m_frame );
 
+    Py_CLEAR( asyncgen->m_yieldfrom );
+
     assert( Py_REFCNT( asyncgen ) == 1 );
     Py_REFCNT( asyncgen ) = 0;
 
-    releaseFiber( &asyncgen->m_yielder_context );
-
     // Now it is safe to release references and memory for it.
     Nuitka_GC_UnTrack( asyncgen );
 
@@ -789,18 +765,25 @@ PyTypeObject Nuitka_Asyncgen_Type =
     0,                                                   /* tp_free */
 };
 
-PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given )
+PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size )
 {
     struct Nuitka_AsyncgenObject *result;
 
+    // The heap storage is allocated after the closure, in units of the items
+    // of the object.
+    Py_ssize_t full_size = closure_given +
+        ( heap_storage_size + sizeof(struct Nuitka_CellObject *) - 1 ) / sizeof(struct Nuitka_CellObject *);
+
     // Macro to assign result memory from GC or free list.
     allocateFromFreeList(
         free_list_asyncgens,
         struct Nuitka_AsyncgenObject,
         Nuitka_Asyncgen_Type,
-        closure_given
+        full_size
     );
 
+    result->m_heap_storage = &result->m_closure[ closure_given ];
+
     result->m_code = (void *)code;
 
     CHECK_OBJECT( name );
@@ -812,7 +795,6 @@ PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qua
     result->m_qualname = qualname;
     Py_INCREF( qualname );
 
-    // TODO: Makes no sense with asyncgens maybe?
     result->m_yieldfrom = NULL;
 
     // The m_closure is set from the outside.
@@ -822,23 +804,21 @@ PyObject *Nuitka_Asyncgen_New( asyncgen_code code, PyObject *name, PyObject *qua
 
     result->m_status = status_Unused;
     result->m_running = false;
-    result->m_awaiting = false;
 
     result->m_exception_type = NULL;
     result->m_exception_value = NULL;
     result->m_exception_tb = NULL;
 
-    result->m_yielded = NULL;
+    result->m_yield_return_index = 0;
 
     result->m_frame = NULL;
     result->m_code_object = code_object;
+    result->m_resume_frame = NULL;
 
     result->m_finalizer = NULL;
     result->m_hooks_init_done = false;
     result->m_closed = false;
 
-    initFiber( &result->m_yielder_context );
-
     Nuitka_GC_Track( result );
     return (PyObject *)result;
 }
@@ -929,8 +909,6 @@ PyObject *Nuitka_AsyncGenValueWrapperNew( PyObject *value )
 
     result->m_value = value;
 
-    Py_INCREF( value );
-
     Nuitka_GC_Track( result );
 
     return (PyObject *)result;
@@ -1531,248 +1509,163 @@ static PyObject *Nuitka_AsyncgenAthrow_New( struct Nuitka_AsyncgenObject *asyncg
     return (PyObject*)result;
 }
 
-static void RAISE_ASYNCGEN_EXCEPTION( struct Nuitka_AsyncgenObject *asyncgen )
-{
-    CHECK_OBJECT( asyncgen->m_exception_type );
-
-    RESTORE_ERROR_OCCURRED(
-        asyncgen->m_exception_type,
-        asyncgen->m_exception_value,
-        asyncgen->m_exception_tb
-    );
-
-    asyncgen->m_exception_type = NULL;
-    asyncgen->m_exception_value = NULL;
-    asyncgen->m_exception_tb = NULL;
-
-    assert( ERROR_OCCURRED() );
-}
-
-extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
+extern PyObject *PyCoro_GetAwaitableIter( PyObject *value );
 extern PyObject *PyGen_Send( PyGenObject *gen, PyObject *arg );
+extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
+
 extern PyObject *const_str_plain_send, *const_str_plain_throw, *const_str_plain_close;
 
-static PyObject *yieldFromAsyncgen( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
+// Send a value into the object awaited, or throw the exception set on the
+// async generator into it. Returns the value to yield, or NULL when the "await" is
+// complete, then "returned_value" is its result or NULL for an error.
+static PyObject *_Nuitka_Asyncgen_yieldfrom( struct Nuitka_AsyncgenObject *asyncgen, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value, bool close_on_genexit )
 {
-    // This is the value, propagated back and forth the sub-generator and the
-    // yield from consumer.
-    PyObject *send_value = Py_None;
+    PyObject *retval;
 
-    while( 1 )
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( asyncgen->m_exception_type )
     {
-        CHECK_OBJECT( value );
-
-        // Send iteration value to the sub-generator, which may be a CPython
-        // generator object, something with an iterator next, or a send method,
-        // where the later is only required if values other than "None" need to
-        // be passed in.
-        PyObject *retval;
-
-        // Exception, was thrown into us, need to send that to sub-generator.
-        if ( asyncgen->m_exception_type )
+        // The async generator is being closed, but we also are tasked to
+        // immediately close the currently awaited object. For "athrow" of
+        // a "GeneratorExit" it is thrown into it instead.
+        if ( close_on_genexit && EXCEPTION_MATCH_BOOL_SINGLE( asyncgen->m_exception_type, PyExc_GeneratorExit ) )
         {
-            // The yielding generator is being closed, but we also are tasked to
-            // immediately close the currently running sub-generator.
-            if ( EXCEPTION_MATCH_BOOL_SINGLE( asyncgen->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
+            PyObject *close_method = PyObject_GetAttr( yieldfrom, const_str_plain_close );
 
-                if ( close_method )
-                {
-                    PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
-                    Py_DECREF( close_method );
-
-                    if (unlikely( close_value == NULL ))
-                    {
-                        return NULL;
-                    }
+            if ( close_method )
+            {
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
 
-                    Py_DECREF( close_value );
-                }
-                else
+                if (unlikely( close_value == NULL ))
                 {
-                    PyObject *error = GET_ERROR_OCCURRED();
+                    Py_CLEAR( asyncgen->m_exception_type );
+                    Py_CLEAR( asyncgen->m_exception_value );
+                    Py_CLEAR( asyncgen->m_exception_tb );
 
-                    if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
-                    {
-                        PyErr_WriteUnraisable( (PyObject *)value );
-                    }
+                    *returned_value = NULL;
+                    return NULL;
                 }
 
-                RAISE_ASYNCGEN_EXCEPTION( asyncgen );
-
-                return NULL;
+                Py_DECREF( close_value );
             }
-
-            PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
-
-            if ( throw_method )
+            else
             {
-                retval = PyObject_CallFunctionObjArgs( throw_method, asyncgen->m_exception_type, asyncgen->m_exception_value, asyncgen->m_exception_tb, NULL );
-                Py_DECREF( throw_method );
+                PyObject *error = GET_ERROR_OCCURRED();
 
-                if (unlikely( send_value == NULL ))
+                if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
                 {
-                    if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) )
-                    {
-                        return ERROR_GET_STOP_ITERATION_VALUE();
-                    }
-
-                    return NULL;
+                    PyErr_WriteUnraisable( (PyObject *)yieldfrom );
                 }
-
-                asyncgen->m_exception_type = NULL;
-                asyncgen->m_exception_value = NULL;
-                asyncgen->m_exception_tb = NULL;
             }
-            else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
-            {
-                CLEAR_ERROR_OCCURRED();
 
-                RAISE_ASYNCGEN_EXCEPTION( asyncgen );
+            RAISE_ASYNCGEN_EXCEPTION( asyncgen );
 
-                return NULL;
-            }
-            else
-            {
-                assert( ERROR_OCCURRED() );
+            *returned_value = NULL;
+            return NULL;
+        }
 
-                Py_CLEAR( asyncgen->m_exception_type );
-                Py_CLEAR( asyncgen->m_exception_value );
-                Py_CLEAR( asyncgen->m_exception_tb );
+        PyObject *throw_method = PyObject_GetAttr( yieldfrom, const_str_plain_throw );
 
-                return NULL;
-            }
-        }
-        else if ( PyGen_CheckExact( value ) || PyCoro_CheckExact( value ) )
+        if ( throw_method )
         {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-        else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
-        {
-            retval = Py_TYPE( value )->tp_iternext( value );
-        }
-        else
-        {
-            retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
-        }
+            retval = PyObject_CallFunctionObjArgs( throw_method, asyncgen->m_exception_type, asyncgen->m_exception_value, asyncgen->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
 
-        // Check the sub-generator result
-        if ( retval == NULL )
+            Py_CLEAR( asyncgen->m_exception_type );
+            Py_CLEAR( asyncgen->m_exception_value );
+            Py_CLEAR( asyncgen->m_exception_tb );
+        }
+        else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
         {
-            PyObject *error = GET_ERROR_OCCURRED();
-
-            // No exception we take it as stop iteration.
-            if ( error == NULL )
-            {
-                Py_INCREF( Py_None );
-                return Py_None;
-            }
+            CLEAR_ERROR_OCCURRED();
 
-            // The sub-generator has given an exception. In case of
-            // StopIteration, we need to check the value, as it is going to be
-            // the expression value of this "yield from", and we are done. All
-            // other errors, we need to raise.
-            if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
-            {
-                return ERROR_GET_STOP_ITERATION_VALUE();
-            }
+            RAISE_ASYNCGEN_EXCEPTION( asyncgen );
 
+            *returned_value = NULL;
             return NULL;
         }
         else
         {
-            asyncgen->m_yielded = retval;
-
-            asyncgen->m_yieldfrom = value;
-
-            // Return to the calling context.
-            swapFiber( &asyncgen->m_yielder_context, &asyncgen->m_caller_context );
-
-            asyncgen->m_yieldfrom = NULL;
+            assert( ERROR_OCCURRED() );
 
-            send_value = asyncgen->m_yielded;
+            Py_CLEAR( asyncgen->m_exception_type );
+            Py_CLEAR( asyncgen->m_exception_value );
+            Py_CLEAR( asyncgen->m_exception_tb );
 
-            if ( ERROR_OCCURRED() )
-            {
-                assert( asyncgen->m_exception_type != NULL );
-                CLEAR_ERROR_OCCURRED();
-            }
+            *returned_value = NULL;
+            return NULL;
         }
     }
-}
-
-
-PyObject *ASYNCGEN_AWAIT( struct Nuitka_AsyncgenObject *asyncgen, PyObject *awaitable )
-{
-#if _DEBUG_ASYNCGEN
-    PRINT_STRING("AWAIT entry:");
-
-    PRINT_ITEM( awaitable );
-    PRINT_NEW_LINE();
-#endif
-
-    PyObject *awaitable_iter = PyCoro_GetAwaitableIter( awaitable );
-
-    if (unlikely( awaitable_iter == NULL ))
+    else if ( PyGen_CheckExact( yieldfrom ) || PyCoro_CheckExact( yieldfrom ) )
     {
-        return NULL;
+        retval = PyGen_Send( (PyGenObject *)yieldfrom, send_value );
+    }
+    else if ( send_value == Py_None && Py_TYPE( yieldfrom )->tp_iternext != NULL )
+    {
+        retval = Py_TYPE( yieldfrom )->tp_iternext( yieldfrom );
+    }
+    else
+    {
+        retval = PyObject_CallMethodObjArgs( yieldfrom, const_str_plain_send, send_value, NULL );
     }
 
-    if ( Nuitka_Coroutine_Check( awaitable ) )
+    // Check the sub-generator result
+    if ( retval == NULL )
     {
-        struct Nuitka_CoroutineObject *awaited_coroutine = (struct Nuitka_CoroutineObject *)awaitable;
+        PyObject *error = GET_ERROR_OCCURRED();
 
-        if ( awaited_coroutine->m_awaiting )
+        if ( error == NULL )
         {
-            Py_DECREF( awaitable_iter );
-
-            PyErr_Format(
-                PyExc_RuntimeError,
-                "coroutine is being awaited already"
-            );
-
-            return NULL;
+            Py_INCREF( Py_None );
+            *returned_value = Py_None;
+        }
+        // The sub-generator has given an exception. In case of StopIteration,
+        // we need to check the value, as it is going to be the expression
+        // value of this "await", and we are done. All other errors, we need
+        // to raise.
+        else if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+        {
+            *returned_value = ERROR_GET_STOP_ITERATION_VALUE();
+        }
+        else
+        {
+            *returned_value = NULL;
         }
     }
 
-    asyncgen->m_awaiting = true;
-    PyObject *retval = yieldFromAsyncgen( asyncgen, awaitable_iter );
-    asyncgen->m_awaiting = false;
-
-    Py_DECREF( awaitable_iter );
-
-#if _DEBUG_ASYNCGEN
-    PRINT_STRING("AWAIT exit");
-
-    PRINT_ITEM( retval );
-    PRINT_NEW_LINE();
-#endif
-
     return retval;
 }
 
-PyObject *ASYNCGEN_AWAIT_IN_HANDLER( struct Nuitka_AsyncgenObject *asyncgen, PyObject *awaitable )
+bool ASYNCGEN_AWAIT_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *awaitable )
 {
 #if _DEBUG_ASYNCGEN
-    PRINT_STRING("AWAIT entry:");
+    PRINT_STRING("ASYNCGEN_AWAIT_START entry:");
+    PRINT_NEW_LINE();
 
     PRINT_ITEM( awaitable );
     PRINT_NEW_LINE();
 #endif
 
+    assert( asyncgen->m_yieldfrom == NULL );
+
     PyObject *awaitable_iter = PyCoro_GetAwaitableIter( awaitable );
 
     if (unlikely( awaitable_iter == NULL ))
     {
-        return NULL;
+        return false;
     }
 
+#if PYTHON_VERSION >= 352 || !defined(_NUITKA_FULL_COMPAT)
+    /* This check got added in Python 3.5.2 only. It's good to do it, but
+     * not fully compatible, therefore guard it.
+     */
+
     if ( Nuitka_Coroutine_Check( awaitable ) )
     {
         struct Nuitka_CoroutineObject *awaited_coroutine = (struct Nuitka_CoroutineObject *)awaitable;
 
-        if ( awaited_coroutine->m_awaiting )
+        if ( awaited_coroutine->m_yieldfrom != NULL )
         {
             Py_DECREF( awaitable_iter );
 
@@ -1781,90 +1674,22 @@ PyObject *ASYNCGEN_AWAIT_IN_HANDLER( struct Nuitka_AsyncgenObject *asyncgen, PyO
                 "coroutine is being awaited already"
             );
 
-            return NULL;
+            return false;
         }
     }
-
-    /* When yielding from an exception handler in Python3, the exception
-     * preserved to the frame is restore, while the current one is put there.
-     */
-    PyThreadState *thread_state = PyThreadState_GET();
-
-    PyObject *saved_exception_type = thread_state->exc_type;
-    PyObject *saved_exception_value = thread_state->exc_value;
-    PyObject *saved_exception_traceback = thread_state->exc_traceback;
-
-    if ( saved_exception_type ) CHECK_OBJECT( saved_exception_type );
-    if ( saved_exception_value ) CHECK_OBJECT( saved_exception_value );
-    if ( saved_exception_traceback ) CHECK_OBJECT( saved_exception_traceback );
-
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-#if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD exit:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
 #endif
 
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-    if ( saved_exception_type ) CHECK_OBJECT( saved_exception_type );
-    if ( saved_exception_value ) CHECK_OBJECT( saved_exception_value );
-    if ( saved_exception_traceback ) CHECK_OBJECT( saved_exception_traceback );
-
-    asyncgen->m_awaiting = true;
-    PyObject *retval = yieldFromAsyncgen( asyncgen, awaitable_iter );
-    asyncgen->m_awaiting = false;
-
-    Py_DECREF( awaitable_iter );
-
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
-
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
-
-    if ( saved_exception_type ) CHECK_OBJECT( saved_exception_type );
-    if ( saved_exception_value ) CHECK_OBJECT( saved_exception_value );
-    if ( saved_exception_traceback ) CHECK_OBJECT( saved_exception_traceback );
-
-#if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD return:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
-#endif
-
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-    if ( thread_state->exc_type ) CHECK_OBJECT( thread_state->exc_type );
-    if ( thread_state->exc_value ) CHECK_OBJECT( thread_state->exc_value );
-    if ( thread_state->exc_traceback ) CHECK_OBJECT( thread_state->exc_traceback );
-
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-#if _DEBUG_ASYNCGEN
-    PRINT_STRING("AWAIT exit");
-
-    PRINT_ITEM( retval );
-    PRINT_NEW_LINE();
-#endif
+    asyncgen->m_yieldfrom = awaitable_iter;
 
-    return retval;
+    return true;
 }
 
+
 extern PyObject *Nuitka_AIterWrapper_New( PyObject *aiter );
 
-PyObject *ASYNCGEN_ASYNC_MAKE_ITERATOR( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
+bool ASYNCGEN_ASYNC_MAKE_ITERATOR_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
 {
-#if _DEBUG_COROUTINE
+#if _DEBUG_ASYNCGEN
     PRINT_STRING("AITER entry:");
 
     PRINT_ITEM( value );
@@ -1886,14 +1711,14 @@ PyObject *ASYNCGEN_ASYNC_MAKE_ITERATOR( struct Nuitka_AsyncgenObject *asyncgen,
             Py_TYPE( value )->tp_name
         );
 
-        return NULL;
+        return false;
     }
 
     PyObject *iter = (*getter)( value );
 
     if (unlikely( iter == NULL ))
     {
-        return NULL;
+        return false;
     }
 
     /* Starting with Python 3.5.2 it is acceptable to return an async iterator
@@ -1921,27 +1746,20 @@ PyObject *ASYNCGEN_ASYNC_MAKE_ITERATOR( struct Nuitka_AsyncgenObject *asyncgen,
 
         Py_DECREF( iter );
 
-        return NULL;
+        return false;
     }
 
     Py_DECREF( iter );
 
-    PyObject *retval = yieldFromAsyncgen( asyncgen, awaitable_iter );
-
-    Py_DECREF( awaitable_iter );
-
-#if _DEBUG_COROUTINE
-    PRINT_STRING("AITER exit");
-    PRINT_ITEM( retval );
-    PRINT_NEW_LINE();
-#endif
+    assert( asyncgen->m_yieldfrom == NULL );
+    asyncgen->m_yieldfrom = awaitable_iter;
 
-    return retval;
+    return true;
 }
 
-PyObject *ASYNCGEN_ASYNC_ITERATOR_NEXT( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
+bool ASYNCGEN_ASYNC_ITERATOR_NEXT_START( struct Nuitka_AsyncgenObject *asyncgen, PyObject *value )
 {
-#if _DEBUG_COROUTINE
+#if _DEBUG_ASYNCGEN
     PRINT_STRING("ANEXT entry:");
 
     PRINT_ITEM( value );
@@ -1963,14 +1781,14 @@ PyObject *ASYNCGEN_ASYNC_ITERATOR_NEXT( struct Nuitka_AsyncgenObject *asyncgen,
             Py_TYPE( value )->tp_name
         );
 
-        return NULL;
+        return false;
     }
 
     PyObject *next_value = (*getter)( value );
 
     if (unlikely( next_value == NULL ))
     {
-        return NULL;
+        return false;
     }
 
     PyObject *awaitable_iter = PyCoro_GetAwaitableIter( next_value );
@@ -1985,22 +1803,15 @@ PyObject *ASYNCGEN_ASYNC_ITERATOR_NEXT( struct Nuitka_AsyncgenObject *asyncgen,
 
         Py_DECREF( next_value );
 
-        return NULL;
+        return false;
     }
 
     Py_DECREF( next_value );
 
-    PyObject *retval = yieldFromAsyncgen( asyncgen, awaitable_iter );
+    assert( asyncgen->m_yieldfrom == NULL );
+    asyncgen->m_yieldfrom = awaitable_iter;
 
-    Py_DECREF( awaitable_iter );
-
-#if _DEBUG_COROUTINE
-PRINT_STRING("ANEXT exit");
-PRINT_ITEM( retval );
-PRINT_NEW_LINE();
-#endif
-
-    return retval;
+    return true;
 }
 
 void _initCompiledAsyncgenTypes( void )
@@ -32,6 +32,24 @@
 #include "HelpersBuiltin.c"
 #include "HelpersStrings.c"
 
+#if PYTHON_VERSION >= 360
+uint64_t dict_entry_writes = 0;
+#endif
+
+#if _NUITKA_EXPERIMENTAL_ATTRIBUTE_CACHE_STATS
+unsigned long attribute_cache_hits = 0;
+unsigned long attribute_cache_misses = 0;
+
+void printAttributeCacheStats( void )
+{
+    fprintf(
+        stderr,
+        "Attribute lookup caches: %lu hits, %lu misses.\n",
+        attribute_cache_hits,
+        attribute_cache_misses
+    );
+}
+#endif
 
 #if PYTHON_VERSION < 300
 
@@ -663,6 +681,158 @@ PyObject *BUILTIN_XRANGE3( PyObject *low, PyObject *high, PyObject *step )
 #endif
 }
 
+/* Same as CPython2 "range" length, for range counters. */
+static unsigned long getRangeCounterLength( long lo, long hi, long step )
+{
+     assert( step != 0 );
+
+     if ( step > 0 && lo < hi )
+     {
+         return 1UL + (hi - 1UL - lo) / step;
+     }
+     else if (step < 0 && lo > hi)
+     {
+         return 1UL + (lo - 1UL - hi) / (0UL - step);
+     }
+     else
+     {
+         return 0UL;
+     }
+}
+
+static bool getRangeCounterValue( PyObject *value, long *result )
+{
+    CHECK_OBJECT( value );
+
+#if PYTHON_VERSION < 300
+    if ( PyInt_CheckExact( value ) )
+    {
+        *result = PyInt_AS_LONG( value );
+        return true;
+    }
+#else
+    if ( PyLong_CheckExact( value ) )
+    {
+        int overflow;
+        *result = PyLong_AsLongAndOverflow( value, &overflow );
+
+        return overflow == 0;
+    }
+#endif
+
+    return false;
+}
+
+static PyObject *makeRangeCounterRange( bool is_xrange, PyObject *low, PyObject *high, PyObject *step )
+{
+#if PYTHON_VERSION < 300
+    if ( is_xrange == false )
+    {
+        if ( low == NULL )
+        {
+            return BUILTIN_RANGE( high );
+        }
+        else if ( step == NULL )
+        {
+            return BUILTIN_RANGE2( low, high );
+        }
+        else
+        {
+            return BUILTIN_RANGE3( low, high, step );
+        }
+    }
+#endif
+
+    if ( low == NULL )
+    {
+        return BUILTIN_XRANGE1( high );
+    }
+    else if ( step == NULL )
+    {
+        return BUILTIN_XRANGE2( low, high );
+    }
+    else
+    {
+        return BUILTIN_XRANGE3( low, high, step );
+    }
+}
+
+bool MAKE_RANGE_COUNTER( nuitka_range_counter *counter, bool is_xrange, PyObject *low, PyObject *high, PyObject *step )
+{
+    long c_low = 0;
+    long c_high;
+    long c_step = 1;
+
+    RELEASE_RANGE_COUNTER( counter );
+
+    if ( ( low == NULL || getRangeCounterValue( low, &c_low ) ) &&
+         getRangeCounterValue( high, &c_high ) &&
+         ( step == NULL || getRangeCounterValue( step, &c_step ) ) &&
+         c_step != 0 )
+    {
+        unsigned long remaining = getRangeCounterLength( c_low, c_high, c_step );
+
+        // Too many items, the built-in decides about the error to give.
+        if ( remaining <= (unsigned long)LONG_MAX )
+        {
+            counter->current = c_low;
+            counter->stop = c_high;
+            counter->step = c_step;
+            counter->remaining = remaining;
+
+            return true;
+        }
+    }
+
+    // Other values, and errors like a step of zero, are left to the built-in.
+    PyObject *range = makeRangeCounterRange( is_xrange, low, high, step );
+
+    if (unlikely( range == NULL ))
+    {
+        return false;
+    }
+
+    counter->iterator = MAKE_ITERATOR( range );
+    Py_DECREF( range );
+
+    return counter->iterator != NULL;
+}
+
+PyObject *RANGE_COUNTER_AS_ITERATOR( nuitka_range_counter *counter )
+{
+    if ( counter->iterator == NULL )
+    {
+        // The current value is not yet produced, unless exhausted.
+        long start = counter->remaining != 0 ? counter->current : 0;
+        long stop = counter->remaining != 0 ? counter->stop : 0;
+        long step = counter->remaining != 0 ? counter->step : 1;
+
+#if PYTHON_VERSION < 300
+        PyObject *range = MAKE_XRANGE( start, stop, step );
+#else
+        PyObject *low = PyLong_FromLong( start );
+        PyObject *high = PyLong_FromLong( stop );
+        PyObject *step_value = PyLong_FromLong( step );
+
+        PyObject *range = BUILTIN_XRANGE3( low, high, step_value );
+
+        Py_DECREF( low );
+        Py_DECREF( high );
+        Py_DECREF( step_value );
+#endif
+
+        if (unlikely( range == NULL ))
+        {
+            return NULL;
+        }
+
+        counter->iterator = MAKE_ITERATOR( range );
+        Py_DECREF( range );
+    }
+
+    return counter->iterator;
+}
+
 PyObject *BUILTIN_LEN( PyObject *value )
 {
     CHECK_OBJECT( value );
@@ -2203,6 +2373,147 @@ PyObject *BUILTIN_SUM2( PyObject *sequence, PyObject *start )
 }
 
 
+static void RELEASE_QUICK_ITERATOR( struct Nuitka_QuickIterator *qiter )
+{
+    if ( qiter->iterator_mode == ITERATOR_GENERIC )
+    {
+        Py_DECREF( qiter->iterator_data.iter );
+    }
+}
+
+// Implementation of "any" and "all", which stop at the first item that has
+// the truth value "stop_value".
+static PyObject *_BUILTIN_ANY_ALL( PyObject *value, int stop_value )
+{
+    struct Nuitka_QuickIterator qiter;
+
+    if (unlikely( MAKE_QUICK_ITERATOR( value, &qiter ) == false ))
+    {
+        return NULL;
+    }
+
+    for(;;)
+    {
+        bool finished;
+
+        PyObject *item = QUICK_ITERATOR_NEXT( &qiter, &finished );
+
+        if ( finished )
+        {
+            return BOOL_FROM( !stop_value );
+        }
+        else if ( item == NULL )
+        {
+            return NULL;
+        }
+
+        int res = CHECK_IF_TRUE( item );
+        Py_DECREF( item );
+
+        if (unlikely( res == -1 ))
+        {
+            RELEASE_QUICK_ITERATOR( &qiter );
+            return NULL;
+        }
+
+        if ( res == stop_value )
+        {
+            RELEASE_QUICK_ITERATOR( &qiter );
+            return BOOL_FROM( stop_value );
+        }
+    }
+}
+
+PyObject *BUILTIN_ANY( PyObject *value )
+{
+    return _BUILTIN_ANY_ALL( value, 1 );
+}
+
+PyObject *BUILTIN_ALL( PyObject *value )
+{
+    return _BUILTIN_ANY_ALL( value, 0 );
+}
+
+// Implementation of "min" and "max" for a single iterable argument, with
+// "op" being "Py_LT" for "min" and "Py_GT" for "max".
+static PyObject *_BUILTIN_MIN_MAX1( PyObject *value, int op, char const *name )
+{
+    struct Nuitka_QuickIterator qiter;
+
+    if (unlikely( MAKE_QUICK_ITERATOR( value, &qiter ) == false ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+
+    for(;;)
+    {
+        bool finished;
+
+        PyObject *item = QUICK_ITERATOR_NEXT( &qiter, &finished );
+
+        if ( finished )
+        {
+            break;
+        }
+        else if ( item == NULL )
+        {
+            Py_XDECREF( result );
+            return NULL;
+        }
+
+        if ( result == NULL )
+        {
+            result = item;
+            continue;
+        }
+
+        int res = PyObject_RichCompareBool( item, result, op );
+
+        if (unlikely( res == -1 ))
+        {
+            Py_DECREF( item );
+            Py_DECREF( result );
+            RELEASE_QUICK_ITERATOR( &qiter );
+
+            return NULL;
+        }
+
+        if ( res == 1 )
+        {
+            Py_DECREF( result );
+            result = item;
+        }
+        else
+        {
+            Py_DECREF( item );
+        }
+    }
+
+    if (unlikely( result == NULL ))
+    {
+        PyErr_Format(
+            PyExc_ValueError,
+            "%s() arg is an empty sequence",
+            name
+        );
+    }
+
+    return result;
+}
+
+PyObject *BUILTIN_MIN1( PyObject *value )
+{
+    return _BUILTIN_MIN_MAX1( value, Py_LT, "min" );
+}
+
+PyObject *BUILTIN_MAX1( PyObject *value )
+{
+    return _BUILTIN_MIN_MAX1( value, Py_GT, "max" );
+}
+
+
 PyDictObject *dict_builtin = NULL;
 PyModuleObject *builtin_module = NULL;
 
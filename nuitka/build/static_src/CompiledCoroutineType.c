@@ -134,30 +134,63 @@ static void Nuitka_Coroutine_release_closure( struct Nuitka_CoroutineObject *cor
 }
 
 
-// For the coroutine object fiber entry point, we may need to follow what
-// "makecontext" will support and that is only a list of integers, but we will need
-// to push a pointer through it, and so it's two of them, which might be fully
-// sufficient.
+static void RAISE_COROUTINE_EXCEPTION( struct Nuitka_CoroutineObject *coroutine )
+{
+    CHECK_OBJECT( coroutine->m_exception_type );
+
+    RESTORE_ERROR_OCCURRED(
+        coroutine->m_exception_type,
+        coroutine->m_exception_value,
+        coroutine->m_exception_tb
+    );
+
+    coroutine->m_exception_type = NULL;
+    coroutine->m_exception_value = NULL;
+    coroutine->m_exception_tb = NULL;
+}
 
-#ifdef _NUITKA_MAKECONTEXT_INTS
-static void Nuitka_Coroutine_entry_point( int address_1, int address_2 )
+static PyObject *_Nuitka_Coroutine_yieldfrom( struct Nuitka_CoroutineObject *coroutine, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value );
+
+// Continue the coroutine code where it left off, or the object it currently
+// awaits, with the value sent or the exception thrown into it.
+static PyObject *_Nuitka_Coroutine_resume( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
 {
-    // Restore the pointer from integers should it be necessary, depending on
-    // the platform. This requires pointers to be no larger that to "int" value.
-    int addresses[2] =
+    while( 1 )
     {
-        address_1,
-        address_2
-    };
+        PyObject *yieldfrom = coroutine->m_yieldfrom;
 
-    struct Nuitka_CoroutineObject *coroutine = (struct Nuitka_CoroutineObject *)*(uintptr_t *)&addresses[0];
-#else
-static void Nuitka_Coroutine_entry_point( struct Nuitka_CoroutineObject *coroutine )
-{
-#endif
-    ((coroutine_code)coroutine->m_code)( coroutine );
+        if ( yieldfrom != NULL )
+        {
+            PyObject *yielded = _Nuitka_Coroutine_yieldfrom( coroutine, yieldfrom, value, &value );
+
+            if ( yielded != NULL )
+            {
+                return yielded;
+            }
+
+            // Done with it, the coroutine code continues with the result as
+            // a new reference, or NULL for the error set.
+            coroutine->m_yieldfrom = NULL;
+            Py_DECREF( yieldfrom );
+        }
+        else if (unlikely( coroutine->m_exception_type ))
+        {
+            RAISE_COROUTINE_EXCEPTION( coroutine );
+
+            value = NULL;
+        }
+
+        PyObject *yielded = ((coroutine_code)coroutine->m_code)( coroutine, value );
+
+        // An "await" was started, start the iteration of it.
+        if ( yielded == NULL && coroutine->m_yieldfrom != NULL )
+        {
+            value = Py_None;
+            continue;
+        }
 
-    swapFiber( &coroutine->m_yielder_context, &coroutine->m_caller_context );
+        return yielded;
+    }
 }
 
 static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutine, PyObject *value, bool closing )
@@ -180,20 +213,9 @@ static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutin
 
         if ( coroutine->m_status == status_Unused )
         {
-            // Prepare the coroutine context to run.
-            int res = prepareFiber( &coroutine->m_yielder_context, (void *)Nuitka_Coroutine_entry_point, (uintptr_t)coroutine );
-
-            if ( res != 0 )
-            {
-                PyErr_Format( PyExc_MemoryError, "coroutine cannot be allocated" );
-                return NULL;
-            }
-
             coroutine->m_status = status_Running;
         }
 
-        coroutine->m_yielded = value;
-
         // Put the coroutine back on the frame stack.
         PyFrameObject *return_frame = thread_state->frame;
 #ifndef __NUITKA_NO_ASSERT__
@@ -216,12 +238,21 @@ static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutin
             coroutine->m_frame->m_frame.f_back = return_frame;
 
             thread_state->frame = &coroutine->m_frame->m_frame;
+
+            Nuitka_Frame_MarkAsExecuting( coroutine->m_frame );
+
+            // Continue on top of the nested frame the "await" was done in.
+            if ( coroutine->m_resume_frame )
+            {
+                thread_state->frame = coroutine->m_resume_frame;
+                coroutine->m_resume_frame = NULL;
+            }
         }
 
         // Continue the yielder function while preventing recursion.
         coroutine->m_running = true;
 
-        swapFiber( &coroutine->m_caller_context, &coroutine->m_yielder_context );
+        PyObject *yielded = _Nuitka_Coroutine_resume( coroutine, value );
 
         coroutine->m_running = false;
 
@@ -230,9 +261,17 @@ static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutin
         // Remove the coroutine from the frame stack.
         if ( coroutine->m_frame )
         {
-            assert( thread_state->frame == &coroutine->m_frame->m_frame );
+            // Nested frames are left on top of ours, when suspended in them.
+            if ( yielded != NULL && thread_state->frame != &coroutine->m_frame->m_frame )
+            {
+                coroutine->m_resume_frame = thread_state->frame;
+            }
+
+            assert( thread_state->frame == &coroutine->m_frame->m_frame || thread_state->frame == coroutine->m_resume_frame );
             assertFrameObject( coroutine->m_frame );
 
+            Nuitka_Frame_MarkAsNotExecuting( coroutine->m_frame );
+
             Py_CLEAR( coroutine->m_frame->m_frame.f_back );
         }
 
@@ -245,16 +284,22 @@ static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutin
         }
 #endif
 
-        if ( coroutine->m_returned != NULL )
+        if ( yielded != NULL )
         {
-            coroutine->m_status = status_Finished;
+            return yielded;
+        }
 
-            Py_XDECREF( coroutine->m_frame );
-            coroutine->m_frame = NULL;
+        coroutine->m_status = status_Finished;
 
-            Nuitka_Coroutine_release_closure( coroutine );
+        Py_XDECREF( coroutine->m_frame );
+        coroutine->m_frame = NULL;
 
+        Nuitka_Coroutine_release_closure( coroutine );
+
+        if ( coroutine->m_returned != NULL )
+        {
             PyObject *result = coroutine->m_returned;
+            coroutine->m_returned = NULL;
 
             if ( result == Py_None )
             {
@@ -275,61 +320,46 @@ static PyObject *_Nuitka_Coroutine_send( struct Nuitka_CoroutineObject *coroutin
 
             return NULL;
         }
-        else if ( coroutine->m_yielded == NULL )
-        {
-            assert( ERROR_OCCURRED() );
 
-            coroutine->m_status = status_Finished;
+        assert( ERROR_OCCURRED() );
 
-            Py_XDECREF( coroutine->m_frame );
-            coroutine->m_frame = NULL;
-
-            Nuitka_Coroutine_release_closure( coroutine );
-
-            assert( ERROR_OCCURRED() );
-
-            if ( GET_ERROR_OCCURRED() == PyExc_StopIteration )
-            {
-                PyObject *saved_exception_type, *saved_exception_value;
-                PyTracebackObject *saved_exception_tb;
-
-                FETCH_ERROR_OCCURRED( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
-                NORMALIZE_EXCEPTION( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
+        if ( GET_ERROR_OCCURRED() == PyExc_StopIteration )
+        {
+            PyObject *saved_exception_type, *saved_exception_value;
+            PyTracebackObject *saved_exception_tb;
 
-                PyErr_Format(
-                    PyExc_RuntimeError,
-                    "coroutine raised StopIteration"
-                );
-                PyObject *exception_type, *exception_value;
-                PyTracebackObject *exception_tb;
+            FETCH_ERROR_OCCURRED( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
+            NORMALIZE_EXCEPTION( &saved_exception_type, &saved_exception_value, &saved_exception_tb );
 
-                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            PyErr_Format(
+                PyExc_RuntimeError,
+                "coroutine raised StopIteration"
+            );
+            PyObject *exception_type, *exception_value;
+            PyTracebackObject *exception_tb;
 
-                RAISE_EXCEPTION_WITH_CAUSE(
-                    &exception_type,
-                    &exception_value,
-                    &exception_tb,
-                    saved_exception_value
-                );
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
 
-                CHECK_OBJECT( exception_value );
-                CHECK_OBJECT( saved_exception_value );
+            RAISE_EXCEPTION_WITH_CAUSE(
+                &exception_type,
+                &exception_value,
+                &exception_tb,
+                saved_exception_value
+            );
 
-                Py_INCREF( saved_exception_value );
-                PyException_SetContext( exception_value, saved_exception_value );
+            CHECK_OBJECT( exception_value );
+            CHECK_OBJECT( saved_exception_value );
 
-                Py_DECREF( saved_exception_type );
-                Py_XDECREF( saved_exception_tb );
+            Py_INCREF( saved_exception_value );
+            PyException_SetContext( exception_value, saved_exception_value );
 
-                RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
-            }
+            Py_DECREF( saved_exception_type );
+            Py_XDECREF( saved_exception_tb );
 
-            return NULL;
-        }
-        else
-        {
-            return coroutine->m_yielded;
+            RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
         }
+
+        return NULL;
     }
     else
     {
@@ -400,107 +430,23 @@ PyObject *Nuitka_Coroutine_close( struct Nuitka_CoroutineObject *coroutine, PyOb
     return Py_None;
 }
 
-extern PyObject *const_str_plain_close;
-
-/* Also used for asyncgen. */
-bool Nuitka_gen_close_iter( PyObject *yieldfrom )
+static PyObject *Nuitka_Coroutine_throw( struct Nuitka_CoroutineObject *coroutine, PyObject *args )
 {
-    PyObject *meth = PyObject_GetAttr( yieldfrom, const_str_plain_close );
-
-    if (unlikely( meth == NULL ))
-    {
-        if (unlikely( !PyErr_ExceptionMatches( PyExc_AttributeError )))
-        {
-            PyErr_WriteUnraisable( yieldfrom );
-        }
-
-        CLEAR_ERROR_OCCURRED();
-
-        return true;
-    }
-    else
-    {
-        PyObject *retval = CALL_FUNCTION_NO_ARGS( meth );
-        Py_DECREF( meth );
-
-        if (unlikely (retval == NULL))
-        {
-            return false;
-        }
-
-        Py_DECREF( retval );
-
-        return true;
-    }
-}
+    assert( coroutine->m_exception_type == NULL );
+    assert( coroutine->m_exception_value == NULL );
+    assert( coroutine->m_exception_tb == NULL );
 
-extern PyObject *const_str_plain_throw;
+    int res = PyArg_UnpackTuple( args, "throw", 1, 3, &coroutine->m_exception_type, &coroutine->m_exception_value, (PyObject **)&coroutine->m_exception_tb );
 
-static PyObject *_Nuitka_Coroutine_throw2( struct Nuitka_CoroutineObject *coroutine, bool close_on_genexit )
-{
-    if ( coroutine->m_yieldfrom != NULL )
+    if (unlikely( res == 0 ))
     {
-        if ( close_on_genexit )
-        {
-            if ( PyErr_GivenExceptionMatches( coroutine->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                // Coroutines need to close the yield_from.
-                coroutine->m_running = 1;
-                bool res = Nuitka_gen_close_iter( coroutine->m_yieldfrom );
-                coroutine->m_running = 0;
-
-                if ( res == true )
-                {
-                    return _Nuitka_Coroutine_send( coroutine, Py_None, false );
-                }
-
-                goto throw_here;
-            }
-        }
-
-        PyObject *meth = PyObject_GetAttr( coroutine->m_yieldfrom, const_str_plain_throw );
-        if (unlikely( meth == NULL ))
-        {
-            if (!PyErr_ExceptionMatches(PyExc_AttributeError))
-            {
-                return NULL;
-            }
-
-            CLEAR_ERROR_OCCURRED();
-            goto throw_here;
-        }
-
-        coroutine->m_running = 1;
-        CHECK_OBJECT( coroutine->m_exception_type );
-
-        PyObject *ret = PyObject_CallFunctionObjArgs( meth, coroutine->m_exception_type, coroutine->m_exception_value, coroutine->m_exception_tb, NULL );
-        coroutine->m_running = 0;
-
-        Py_DECREF( meth );
-
-        if (unlikely( ret == NULL ))
-        {
-            PyObject *val;
-
-            if ( _PyGen_FetchStopIterationValue( &val ) == 0 )
-            {
-                ret = _Nuitka_Coroutine_send( coroutine, val, false );
-
-                Py_DECREF( val );
-            }
-            else
-            {
-                ret = _Nuitka_Coroutine_send( coroutine, Py_None, false );
-            }
-        }
+        coroutine->m_exception_type = NULL;
+        coroutine->m_exception_value = NULL;
+        coroutine->m_exception_tb = NULL;
 
-        return ret;
+        return NULL;
     }
 
-throw_here:
-
-    CHECK_OBJECT( coroutine->m_exception_type );
-
     if ( (PyObject *)coroutine->m_exception_tb == Py_None )
     {
         coroutine->m_exception_tb = NULL;
@@ -556,26 +502,16 @@ throw_here:
         return NULL;
     }
 
-    if ( ( coroutine->m_exception_tb != NULL ) && ( (PyObject *)coroutine->m_exception_tb != Py_None ) && ( !PyTraceBack_Check( coroutine->m_exception_tb ) ) )
-    {
-        PyErr_Format( PyExc_TypeError, "throw() third argument must be a traceback object" );
-        return NULL;
-    }
-
-    if ( coroutine->m_status != status_Finished )
+    if ( coroutine->m_status == status_Running )
     {
-        PyObject *result = _Nuitka_Coroutine_send( coroutine, Py_None, false );
-
-        return result;
+        // The exception is raised in the coroutine code, or thrown into the
+        // awaited object first.
+        return _Nuitka_Coroutine_send( coroutine, Py_None, false );
     }
-    else
+    else if ( coroutine->m_status == status_Finished )
     {
         /* This seems wasteful to do it like this, but it's a corner case. */
-        RESTORE_ERROR_OCCURRED( coroutine->m_exception_type, coroutine->m_exception_value, coroutine->m_exception_tb );
-
-        coroutine->m_exception_type = NULL;
-        coroutine->m_exception_value = NULL;
-        coroutine->m_exception_tb = NULL;
+        RAISE_COROUTINE_EXCEPTION( coroutine );
 
 #if PYTHON_VERSION >= 352 || !defined(_NUITKA_FULL_COMPAT)
         /* This check got added in Python 3.5.2 only. It's good to do it, but
@@ -589,27 +525,17 @@ throw_here:
 
         return NULL;
     }
-}
+    else
+    {
+        // Never started, the exception is raised right away.
+        RAISE_COROUTINE_EXCEPTION( coroutine );
 
-static PyObject *Nuitka_Coroutine_throw( struct Nuitka_CoroutineObject *coroutine, PyObject *args )
-{
-    assert( coroutine->m_exception_type == NULL );
-    assert( coroutine->m_exception_value == NULL );
-    assert( coroutine->m_exception_tb == NULL );
+        coroutine->m_status = status_Finished;
 
-    int res = PyArg_UnpackTuple( args, "throw", 1, 3, &coroutine->m_exception_type, &coroutine->m_exception_value, (PyObject **)&coroutine->m_exception_tb );
-
-    if (unlikely( res == 0 ))
-    {
-        coroutine->m_exception_type = NULL;
-        coroutine->m_exception_value = NULL;
-        coroutine->m_exception_tb = NULL;
+        Nuitka_Coroutine_release_closure( coroutine );
 
         return NULL;
     }
-
-    return _Nuitka_Coroutine_throw2( coroutine, true );
-
 }
 
 static void Nuitka_Coroutine_tp_del( struct Nuitka_CoroutineObject *coroutine )
@@ -721,11 +647,11 @@ static void Nuitka_Coroutine_tp_dealloc( struct Nuitka_CoroutineObject *coroutin
 
     Py_XDECREF( coroutine->m_frame );
 
+    Py_CLEAR( coroutine->m_yieldfrom );
+
     assert( Py_REFCNT( coroutine ) == 1 );
     Py_REFCNT( coroutine ) = 0;
 
-    releaseFiber( &coroutine->m_yielder_context );
-
     // Now it is safe to release references and memory for it.
     Nuitka_GC_UnTrack( coroutine );
 
@@ -933,18 +859,25 @@ PyTypeObject Nuitka_CoroutineWrapper_Type =
     0,                                                 /* tp_free */
 };
 
-PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given )
+PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size )
 {
     struct Nuitka_CoroutineObject *result;
 
+    // The heap storage is allocated after the closure, in units of the items
+    // of the object.
+    Py_ssize_t full_size = closure_given +
+        ( heap_storage_size + sizeof(struct Nuitka_CellObject *) - 1 ) / sizeof(struct Nuitka_CellObject *);
+
     // Macro to assign result memory from GC or free list.
     allocateFromFreeList(
         free_list_coros,
         struct Nuitka_CoroutineObject,
         Nuitka_Coroutine_Type,
-        closure_given
+        full_size
     );
 
+    result->m_heap_storage = &result->m_closure[ closure_given ];
+
     result->m_code = (void *)code;
 
     CHECK_OBJECT( name );
@@ -956,7 +889,6 @@ PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *q
     result->m_qualname = qualname;
     Py_INCREF( qualname );
 
-    // TODO: Makes no sense with coroutines maybe?
     result->m_yieldfrom = NULL;
 
     // The m_closure is set from the outside.
@@ -966,19 +898,18 @@ PyObject *Nuitka_Coroutine_New( coroutine_code code, PyObject *name, PyObject *q
 
     result->m_status = status_Unused;
     result->m_running = false;
-    result->m_awaiting = false;
 
     result->m_exception_type = NULL;
     result->m_exception_value = NULL;
     result->m_exception_tb = NULL;
 
-    result->m_yielded = NULL;
     result->m_returned = NULL;
 
+    result->m_yield_return_index = 0;
+
     result->m_frame = NULL;
     result->m_code_object = code_object;
-
-    initFiber( &result->m_yielder_context );
+    result->m_resume_frame = NULL;
 
     Nuitka_GC_Track( result );
     return (PyObject *)result;
@@ -1064,257 +995,148 @@ PyObject *PyCoro_GetAwaitableIter( PyObject *value )
     return NULL;
 }
 
-static void RAISE_COROUTINE_EXCEPTION( struct Nuitka_CoroutineObject *coroutine )
-{
-    CHECK_OBJECT( coroutine->m_exception_type );
-
-    RESTORE_ERROR_OCCURRED(
-        coroutine->m_exception_type,
-        coroutine->m_exception_value,
-        coroutine->m_exception_tb
-    );
-
-    coroutine->m_exception_type = NULL;
-    coroutine->m_exception_value = NULL;
-    coroutine->m_exception_tb = NULL;
-}
-
 extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
 
 extern PyObject *const_str_plain_send, *const_str_plain_throw, *const_str_plain_close;
 
-static PyObject *yieldFromCoroutine( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
+// Send a value into the object awaited, or throw the exception set on the
+// coroutine into it. Returns the value to yield, or NULL when the "await" is
+// complete, then "returned_value" is its result or NULL for an error.
+static PyObject *_Nuitka_Coroutine_yieldfrom( struct Nuitka_CoroutineObject *coroutine, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value )
 {
-    CHECK_OBJECT( value );
+    PyObject *retval;
 
-    // This is the value, propagated back and forth the sub-generator and the
-    // yield from consumer.
-    PyObject *send_value = Py_None;
-
-    while( 1 )
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( coroutine->m_exception_type )
     {
-        // Send iteration value to the sub-generator, which may be a CPython
-        // generator object, something with an iterator next, or a send method,
-        // where the later is only required if values other than "None" need to
-        // be passed in.
-        PyObject *retval;
-
-        // Exception, was thrown into us, need to send that to sub-generator.
-        if ( coroutine->m_exception_type )
+        // The awaiting coroutine is being closed, but we also are tasked to
+        // immediately close the currently awaited object.
+        if ( EXCEPTION_MATCH_BOOL_SINGLE( coroutine->m_exception_type, PyExc_GeneratorExit ) )
         {
-            // The yielding coroutine is being closed, but we also are tasked to
-            // immediately close the currently running sub-generator.
-            if ( EXCEPTION_MATCH_BOOL_SINGLE( coroutine->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
-
-                if ( close_method )
-                {
-                    PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
-                    Py_DECREF( close_method );
+            PyObject *close_method = PyObject_GetAttr( yieldfrom, const_str_plain_close );
 
-                    if (unlikely( close_value == NULL ))
-                    {
-                        return NULL;
-                    }
+            if ( close_method )
+            {
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
 
-                    Py_DECREF( close_value );
-                }
-                else
+                if (unlikely( close_value == NULL ))
                 {
-                    PyObject *error = GET_ERROR_OCCURRED();
+                    Py_CLEAR( coroutine->m_exception_type );
+                    Py_CLEAR( coroutine->m_exception_value );
+                    Py_CLEAR( coroutine->m_exception_tb );
 
-                    if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
-                    {
-                        PyErr_WriteUnraisable( (PyObject *)value );
-                    }
+                    *returned_value = NULL;
+                    return NULL;
                 }
 
-                RAISE_COROUTINE_EXCEPTION( coroutine );
-
-                return NULL;
+                Py_DECREF( close_value );
             }
-
-            PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
-
-            if ( throw_method )
+            else
             {
-                retval = PyObject_CallFunctionObjArgs( throw_method, coroutine->m_exception_type, coroutine->m_exception_value, coroutine->m_exception_tb, NULL );
-                Py_DECREF( throw_method );
+                PyObject *error = GET_ERROR_OCCURRED();
 
-                if (unlikely( send_value == NULL ))
+                if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
                 {
-                    if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) )
-                    {
-                        return ERROR_GET_STOP_ITERATION_VALUE();
-                    }
-
-                    return NULL;
+                    PyErr_WriteUnraisable( (PyObject *)yieldfrom );
                 }
-
-                coroutine->m_exception_type = NULL;
-                coroutine->m_exception_value = NULL;
-                coroutine->m_exception_tb = NULL;
             }
-            else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
-            {
-                CLEAR_ERROR_OCCURRED();
 
-                RAISE_COROUTINE_EXCEPTION( coroutine );
+            RAISE_COROUTINE_EXCEPTION( coroutine );
 
-                return NULL;
-            }
-            else
-            {
-                assert( ERROR_OCCURRED() );
-
-                Py_CLEAR( coroutine->m_exception_type );
-                Py_CLEAR( coroutine->m_exception_value );
-                Py_CLEAR( coroutine->m_exception_tb );
+            *returned_value = NULL;
+            return NULL;
+        }
 
-                return NULL;
-            }
+        PyObject *throw_method = PyObject_GetAttr( yieldfrom, const_str_plain_throw );
 
-        }
-        else if ( PyGen_CheckExact( value ) || PyCoro_CheckExact( value ) )
-        {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-        else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
-        {
-            retval = Py_TYPE( value )->tp_iternext( value );
-        }
-        else
+        if ( throw_method )
         {
-            retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
-        }
+            retval = PyObject_CallFunctionObjArgs( throw_method, coroutine->m_exception_type, coroutine->m_exception_value, coroutine->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
 
-        // Check the sub-generator result
-        if ( retval == NULL )
+            Py_CLEAR( coroutine->m_exception_type );
+            Py_CLEAR( coroutine->m_exception_value );
+            Py_CLEAR( coroutine->m_exception_tb );
+        }
+        else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
         {
-            PyObject *error = GET_ERROR_OCCURRED();
-            if ( error == NULL )
-            {
-                Py_INCREF( Py_None );
-                return Py_None;
-            }
+            CLEAR_ERROR_OCCURRED();
 
-            // The sub-generator has given an exception. In case of
-            // StopIteration, we need to check the value, as it is going to be
-            // the expression value of this "yield from", and we are done. All
-            // other errors, we need to raise.
-            if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
-            {
-                return ERROR_GET_STOP_ITERATION_VALUE();
-            }
+            RAISE_COROUTINE_EXCEPTION( coroutine );
 
+            *returned_value = NULL;
             return NULL;
         }
         else
         {
-            coroutine->m_yielded = retval;
-
-            coroutine->m_yieldfrom = value;
-
-            // Return to the calling context.
-            swapFiber( &coroutine->m_yielder_context, &coroutine->m_caller_context );
-
-            coroutine->m_yieldfrom = NULL;
+            assert( ERROR_OCCURRED() );
 
-            send_value = coroutine->m_yielded;
+            Py_CLEAR( coroutine->m_exception_type );
+            Py_CLEAR( coroutine->m_exception_value );
+            Py_CLEAR( coroutine->m_exception_tb );
 
-            if ( ERROR_OCCURRED() )
-            {
-                assert( coroutine->m_exception_type != NULL );
-                CLEAR_ERROR_OCCURRED();
-                CHECK_OBJECT( coroutine->m_exception_type );
-            }
-
-            CHECK_OBJECT( send_value );
+            *returned_value = NULL;
+            return NULL;
         }
     }
-}
-
-
-PyObject *COROUTINE_AWAIT( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable )
-{
-#if _DEBUG_COROUTINE
-    PRINT_STRING("COROUTINE_AWAIT entry:");
-    PRINT_NEW_LINE();
-
-    PRINT_ITEM( awaitable );
-    PRINT_NEW_LINE();
-#endif
-
-    PyObject *awaitable_iter = PyCoro_GetAwaitableIter( awaitable );
-
-    if (unlikely( awaitable_iter == NULL ))
+    else if ( PyGen_CheckExact( yieldfrom ) || PyCoro_CheckExact( yieldfrom ) )
     {
-        return NULL;
+        retval = PyGen_Send( (PyGenObject *)yieldfrom, send_value );
     }
-
-#if PYTHON_VERSION >= 352 || !defined(_NUITKA_FULL_COMPAT)
-    /* This check got added in Python 3.5.2 only. It's good to do it, but
-     * not fully compatible, therefore guard it.
-     */
-
-    if ( Nuitka_Coroutine_Check( awaitable ) )
+    else if ( send_value == Py_None && Py_TYPE( yieldfrom )->tp_iternext != NULL )
     {
-        struct Nuitka_CoroutineObject *awaited_coroutine = (struct Nuitka_CoroutineObject *)awaitable;
-
-        if ( awaited_coroutine->m_awaiting )
-        {
-            Py_DECREF( awaitable_iter );
-
-            PyErr_Format(
-                PyExc_RuntimeError,
-                "coroutine is being awaited already"
-            );
-
-            return NULL;
-        }
-    }
-#endif
-
-    coroutine->m_awaiting = true;
-    PyObject *retval = yieldFromCoroutine( coroutine, awaitable_iter );
-    coroutine->m_awaiting = false;
-
-    Py_DECREF( awaitable_iter );
-
-#if _DEBUG_COROUTINE
-    PRINT_STRING("COROUTINE_AWAIT exit: ");
-
-    if ( retval )
-    {
-        PRINT_ITEM( retval );
+        retval = Py_TYPE( yieldfrom )->tp_iternext( yieldfrom );
     }
     else
     {
-        PRINT_CURRENT_EXCEPTION();
+        retval = PyObject_CallMethodObjArgs( yieldfrom, const_str_plain_send, send_value, NULL );
     }
 
-    PRINT_REFCOUNT( (PyObject *)coroutine );
-    PRINT_NEW_LINE();
-#endif
+    // Check the sub-generator result
+    if ( retval == NULL )
+    {
+        PyObject *error = GET_ERROR_OCCURRED();
+
+        if ( error == NULL )
+        {
+            Py_INCREF( Py_None );
+            *returned_value = Py_None;
+        }
+        // The sub-generator has given an exception. In case of StopIteration,
+        // we need to check the value, as it is going to be the expression
+        // value of this "await", and we are done. All other errors, we need
+        // to raise.
+        else if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+        {
+            *returned_value = ERROR_GET_STOP_ITERATION_VALUE();
+        }
+        else
+        {
+            *returned_value = NULL;
+        }
+    }
 
     return retval;
 }
 
-PyObject *COROUTINE_AWAIT_IN_HANDLER( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable )
+bool COROUTINE_AWAIT_START( struct Nuitka_CoroutineObject *coroutine, PyObject *awaitable )
 {
 #if _DEBUG_COROUTINE
-    PRINT_STRING("AWAIT entry:");
+    PRINT_STRING("COROUTINE_AWAIT_START entry:");
+    PRINT_NEW_LINE();
 
     PRINT_ITEM( awaitable );
     PRINT_NEW_LINE();
 #endif
 
+    assert( coroutine->m_yieldfrom == NULL );
+
     PyObject *awaitable_iter = PyCoro_GetAwaitableIter( awaitable );
 
     if (unlikely( awaitable_iter == NULL ))
     {
-        return NULL;
+        return false;
     }
 
 #if PYTHON_VERSION >= 352 || !defined(_NUITKA_FULL_COMPAT)
@@ -1326,7 +1148,7 @@ PyObject *COROUTINE_AWAIT_IN_HANDLER( struct Nuitka_CoroutineObject *coroutine,
     {
         struct Nuitka_CoroutineObject *awaited_coroutine = (struct Nuitka_CoroutineObject *)awaitable;
 
-        if ( awaited_coroutine->m_awaiting )
+        if ( awaited_coroutine->m_yieldfrom != NULL )
         {
             Py_DECREF( awaitable_iter );
 
@@ -1335,77 +1157,14 @@ PyObject *COROUTINE_AWAIT_IN_HANDLER( struct Nuitka_CoroutineObject *coroutine,
                 "coroutine is being awaited already"
             );
 
-            return NULL;
+            return false;
         }
     }
 #endif
 
+    coroutine->m_yieldfrom = awaitable_iter;
 
-    /* When yielding from an exception handler in Python3, the exception
-     * preserved to the frame is restore, while the current one is put there.
-     */
-    PyThreadState *thread_state = PyThreadState_GET();
-
-    PyObject *saved_exception_type = thread_state->exc_type;
-    PyObject *saved_exception_value = thread_state->exc_value;
-    PyObject *saved_exception_traceback = thread_state->exc_traceback;
-
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-#if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD exit:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
-#endif
-
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-    coroutine->m_awaiting = true;
-    PyObject *retval = yieldFromCoroutine( coroutine, awaitable_iter );
-    coroutine->m_awaiting = false;
-
-    Py_DECREF( awaitable_iter );
-
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
-
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
-
-#if _DEBUG_EXCEPTIONS
-    PRINT_STRING("YIELD return:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
-#endif
-
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-#if _DEBUG_COROUTINE
-    PRINT_STRING("AWAIT exit: ");
-
-    if ( retval )
-    {
-        PRINT_ITEM( retval );
-    }
-    else
-    {
-        PRINT_CURRENT_EXCEPTION();
-    }
-
-    PRINT_NEW_LINE();
-#endif
-
-    return retval;
+    return true;
 }
 
 
@@ -1534,7 +1293,7 @@ PyObject *Nuitka_AIterWrapper_New( PyObject *aiter )
 
 #endif
 
-PyObject *COROUTINE_ASYNC_MAKE_ITERATOR( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
+bool COROUTINE_ASYNC_MAKE_ITERATOR_START( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
 {
 #if _DEBUG_COROUTINE
     PRINT_STRING("AITER entry:");
@@ -1558,14 +1317,14 @@ PyObject *COROUTINE_ASYNC_MAKE_ITERATOR( struct Nuitka_CoroutineObject *coroutin
             Py_TYPE( value )->tp_name
         );
 
-        return NULL;
+        return false;
     }
 
     PyObject *iter = (*getter)( value );
 
     if (unlikely( iter == NULL ))
     {
-        return NULL;
+        return false;
     }
 
 #if PYTHON_VERSION >= 352
@@ -1599,25 +1358,18 @@ PyObject *COROUTINE_ASYNC_MAKE_ITERATOR( struct Nuitka_CoroutineObject *coroutin
 
         Py_DECREF( iter );
 
-        return NULL;
+        return false;
     }
 
     Py_DECREF( iter );
 
-    PyObject *retval = yieldFromCoroutine( coroutine, awaitable_iter );
-
-    Py_DECREF( awaitable_iter );
+    assert( coroutine->m_yieldfrom == NULL );
+    coroutine->m_yieldfrom = awaitable_iter;
 
-#if _DEBUG_COROUTINE
-    PRINT_STRING("AITER exit");
-    PRINT_ITEM( retval );
-    PRINT_NEW_LINE();
-#endif
-
-    return retval;
+    return true;
 }
 
-PyObject *COROUTINE_ASYNC_ITERATOR_NEXT( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
+bool COROUTINE_ASYNC_ITERATOR_NEXT_START( struct Nuitka_CoroutineObject *coroutine, PyObject *value )
 {
 #if _DEBUG_COROUTINE
     PRINT_STRING("ANEXT entry:");
@@ -1641,14 +1393,14 @@ PyObject *COROUTINE_ASYNC_ITERATOR_NEXT( struct Nuitka_CoroutineObject *coroutin
             Py_TYPE( value )->tp_name
         );
 
-        return NULL;
+        return false;
     }
 
     PyObject *next_value = (*getter)( value );
 
     if (unlikely( next_value == NULL ))
     {
-        return NULL;
+        return false;
     }
 
     PyObject *awaitable_iter = PyCoro_GetAwaitableIter( next_value );
@@ -1667,22 +1419,15 @@ PyObject *COROUTINE_ASYNC_ITERATOR_NEXT( struct Nuitka_CoroutineObject *coroutin
 
         Py_DECREF( next_value );
 
-        return NULL;
+        return false;
     }
 
     Py_DECREF( next_value );
 
-    PyObject *retval = yieldFromCoroutine( coroutine, awaitable_iter );
+    assert( coroutine->m_yieldfrom == NULL );
+    coroutine->m_yieldfrom = awaitable_iter;
 
-    Py_DECREF( awaitable_iter );
-
-#if _DEBUG_COROUTINE
-PRINT_STRING("ANEXT exit");
-PRINT_ITEM( retval );
-PRINT_NEW_LINE();
-#endif
-
-    return retval;
+    return true;
 }
 
 void _initCompiledCoroutineTypes( void )
@@ -163,6 +163,7 @@ static PyObject *Nuitka_Frame_getlocals( struct Nuitka_FrameObject *frame, void
             {
                 case NUITKA_TYPE_DESCRIPTION_OBJECT:
                 case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+                case NUITKA_TYPE_DESCRIPTION_NILONG:
                 {
                     PyObject *value = *(PyObject **)t;
                     PyDict_SetItem( result, *varnames, value );
@@ -281,6 +282,7 @@ static void Nuitka_Frame_tp_clear( struct Nuitka_FrameObject *frame )
             {
                 case NUITKA_TYPE_DESCRIPTION_OBJECT:
                 case NUITKA_TYPE_DESCRIPTION_OBJECT_PTR:
+                case NUITKA_TYPE_DESCRIPTION_NILONG:
                 {
                     PyObject *value = *(PyObject **)t;
                     Py_XDECREF( value );
@@ -723,6 +725,30 @@ void Nuitka_Frame_AttachLocals( struct Nuitka_FrameObject *frame, char const *ty
                 t += sizeof(value);
                 break;
             }
+            case NUITKA_TYPE_DESCRIPTION_NILONG:
+            {
+                /* We store the object only, creating it if necessary. */
+                nuitka_ilong *dual_value = va_arg( ap, nuitka_ilong * );
+                PyObject *value = NULL;
+
+                if ( dual_value->validity != NUITKA_ILONG_UNASSIGNED )
+                {
+                    value = ENFORCE_NILONG_OBJECT_VALUE( dual_value );
+
+                    // Without memory for the object, it appears as not
+                    // assigned, the exception being attached to is kept.
+                    if ( value == NULL )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                memcpy( t, &value, sizeof(value) );
+                Py_XINCREF( value );
+                t += sizeof(value);
+
+                break;
+            }
             default:
                 assert(false);
 
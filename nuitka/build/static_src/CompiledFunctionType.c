@@ -275,8 +275,17 @@ static PyObject *Nuitka_Function_get_closure( struct Nuitka_FunctionObject *obje
 
         for( Py_ssize_t i = 0; i < object->m_closure_given; i++ )
         {
-            PyTuple_SET_ITEM( result, i, (PyObject *)object->m_closure[i] );
-            Py_INCREF( (PyObject *)object->m_closure[i] );
+            // Values that are never changed are not in a cell, but they are
+            // expected to be.
+            if ( object->m_closure_values != NULL && object->m_closure_values[i] )
+            {
+                PyTuple_SET_ITEM( result, i, (PyObject *)PyCell_NEW0( (PyObject *)object->m_closure[i] ) );
+            }
+            else
+            {
+                PyTuple_SET_ITEM( result, i, (PyObject *)object->m_closure[i] );
+                Py_INCREF( (PyObject *)object->m_closure[i] );
+            }
         }
 
         return result;
@@ -676,6 +685,7 @@ struct Nuitka_FunctionObject *Nuitka_Function_New( function_impl_code c_code, Py
 
     /* Closure is set externally after we return */
     result->m_closure_given = closure_given;
+    result->m_closure_values = NULL;
 
     result->m_c_code = c_code;
 
@@ -2273,6 +2283,107 @@ PyObject *Nuitka_CallFunctionPosArgsKwArgs( struct Nuitka_FunctionObject const *
     return function->m_c_code( function, python_pars );
 }
 
+// Quick parsing for keyword argument values given after the positional ones,
+// with a tuple of their names, for functions with only plain parameters. The
+// names are matched by identity, both are interned. Gives false without an
+// exception, if the general parsing is needed, which also reports errors.
+static bool parseArgumentsVectorSimple( struct Nuitka_FunctionObject const *function, PyObject **python_pars, PyObject **args, Py_ssize_t args_size, PyObject *kw_names )
+{
+    if ( !function->m_args_simple ) return false;
+
+    Py_ssize_t arg_count = function->m_args_positional_count;
+    Py_ssize_t kw_size = PyTuple_GET_SIZE( kw_names );
+
+    if ( args_size + kw_size > arg_count ) return false;
+
+    memcpy( python_pars, args, args_size * sizeof(PyObject *) );
+    memset( python_pars + args_size, 0, ( arg_count - args_size ) * sizeof(PyObject *) );
+
+    for( Py_ssize_t i = 0; i < kw_size; i++ )
+    {
+        PyObject *kw_name = PyTuple_GET_ITEM( kw_names, i );
+
+        Py_ssize_t j;
+
+        for( j = args_size; j < arg_count; j++ )
+        {
+            if ( function->m_varnames[ j ] == kw_name ) break;
+        }
+
+        if ( j == arg_count || python_pars[ j ] != NULL ) return false;
+
+        python_pars[ j ] = args[ args_size + i ];
+    }
+
+    Py_ssize_t defaults_given = function->m_defaults_given;
+
+    for( Py_ssize_t i = args_size; i < arg_count; i++ )
+    {
+        if ( python_pars[ i ] == NULL )
+        {
+            if ( i + defaults_given < arg_count ) return false;
+
+            python_pars[ i ] = PyTuple_GET_ITEM( function->m_defaults, defaults_given + i - arg_count );
+        }
+    }
+
+    for( Py_ssize_t i = 0; i < arg_count; i++ )
+    {
+        Py_INCREF( python_pars[ i ] );
+    }
+
+    return true;
+}
+
+PyObject *Nuitka_CallFunctionVectorcall( struct Nuitka_FunctionObject const *function, PyObject **args, Py_ssize_t args_size, PyObject *kw_names )
+{
+    assert( PyTuple_CheckExact( kw_names ) );
+
+#ifdef _MSC_VER
+    PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * function->m_args_overall_count );
+#else
+    PyObject *python_pars[ function->m_args_overall_count ];
+#endif
+
+    if ( parseArgumentsVectorSimple( function, python_pars, args, args_size, kw_names ) )
+    {
+        return function->m_c_code( function, python_pars );
+    }
+
+    // Otherwise the keyword arguments dictionary is needed after all.
+    Py_ssize_t kw_size = PyTuple_GET_SIZE( kw_names );
+
+    PyObject *kw = _PyDict_NewPresized( kw_size );
+
+    for( Py_ssize_t i = 0; i < kw_size; i++ )
+    {
+        int res = PyDict_SetItem( kw, PyTuple_GET_ITEM( kw_names, i ), args[ args_size + i ] );
+
+        if (unlikely( res != 0 ))
+        {
+            Py_DECREF( kw );
+            return NULL;
+        }
+    }
+
+    memset( python_pars, 0, function->m_args_overall_count * sizeof(PyObject *) );
+
+    PyObject *result;
+
+    if ( parseArgumentsFull( function, python_pars, args, args_size, kw ) )
+    {
+        result = function->m_c_code( function, python_pars );
+    }
+    else
+    {
+        result = NULL;
+    }
+
+    Py_DECREF( kw );
+
+    return result;
+}
+
 PyObject *Nuitka_CallMethodFunctionNoArgs( struct Nuitka_FunctionObject const *function, PyObject *object )
 {
 #ifdef _MSC_VER
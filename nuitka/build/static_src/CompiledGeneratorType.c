@@ -61,34 +61,72 @@ static void Nuitka_Generator_release_closure( struct Nuitka_GeneratorObject *gen
     generator->m_closure_given = 0;
 }
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-// For the generator object fiber entry point, we may need to follow what
-// "makecontext" will support and that is only a list of integers, but we will need
-// to push a pointer through it, and so it's two of them, which might be fully
-// sufficient.
-
-#ifdef _NUITKA_MAKECONTEXT_INTS
-static void Nuitka_Generator_entry_point( int address_1, int address_2 )
+static void RAISE_GENERATOR_EXCEPTION( struct Nuitka_GeneratorObject *generator )
 {
-    // Restore the pointer from integers should it be necessary, depending on
-    // the platform. This requires pointers to be no larger that to "int" value.
-    int addresses[2] =
-    {
-        address_1,
-        address_2
-    };
+    CHECK_OBJECT( generator->m_exception_type );
 
-    struct Nuitka_GeneratorObject *generator = (struct Nuitka_GeneratorObject *)*(uintptr_t *)&addresses[0];
-#else
-static void Nuitka_Generator_entry_point( struct Nuitka_GeneratorObject *generator )
+    RESTORE_ERROR_OCCURRED(
+        generator->m_exception_type,
+        generator->m_exception_value,
+        generator->m_exception_tb
+    );
+
+    generator->m_exception_type = NULL;
+    generator->m_exception_value = NULL;
+    generator->m_exception_tb = NULL;
+}
+
+
+#if PYTHON_VERSION >= 330
+static PyObject *_Nuitka_Generator_yieldfrom( struct Nuitka_GeneratorObject *generator, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value );
+#endif
+
+// Continue the generator code where it left off, or the object it currently
+// yields from, with the value sent or the exception thrown into it.
+static PyObject *_Nuitka_Generator_resume( struct Nuitka_GeneratorObject *generator, PyObject *value )
 {
+    while( 1 )
+    {
+#if PYTHON_VERSION >= 330
+        PyObject *yieldfrom = generator->m_yieldfrom;
+
+        if ( yieldfrom != NULL )
+        {
+            PyObject *yielded = _Nuitka_Generator_yieldfrom( generator, yieldfrom, value, &value );
+
+            if ( yielded != NULL )
+            {
+                return yielded;
+            }
+
+            // Done with it, the generator code continues with the result as
+            // a new reference, or NULL for the error set.
+            generator->m_yieldfrom = NULL;
+            Py_DECREF( yieldfrom );
+        }
+        else
 #endif
-    ((generator_code)generator->m_code)( generator );
+        if (unlikely( generator->m_exception_type ))
+        {
+            RAISE_GENERATOR_EXCEPTION( generator );
 
-    swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
-}
+            value = NULL;
+        }
+
+        PyObject *yielded = ((generator_code)generator->m_code)( generator, value );
+
+#if PYTHON_VERSION >= 330
+        // A "yield from" was started, start the iteration of it.
+        if ( yielded == NULL && generator->m_yieldfrom != NULL )
+        {
+            value = Py_None;
+            continue;
+        }
 #endif
 
+        return yielded;
+    }
+}
 
 static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generator, PyObject *value )
 {
@@ -119,18 +157,6 @@ static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generato
 
         if ( generator->m_status == status_Unused )
         {
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-
-            // Prepare the generator context to run.
-            int res = prepareFiber( &generator->m_yielder_context, (void *)Nuitka_Generator_entry_point, (uintptr_t)generator );
-
-            if ( res != 0 )
-            {
-                PyErr_Format( PyExc_MemoryError, "generator cannot be allocated" );
-                return NULL;
-            }
-#endif
-
             generator->m_status = status_Running;
         }
 
@@ -156,19 +182,14 @@ static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generato
             generator->m_frame->m_frame.f_back = return_frame;
 
             thread_state->frame = &generator->m_frame->m_frame;
+
+            Nuitka_Frame_MarkAsExecuting( generator->m_frame );
         }
 
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-
-        PyObject *yielded = ((generator_code)generator->m_code)( generator, value );
-#else
-        generator->m_yielded = value;
-        swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
-        PyObject *yielded = generator->m_yielded;
-#endif
+        PyObject *yielded = _Nuitka_Generator_resume( generator, value );
 
         generator->m_running = false;
 
@@ -180,6 +201,8 @@ static PyObject *Nuitka_Generator_send2( struct Nuitka_GeneratorObject *generato
             assert( thread_state->frame == &generator->m_frame->m_frame );
             assertFrameObject( generator->m_frame );
 
+            Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+
             Py_CLEAR( generator->m_frame->m_frame.f_back );
         }
 
@@ -627,13 +650,13 @@ static void Nuitka_Generator_tp_dealloc( struct Nuitka_GeneratorObject *generato
 
     Py_XDECREF( generator->m_frame );
 
+#if PYTHON_VERSION >= 330
+    Py_CLEAR( generator->m_yieldfrom );
+#endif
+
     assert( Py_REFCNT( generator ) == 1 );
     Py_REFCNT( generator ) = 0;
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-    releaseFiber( &generator->m_yielder_context );
-#endif
-
     // Now it is safe to release references and memory for it.
     Nuitka_GC_UnTrack( generator );
 
@@ -869,25 +892,32 @@ void _initCompiledGeneratorType( void )
 }
 
 #if PYTHON_VERSION < 350
-PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyCodeObject *code_object, Py_ssize_t closure_given )
+PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size )
 #else
-PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given )
+PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject *name, PyObject *qualname, PyCodeObject *code_object, Py_ssize_t closure_given, Py_ssize_t heap_storage_size )
 #endif
 {
     struct Nuitka_GeneratorObject *result;
 
+    // The heap storage is allocated after the closure, in units of the items
+    // of the object.
+    Py_ssize_t full_size = closure_given +
+        ( heap_storage_size + sizeof(struct Nuitka_CellObject *) - 1 ) / sizeof(struct Nuitka_CellObject *);
+
     // Macro to assign result memory from GC or free list.
     allocateFromFreeList(
         free_list_generators,
         struct Nuitka_GeneratorObject,
         Nuitka_Generator_Type,
-        closure_given
+        full_size
     );
 
     assert( result != NULL );
     CHECK_OBJECT( result );
 
-    assert( Py_SIZE( result ) >= closure_given );
+    assert( Py_SIZE( result ) >= full_size );
+
+    result->m_heap_storage = &result->m_closure[ closure_given ];
 
     result->m_code = (void *)code;
 
@@ -904,6 +934,9 @@ PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject
     result->m_qualname = qualname;
     Py_INCREF( qualname );
 
+#endif
+
+#if PYTHON_VERSION >= 330
     result->m_yieldfrom = NULL;
 #endif
 
@@ -919,19 +952,11 @@ PyObject *Nuitka_Generator_New( generator_code code, PyObject *module, PyObject
     result->m_exception_value = NULL;
     result->m_exception_tb = NULL;
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-    result->m_yielded = NULL;
-#else
     result->m_yield_return_index = 0;
-#endif
 
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
-#ifndef _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
-    initFiber( &result->m_yielder_context );
-#endif
-
     Nuitka_GC_Track( result );
     return (PyObject *)result;
 }
@@ -1088,409 +1113,148 @@ PyObject *ERROR_GET_STOP_ITERATION_VALUE()
     return value;
 }
 
-static void RAISE_GENERATOR_EXCEPTION( struct Nuitka_GeneratorObject *generator )
-{
-    CHECK_OBJECT( generator->m_exception_type );
-
-    RESTORE_ERROR_OCCURRED(
-        generator->m_exception_type,
-        generator->m_exception_value,
-        generator->m_exception_tb
-    );
-
-    generator->m_exception_type = NULL;
-    generator->m_exception_value = NULL;
-    generator->m_exception_tb = NULL;
-}
-
-extern PyObject *ERROR_GET_STOP_ITERATION_VALUE();
-
 extern PyObject *const_str_plain_send, *const_str_plain_throw, *const_str_plain_close;
 
-static PyObject *_YIELD_FROM( struct Nuitka_GeneratorObject *generator, PyObject *value )
+// Send a value into the object yielded from, or throw the exception set on the
+// generator into it. Returns the value to yield, or NULL when the "yield from"
+// is complete, then "returned_value" is its result or NULL for an error.
+static PyObject *_Nuitka_Generator_yieldfrom( struct Nuitka_GeneratorObject *generator, PyObject *yieldfrom, PyObject *send_value, PyObject **returned_value )
 {
-    // This is the value, propagated back and forth the sub-generator and the
-    // yield from consumer.
-    PyObject *send_value = Py_None;
+    PyObject *retval;
 
-    while( 1 )
+    // Exception, was thrown into us, need to send that to sub-generator.
+    if ( generator->m_exception_type )
     {
-        // Send iteration value to the sub-generator, which may be a CPython
-        // generator object, something with an iterator next, or a send method,
-        // where the later is only required if values other than "None" need to
-        // be passed in.
-        PyObject *retval;
-
-        // Exception, was thrown into us, need to send that to sub-generator.
-        if ( generator->m_exception_type )
+        // The yielding generator is being closed, but we also are tasked to
+        // immediately close the currently running sub-generator.
+        if ( EXCEPTION_MATCH_BOOL_SINGLE( generator->m_exception_type, PyExc_GeneratorExit ) )
         {
-            // The yielding generator is being closed, but we also are tasked to
-            // immediately close the currently running sub-generator.
-            if ( EXCEPTION_MATCH_BOOL_SINGLE( generator->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
-
-                if ( close_method )
-                {
-                    PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
-                    Py_DECREF( close_method );
+            PyObject *close_method = PyObject_GetAttr( yieldfrom, const_str_plain_close );
 
-                    if (unlikely( close_value == NULL ))
-                    {
-                        return NULL;
-                    }
+            if ( close_method )
+            {
+                PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
+                Py_DECREF( close_method );
 
-                    Py_DECREF( close_value );
-                }
-                else
+                if (unlikely( close_value == NULL ))
                 {
-                    PyObject *error = GET_ERROR_OCCURRED();
+                    Py_CLEAR( generator->m_exception_type );
+                    Py_CLEAR( generator->m_exception_value );
+                    Py_CLEAR( generator->m_exception_tb );
 
-                    if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
-                    {
-                        PyErr_WriteUnraisable( (PyObject *)value );
-                    }
+                    *returned_value = NULL;
+                    return NULL;
                 }
 
-                RAISE_GENERATOR_EXCEPTION( generator );
-
-                return NULL;
+                Py_DECREF( close_value );
             }
-
-            PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
-
-            if ( throw_method )
+            else
             {
-                retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
-                Py_DECREF( throw_method );
+                PyObject *error = GET_ERROR_OCCURRED();
 
-                if (unlikely( send_value == NULL ))
+                if ( error != NULL && !EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_AttributeError ) )
                 {
-                    if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) )
-                    {
-                        return ERROR_GET_STOP_ITERATION_VALUE();
-                    }
-
-                    return NULL;
+                    PyErr_WriteUnraisable( (PyObject *)yieldfrom );
                 }
-
-                generator->m_exception_type = NULL;
-                generator->m_exception_value = NULL;
-                generator->m_exception_tb = NULL;
             }
-            else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
-            {
-                CLEAR_ERROR_OCCURRED();
-
-                RAISE_GENERATOR_EXCEPTION( generator );
 
-                return NULL;
-            }
-            else
-            {
-                assert( ERROR_OCCURRED() );
+            RAISE_GENERATOR_EXCEPTION( generator );
 
-                Py_CLEAR( generator->m_exception_type );
-                Py_CLEAR( generator->m_exception_value );
-                Py_CLEAR( generator->m_exception_tb );
+            *returned_value = NULL;
+            return NULL;
+        }
 
-                return NULL;
-            }
+        PyObject *throw_method = PyObject_GetAttr( yieldfrom, const_str_plain_throw );
 
-        }
-        else if ( PyGen_CheckExact( value ) )
-        {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-#if PYTHON_VERSION >= 350
-        else if ( PyCoro_CheckExact( value ) )
-        {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-#endif
-        else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
-        {
-            retval = Py_TYPE( value )->tp_iternext( value );
-        }
-        else
+        if ( throw_method )
         {
-            // Bug compatibility here, before 3.3 tuples were unrolled in calls, which is what
-            // PyObject_CallMethod does.
-#if PYTHON_VERSION >= 340
-            retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
-#else
-            retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
-#endif
-        }
+            retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
+            Py_DECREF( throw_method );
 
-        // Check the sub-generator result
-        if ( retval == NULL )
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
+        }
+        else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
         {
-            PyObject *error = GET_ERROR_OCCURRED();
-            if ( error == NULL )
-            {
-                Py_INCREF( Py_None );
-                return Py_None;
-            }
+            CLEAR_ERROR_OCCURRED();
 
-            // The sub-generator has given an exception. In case of
-            // StopIteration, we need to check the value, as it is going to be
-            // the expression value of this "yield from", and we are done. All
-            // other errors, we need to raise.
-            if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
-            {
-                return ERROR_GET_STOP_ITERATION_VALUE();
-            }
+            RAISE_GENERATOR_EXCEPTION( generator );
 
+            *returned_value = NULL;
             return NULL;
         }
         else
         {
-            generator->m_yielded = retval;
+            assert( ERROR_OCCURRED() );
 
-#if PYTHON_VERSION >= 350
-            generator->m_yieldfrom = value;
-#endif
-            // Return to the calling context.
-            swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
-
-#if PYTHON_VERSION >= 350
-            generator->m_yieldfrom = NULL;
-#endif
+            Py_CLEAR( generator->m_exception_type );
+            Py_CLEAR( generator->m_exception_value );
+            Py_CLEAR( generator->m_exception_tb );
 
-            send_value = generator->m_yielded;
-
-            CHECK_OBJECT( send_value );
+            *returned_value = NULL;
+            return NULL;
         }
     }
-}
-
-PyObject *GENERATOR_YIELD_FROM( struct Nuitka_GeneratorObject *generator, PyObject *target )
-{
-    PyObject *value;
-
+    else if ( Nuitka_Generator_Check( yieldfrom ) )
+    {
+        retval = Nuitka_Generator_send2( (struct Nuitka_GeneratorObject *)yieldfrom, send_value );
+    }
+    else if ( PyGen_CheckExact( yieldfrom ) )
+    {
+        retval = PyGen_Send( (PyGenObject *)yieldfrom, send_value );
+    }
 #if PYTHON_VERSION >= 350
-    if ( PyCoro_CheckExact( target ) || Nuitka_Coroutine_Check( target ))
+    else if ( PyCoro_CheckExact( yieldfrom ) )
     {
-        if (unlikely( (generator->m_code_object->co_flags & CO_ITERABLE_COROUTINE) == 0 ))
-        {
-            PyErr_SetString(
-                PyExc_TypeError,
-                "cannot 'yield from' a coroutine object in a non-coroutine generator"
-            );
-            return NULL;
-        }
-
-        return _YIELD_FROM( generator, target );
+        retval = PyGen_Send( (PyGenObject *)yieldfrom, send_value );
     }
-    else
 #endif
+    else if ( send_value == Py_None && Py_TYPE( yieldfrom )->tp_iternext != NULL )
     {
-        value = MAKE_ITERATOR( target );
-
-        if (unlikely( value == NULL ))
-        {
-            return NULL;
-        }
-
-        PyObject *result = _YIELD_FROM( generator, value );
-
-        Py_DECREF( value );
-
-        return result;
+        retval = Py_TYPE( yieldfrom )->tp_iternext( yieldfrom );
     }
-}
-
-// Note: This is copy if YIELD_FROM with changes only at the end. As it's not
-// easy to split up, we are going to tolerate the copy.
-static PyObject *_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *generator, PyObject *value )
-{
-
-    // This is the value, propagated back and forth the sub-generator and the
-    // yield from consumer.
-    PyObject *send_value = Py_None;
-
-    while( 1 )
+    else
     {
-        // Send iteration value to the sub-generator, which may be a CPython
-        // generator object, something with an iterator next, or a send method,
-        // where the later is only required if values other than "None" need to
-        // be passed in.
-        PyObject *retval;
-
-        // Exception, was thrown into us, need to send that to sub-generator.
-        if ( generator->m_exception_type )
-        {
-            // The yielding generator is being closed, but we also are tasked to
-            // immediately close the currently running sub-generator.
-            if ( EXCEPTION_MATCH_BOOL_SINGLE( generator->m_exception_type, PyExc_GeneratorExit ) )
-            {
-                PyObject *close_method = PyObject_GetAttr( value, const_str_plain_close );
-
-                if ( close_method )
-                {
-                    PyObject *close_value = PyObject_Call( close_method, const_tuple_empty, NULL );
-                    Py_DECREF( close_method );
-
-                    if (unlikely( close_value == NULL ))
-                    {
-                        return NULL;
-                    }
-
-                    Py_DECREF( close_value );
-                }
-                else if ( !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
-                {
-                    PyErr_WriteUnraisable( (PyObject *)value );
-                }
-
-                RAISE_GENERATOR_EXCEPTION( generator );
-
-                return NULL;
-            }
-
-            PyObject *throw_method = PyObject_GetAttr( value, const_str_plain_throw );
-
-            if ( throw_method )
-            {
-                retval = PyObject_CallFunctionObjArgs( throw_method, generator->m_exception_type, generator->m_exception_value, generator->m_exception_tb, NULL );
-                Py_DECREF( throw_method );
-
-                if (unlikely( send_value == NULL ))
-                {
-                    if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) )
-                    {
-                        return ERROR_GET_STOP_ITERATION_VALUE();
-                    }
-
-                    return NULL;
-                }
-
-
-                generator->m_exception_type = NULL;
-                generator->m_exception_value = NULL;
-                generator->m_exception_tb = NULL;
-            }
-            else if ( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_AttributeError ) )
-            {
-                CLEAR_ERROR_OCCURRED();
-
-                RAISE_GENERATOR_EXCEPTION( generator );
-
-                return NULL;
-            }
-            else
-            {
-                assert( ERROR_OCCURRED() );
-
-                Py_CLEAR( generator->m_exception_type );
-                Py_CLEAR( generator->m_exception_value );
-                Py_CLEAR( generator->m_exception_tb );
-
-                return NULL;
-            }
-
-        }
-        else if ( PyGen_CheckExact( value ) )
-        {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-#if PYTHON_VERSION >= 350
-        else if ( PyCoro_CheckExact( value ) )
-        {
-            retval = PyGen_Send( (PyGenObject *)value, Py_None );
-        }
-#endif
-        else if ( send_value == Py_None && Py_TYPE( value )->tp_iternext != NULL )
-        {
-            retval = Py_TYPE( value )->tp_iternext( value );
-        }
-        else
-        {
-            // Bug compatibility here, before 3.3 tuples were unrolled in calls, which is what
-            // PyObject_CallMethod does.
+        // Bug compatibility here, before 3.3 tuples were unrolled in calls, which is what
+        // PyObject_CallMethod does.
 #if PYTHON_VERSION >= 340
-            retval = PyObject_CallMethodObjArgs( value, const_str_plain_send, send_value, NULL );
+        retval = PyObject_CallMethodObjArgs( yieldfrom, const_str_plain_send, send_value, NULL );
 #else
-            retval = PyObject_CallMethod( value, (char *)"send", (char *)"O", send_value );
+        retval = PyObject_CallMethod( yieldfrom, (char *)"send", (char *)"O", send_value );
 #endif
-        }
-
-        // Check the sub-generator result
-        if ( retval == NULL )
-        {
-            if ( !ERROR_OCCURRED() )
-            {
-                Py_INCREF( Py_None );
-                return Py_None;
-            }
+    }
 
-            // The sub-generator has given an exception. In case of
-            // StopIteration, we need to check the value, as it is going to be
-            // the expression value of this "yield from", and we are done. All
-            // other errors, we need to raise.
-            if (likely( EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) ))
-            {
-                return ERROR_GET_STOP_ITERATION_VALUE();
-            }
+    // Check the sub-generator result
+    if ( retval == NULL )
+    {
+        PyObject *error = GET_ERROR_OCCURRED();
 
-            return NULL;
+        if ( error == NULL )
+        {
+            Py_INCREF( Py_None );
+            *returned_value = Py_None;
+        }
+        // The sub-generator has given an exception. In case of StopIteration,
+        // we need to check the value, as it is going to be the expression
+        // value of this "yield from", and we are done. All other errors, we
+        // need to raise.
+        else if (likely( EXCEPTION_MATCH_BOOL_SINGLE( error, PyExc_StopIteration ) ))
+        {
+            *returned_value = ERROR_GET_STOP_ITERATION_VALUE();
         }
         else
         {
-            generator->m_yielded = retval;
-
-            // When yielding from an exception handler in Python3, the exception
-            // preserved to the frame is restore, while the current one is put there.
-            PyThreadState *thread_state = PyThreadState_GET();
-
-            PyObject *saved_exception_type = thread_state->exc_type;
-            PyObject *saved_exception_value = thread_state->exc_value;
-            PyObject *saved_exception_traceback = thread_state->exc_traceback;
-
-            thread_state->exc_type = thread_state->frame->f_exc_type;
-            thread_state->exc_value = thread_state->frame->f_exc_value;
-            thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-            thread_state->frame->f_exc_type = saved_exception_type;
-            thread_state->frame->f_exc_value = saved_exception_value;
-            thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-#if PYTHON_VERSION >= 350
-            generator->m_yieldfrom = value;
-#endif
-            // Return to the calling context.
-            swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
-
-#if PYTHON_VERSION >= 350
-            generator->m_yieldfrom = NULL;
-#endif
-            // When returning from yield, the exception of the frame is preserved, and
-            // the one that enters should be there.
-            thread_state = PyThreadState_GET();
-
-            saved_exception_type = thread_state->exc_type;
-            saved_exception_value = thread_state->exc_value;
-            saved_exception_traceback = thread_state->exc_traceback;
-
-            thread_state->exc_type = thread_state->frame->f_exc_type;
-            thread_state->exc_value = thread_state->frame->f_exc_value;
-            thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-            thread_state->frame->f_exc_type = saved_exception_type;
-            thread_state->frame->f_exc_value = saved_exception_value;
-            thread_state->frame->f_exc_traceback = saved_exception_traceback;
-
-            send_value = generator->m_yielded;
-
-            CHECK_OBJECT( send_value );
+            *returned_value = NULL;
         }
     }
+
+    return retval;
 }
 
-PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *generator, PyObject *target )
+bool GENERATOR_YIELD_FROM_START( struct Nuitka_GeneratorObject *generator, PyObject *target )
 {
-    PyObject *value;
+    assert( generator->m_yieldfrom == NULL );
 
 #if PYTHON_VERSION >= 350
     if ( PyCoro_CheckExact( target ) || Nuitka_Coroutine_Check( target ))
@@ -1501,27 +1265,26 @@ PyObject *GENERATOR_YIELD_FROM_IN_HANDLER( struct Nuitka_GeneratorObject *genera
                 PyExc_TypeError,
                 "cannot 'yield from' a coroutine object in a non-coroutine generator"
             );
-            return NULL;
+            return false;
         }
 
-        return _YIELD_FROM_IN_HANDLER( generator, target );
+        Py_INCREF( target );
+        generator->m_yieldfrom = target;
+
+        return true;
     }
-    else
 #endif
-    {
-        value = MAKE_ITERATOR( target );
 
-        if (unlikely( value == NULL ))
-        {
-            return NULL;
-        }
+    PyObject *iter = MAKE_ITERATOR( target );
 
-        PyObject *result = _YIELD_FROM_IN_HANDLER( generator, value );
+    if (unlikely( iter == NULL ))
+    {
+        return false;
+    }
 
-        Py_DECREF( value );
+    generator->m_yieldfrom = iter;
 
-        return result;
-    }
+    return true;
 }
 
 #endif
@@ -927,3 +927,211 @@ PyObject *BUILTIN_DIVMOD( PyObject *operand1, PyObject *operand2 )
 
 	return NULL;
 }
+
+/** The "min" and "max" built-ins.
+ *
+ * The two arguments variants are here, the iterating ones live with "sum",
+ * as they share the quick iteration.
+ *
+ **/
+
+PyObject *BUILTIN_MIN2( PyObject *value1, PyObject *value2 )
+{
+    CHECK_OBJECT( value1 );
+    CHECK_OBJECT( value2 );
+
+    int res = PyObject_RichCompareBool( value2, value1, Py_LT );
+
+    if (unlikely( res == -1 ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = res ? value2 : value1;
+
+    Py_INCREF( result );
+    return result;
+}
+
+PyObject *BUILTIN_MAX2( PyObject *value1, PyObject *value2 )
+{
+    CHECK_OBJECT( value1 );
+    CHECK_OBJECT( value2 );
+
+    int res = PyObject_RichCompareBool( value2, value1, Py_GT );
+
+    if (unlikely( res == -1 ))
+    {
+        return NULL;
+    }
+
+    PyObject *result = res ? value2 : value1;
+
+    Py_INCREF( result );
+    return result;
+}
+
+/** The "sorted" built-in.
+ *
+ * Only the variant without "key", "cmp" and "reverse" arguments.
+ *
+ **/
+
+PyObject *BUILTIN_SORTED( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    PyObject *result = PySequence_List( value );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    int res = PyList_Sort( result );
+
+    if (unlikely( res == -1 ))
+    {
+        Py_DECREF( result );
+        return NULL;
+    }
+
+    return result;
+}
+
+/** The "enumerate" built-in.
+ *
+ * The start value is optional.
+ *
+ **/
+
+PyObject *BUILTIN_ENUMERATE( PyObject *value, PyObject *start )
+{
+    CHECK_OBJECT( value );
+
+    if ( start == NULL )
+    {
+        PyObject *args[] = { value };
+
+        return CALL_FUNCTION_WITH_ARGS1( (PyObject *)&PyEnum_Type, args );
+    }
+    else
+    {
+        PyObject *args[] = { value, start };
+
+        return CALL_FUNCTION_WITH_ARGS2( (PyObject *)&PyEnum_Type, args );
+    }
+}
+
+/** The "reversed" built-in.
+ *
+ **/
+
+PyObject *BUILTIN_REVERSED( PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    PyObject *args[] = { value };
+
+    return CALL_FUNCTION_WITH_ARGS1( (PyObject *)&PyReversed_Type, args );
+}
+
+/** The "zip" built-in.
+ *
+ * For Python2 it creates the list directly, for Python3 it makes the "zip"
+ * iterator object.
+ *
+ **/
+
+PyObject *BUILTIN_ZIP( PyObject **args, Py_ssize_t args_size )
+{
+#if PYTHON_VERSION < 300
+    PyObject *result = PyList_New( 0 );
+
+    if ( args_size == 0 )
+    {
+        return result;
+    }
+
+    PyObject *iterators = PyTuple_New( args_size );
+
+    for ( Py_ssize_t i = 0; i < args_size; i++ )
+    {
+        CHECK_OBJECT( args[i] );
+
+        PyObject *iterator = PyObject_GetIter( args[i] );
+
+        if (unlikely( iterator == NULL ))
+        {
+            if ( PyErr_ExceptionMatches( PyExc_TypeError ) )
+            {
+                PyErr_Format(
+                    PyExc_TypeError,
+                    "zip argument #%zd must support iteration",
+                    i + 1
+                );
+            }
+
+            Py_DECREF( iterators );
+            Py_DECREF( result );
+
+            return NULL;
+        }
+
+        PyTuple_SET_ITEM( iterators, i, iterator );
+    }
+
+    for(;;)
+    {
+        PyObject *item = PyTuple_New( args_size );
+
+        for ( Py_ssize_t i = 0; i < args_size; i++ )
+        {
+            PyObject *element = PyIter_Next( PyTuple_GET_ITEM( iterators, i ) );
+
+            if ( element == NULL )
+            {
+                Py_DECREF( item );
+                Py_DECREF( iterators );
+
+                if (unlikely( ERROR_OCCURRED() ))
+                {
+                    Py_DECREF( result );
+                    return NULL;
+                }
+
+                return result;
+            }
+
+            PyTuple_SET_ITEM( item, i, element );
+        }
+
+        int res = PyList_Append( result, item );
+        Py_DECREF( item );
+
+        if (unlikely( res == -1 ))
+        {
+            Py_DECREF( iterators );
+            Py_DECREF( result );
+
+            return NULL;
+        }
+    }
+#else
+    PyObject *args_tuple = PyTuple_New( args_size );
+
+    for ( Py_ssize_t i = 0; i < args_size; i++ )
+    {
+        CHECK_OBJECT( args[i] );
+
+        PyTuple_SET_ITEM( args_tuple, i, args[i] );
+        Py_INCREF( args[i] );
+    }
+
+    PyObject *result = CALL_FUNCTION_WITH_POSARGS( (PyObject *)&PyZip_Type, args_tuple );
+
+    Py_DECREF( args_tuple );
+
+    return result;
+#endif
+}
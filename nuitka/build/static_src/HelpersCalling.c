@@ -91,6 +91,23 @@ PyObject *callPythonFunction( PyObject *func, PyObject **args, int count )
     return result;
 }
 
+// Call of a function with "self" prepended to the positional arguments, as the
+// bound method would do.
+static PyObject *callPythonMethodFunction( PyObject *func, PyObject *self, PyObject *positional_args )
+{
+    Py_ssize_t args_size = PyTuple_GET_SIZE( positional_args );
+
+#ifdef _MSC_VER
+    PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * ( args_size + 1 ) );
+#else
+    PyObject *python_pars[ args_size + 1 ];
+#endif
+    python_pars[ 0 ] = self;
+    memcpy( python_pars + 1, &PyTuple_GET_ITEM( positional_args, 0 ), args_size * sizeof( PyObject * ) );
+
+    return callPythonFunction( func, python_pars, (int)( args_size + 1 ) );
+}
+
 static PyObject *_fast_function_noargs( PyObject *func )
 {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE( func );
@@ -273,6 +290,196 @@ PyObject *CALL_FUNCTION_NO_ARGS( PyObject *called )
     );
 }
 
+// Compiled functions and bound compiled methods take the argument values and
+// keyword argument names directly, without a tuple and dictionary.
+static bool isCompiledVectorcallCallable( PyObject *called )
+{
+    if ( Nuitka_Function_Check( called ) )
+    {
+        return true;
+    }
+
+    // Unbound method, let the error path be slow.
+    return Nuitka_Method_Check( called ) && ((struct Nuitka_MethodObject *)called)->m_object != NULL;
+}
+
+static PyObject *callCompiledWithArgsKwNames( PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names )
+{
+    Py_ssize_t kw_size = PyTuple_GET_SIZE( kw_names );
+
+    // Check if arguments are valid objects in debug mode.
+#ifndef __NUITKA_NO_ASSERT__
+    for( Py_ssize_t i = 0; i < args_size + kw_size; i++ )
+    {
+        CHECK_OBJECT( args[ i ] );
+    }
+#endif
+
+    if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+    {
+        return NULL;
+    }
+
+    PyObject *result;
+
+    if ( Nuitka_Function_Check( called ) )
+    {
+        result = Nuitka_CallFunctionVectorcall(
+            (struct Nuitka_FunctionObject *)called,
+            args,
+            args_size,
+            kw_names
+        );
+    }
+    else
+    {
+        struct Nuitka_MethodObject *method = (struct Nuitka_MethodObject *)called;
+
+#ifdef _MSC_VER
+        PyObject **new_args = (PyObject **)_alloca( sizeof( PyObject * ) * ( args_size + kw_size + 1 ) );
+#else
+        PyObject *new_args[ args_size + kw_size + 1 ];
+#endif
+        new_args[ 0 ] = method->m_object;
+        memcpy( new_args + 1, args, ( args_size + kw_size ) * sizeof( PyObject * ) );
+
+        result = Nuitka_CallFunctionVectorcall(
+            method->m_function,
+            new_args,
+            args_size + 1,
+            kw_names
+        );
+    }
+
+    Py_LeaveRecursiveCall();
+
+    return result;
+}
+
+PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES( PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names )
+{
+    CHECK_OBJECT( called );
+    CHECK_OBJECT( kw_names );
+    assert( PyTuple_CheckExact( kw_names ) );
+
+    if ( isCompiledVectorcallCallable( called ) )
+    {
+        return callCompiledWithArgsKwNames( called, args, args_size, kw_names );
+    }
+
+    Py_ssize_t kw_size = PyTuple_GET_SIZE( kw_names );
+
+    // Other callables need the argument tuple and dictionary.
+    PyObject *pos_args = MAKE_TUPLE( args, args_size );
+    PyObject *named_args = _PyDict_NewPresized( kw_size );
+
+    for( Py_ssize_t i = 0; i < kw_size; i++ )
+    {
+        int res = PyDict_SetItem( named_args, PyTuple_GET_ITEM( kw_names, i ), args[ args_size + i ] );
+
+        if (unlikely( res != 0 ))
+        {
+            Py_DECREF( pos_args );
+            Py_DECREF( named_args );
+
+            return NULL;
+        }
+    }
+
+    PyObject *result = CALL_FUNCTION( called, pos_args, named_args );
+
+    Py_DECREF( pos_args );
+    Py_DECREF( named_args );
+
+    return result;
+}
+
+PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES_KWDICT( PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names, PyObject *pos_args, PyObject *named_args )
+{
+    CHECK_OBJECT( called );
+    CHECK_OBJECT( kw_names );
+    assert( PyTuple_CheckExact( kw_names ) );
+    CHECK_OBJECT( named_args );
+    assert( PyDict_Size( named_args ) == PyTuple_GET_SIZE( kw_names ) );
+
+    if ( isCompiledVectorcallCallable( called ) )
+    {
+        return callCompiledWithArgsKwNames( called, args, args_size, kw_names );
+    }
+
+    // Other callables get the given dictionary, and the tuple too, if there
+    // is one.
+    if ( pos_args != NULL )
+    {
+        CHECK_OBJECT( pos_args );
+        assert( PyTuple_GET_SIZE( pos_args ) == args_size );
+
+        return CALL_FUNCTION( called, pos_args, named_args );
+    }
+
+    pos_args = MAKE_TUPLE( args, args_size );
+
+    PyObject *result = CALL_FUNCTION( called, pos_args, named_args );
+
+    Py_DECREF( pos_args );
+
+    return result;
+}
+
+// For types with generic attribute lookup, find a function on the type, compiled
+// or not, that the attribute lookup would bind to "source". Gives a new reference
+// to it, or NULL if the attribute lookup is needed, e.g. because the instance
+// dictionary has the attribute too.
+static PyObject *LOOKUP_METHOD_FUNCTION( PyObject *source, PyObject *attr_name )
+{
+    PyTypeObject *type = Py_TYPE( source );
+
+    assert( type->tp_getattro == PyObject_GenericGetAttr );
+
+    if (unlikely( type->tp_dict == NULL ))
+    {
+        return NULL;
+    }
+
+    PyObject *descr = _PyType_Lookup( type, attr_name );
+
+    if ( descr == NULL || ( Py_TYPE( descr ) != &Nuitka_Function_Type && Py_TYPE( descr ) != &PyFunction_Type ) )
+    {
+        return NULL;
+    }
+
+    Py_INCREF( descr );
+
+    Py_ssize_t dictoffset = type->tp_dictoffset;
+
+    if ( dictoffset != 0 )
+    {
+        // Negative dictionary offsets have special meaning.
+        if ( dictoffset < 0 )
+        {
+            Py_ssize_t tsize;
+            size_t size;
+
+            tsize = ((PyVarObject *)source)->ob_size;
+            if (tsize < 0)
+                tsize = -tsize;
+            size = _PyObject_VAR_SIZE( type, tsize );
+
+            dictoffset += (long)size;
+        }
+
+        PyObject *dict = *(PyObject **) ((char *)source + dictoffset);
+
+        if ( dict != NULL && PyDict_GetItem( dict, attr_name ) != NULL )
+        {
+            Py_DECREF( descr );
+            return NULL;
+        }
+    }
+
+    return descr;
+}
+
 PyObject *CALL_METHOD_WITH_POSARGS( PyObject *source, PyObject *attribute, PyObject *positional_args )
 {
     CHECK_OBJECT( source );
@@ -326,6 +533,14 @@ PyObject *CALL_METHOD_WITH_POSARGS( PyObject *source, PyObject *attribute, PyObj
                     PyTuple_GET_SIZE(positional_args)
                 );
             }
+            else if ( descr_get == PyFunction_Type.tp_descr_get )
+            {
+                return callPythonMethodFunction(
+                    called_object,
+                    source,
+                    positional_args
+                );
+            }
             else if ( descr_get != NULL )
             {
                 PyObject *method = descr_get(
@@ -400,6 +615,39 @@ PyObject *CALL_METHOD_WITH_POSARGS( PyObject *source, PyObject *attribute, PyObj
 
         PyTypeObject *type = Py_TYPE( source );
 
+        if ( type->tp_getattro == PyObject_GenericGetAttr )
+        {
+            PyObject *function = LOOKUP_METHOD_FUNCTION( source, attribute );
+
+            // Functions on the type are called without creating a bound method.
+            if ( function != NULL )
+            {
+                PyObject *result;
+
+                if ( Nuitka_Function_Check( function ) )
+                {
+                    result = Nuitka_CallMethodFunctionPosArgs(
+                        (struct Nuitka_FunctionObject const *)function,
+                        source,
+                        &PyTuple_GET_ITEM(positional_args, 0),
+                        PyTuple_GET_SIZE(positional_args)
+                    );
+                }
+                else
+                {
+                    result = callPythonMethodFunction(
+                        function,
+                        source,
+                        positional_args
+                    );
+                }
+
+                Py_DECREF( function );
+
+                return result;
+            }
+        }
+
         if ( type->tp_getattro != NULL )
         {
             called_object = (*type->tp_getattro)( source, attribute );
@@ -538,6 +786,16 @@ PyObject *CALL_METHOD_NO_ARGS( PyObject *source, PyObject *attr_name )
 
                 return result;
             }
+            else if ( func == PyFunction_Type.tp_descr_get )
+            {
+                // Call with "self" as the only argument, instead of creating
+                // a bound method.
+                PyObject *result = callPythonFunction( descr, &source, 1 );
+
+                Py_DECREF( descr );
+
+                return result;
+            }
             else
             {
                 PyObject *called_object = func( descr, source, (PyObject *)type );
@@ -621,6 +879,10 @@ PyObject *CALL_METHOD_NO_ARGS( PyObject *source, PyObject *attr_name )
                     source
                 );
             }
+            else if ( descr_get == PyFunction_Type.tp_descr_get )
+            {
+                return callPythonFunction( called_object, &source, 1 );
+            }
             else if ( descr_get != NULL )
             {
                 PyObject *method = descr_get(
@@ -498,6 +498,10 @@ int main( int argc, char **argv )
     stopProfiling();
 #endif
 
+#if _NUITKA_EXPERIMENTAL_ATTRIBUTE_CACHE_STATS
+    printAttributeCacheStats();
+#endif
+
 #ifndef __NUITKA_NO_ASSERT__
     checkGlobalConstants();
 
@@ -21,20 +21,30 @@
 
 from .CodeHelpers import generateStatementSequenceCode
 from .Emission import SourceCodeCollector
+from .ErrorCodes import getSharedErrorExitsCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
 )
-from .GeneratorCodes import getClosureCopyCode
+from .GeneratorCodes import (
+    getClosureCopyCode,
+    getHeapDeclarationsCode,
+    getYieldReturnDispatchCode
+)
 from .Indentation import indented
 from .templates.CodeTemplatesAsyncgens import (
     template_asyncgen_exception_exit,
     template_asyncgen_noexception_exit,
     template_asyncgen_object_body_template,
     template_asyncgen_object_decl_template,
+    template_asyncgen_object_heap_decl_template,
     template_asyncgen_return_exit,
     template_make_asyncgen_template
 )
+from .VariableDeclarations import (
+    getCFunctionLevelDeclarations,
+    getCStructInits
+)
 
 
 def getAsyncgenObjectDeclCode(function_identifier):
@@ -77,13 +87,30 @@ def getAsyncgenObjectCode(context, function_identifier, closure_variables,
             "function_cleanup"    : indented(function_cleanup)
         }
 
+    # Not reached by control flow, only by the error exits.
+    shared_error_exits_code = getSharedErrorExitsCode(context)
+    if shared_error_exits_code:
+        generator_exit += indented(shared_error_exits_code) + '\n'
+
     if needs_generator_return:
         generator_exit += template_asyncgen_return_exit % {}
 
+    context.addDeclaration(
+        key  = function_identifier + "_locals",
+        code = template_asyncgen_object_heap_decl_template % {
+            "function_identifier"  : function_identifier,
+            "function_local_types" : getHeapDeclarationsCode(function_locals)
+        }
+    )
+
     return template_asyncgen_object_body_template % {
         "function_identifier" : function_identifier,
         "function_body"       : indented(function_codes.codes),
-        "function_var_inits"  : indented(function_locals),
+        "function_locals"     : indented(
+            getCFunctionLevelDeclarations(function_locals)
+        ),
+        "function_var_inits"  : indented(getCStructInits(function_locals)),
+        "function_dispatch"   : indented(getYieldReturnDispatchCode(context)),
         "asyncgen_exit"      : generator_exit
     }
 
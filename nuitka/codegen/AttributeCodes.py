@@ -155,8 +155,13 @@ def getAttributeLookupCode(to_name, source_name, attribute_name, needs_check,
             )
         )
     else:
+        # Each lookup site has its own cache of the type lookup.
         emit(
-            "%s = LOOKUP_ATTRIBUTE( %s, %s );" % (
+            """\
+{
+    static struct Nuitka_AttributeCache attribute_cache = { NULL, 0, NULL };
+    %s = LOOKUP_ATTRIBUTE_CACHED( %s, %s, &attribute_cache );
+}""" % (
                 to_name,
                 source_name,
                 context.getConstantCode(
@@ -23,7 +23,10 @@ bin, etc.
 from nuitka import Builtins
 from nuitka.PythonVersions import python_version
 
-from .CodeHelpers import generateChildExpressionsCode
+from .CodeHelpers import (
+    generateChildExpressionsCode,
+    generateExpressionCode
+)
 from .ErrorCodes import getAssertionCode, getErrorExitCode, getReleaseCodes
 from .PythonAPICodes import generateCAPIObjectCode, generateCAPIObjectCode0
 
@@ -166,6 +169,188 @@ def generateBuiltinSum2Code(to_name, expression, emit, context):
     )
 
 
+def generateBuiltinAnyCode(to_name, expression, emit, context):
+    generateCAPIObjectCode0(
+        to_name    = to_name,
+        capi       = "BUILTIN_ANY",
+        arg_desc   = (
+            ("any_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinAllCode(to_name, expression, emit, context):
+    generateCAPIObjectCode0(
+        to_name    = to_name,
+        capi       = "BUILTIN_ALL",
+        arg_desc   = (
+            ("all_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinMin1Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_MIN1",
+        arg_desc   = (
+            ("min_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinMax1Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_MAX1",
+        arg_desc   = (
+            ("max_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinMin2Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_MIN2",
+        arg_desc   = (
+            ("min_value1", expression.getValue1()),
+            ("min_value2", expression.getValue2()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinMax2Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_MAX2",
+        arg_desc   = (
+            ("max_value1", expression.getValue1()),
+            ("max_value2", expression.getValue2()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinSortedCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_SORTED",
+        arg_desc   = (
+            ("sorted_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinEnumerateCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_ENUMERATE",
+        arg_desc   = (
+            ("enumerate_arg", expression.getValue()),
+            ("enumerate_start", expression.getStart()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        none_null  = True,
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinReversedCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name    = to_name,
+        capi       = "BUILTIN_REVERSED",
+        arg_desc   = (
+            ("reversed_arg", expression.getValue()),
+        ),
+        may_raise  = expression.mayRaiseException(BaseException),
+        source_ref = expression.getCompatibleSourceReference(),
+        emit       = emit,
+        context    = context
+    )
+
+
+def generateBuiltinZipCode(to_name, expression, emit, context):
+    arg_names = []
+
+    for count, value in enumerate(expression.getValues()):
+        arg_name = context.allocateTempName("zip_arg_%d" % (count + 1))
+
+        generateExpressionCode(
+            to_name    = arg_name,
+            expression = value,
+            emit       = emit,
+            context    = context
+        )
+
+        arg_names.append(arg_name)
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    if arg_names:
+        emit(
+            """\
+{
+    PyObject *zip_args[] = { %s };
+    %s = BUILTIN_ZIP( zip_args, %d );
+}
+""" % (
+                ", ".join(arg_names),
+                to_name,
+                len(arg_names)
+            )
+        )
+    else:
+        emit(
+            "%s = BUILTIN_ZIP( NULL, 0 );" % to_name
+        )
+
+    getReleaseCodes(
+        release_names = arg_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateBuiltinRange1Code(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name    = to_name,
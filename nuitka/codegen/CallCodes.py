@@ -23,6 +23,8 @@ able to execute them without creating the argument dictionary at all.
 
 """
 
+from nuitka.__past__ import iterItems
+
 from .CodeHelpers import generateChildExpressionCode, generateExpressionCode
 from .ConstantCodes import getConstantAccess
 from .ErrorCodes import getErrorExitCode, getReleaseCode, getReleaseCodes
@@ -232,6 +234,182 @@ def _generateCallCodeKwOnly(to_name, expression, call_kw, called_name,
     )
 
 
+def _getCallKwNamesAndValues(call_kw):
+    """ Keyword argument names and values, if the names are known.
+
+    The values are nodes for dictionary creations, and constants for
+    constant dictionaries. Returns None for keyword arguments that must be
+    passed as a dictionary.
+    """
+
+    if call_kw.isExpressionConstantRef():
+        kw_items = tuple(iterItems(call_kw.getConstant()))
+
+        values_are_constant = True
+    elif call_kw.isExpressionMakeDict():
+        kw_items = []
+
+        for pair in call_kw.getPairs():
+            key = pair.getKey()
+
+            if not key.isExpressionConstantRef():
+                return None
+
+            kw_items.append((key.getConstant(), pair.getValue()))
+
+        values_are_constant = False
+    else:
+        return None
+
+    kw_names = tuple(
+        kw_name
+        for kw_name, _value in
+        kw_items
+    )
+
+    # Duplicate names are for the dictionary to sort out.
+    if not kw_names or len(set(kw_names)) != len(kw_names):
+        return None
+
+    for kw_name in kw_names:
+        if type(kw_name) is not str:
+            return None
+
+    return (
+        kw_names,
+        tuple(value for _kw_name, value in kw_items),
+        values_are_constant
+    )
+
+
+def _generateCallCodeKwNames(to_name, expression, called_name, call_args,
+                             call_kw, kw_names, kw_values,
+                             kw_values_are_constant, emit, context):
+    # Positional argument values followed by keyword argument values in an
+    # array, with only the names passed as a constant tuple, so compiled
+    # functions get no argument tuple or dictionary created.
+    call_arg_names = []
+
+    if call_args is None or call_args.isExpressionConstantRef():
+        if call_args is not None:
+            for call_arg_element in call_args.getConstant():
+                call_arg_name = context.allocateTempName("call_arg_element")
+
+                getConstantAccess(
+                    to_name  = call_arg_name,
+                    constant = call_arg_element,
+                    emit     = emit,
+                    context  = context,
+                )
+
+                call_arg_names.append(call_arg_name)
+    else:
+        for call_arg_element in call_args.getElements():
+            call_arg_name = generateChildExpressionCode(
+                child_name = call_args.getChildName() + "_element",
+                expression = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    kw_value_names = []
+
+    for kw_value in kw_values:
+        if kw_values_are_constant:
+            kw_value_name = context.allocateTempName("call_kw_value")
+
+            getConstantAccess(
+                to_name  = kw_value_name,
+                constant = kw_value,
+                emit     = emit,
+                context  = context,
+            )
+        else:
+            kw_value_name = generateChildExpressionCode(
+                child_name = "call_kw_value",
+                expression = kw_value,
+                emit       = emit,
+                context    = context,
+            )
+
+        kw_value_names.append(kw_value_name)
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    emitLineNumberUpdateCode(emit, context)
+
+    if kw_values_are_constant:
+        # Other callables than compiled ones then use the constant dictionary
+        # and tuple, and need not create them.
+        if call_args is None:
+            pos_args_code = context.getConstantCode(
+                constant = ()
+            )
+        elif call_args.isExpressionConstantRef():
+            pos_args_code = context.getConstantCode(
+                constant = call_args.getConstant()
+            )
+        else:
+            pos_args_code = "NULL"
+
+        emit(
+            """\
+{
+    PyObject *call_args[] = { %s };
+    %s = CALL_FUNCTION_WITH_ARGS_KWNAMES_KWDICT( %s, call_args, %d, %s, %s, %s );
+}
+""" % (
+                ", ".join(call_arg_names + kw_value_names),
+                to_name,
+                called_name,
+                len(call_arg_names),
+                context.getConstantCode(
+                    constant = kw_names
+                ),
+                pos_args_code,
+                context.getConstantCode(
+                    constant = call_kw.getConstant()
+                )
+            )
+        )
+    else:
+        emit(
+            """\
+{
+    PyObject *call_args[] = { %s };
+    %s = CALL_FUNCTION_WITH_ARGS_KWNAMES( %s, call_args, %d, %s );
+}
+""" % (
+                ", ".join(call_arg_names + kw_value_names),
+                to_name,
+                called_name,
+                len(call_arg_names),
+                context.getConstantCode(
+                    constant = kw_names
+                )
+            )
+        )
+
+    getReleaseCodes(
+        release_names = [called_name] + call_arg_names + kw_value_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = expression.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateCallCode(to_name, expression, emit, context):
     # There is a whole lot of different cases, for each of which, we create
     # optimized code, constant, with and without positional or keyword arguments
@@ -286,7 +464,27 @@ def generateCallCode(to_name, expression, emit, context):
     else:
         call_args = expression.getCallArgs()
 
-        if call_args is None or \
+        kw_names_and_values = _getCallKwNamesAndValues(call_kw)
+
+        if kw_names_and_values is not None and \
+           (call_args is None or \
+            call_args.isExpressionConstantRef() or \
+            call_args.isExpressionMakeTuple()):
+            kw_names, kw_values, kw_values_are_constant = kw_names_and_values
+
+            _generateCallCodeKwNames(
+                to_name                = to_name,
+                expression             = expression,
+                called_name            = called_name,
+                call_args              = call_args,
+                call_kw                = call_kw,
+                kw_names               = kw_names,
+                kw_values              = kw_values,
+                kw_values_are_constant = kw_values_are_constant,
+                emit                   = emit,
+                context                = context
+            )
+        elif call_args is None or \
            (call_args.isExpressionConstantRef() and \
             call_args.getConstant() == ()):
             _generateCallCodeKwOnly(
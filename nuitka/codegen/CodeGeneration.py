@@ -26,6 +26,9 @@ branches and make a code block out of it. But it doesn't contain any target
 language syntax.
 """
 
+from logging import info
+
+from nuitka import Options
 from nuitka.__past__ import iterItems
 
 from . import Contexts, Emission
@@ -45,21 +48,30 @@ from .AttributeCodes import (
 )
 from .BranchCodes import generateBranchCode
 from .BuiltinCodes import (
+    generateBuiltinAllCode,
     generateBuiltinAnonymousRefCode,
+    generateBuiltinAnyCode,
     generateBuiltinBinCode,
     generateBuiltinBoolCode,
     generateBuiltinBytearray1Code,
     generateBuiltinBytearray3Code,
     generateBuiltinClassmethodCode,
     generateBuiltinComplexCode,
+    generateBuiltinEnumerateCode,
     generateBuiltinFloatCode,
     generateBuiltinHexCode,
+    generateBuiltinMax1Code,
+    generateBuiltinMax2Code,
+    generateBuiltinMin1Code,
+    generateBuiltinMin2Code,
     generateBuiltinOctCode,
     generateBuiltinOpenCode,
     generateBuiltinRange1Code,
     generateBuiltinRange2Code,
     generateBuiltinRange3Code,
     generateBuiltinRefCode,
+    generateBuiltinReversedCode,
+    generateBuiltinSortedCode,
     generateBuiltinStaticmethodCode,
     generateBuiltinSum1Code,
     generateBuiltinSum2Code,
@@ -67,7 +79,8 @@ from .BuiltinCodes import (
     generateBuiltinType3Code,
     generateBuiltinXrange1Code,
     generateBuiltinXrange2Code,
-    generateBuiltinXrange3Code
+    generateBuiltinXrange3Code,
+    generateBuiltinZipCode
 )
 from .CallCodes import generateCallCode, getCallsCode, getCallsDecls
 from .ClassCodes import (
@@ -134,6 +147,7 @@ from .FrameCodes import (
 )
 from .FunctionCodes import (
     generateFunctionCallCode,
+    generateFunctionCodeCheckCode,
     generateFunctionCreationCode,
     generateFunctionOutlineCode,
     getExportScopeCode,
@@ -197,6 +211,7 @@ from .LoopCodes import (
     generateLoopCode,
     generateLoopContinueCode
 )
+from .MathCodes import generateMathFunctionCallCode
 from .ModuleCodes import (
     generateModuleAttributeFileCode,
     generateModuleAttributeLoaderCode,
@@ -440,6 +455,8 @@ def prepareModuleCode(global_context, module, module_name):
     function_decl_codes = []
     function_body_codes = []
 
+    error_exit_saving = context.getSharedErrorExitSaving()
+
     for function_body in module.getUsedFunctions():
         function_code, function_context = generateFunctionBodyCode(
             function_body = function_body,
@@ -450,6 +467,8 @@ def prepareModuleCode(global_context, module, module_name):
 
         function_body_codes.append(function_code)
 
+        error_exit_saving += function_context.getSharedErrorExitSaving()
+
         function_decl = _generateFunctionDeclCode(
             function_body = function_body,
             context       = function_context
@@ -502,6 +521,14 @@ def prepareModuleCode(global_context, module, module_name):
         context             = context
     )
 
+    if Options.isShowProgress():
+        info(
+            "Module '%s': Sharing error exits saved %d bytes of C code." % (
+                module_name,
+                error_exit_saving
+            )
+        )
+
     return template_values, context
 
 
@@ -543,6 +570,16 @@ setExpressionDispatchDict(
         "EXPRESSION_BUILTIN_NEXT2"                    : generateBuiltinNext2Code,
         "EXPRESSION_BUILTIN_SUM1"                     : generateBuiltinSum1Code,
         "EXPRESSION_BUILTIN_SUM2"                     : generateBuiltinSum2Code,
+        "EXPRESSION_BUILTIN_ANY"                      : generateBuiltinAnyCode,
+        "EXPRESSION_BUILTIN_ALL"                      : generateBuiltinAllCode,
+        "EXPRESSION_BUILTIN_MIN1"                     : generateBuiltinMin1Code,
+        "EXPRESSION_BUILTIN_MIN2"                     : generateBuiltinMin2Code,
+        "EXPRESSION_BUILTIN_MAX1"                     : generateBuiltinMax1Code,
+        "EXPRESSION_BUILTIN_MAX2"                     : generateBuiltinMax2Code,
+        "EXPRESSION_BUILTIN_SORTED"                   : generateBuiltinSortedCode,
+        "EXPRESSION_BUILTIN_ENUMERATE"                : generateBuiltinEnumerateCode,
+        "EXPRESSION_BUILTIN_REVERSED"                 : generateBuiltinReversedCode,
+        "EXPRESSION_BUILTIN_ZIP"                      : generateBuiltinZipCode,
         "EXPRESSION_BUILTIN_TYPE1"                    : generateBuiltinType1Code,
         "EXPRESSION_BUILTIN_TYPE3"                    : generateBuiltinType3Code,
         "EXPRESSION_BUILTIN_IMPORT"                   : generateBuiltinImportCode,
@@ -639,6 +676,7 @@ setExpressionDispatchDict(
         "EXPRESSION_DICT_OPERATION_NOT_IN"            : generateDictOperationInCode,
         "EXPRESSION_FUNCTION_CREATION"                : generateFunctionCreationCode,
         "EXPRESSION_FUNCTION_CALL"                    : generateFunctionCallCode,
+        "EXPRESSION_FUNCTION_CODE_CHECK"              : generateFunctionCodeCheckCode,
         "EXPRESSION_IMPORT_MODULE_HARD"               : generateImportModuleHardCode,
         "EXPRESSION_IMPORT_MODULE_NAME_HARD"          : generateImportModuleNameHardCode,
         "EXPRESSION_IMPORT_NAME"                      : generateImportNameCode,
@@ -657,6 +695,7 @@ setExpressionDispatchDict(
         "EXPRESSION_MAKE_TUPLE"                       : generateTupleCreationCode,
         "EXPRESSION_MAKE_LIST"                        : generateListCreationCode,
         "EXPRESSION_MAKE_DICT"                        : generateDictionaryCreationCode,
+        "EXPRESSION_MATH_FUNCTION_CALL"               : generateMathFunctionCallCode,
         "EXPRESSION_OPERATION_BINARY"                 : generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_ADD"             : generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_MULT"            : generateOperationBinaryCode,
@@ -664,6 +703,7 @@ setExpressionDispatchDict(
         "EXPRESSION_OPERATION_BINARY_INPLACE"         : generateOperationBinaryCode,
         "EXPRESSION_OPERATION_UNARY"                  : generateOperationUnaryCode,
         "EXPRESSION_OPERATION_NOT"                    : generateOperationUnaryCode,
+        "EXPRESSION_OPERATION_ABS"                    : generateOperationUnaryCode,
         "EXPRESSION_OUTLINE_BODY"                     : generateFunctionOutlineCode,
         "EXPRESSION_OUTLINE_FUNCTION"                 : generateFunctionOutlineCode,
         # TODO: Rename to make more clear it is an outline
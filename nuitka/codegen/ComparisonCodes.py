@@ -21,6 +21,12 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 "isinstance" check as used in conditions, as well as exception matching.
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeStr
+)
+
 from . import OperatorCodes
 from .CodeHelpers import generateExpressionCode
 from .ErrorCodes import (
@@ -31,8 +37,114 @@ from .ErrorCodes import (
 )
 from .LabelCodes import getBranchingCode
 
+# Shapes of both operands with specialized helpers giving "nuitka_bool",
+# in "richcomparisons_specialized.h".
+_specialized_comparison_shapes = {
+    (ShapeTypeInt, ShapeTypeInt)     : "INT_INT",
+    (ShapeTypeFloat, ShapeTypeFloat) : "FLOAT_FLOAT",
+    (ShapeTypeStr, ShapeTypeStr)     : "STR_STR",
+}
+
+
+def isComparisonInElements(expression):
+    """ Is this "in" or "not in" on a tuple display.
+
+    The tuple is not created then, the values are compared directly.
+    """
+
+    return expression.getComparator() in OperatorCodes.normal_comparison_codes and \
+           expression.getRight().isExpressionMakeTuple() and \
+           expression.getRight().getElements()
+
+
+def getComparisonInElementsCode(expression, needs_check, emit, context):
+    """ Generate "in" or "not in" on the elements of a tuple display.
+
+    Returns the C condition for the comparison result.
+    """
+
+    left_name = context.allocateTempName("compexpr_left")
+
+    generateExpressionCode(
+        to_name    = left_name,
+        expression = expression.getLeft(),
+        emit       = emit,
+        context    = context
+    )
+
+    element_names = []
+
+    for count, element in enumerate(expression.getRight().getElements()):
+        element_name = context.allocateTempName(
+            "compexpr_element_%d" % (count + 1)
+        )
+
+        generateExpressionCode(
+            to_name    = element_name,
+            expression = element,
+            emit       = emit,
+            context    = context
+        )
+
+        element_names.append(element_name)
+
+    comparator = expression.getComparator()
+
+    res_name = context.allocateTempName("cmp_" + comparator, "int")
+
+    emit(
+        """\
+{
+    PyObject *contains_elements[] = { %s };
+    %s = SEQUENCE_CONTAINS_ELEMENTS( %s, contains_elements, %d );
+}""" % (
+            ", ".join(element_names),
+            res_name,
+            left_name,
+            len(element_names)
+        )
+    )
+
+    getReleaseCodes(
+        release_names = [left_name] + element_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitBoolCode(
+        condition   = "%s == -1" % res_name,
+        needs_check = needs_check,
+        emit        = emit,
+        context     = context
+    )
+
+    return "%s == %d" % (
+        res_name,
+        1 if comparator == "In" else 0
+    )
+
 
 def generateComparisonExpressionCode(to_name, expression, emit, context):
+    if isComparisonInElements(expression):
+        condition = getComparisonInElementsCode(
+            expression  = expression,
+            needs_check = expression.getRight().mayRaiseExceptionIn(
+                BaseException,
+                expression.getLeft()
+            ),
+            emit        = emit,
+            context     = context
+        )
+
+        emit(
+            "%s = BOOL_FROM( %s );" % (
+                to_name,
+                condition
+            )
+        )
+
+        return
+
     left_name = context.allocateTempName("compexpr_left")
     right_name = context.allocateTempName("compexpr_right")
 
@@ -181,7 +293,9 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
 
 
 def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_check,
-                                    emit, context):
+                                    emit, context, shapes = None):
+    # Many comparators to handle, pylint: disable=too-many-branches
+
     if comparator in OperatorCodes.normal_comparison_codes:
         operator_res_name = context.allocateTempName("cmp_" + comparator, "int")
 
@@ -204,6 +318,30 @@ def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_che
             operator_res_name,
             1 if comparator == "In" else 0
         )
+    elif comparator in OperatorCodes.rich_comparison_codes and \
+         shapes in _specialized_comparison_shapes:
+        operator_res_name = context.allocateTempName("cmp_nbool_" + comparator, "nuitka_bool")
+
+        emit(
+             "%s = RICH_COMPARE_NBOOL_%s( %s, %s, Py_%s );" % (
+                operator_res_name,
+                _specialized_comparison_shapes[shapes],
+                left_name,
+                right_name,
+                OperatorCodes.rich_comparison_codes[comparator]
+            )
+        )
+
+        getErrorExitBoolCode(
+            condition   = "%s == NUITKA_BOOL_EXCEPTION" % operator_res_name,
+            needs_check = needs_check,
+            emit        = emit,
+            context     = context
+        )
+
+        condition = "%s == NUITKA_BOOL_TRUE" % (
+            operator_res_name,
+        )
     elif comparator in OperatorCodes.rich_comparison_codes:
         operator_res_name = context.allocateTempName("cmp_" + comparator, "int")
 
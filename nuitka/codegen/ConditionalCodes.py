@@ -26,10 +26,13 @@ from .AttributeCodes import getAttributeCheckBoolCode
 from .CodeHelpers import generateExpressionCode
 from .ComparisonCodes import (
     getBuiltinIsinstanceBoolCode,
-    getComparisonExpressionBoolCode
+    getComparisonExpressionBoolCode,
+    getComparisonInElementsCode,
+    isComparisonInElements
 )
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitBoolCode, getReleaseCode
+from .FunctionCodes import generateFunctionCodeCheckConditionCode
 from .LabelCodes import getBranchingCode, getGotoCode, getLabelCode
 
 
@@ -37,7 +40,21 @@ def generateConditionCode(condition, emit, context):
     # The complexity is needed to avoid unnecessary complex generated C
     # pylint: disable=too-many-locals,too-many-statements
 
-    if condition.isExpressionComparison():
+    if condition.isExpressionComparison() and \
+       isComparisonInElements(condition):
+        old_source_ref = context.setCurrentSourceCodeReference(condition.getSourceReference())
+        getBranchingCode(
+            condition = getComparisonInElementsCode(
+                expression  = condition,
+                needs_check = condition.mayRaiseExceptionBool(BaseException),
+                emit        = emit,
+                context     = context
+            ),
+            emit      = emit,
+            context   = context
+        )
+        context.setCurrentSourceCodeReference(old_source_ref)
+    elif condition.isExpressionComparison():
         left_name = context.allocateTempName("compare_left")
 
         generateExpressionCode(
@@ -62,6 +79,10 @@ def generateConditionCode(condition, emit, context):
             left_name   = left_name,
             right_name  = right_name,
             needs_check = condition.mayRaiseExceptionBool(BaseException),
+            shapes      = (
+                condition.getLeft().getTypeShape(),
+                condition.getRight().getTypeShape()
+            ),
             emit        = emit,
             context     = context
         )
@@ -186,6 +207,12 @@ def generateConditionCode(condition, emit, context):
         )
 
         context.setCurrentSourceCodeReference(old_source_ref)
+    elif condition.isExpressionFunctionCodeCheck():
+        generateFunctionCodeCheckConditionCode(
+            condition = condition,
+            emit      = emit,
+            context   = context
+        )
     elif condition.isCompileTimeConstant():
         getBranchingCode(
             condition = '1' if condition.getCompileTimeConstant() else '0',
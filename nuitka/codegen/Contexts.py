@@ -29,6 +29,7 @@ from nuitka.PythonVersions import python_version
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
 from .Namify import namifyConstant
+from .VariableDeclarations import VariableDeclaration
 
 
 class ContextMetaClass(ABCMeta):
@@ -74,6 +75,12 @@ class TempMixin(object):
 
         self.cleanup_names = []
 
+        # Error exit epilogues, identical ones are shared by all error exits
+        # that need them, and emitted once at the end of the function.
+        self.shared_error_exits = {}
+        self.shared_error_exit_codes = []
+        self.shared_error_exit_saving = 0
+
     def formatTempName(self, base_name, number):
         if number is None:
             return "tmp_{name}".format(
@@ -101,11 +108,27 @@ class TempMixin(object):
             assert self.tmp_types[base_name] == type_name, \
                 (self.tmp_types[base_name], type_name)
 
-        return self.formatTempName(
-            base_name = base_name,
-            number    = number
+        return self.getLocalStorageName(
+            self.formatTempName(
+                base_name = base_name,
+                number    = number
+            )
         )
 
+    def getLocalHeapName(self):
+        """ Name of the heap storage for C locals, None for stack storage. """
+        return None
+
+    def getLocalStorageName(self, code_name):
+        """ Code to access a C local of the function, given its name. """
+
+        heap_name = self.getLocalHeapName()
+
+        if heap_name is None:
+            return code_name
+        else:
+            return "%s->%s" % (heap_name, code_name)
+
     def getIntResName(self):
         return self.allocateTempName("res", "int", unique = True)
 
@@ -129,7 +152,7 @@ class TempMixin(object):
                         number    = number
                     )
 
-                    if tmp_name not in self.forgotten_names:
+                    if self.getLocalStorageName(tmp_name) not in self.forgotten_names:
                         result.append(
                             (
                                 tmp_name,
@@ -142,7 +165,7 @@ class TempMixin(object):
                     number    = None
                 )
 
-                if tmp_name not in self.forgotten_names:
+                if self.getLocalStorageName(tmp_name) not in self.forgotten_names:
                     result.append(
                         (
                             tmp_name,
@@ -189,6 +212,27 @@ class TempMixin(object):
     def getLabelCount(self, label):
         return self.labels.get(label, 0)
 
+    def getSharedErrorExitLabel(self, code):
+        if code in self.shared_error_exits:
+            self.shared_error_exit_saving += len(code)
+        else:
+            self.shared_error_exits[code] = self.allocateLabel("error_exit")
+            self.shared_error_exit_codes.append(code)
+
+        return self.shared_error_exits[code]
+
+    def getSharedErrorExits(self):
+        return [
+            (self.shared_error_exits[code], code)
+            for code in
+            self.shared_error_exit_codes
+        ]
+
+    def getSharedErrorExitSaving(self):
+        """ Size of the C code that was not emitted due to sharing. """
+
+        return self.shared_error_exit_saving
+
     def needsExceptionVariables(self):
         return self.needs_exception_variables
 
@@ -199,10 +243,18 @@ class TempMixin(object):
         self.keeper_variable_count += 1
 
         return (
-            "exception_keeper_type_%d" % self.keeper_variable_count,
-            "exception_keeper_value_%d" % self.keeper_variable_count,
-            "exception_keeper_tb_%d" % self.keeper_variable_count,
-            "exception_keeper_lineno_%s" % self.keeper_variable_count
+            self.getLocalStorageName(
+                "exception_keeper_type_%d" % self.keeper_variable_count
+            ),
+            self.getLocalStorageName(
+                "exception_keeper_value_%d" % self.keeper_variable_count
+            ),
+            self.getLocalStorageName(
+                "exception_keeper_tb_%d" % self.keeper_variable_count
+            ),
+            self.getLocalStorageName(
+                "exception_keeper_lineno_%d" % self.keeper_variable_count
+            )
         )
 
     def getKeeperVariableCount(self):
@@ -223,6 +275,13 @@ class TempMixin(object):
         assert count != 0
         self.preserver_variable_counts.add(count)
 
+    def getExceptionPreserverVariables(self, count):
+        return (
+            self.getLocalStorageName("exception_preserved_type_%d" % count),
+            self.getLocalStorageName("exception_preserved_value_%d" % count),
+            self.getLocalStorageName("exception_preserved_tb_%d" % count)
+        )
+
     def getTrueBranchTarget(self):
         return self.true_target
 
@@ -462,6 +521,14 @@ class PythonContextBase(ContextMetaClassBase):
     def addExceptionPreserverVariables(self, count):
         pass
 
+    @abstractmethod
+    def getExceptionPreserverVariables(self, count):
+        pass
+
+    @abstractmethod
+    def getLocalStorageName(self, code_name):
+        pass
+
     @abstractmethod
     def getTrueBranchTarget(self):
         pass
@@ -832,12 +899,17 @@ class FrameDeclarationsMixin(object):
     def getFrameHandle(self):
         return self.frame_stack[-1]
 
-    def pushFrameHandle(self, frame_handle):
+    def pushFrameHandle(self, frame_handle, is_light):
         self.frames_used += 1
 
         if self.frames_used > 1:
             frame_handle += "_%d" % self.frames_used
 
+        # Nested frames of coroutines and asyncgens can be left at an "await",
+        # so these are kept in the heap storage like other C locals.
+        if not is_light:
+            frame_handle = self.getLocalStorageName(frame_handle)
+
         self.frame_stack.append(frame_handle)
         return self.frame_stack[-1]
 
@@ -855,7 +927,12 @@ class FrameDeclarationsMixin(object):
 
     def getFrameDeclarations(self):
         return self.frame_declarations + [
-            "NUITKA_MAY_BE_UNUSED char const *type_description_%d = NULL;" % (i+1)
+            VariableDeclaration(
+                "NUITKA_MAY_BE_UNUSED char const *",
+                "type_description_%d" % (i+1),
+                "NULL",
+                self.getLocalHeapName()
+            )
             for i in
             range(self.getFramesCount())
         ]
@@ -871,15 +948,22 @@ class FrameDeclarationsMixin(object):
         del self.frame_type_descriptions[-1]
 
     def setVariableType(self, variable, variable_code_name, variable_c_type):
-        assert variable.isLocalVariable(), variable
+        assert not variable.isModuleVariable(), variable
 
-        self.frame_variable_types[variable] = variable_code_name, variable_c_type.getTypeIndicator()
+        # Plain C values of temporary variables cannot be attached to frames,
+        # these appear as not assigned.
+        if variable_c_type.hasTypeIndicator():
+            self.frame_variable_types[variable] = variable_code_name, variable_c_type.getTypeIndicator()
+        else:
+            self.frame_variable_types.pop(variable, None)
 
     def getFrameVariableTypeDescriptions(self):
         return self.frame_type_descriptions[-1]
 
     def getFrameVariableTypeDescriptionName(self):
-        return "type_description_%d" % (len(self.frame_stack) - 1)
+        return self.getLocalStorageName(
+            "type_description_%d" % (len(self.frame_stack) - 1)
+        )
 
     def getFrameVariableTypeDescription(self):
         result = "".join(
@@ -901,6 +985,8 @@ class FrameDeclarationsMixin(object):
 
             if variable_code_type in ('b',):
                 result.append("(int)" + variable_code_name)
+            elif variable_code_type in ('L',):
+                result.append('&' + variable_code_name)
             else:
                 result.append(variable_code_name)
 
@@ -1125,6 +1211,11 @@ class PythonGeneratorObjectContext(PythonFunctionContext):
     def getContextObjectName(self):
         return "generator"
 
+    def getLocalHeapName(self):
+        # The generator code returns at yields, so its locals are kept in the
+        # heap storage of the object.
+        return self.getContextObjectName() + "_heap"
+
     def getGeneratorReturnValueName(self):
         if python_version >= 330:
             return self.allocateTempName(
@@ -1180,6 +1271,9 @@ class PythonFunctionOutlineContext(ReturnReleaseModeMixin,
     def allocateLabel(self, label):
         return self.parent.allocateLabel(label)
 
+    def getSharedErrorExitLabel(self, code):
+        return self.parent.getSharedErrorExitLabel(code)
+
     def allocateTempName(self, base_name, type_name = "PyObject *",
                          unique = False):
         return self.parent.allocateTempName(base_name, type_name, unique)
@@ -1241,8 +1335,8 @@ class PythonFunctionOutlineContext(ReturnReleaseModeMixin,
     def getFrameHandle(self):
         return self.parent.getFrameHandle()
 
-    def pushFrameHandle(self, frame_handle):
-        return self.parent.pushFrameHandle(frame_handle)
+    def pushFrameHandle(self, frame_handle, is_light):
+        return self.parent.pushFrameHandle(frame_handle, is_light)
 
     def popFrameHandle(self):
         return self.parent.popFrameHandle()
@@ -1288,6 +1382,15 @@ class PythonFunctionOutlineContext(ReturnReleaseModeMixin,
     def addExceptionPreserverVariables(self, count):
         self.parent.addExceptionPreserverVariables(count)
 
+    def getExceptionPreserverVariables(self, count):
+        return self.parent.getExceptionPreserverVariables(count)
+
+    def getLocalHeapName(self):
+        return self.parent.getLocalHeapName()
+
+    def getLocalStorageName(self, code_name):
+        return self.parent.getLocalStorageName(code_name)
+
     def getTempNameInfos(self):
         return self.parent.getTempNameInfos()
 
@@ -24,12 +24,20 @@ from .CodeHelpers import (
     generateStatementSequenceCode
 )
 from .Emission import SourceCodeCollector
-from .ErrorCodes import getErrorExitCode, getReleaseCode
+from .ErrorCodes import (
+    getErrorExitCode,
+    getReleaseCode,
+    getSharedErrorExitsCode
+)
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
 )
-from .GeneratorCodes import getClosureCopyCode
+from .GeneratorCodes import (
+    getClosureCopyCode,
+    getHeapDeclarationsCode,
+    getYieldReturnDispatchCode
+)
 from .Indentation import indented
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .PythonAPICodes import getReferenceExportCode
@@ -38,9 +46,15 @@ from .templates.CodeTemplatesCoroutines import (
     template_coroutine_noexception_exit,
     template_coroutine_object_body_template,
     template_coroutine_object_decl_template,
+    template_coroutine_object_heap_decl_template,
     template_coroutine_return_exit,
     template_make_coroutine_template
 )
+from .VariableDeclarations import (
+    getCFunctionLevelDeclarations,
+    getCStructInits
+)
+from .YieldCodes import getYieldFromStartCode
 
 
 def getCoroutineObjectDeclCode(function_identifier):
@@ -83,13 +97,32 @@ def getCoroutineObjectCode(context, function_identifier, closure_variables,
             "function_cleanup"    : indented(function_cleanup)
         }
 
+    # Not reached by control flow, only by the error exits.
+    shared_error_exits_code = getSharedErrorExitsCode(context)
+    if shared_error_exits_code:
+        generator_exit += indented(shared_error_exits_code) + '\n'
+
     if needs_generator_return:
-        generator_exit += template_coroutine_return_exit % {}
+        generator_exit += template_coroutine_return_exit % {
+            "return_value" : context.getGeneratorReturnValueName()
+        }
+
+    context.addDeclaration(
+        key  = function_identifier + "_locals",
+        code = template_coroutine_object_heap_decl_template % {
+            "function_identifier"  : function_identifier,
+            "function_local_types" : getHeapDeclarationsCode(function_locals)
+        }
+    )
 
     return template_coroutine_object_body_template % {
         "function_identifier" : function_identifier,
         "function_body"       : indented(function_codes.codes),
-        "function_var_inits"  : indented(function_locals),
+        "function_locals"     : indented(
+            getCFunctionLevelDeclarations(function_locals)
+        ),
+        "function_var_inits"  : indented(getCStructInits(function_locals)),
+        "function_dispatch"   : indented(getYieldReturnDispatchCode(context)),
         "coroutine_exit"      : generator_exit
     }
 
@@ -135,19 +168,19 @@ def generateAsyncWaitCode(to_name, expression, emit, context):
 
     context_identifier = context.getContextObjectName()
 
-    # This produces AWAIT_COROUTINE or AWAIT_ASYNCGEN calls.
+    # This produces COROUTINE_AWAIT_START or ASYNCGEN_AWAIT_START calls.
     getReferenceExportCode(value_name, emit, context)
 
-    emit(
-        "%s = %s_%s( %s, %s );" % (
-            to_name,
+    getYieldFromStartCode(
+        to_name            = to_name,
+        start_code         = "%s_AWAIT_START( %s, %s )" % (
             context_identifier.upper(),
-            "AWAIT"
-              if not preserve_exception else
-            "AWAIT_IN_HANDLER",
             context_identifier,
             value_name
-        )
+        ),
+        preserve_exception = preserve_exception,
+        emit               = emit,
+        context            = context
     )
 
     if not context.needsCleanup(value_name):
@@ -175,13 +208,16 @@ def generateAsyncIterCode(to_name, expression, emit, context):
         context    = context
     )
 
-    emit(
-        "%s = %s_ASYNC_MAKE_ITERATOR( %s, %s );" % (
-            to_name,
+    getYieldFromStartCode(
+        to_name            = to_name,
+        start_code         = "%s_ASYNC_MAKE_ITERATOR_START( %s, %s )" % (
             context.getContextObjectName().upper(),
             context.getContextObjectName(),
             value_name
-        )
+        ),
+        preserve_exception = False,
+        emit               = emit,
+        context            = context
     )
 
     getReleaseCode(
@@ -206,13 +242,16 @@ def generateAsyncNextCode(to_name, expression, emit, context):
         context    = context
     )
 
-    emit(
-        "%s = %s_ASYNC_ITERATOR_NEXT( %s, %s );" % (
-            to_name,
+    getYieldFromStartCode(
+        to_name            = to_name,
+        start_code         = "%s_ASYNC_ITERATOR_NEXT_START( %s, %s )" % (
             context.getContextObjectName().upper(),
             context.getContextObjectName(),
-            value_name,
-        )
+            value_name
+        ),
+        preserve_exception = False,
+        emit               = emit,
+        context            = context
     )
 
     getReleaseCode(
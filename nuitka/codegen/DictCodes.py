@@ -19,12 +19,16 @@
 
 """
 
-from nuitka import Options
+from nuitka import Constants, Options
+from nuitka.__past__ import long, unicode  # pylint: disable=I0021,redefined-builtin
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
 
+# Constant key types, that can be put into dictionary templates.
+_template_key_types = (str, unicode, bytes, int, long, bool, type(None))
+
 
 def generateBuiltinDictCode(to_name, expression, emit, context):
     if expression.getPositionalArgument():
@@ -98,14 +102,57 @@ def generateDictionaryCreationCode(to_name, expression, emit, context):
     )
 
 
+def _getDictionaryTemplate(pairs):
+    """ Constant dictionary with the keys of pairs, if all are constants.
+
+    Copying it gives a dictionary with all keys already inserted, their hash
+    values included, so only the values need to be set.
+    """
+
+    # Nothing gained for a single key, copying is not cheaper then.
+    if len(pairs) < 2:
+        return None
+
+    keys = []
+
+    for pair in pairs:
+        key = pair.getKey()
+
+        if not key.isExpressionConstantRef():
+            return None
+
+        constant = key.getConstant()
+
+        # Only values, which compare equal in the same way at compile time
+        # and at run time, e.g. no "nan" float values.
+        if type(constant) not in _template_key_types:
+            return None
+
+        keys.append(constant)
+
+    return Constants.createConstantDict(
+        keys   = keys,
+        values = [None] * len(keys)
+    )
+
+
 def getDictionaryCreationCode(to_name, pairs, emit, context):
+    template = _getDictionaryTemplate(pairs)
 
-    emit(
-        "%s = _PyDict_NewPresized( %d );" % (
-            to_name,
-            len(pairs)
+    if template is not None:
+        emit(
+            "%s = PyDict_Copy( %s );" % (
+                to_name,
+                context.getConstantCode(template)
+            )
+        )
+    else:
+        emit(
+            "%s = _PyDict_NewPresized( %d );" % (
+                to_name,
+                len(pairs)
+            )
         )
-    )
 
     context.addCleanupTempName(to_name)
 
@@ -139,7 +186,9 @@ def getDictionaryCreationCode(to_name, pairs, emit, context):
             generateKeyCode(dict_key_name, pair)
             generateValueCode(dict_value_name, pair)
 
-        needs_check = not pair.getKey().isKnownToBeHashable()
+        # Replacing the value of a key that is present cannot fail.
+        needs_check = template is None and \
+                      not pair.getKey().isKnownToBeHashable()
 
         res_name = context.getIntResName()
 
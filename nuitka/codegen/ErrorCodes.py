@@ -31,14 +31,18 @@ And releasing of values, as this is what the error case commonly does.
 from nuitka import Options
 from nuitka.PythonVersions import python_version
 
+from .Emission import SourceCodeCollector
 from .ExceptionCodes import getExceptionIdentifier
 from .Indentation import getCommentCode, indented
+from .LabelCodes import getColdLabelCode
 from .LineNumberCodes import getErrorLineNumberUpdateCode
 from .templates.CodeTemplatesExceptions import (
     template_error_catch_exception,
-    template_error_catch_quick_exception,
+    template_error_exit_exception,
+    template_error_exit_quick_exception,
     template_error_format_string_exception
 )
+from .VariableDeclarations import VariableDeclaration
 
 
 def getErrorExitReleaseCode(context):
@@ -81,45 +85,48 @@ def getErrorExitBoolCode(condition, emit, context,
 
     context.markAsNeedsExceptionVariables()
 
+    # Only the line number differs between most error exits, the epilogue
+    # that fetches the exception, releases the temporaries and goes to the
+    # exception exit, is shared with all exits that have the same one.
     if quick_exception:
-        emit(
-            indented(
-                template_error_catch_quick_exception % {
-                    "condition"            : condition,
-                    "exception_exit"       : context.getExceptionEscape(),
-                    "quick_exception"      : getExceptionIdentifier(quick_exception),
-                    "release_temps"        : indented(
-                        getErrorExitReleaseCode(context)
-                    ),
-                    "var_description_code" : indented(
-                        getFrameVariableTypeDescriptionCode(context),
-                    ),
-                    "line_number_code"     : indented(
-                        getErrorLineNumberUpdateCode(context)
-                    )
-                },
-                0
-            )
-        )
+        error_exit_code = template_error_exit_quick_exception % {
+            "exception_exit"       : context.getExceptionEscape(),
+            "quick_exception"      : getExceptionIdentifier(quick_exception),
+            "release_temps"        : getErrorExitReleaseCode(context),
+            "var_description_code" : getFrameVariableTypeDescriptionCode(context)
+        }
     else:
-        emit(
-            indented(
-                template_error_catch_exception % {
-                    "condition"        : condition,
-                    "exception_exit"   : context.getExceptionEscape(),
-                    "release_temps"    : indented(
-                        getErrorExitReleaseCode(context)
-                    ),
-                    "var_description_code": indented(
-                        getFrameVariableTypeDescriptionCode(context),
-                    ),
-                    "line_number_code" : indented(
-                        getErrorLineNumberUpdateCode(context)
-                    )
-                },
-                0
+        error_exit_code = template_error_exit_exception % {
+            "exception_exit"       : context.getExceptionEscape(),
+            "release_temps"        : getErrorExitReleaseCode(context),
+            "var_description_code" : getFrameVariableTypeDescriptionCode(context)
+        }
+
+    emit(
+        template_error_catch_exception % {
+            "condition"        : condition,
+            "error_exit"       : context.getSharedErrorExitLabel(error_exit_code),
+            "line_number_code" : indented(
+                getErrorLineNumberUpdateCode(context)
             )
-        )
+        }
+    )
+
+
+def getSharedErrorExitsCode(context):
+    """ Code of the error exit epilogues shared in a function.
+
+    This must be placed where it is not reached by normal control flow, e.g.
+    after a return, it is only entered by the gotos of the error exits.
+    """
+
+    emit = SourceCodeCollector()
+
+    for label, error_exit_code in context.getSharedErrorExits():
+        getColdLabelCode(label, emit)
+        emit(error_exit_code)
+
+    return '\n'.join(emit.codes)
 
 
 def getErrorExitCode(check_name, emit, context, quick_exception = None, needs_check = True):
@@ -199,66 +206,88 @@ def getErrorFormatExitBoolCode(condition, exception, args, emit, context):
 
 
 def getErrorVariableDeclarations():
+    # These are only used until the exception is handled or kept, and never
+    # across a yield, so they are always C locals.
     return (
-        "PyObject *exception_type = NULL;",
-        "PyObject *exception_value = NULL;",
-        "PyTracebackObject *exception_tb = NULL;",
-        "NUITKA_MAY_BE_UNUSED int exception_lineno = 0;"
+        VariableDeclaration("PyObject *", "exception_type", "NULL", None),
+        VariableDeclaration("PyObject *", "exception_value", "NULL", None),
+        VariableDeclaration("PyTracebackObject *", "exception_tb", "NULL", None),
+        VariableDeclaration(
+            "NUITKA_MAY_BE_UNUSED int",
+            "exception_lineno",
+            '0',
+            None
+        )
     )
 
-def getExceptionKeeperVariableNames(keeper_index):
+
+def getExceptionKeeperVariableDeclarations(keeper_index, heap_name):
     # For finally handlers of Python3, which have conditions on assign and
     # use.
     debug = Options.isDebug() and python_version >= 300
 
     if debug:
-        keeper_obj_init = " = NULL"
+        keeper_obj_init = "NULL"
     else:
-        keeper_obj_init = ""
+        keeper_obj_init = None
 
     return (
-        "PyObject *exception_keeper_type_%d%s;" % (
-            keeper_index,
-            keeper_obj_init
+        VariableDeclaration(
+            "PyObject *",
+            "exception_keeper_type_%d" % keeper_index,
+            keeper_obj_init,
+            heap_name
         ),
-        "PyObject *exception_keeper_value_%d%s;" % (
-            keeper_index,
-            keeper_obj_init
+        VariableDeclaration(
+            "PyObject *",
+            "exception_keeper_value_%d" % keeper_index,
+            keeper_obj_init,
+            heap_name
         ),
-        "PyTracebackObject *exception_keeper_tb_%d%s;" % (
-            keeper_index,
-            keeper_obj_init
+        VariableDeclaration(
+            "PyTracebackObject *",
+            "exception_keeper_tb_%d" % keeper_index,
+            keeper_obj_init,
+            heap_name
         ),
-        "NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_%d%s;" % (
-            keeper_index,
-            " = 0" if debug else ""
+        VariableDeclaration(
+            "NUITKA_MAY_BE_UNUSED int",
+            "exception_keeper_lineno_%d" % keeper_index,
+            '0' if debug else None,
+            heap_name
         )
     )
 
 
-def getExceptionPreserverVariableNames(preserver_id):
+def getExceptionPreserverVariableDeclarations(preserver_id, heap_name):
     # For finally handlers of Python3, which have conditions on assign and
     # use.
     debug = Options.isDebug() and python_version >= 300
 
     if debug:
-        preserver_obj_init = " = NULL"
+        preserver_obj_init = "NULL"
     else:
-        preserver_obj_init = ""
+        preserver_obj_init = None
 
     return (
-        "PyObject *exception_preserved_type_%d%s;" % (
-            preserver_id,
-            preserver_obj_init
+        VariableDeclaration(
+            "PyObject *",
+            "exception_preserved_type_%d" % preserver_id,
+            preserver_obj_init,
+            heap_name
         ),
-        "PyObject *exception_preserved_value_%d%s;" % (
-            preserver_id,
-            preserver_obj_init
-        ),
-        "PyTracebackObject *exception_preserved_tb_%d%s;" % (
-            preserver_id,
-            preserver_obj_init
+        VariableDeclaration(
+            "PyObject *",
+            "exception_preserved_value_%d" % preserver_id,
+            preserver_obj_init,
+            heap_name
         ),
+        VariableDeclaration(
+            "PyTracebackObject *",
+            "exception_preserved_tb_%d" % preserver_id,
+            preserver_obj_init,
+            heap_name
+        )
     )
 
 
@@ -300,13 +329,7 @@ def getMustNotGetHereCode(reason, context, emit):
         }
     )
 
-    if provider.isExpressionGeneratorObjectBody():
-        emit("return;")
-    elif provider.isExpressionCoroutineObjectBody():
-        emit("return;")
-    elif provider.isExpressionAsyncgenObjectBody():
-        emit("return;")
-    elif provider.isCompiledPythonModule():
+    if provider.isCompiledPythonModule():
         emit("return MOD_RETURN_VALUE( NULL );")
     else:
         emit("return NULL;")
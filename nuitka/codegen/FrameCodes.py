@@ -28,12 +28,11 @@ from .CodeHelpers import _generateStatementSequenceCode
 from .ErrorCodes import getFrameVariableTypeDescriptionCode
 from .ExceptionCodes import getTracebackMakingIdentifier
 from .Indentation import indented
-from .LabelCodes import getGotoCode, getLabelCode
+from .LabelCodes import getColdLabelCode, getGotoCode, getLabelCode
+from .LineNumberCodes import emitErrorLineNumberUpdateCode
 from .ModuleCodes import getModuleAccessCode
 from .templates.CodeTemplatesFrames import (
     template_frame_attach_locals,
-    template_frame_guard_cache_decl,
-    template_frame_guard_frame_decl,
     template_frame_guard_full_block,
     template_frame_guard_full_exception_handler,
     template_frame_guard_full_return_handler,
@@ -42,6 +41,42 @@ from .templates.CodeTemplatesFrames import (
     template_frame_guard_generator_return_handler,
     template_frame_guard_once
 )
+from .VariableDeclarations import VariableDeclaration
+
+
+def getFrameCacheDeclaration(frame_identifier):
+    # Static storage, which is kept by generators too.
+    return VariableDeclaration(
+        "static struct Nuitka_FrameObject *",
+        "cache_" + frame_identifier,
+        "NULL",
+        None
+    )
+
+
+def getFrameDeclaration(frame_name, context):
+    # Generators use the frame of their object, other frames are C locals,
+    # kept in the heap storage if there is one, as e.g. coroutines can leave
+    # them at an "await".
+    return VariableDeclaration(
+        "struct Nuitka_FrameObject *",
+        frame_name,
+        None,
+        context.getLocalHeapName()
+    )
+
+
+def _getFrameName(frame_identifier, context):
+    """ Name of a frame, the identifier may access it in the heap storage. """
+
+    heap_name = context.getLocalHeapName()
+
+    if heap_name is not None:
+        assert frame_identifier.startswith(heap_name + "->"), frame_identifier
+
+        frame_identifier = frame_identifier[len(heap_name)+2:]
+
+    return frame_identifier
 
 
 def getFrameLocalsStorageSize(type_descriptions):
@@ -90,6 +125,12 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
         real_parent_exception_exit = parent_exception_exit
         parent_exception_exit = context.allocateLabel("nested_frame_exit")
 
+        # Nested frames entered before any statement of the parent frame,
+        # e.g. contractions in returns of outlines, start at its line.
+        parent_source_ref = context.getCurrentSourceCodeReference()
+        if parent_source_ref is None:
+            parent_source_ref = statement_sequence.getSourceReference()
+
     if statement_sequence.hasStructureMember():
         frame_identifier = "%s->m_frame" % context.getContextObjectName()
     else:
@@ -97,7 +138,8 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 
     # Allow stacking of frame handles.
     frame_identifier = context.pushFrameHandle(
-        frame_identifier
+        frame_handle = frame_identifier,
+        is_light     = statement_sequence.hasStructureMember()
     )
 
     context.setExceptionEscape(
@@ -119,8 +161,13 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
     # have a flag that says "always NULL" for variables. With efficient NULL
     # passing however (not at all, TODO), that doesn't matter much.
     local_variables = statement_sequence.getParentVariableProvider().getLocalVariables()
+    frame_variables = statement_sequence.getFrameVariables()
 
     def search(variable_name):
+        # In-lined frames have their variables given.
+        if frame_variables is not None:
+            return frame_variables.get(variable_name)
+
         for local_variable in local_variables:
             if local_variable.getName() == variable_name:
                 return local_variable
@@ -209,8 +256,14 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
     if context.getFrameHandle() is not None:
         label = context.allocateLabel("skip_nested_handling")
         getGotoCode(label, emit)
-        getLabelCode(parent_exception_exit, emit)
+        getColdLabelCode(parent_exception_exit, emit)
         emit(getFrameVariableTypeDescriptionCode(context))
+
+        # The exception passes through the parent frame at the line, where
+        # the nested frame was entered.
+        context.setCurrentSourceCodeReference(parent_source_ref)
+        emitErrorLineNumberUpdateCode(emit, context)
+
         getGotoCode(real_parent_exception_exit, emit)
         getLabelCode(label, emit)
 
@@ -226,7 +279,7 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
 
 
 def getTypeSizeOf(type_indicator):
-    if type_indicator in ('O', 'o', 'N', 'c'):
+    if type_indicator in ('O', 'o', 'N', 'c', 'L'):
         return "sizeof(void *)"
     elif type_indicator == 'b':
         return "sizeof(nuitka_bool)"
@@ -240,10 +293,15 @@ def getFrameAttachLocalsCode(context, frame_identifier):
     if frame_variable_codes:
         frame_variable_codes = ",\n    " + frame_variable_codes
 
+        type_description = context.getFrameVariableTypeDescriptionName()
+    else:
+        # Without variables, the type description is never set, and could
+        # be one of another frame, e.g. one in-lined before.
+        type_description = "NULL"
 
     return template_frame_attach_locals % {
         "frame_identifier"      : frame_identifier,
-        "type_description"      : context.getFrameVariableTypeDescriptionName(),
+        "type_description"      : type_description,
         "frame_variable_refs"   : frame_variable_codes
     }
 
@@ -256,26 +314,25 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
 
     no_exception_exit = context.allocateLabel("frame_no_exception")
 
+    frame_name = _getFrameName(frame_identifier, context)
+
     context.addFrameDeclaration(
-        template_frame_guard_cache_decl % {
-            "frame_identifier" : frame_identifier,
-        }
+        getFrameCacheDeclaration(frame_name)
     )
     context.addFrameDeclaration(
-        template_frame_guard_frame_decl % {
-            "frame_identifier" : frame_identifier,
-        }
+        getFrameDeclaration(frame_name, context)
     )
 
     emit(
         template_frame_guard_full_block % {
-            "frame_identifier"  : frame_identifier,
-            "code_identifier"   : code_identifier,
-            "locals_size"       : getFrameLocalsStorageSize(type_descriptions),
-            "codes"             : indented(codes, 0),
-            "module_identifier" : getModuleAccessCode(context),
-            "no_exception_exit" : no_exception_exit,
-            "needs_preserve"    : 1 if needs_preserve else 0,
+            "frame_identifier"       : frame_identifier,
+            "frame_cache_identifier" : "cache_" + frame_name,
+            "code_identifier"        : code_identifier,
+            "locals_size"            : getFrameLocalsStorageSize(type_descriptions),
+            "codes"                  : indented(codes, 0),
+            "module_identifier"      : getModuleAccessCode(context),
+            "no_exception_exit"      : no_exception_exit,
+            "needs_preserve"         : 1 if needs_preserve else 0,
         }
     )
 
@@ -293,15 +350,16 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
 
         emit(
             template_frame_guard_full_exception_handler % {
-                "frame_identifier"      : frame_identifier,
-                "tb_making"             : getTracebackMakingIdentifier(
-                                              context     = context,
-                                              lineno_name = "exception_lineno"
-                                          ),
-                "parent_exception_exit" : parent_exception_exit,
-                "frame_exception_exit"  : frame_exception_exit,
-                "attach_locals"         : getFrameAttachLocalsCode(context, frame_identifier),
-                "needs_preserve"        : 1 if needs_preserve else 0,
+                "frame_identifier"       : frame_identifier,
+                "frame_cache_identifier" : "cache_" + frame_name,
+                "tb_making"              : getTracebackMakingIdentifier(
+                                               context     = context,
+                                               lineno_name = "exception_lineno"
+                                           ),
+                "parent_exception_exit"  : parent_exception_exit,
+                "frame_exception_exit"   : frame_exception_exit,
+                "attach_locals"          : getFrameAttachLocalsCode(context, frame_identifier),
+                "needs_preserve"         : 1 if needs_preserve else 0,
             }
         )
 
@@ -318,9 +376,7 @@ def getFrameGuardOnceCode(frame_identifier, code_identifier,
     assert parent_return_exit is None and frame_return_exit is None
 
     context.addFrameDeclaration(
-        template_frame_guard_frame_decl % {
-            "frame_identifier" : frame_identifier,
-        }
+        getFrameDeclaration(frame_identifier, context)
     )
 
     emit(
@@ -352,9 +408,7 @@ def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
     context_identifier = context.getContextObjectName()
 
     context.addFrameDeclaration(
-        template_frame_guard_cache_decl % {
-            "frame_identifier" : "frame_" + context_identifier,
-        }
+        getFrameCacheDeclaration("frame_" + context_identifier)
     )
 
     no_exception_exit = context.allocateLabel("frame_no_exception")
@@ -423,16 +477,21 @@ def generateFramePreserveExceptionCode(statement, emit, context):
         else:
             context.addExceptionPreserverVariables(preserver_id)
 
+            preserved_type, preserved_value, preserved_tb = \
+              context.getExceptionPreserverVariables(preserver_id)
+
             emit(
                 """\
-exception_preserved_type_%(preserver_id)d = PyThreadState_GET()->exc_type;
-Py_XINCREF( exception_preserved_type_%(preserver_id)d );
-exception_preserved_value_%(preserver_id)d = PyThreadState_GET()->exc_value;
-Py_XINCREF( exception_preserved_value_%(preserver_id)d );
-exception_preserved_tb_%(preserver_id)d = (PyTracebackObject *)PyThreadState_GET()->exc_traceback;
-Py_XINCREF( exception_preserved_tb_%(preserver_id)d );
+%(preserved_type)s = PyThreadState_GET()->exc_type;
+Py_XINCREF( %(preserved_type)s );
+%(preserved_value)s = PyThreadState_GET()->exc_value;
+Py_XINCREF( %(preserved_value)s );
+%(preserved_tb)s = (PyTracebackObject *)PyThreadState_GET()->exc_traceback;
+Py_XINCREF( %(preserved_tb)s );
 """ % {
-                    "preserver_id"  : preserver_id,
+                    "preserved_type"  : preserved_type,
+                    "preserved_value" : preserved_value,
+                    "preserved_tb"    : preserved_tb
                 }
             )
 
@@ -457,10 +516,7 @@ def generateFrameRestoreExceptionCode(statement, emit, context):
             )
         else:
             emit(
-                """\
-SET_CURRENT_EXCEPTION( exception_preserved_type_%(preserver_id)d, \
-exception_preserved_value_%(preserver_id)d, \
-exception_preserved_tb_%(preserver_id)d );""" % {
-                    "preserver_id" : preserver_id,
-                }
+                "SET_CURRENT_EXCEPTION( %s, %s, %s );" % (
+                    context.getExceptionPreserverVariables(preserver_id)
+                )
             )
@@ -28,13 +28,19 @@ from .Emission import SourceCodeCollector
 from .ErrorCodes import (
     getErrorExitCode,
     getErrorVariableDeclarations,
-    getExceptionKeeperVariableNames,
-    getExceptionPreserverVariableNames,
+    getExceptionKeeperVariableDeclarations,
+    getExceptionPreserverVariableDeclarations,
     getMustNotGetHereCode,
-    getReleaseCode
+    getReleaseCode,
+    getSharedErrorExitsCode
 )
 from .Indentation import indented
-from .LabelCodes import getGotoCode, getLabelCode
+from .LabelCodes import (
+    getBranchingCode,
+    getColdLabelCode,
+    getGotoCode,
+    getLabelCode
+)
 from .LineNumberCodes import emitErrorLineNumberUpdateCode
 from .ModuleCodes import getModuleAccessCode
 from .PythonAPICodes import getReferenceExportCode
@@ -50,24 +56,34 @@ from .templates.CodeTemplatesFunction import (
 from .TupleCodes import getTupleCreationCode
 from .VariableCodes import (
     getLocalVariableCodeType,
-    getLocalVariableInitCode,
-    getVariableCode,
+    getLocalVariableDeclaration,
     getVariableCodeName
 )
+from .VariableDeclarations import (
+    VariableDeclaration,
+    getCFunctionLevelDeclarations
+)
 
 
 def getClosureVariableProvisionCode(context, closure_variables):
     result = []
 
     for variable, version, _trace in closure_variables:
-        result.append(
-            getVariableCode(
-                context  = context,
-                variable = variable,
-                version  = version
-            )
+        variable_code_name, variable_c_type = getLocalVariableCodeType(
+            context  = context,
+            variable = variable,
+            version  = version
         )
 
+        if variable.isSharedByValue():
+            result.append(
+                variable_c_type.getLocalVariableObjectAccessCode(
+                    variable_code_name
+                )
+            )
+        else:
+            result.append(variable_code_name)
+
     return result
 
 
@@ -86,7 +102,10 @@ def _getFunctionCreationArgs(defaults_name, kw_defaults_name,
 
     for closure_variable in closure_variables:
         result.append(
-            "struct Nuitka_CellObject *%s" % (
+            "%s%s" % (
+                "PyObject *"
+                  if closure_variable.isSharedByValue() else
+                "struct Nuitka_CellObject *",
                 getVariableCodeName(
                     variable   = closure_variable,
                     in_context = True
@@ -143,9 +162,11 @@ def getFunctionMakerCode(function_name, function_qualname, function_identifier,
 
     for count, closure_variable in enumerate(closure_variables):
         closure_copy.append(
-            "result->m_closure[%d] = %s;" % (
-
+            "result->m_closure[%d] = %s%s;" % (
                 count,
+                "(struct Nuitka_CellObject *)"
+                  if closure_variable.isSharedByValue() else
+                "",
                 getVariableCodeName(
                     True,
                     closure_variable
@@ -156,6 +177,24 @@ def getFunctionMakerCode(function_name, function_qualname, function_identifier,
             "Py_INCREF( result->m_closure[%d] );" %count
         )
 
+    # For "__closure__", the values taken without cell need to be known. The
+    # C name must not clash with "closure_" prefixed closure variable names.
+    closure_values = [
+        "true" if closure_variable.isSharedByValue() else "false"
+        for closure_variable in
+        closure_variables
+    ]
+
+    if "true" in closure_values:
+        closure_copy.append(
+            "static bool const taken_by_value[] = { %s };" % (
+                ", ".join(closure_values)
+            )
+        )
+        closure_copy.append(
+            "result->m_closure_values = taken_by_value;"
+        )
+
     result = template_make_function_template % {
         "function_name_obj"          : context.getConstantCode(
             constant = function_name
@@ -448,7 +487,7 @@ def setupFunctionLocalVariables(context, parameters, closure_variables,
     if parameters is not None:
         for count, variable in enumerate(parameters.getAllVariables()):
             function_locals.append(
-                getLocalVariableInitCode(
+                getLocalVariableDeclaration(
                     context   = context,
                     variable  = variable,
                     version   = 0,
@@ -458,7 +497,7 @@ def setupFunctionLocalVariables(context, parameters, closure_variables,
 
     # User local variable initializations
     function_locals += [
-        getLocalVariableInitCode(
+        getLocalVariableDeclaration(
             context   = context,
             variable  = variable,
             version   = 0,
@@ -495,47 +534,46 @@ def setupFunctionLocalVariables(context, parameters, closure_variables,
 
 
 def finalizeFunctionLocalVariables(context, function_locals, function_cleanup):
+    heap_name = context.getLocalHeapName()
+
     if context.needsExceptionVariables():
         function_locals.extend(getErrorVariableDeclarations())
 
     for keeper_index in range(1, context.getKeeperVariableCount()+1):
-        function_locals.extend(getExceptionKeeperVariableNames(keeper_index))
+        function_locals.extend(
+            getExceptionKeeperVariableDeclarations(keeper_index, heap_name)
+        )
 
     for preserver_id in context.getExceptionPreserverCounts():
-        function_locals.extend(getExceptionPreserverVariableNames(preserver_id))
+        function_locals.extend(
+            getExceptionPreserverVariableDeclarations(preserver_id, heap_name)
+        )
 
-    tmp_infos = context.getTempNameInfos()
+    for tmp_name, tmp_type in context.getTempNameInfos():
+        # TODO: Could avoid this unless try/except or try/finally with returns
+        # occur.
+        if tmp_name == "tmp_return_value" or \
+           tmp_name.startswith("tmp_outline_return_value_"):
+            init_value = "NULL"
+        elif tmp_name == "tmp_generator_return":
+            init_value = "false"
+        else:
+            init_value = None
 
-    function_locals += [
-        "%s%s%s;" % (
-            tmp_type,
-            ' ' if not tmp_type.endswith('*') else "",
-            tmp_name
+        function_locals.append(
+            VariableDeclaration(tmp_type, tmp_name, init_value, heap_name)
         )
-        for tmp_name, tmp_type in
-        tmp_infos
-    ]
 
     function_locals += context.getFrameDeclarations()
 
-    # TODO: Could avoid this unless try/except or try/finally with returns
-    # occur.
-    if context.hasTempName("return_value"):
-        function_locals.append("tmp_return_value = NULL;")
-    if context.hasTempName("generator_return"):
-        function_locals.append("tmp_generator_return = false;")
-    for tmp_name, _tmp_type in tmp_infos:
-        if tmp_name.startswith("tmp_outline_return_value_"):
-            function_locals.append("%s = NULL;" % tmp_name)
-
     for locals_dict_name in context.getLocalsDictNames():
         function_locals.append(
-            "PyObject *%s = NULL;" % locals_dict_name
+            VariableDeclaration("PyObject *", locals_dict_name, "NULL", heap_name)
         )
 
         function_cleanup.append(
             "Py_XDECREF( %(locals_dict)s );\n" % {
-                "locals_dict" : locals_dict_name
+                "locals_dict" : context.getLocalStorageName(locals_dict_name)
             }
         )
 
@@ -580,6 +618,11 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
         emit    = emit
     )
 
+    # Not reached by control flow, only by the error exits.
+    shared_error_exits_code = getSharedErrorExitsCode(context)
+    if shared_error_exits_code:
+        emit(shared_error_exits_code)
+
     function_exit = indented(emit.codes) + "\n\n"
     del emit
 
@@ -620,7 +663,9 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
             "direct_call_arg_spec" : ", ".join(
                 parameter_objects_decl
             ),
-            "function_locals"      : indented(function_locals),
+            "function_locals"      : indented(
+                getCFunctionLevelDeclarations(function_locals)
+            ),
             "function_body"        : indented(function_codes.codes),
             "function_exit"        : function_exit
         }
@@ -628,7 +673,9 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
         result += template_function_body % {
             "function_identifier"    : function_identifier,
             "parameter_objects_decl" : ", ".join(parameter_objects_decl),
-            "function_locals"        : indented(function_locals),
+            "function_locals"        : indented(
+                getCFunctionLevelDeclarations(function_locals)
+            ),
             "function_body"          : indented(function_codes.codes),
             "function_exit"          : function_exit
         }
@@ -680,6 +727,74 @@ def generateFunctionCallCode(to_name, expression, emit, context):
     )
 
 
+def _getFunctionCodeCheckCondition(value_name, expression, context):
+    return """\
+Nuitka_Function_Check( %s ) && \
+((struct Nuitka_FunctionObject *)%s)->m_code_object == %s""" % (
+        value_name,
+        value_name,
+        context.getCodeObjectHandle(
+            code_object = expression.getCodeObject()
+        )
+    )
+
+
+def generateFunctionCodeCheckCode(to_name, expression, emit, context):
+    value_name = context.allocateTempName("code_check_value")
+
+    generateExpressionCode(
+        to_name    = value_name,
+        expression = expression.getValue(),
+        emit       = emit,
+        context    = context
+    )
+
+    emit(
+        "%s = BOOL_FROM( %s );" % (
+            to_name,
+            _getFunctionCodeCheckCondition(value_name, expression, context)
+        )
+    )
+
+    getReleaseCode(
+        release_name = value_name,
+        emit         = emit,
+        context      = context
+    )
+
+
+def generateFunctionCodeCheckConditionCode(condition, emit, context):
+    value_name = context.allocateTempName("code_check_value")
+
+    generateExpressionCode(
+        to_name    = value_name,
+        expression = condition.getValue(),
+        emit       = emit,
+        context    = context
+    )
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = %s;" % (
+            res_name,
+            _getFunctionCodeCheckCondition(value_name, condition, context)
+        )
+    )
+
+    getReleaseCode(
+        release_name = value_name,
+        emit         = emit,
+        context      = context
+    )
+
+    getBranchingCode(
+        condition = res_name,
+        emit      = emit,
+        context   = context
+    )
+
+
 def generateFunctionOutlineCode(to_name, expression, emit, context):
     assert expression.isExpressionOutlineBody() or \
            expression.isExpressionOutlineFunction() or \
@@ -700,7 +815,14 @@ def generateFunctionOutlineCode(to_name, expression, emit, context):
     return_value_name = context.allocateTempName("outline_return_value")
     old_return_value_name = context.setReturnValueName(return_value_name)
 
-    if expression.isExpressionOutlineFunctionBodyBase() and \
+    # Returns from the outline do not leave an exception handler it is in,
+    # only an exception leaving the outline replaces the kept exception.
+    old_keeper_variables = context.setExceptionKeeperVariables(
+        (None, None, None, None)
+    )
+
+    if (expression.isExpressionOutlineFunctionBodyBase() or \
+        old_keeper_variables[0] is not None) and \
        expression.getBody().mayRaiseException(BaseException):
         exception_target = context.allocateLabel("outline_exception")
         old_exception_target = context.setExceptionEscape(exception_target)
@@ -721,15 +843,24 @@ def generateFunctionOutlineCode(to_name, expression, emit, context):
     )
 
     if exception_target is not None:
-        getLabelCode(exception_target, emit)
+        getColdLabelCode(exception_target, emit)
+
+        if expression.isExpressionOutlineFunctionBodyBase():
+            context.setCurrentSourceCodeReference(expression.getSourceReference())
 
-        context.setCurrentSourceCodeReference(expression.getSourceReference())
+            emitErrorLineNumberUpdateCode(emit, context)
+
+        if old_keeper_variables[0] is not None:
+            emit("Py_DECREF( %s );" % old_keeper_variables[0])
+            emit("Py_XDECREF( %s );" % old_keeper_variables[1])
+            emit("Py_XDECREF( %s );" % old_keeper_variables[2])
 
-        emitErrorLineNumberUpdateCode(emit, context)
         getGotoCode(old_exception_target, emit)
 
         context.setExceptionEscape(old_exception_target)
 
+    context.setExceptionKeeperVariables(old_keeper_variables)
+
     getLabelCode(return_target, emit)
     emit(
         "%s = %s;" % (
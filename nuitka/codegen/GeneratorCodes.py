@@ -19,11 +19,11 @@
 
 """
 
-from nuitka import Options
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateStatementSequenceCode
 from .Emission import SourceCodeCollector
+from .ErrorCodes import getSharedErrorExitsCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
     setupFunctionLocalVariables
@@ -36,9 +36,15 @@ from .templates.CodeTemplatesGeneratorFunction import (
     template_generator_noexception_exit,
     template_generator_return_exit,
     template_genfunc_yielder_body_template,
-    template_genfunc_yielder_decl_template
+    template_genfunc_yielder_decl_template,
+    template_genfunc_yielder_heap_decl_template
 )
 from .VariableCodes import getLocalVariableCodeType
+from .VariableDeclarations import (
+    getCFunctionLevelDeclarations,
+    getCStructDeclarations,
+    getCStructInits
+)
 
 
 def getGeneratorObjectDeclCode(function_identifier):
@@ -51,7 +57,6 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
                            user_variables, outline_variables,
                            temp_variables, needs_exception_exit,
                            needs_generator_return):
-    # Due to the current experimental code, pylint: disable=too-many-locals
 
     function_locals, function_cleanup = setupFunctionLocalVariables(
         context           = context,
@@ -81,8 +86,43 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
             "function_cleanup" : indented(function_cleanup)
         }
 
+    # Not reached by control flow, only by the error exits.
+    shared_error_exits_code = getSharedErrorExitsCode(context)
+    if shared_error_exits_code:
+        generator_exit += indented(shared_error_exits_code) + '\n'
+
     if needs_generator_return:
-        generator_exit += template_generator_return_exit % {}
+        generator_exit += template_generator_return_exit % {
+            "return_value" : context.getGeneratorReturnValueName()
+        }
+
+    function_dispatch = getYieldReturnDispatchCode(context)
+
+    context.addDeclaration(
+        key  = function_identifier + "_locals",
+        code = template_genfunc_yielder_heap_decl_template % {
+            "function_identifier"  : function_identifier,
+            "function_local_types" : getHeapDeclarationsCode(function_locals)
+        }
+    )
+
+    return template_genfunc_yielder_body_template % {
+        "function_identifier" : function_identifier,
+        "function_body"       : indented(function_codes.codes),
+        "function_locals"     : indented(
+            getCFunctionLevelDeclarations(function_locals)
+        ),
+        "function_var_inits"  : indented(getCStructInits(function_locals)),
+        "function_dispatch"   : indented(function_dispatch),
+        "generator_exit"      : generator_exit
+    }
+
+
+def getYieldReturnDispatchCode(context):
+    """ Get code to continue at the yield the code returned at.
+
+    This gets used by generator/coroutine/asyncgen with their object name.
+    """
 
     function_dispatch = [
         "case %(index)d: goto yield_return_%(index)d;" % {
@@ -93,50 +133,22 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
     ]
 
     if function_dispatch:
-        function_dispatch.insert(0, "switch(generator->m_yield_return_index) {")
+        function_dispatch.insert(
+            0,
+            "switch(%s->m_yield_return_index) {" % context.getContextObjectName()
+        )
         function_dispatch.append('}')
 
-    local_type_decl = []
-    local_type_init = []
-    local_reals = []
+    return function_dispatch
 
-    for decl in function_locals:
-        if decl.startswith("NUITKA_MAY_BE_UNUSED "):
-            decl = decl[21:]
 
-        if decl.startswith("static"):
-            local_reals.append(decl)
-            continue
+def getHeapDeclarationsCode(function_locals):
+    """ Get the declarations of the C locals kept in the heap storage. """
 
-        if decl in ("char const *type_description;", "PyObject *tmp_unused;"):
-            local_reals.append(decl)
-            continue
-
-        parts = decl.split('=')
-
-        if len(parts) == 1:
-            local_type_decl.append(decl)
-        else:
-            type_decl = parts[0].strip()
-            var_name = type_decl.split('*')[-1]
-            var_name = var_name.split(' ')[-1]
-
-            local_type_decl.append(type_decl)
-            local_type_init.append(
-                "local_variables->" + var_name + " =" + parts[1]
-            )
-
-    if Options.isExperimental("generator_goto"):
-        function_locals = local_reals + local_type_init
-
-    return template_genfunc_yielder_body_template % {
-        "function_identifier"  : function_identifier,
-        "function_body"        : indented(function_codes.codes),
-        "function_local_types" : indented(local_type_decl),
-        "function_var_inits"   : indented(function_locals),
-        "function_dispatch"    : indented(function_dispatch),
-        "generator_exit"       : generator_exit
-    }
+    # Empty structs are not allowed in C.
+    return indented(
+        getCStructDeclarations(function_locals) or ["char dummy;"]
+    )
 
 
 def getClosureCopyCode(to_name, closure_variables, closure_type, context):
@@ -155,11 +167,24 @@ def getClosureCopyCode(to_name, closure_variables, closure_type, context):
             count
         )
 
-        variable_c_type.getCellObjectAssignmentCode(
-            target_cell_code   = target_cell_code,
-            variable_code_name = variable_code_name,
-            emit               = closure_copy.append
-        )
+        if variable.isSharedByValue():
+            closure_copy.append(
+                "%s = (struct Nuitka_CellObject *)%s;" % (
+                    target_cell_code,
+                    variable_c_type.getLocalVariableObjectAccessCode(
+                        variable_code_name
+                    )
+                )
+            )
+            closure_copy.append(
+                "Py_INCREF( %s );" % target_cell_code
+            )
+        else:
+            variable_c_type.getCellObjectAssignmentCode(
+                target_cell_code   = target_cell_code,
+                variable_code_name = variable_code_name,
+                emit               = closure_copy.append
+            )
 
     closure_copy.append(
         "assert( Py_SIZE( %s ) >= %s ); " % (
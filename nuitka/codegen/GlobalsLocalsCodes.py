@@ -34,13 +34,13 @@ from .VariableCodes import getLocalVariableCodeType
 
 
 def generateBuiltinLocalsRefCode(to_name, expression, emit, context):
-    # The locals scope is the context needed, pylint: disable=unused-argument
-
     emit(
         """\
 %s = %s;""" % (
             to_name,
-            expression.getLocalsScope().getCodeName(),
+            context.getLocalStorageName(
+                expression.getLocalsScope().getCodeName()
+            ),
         )
     )
 
@@ -83,7 +83,7 @@ if (%(locals_dict)s == NULL) %(locals_dict)s = PyDict_New();
 %(to_name)s = %(locals_dict)s;
 Py_INCREF( %(to_name)s );""" % {
                 "to_name" : to_name ,
-                "locals_dict" : locals_dict_name,
+                "locals_dict" : context.getLocalStorageName(locals_dict_name),
             }
         )
         context.addCleanupTempName(to_name)
@@ -105,7 +105,9 @@ Py_INCREF( %(to_name)s );""" % {
 if (%(locals_dict)s == NULL) %(locals_dict)s = PyDict_New();
 %(to_name)s = PyDict_Copy( %(locals_dict)s );""" % {
                     "to_name"     : to_name,
-                    "locals_dict" : locals_dict_name,
+                    "locals_dict" : context.getLocalStorageName(
+                        locals_dict_name
+                    ),
                 }
             )
 
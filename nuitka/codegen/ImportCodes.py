@@ -222,7 +222,7 @@ def generateImportStarCode(statement, emit, context):
 %(res_name)s = IMPORT_MODULE_STAR( %(locals_dict)s, false, %(module_name)s );
 """ % {
                 "res_name"    : res_name,
-                "locals_dict" : locals_dict_name,
+                "locals_dict" : context.getLocalStorageName(locals_dict_name),
                 "module_name" : module_name
             }
         )
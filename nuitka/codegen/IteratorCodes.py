@@ -22,6 +22,7 @@ Next variants and unpacking with related checks.
 
 from nuitka.PythonVersions import python_version
 
+from .c_types.CTypeNuitkaRangeCounters import CTypeNuitkaRangeCounter
 from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
 from .ErrorCodes import (
     getErrorExitCode,
@@ -36,26 +37,71 @@ from .templates.CodeTemplatesIterators import (
     template_iterator_check,
     template_loop_break_next
 )
+from .VariableCodes import getLocalVariableCodeType
 
 
-def generateBuiltinNext1Code(to_name, expression, emit, context):
-    value_name, = generateChildExpressionsCode(
-        expression = expression,
-        emit       = emit,
-        context    = context
+def getRangeCounterCodeName(expression, context):
+    """ Variable code name, if the expression reads a range counter. """
+
+    if not expression.isExpressionTempVariableRef():
+        return None
+
+    variable_code_name, variable_c_type = getLocalVariableCodeType(
+        context  = context,
+        variable = expression.getVariable(),
+        version  = expression.getVariableVersion()
     )
 
-    emit(
-        "%s = %s;" % (
-            to_name,
-            "ITERATOR_NEXT( %s )" % value_name,
+    if variable_c_type is CTypeNuitkaRangeCounter:
+        return variable_code_name
+    else:
+        return None
+
+
+def _getIteratorNextCode(to_name, value, counter_code_name, emit, context):
+    if counter_code_name is not None:
+        emit(
+            "%s = RANGE_COUNTER_NEXT( &%s );" % (
+                to_name,
+                counter_code_name
+            )
+        )
+    else:
+        emit(
+            "%s = %s;" % (
+                to_name,
+                "ITERATOR_NEXT( %s )" % value,
+            )
+        )
+
+        getReleaseCode(
+            release_name = value,
+            emit         = emit,
+            context      = context
         )
+
+
+def generateBuiltinNext1Code(to_name, expression, emit, context):
+    counter_code_name = getRangeCounterCodeName(
+        expression = expression.getValue(),
+        context    = context
     )
 
-    getReleaseCode(
-        release_name = value_name,
-        emit         = emit,
-        context      = context
+    if counter_code_name is None:
+        value_name, = generateChildExpressionsCode(
+            expression = expression,
+            emit       = emit,
+            context    = context
+        )
+    else:
+        value_name = None
+
+    _getIteratorNextCode(
+        to_name           = to_name,
+        value             = value_name,
+        counter_code_name = counter_code_name,
+        emit              = emit,
+        context           = context
     )
 
     getErrorExitCode(
@@ -68,18 +114,13 @@ def generateBuiltinNext1Code(to_name, expression, emit, context):
     context.addCleanupTempName(to_name)
 
 
-def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
-    emit(
-        "%s = %s;" % (
-            to_name,
-            "ITERATOR_NEXT( %s )" % value,
-        )
-    )
-
-    getReleaseCode(
-        release_name = value,
-        emit         = emit,
-        context      = context
+def getBuiltinLoopBreakNextCode(to_name, value, counter_code_name, emit, context):
+    _getIteratorNextCode(
+        to_name           = to_name,
+        value             = value,
+        counter_code_name = counter_code_name,
+        emit              = emit,
+        context           = context
     )
 
     break_target = context.getLoopBreakTarget()
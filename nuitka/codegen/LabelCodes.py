@@ -41,6 +41,16 @@ def getLabelCode(label, emit):
     )
 
 
+def getColdLabelCode(label, emit):
+    """ Label for code that is rarely executed, e.g. exception handlers. """
+
+    assert label is not None
+
+    emit(
+        "%s: NUITKA_COLD_LABEL;" % label
+    )
+
+
 def getBranchingCode(condition, emit, context):
     true_target = context.getTrueBranchTarget()
     false_target = context.getFalseBranchTarget()
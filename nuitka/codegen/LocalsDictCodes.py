@@ -50,7 +50,7 @@ def generateSetLocalsDictCode(statement, emit, context):
     emit(
         """\
 %(locals_dict)s = %(locals_value)s;""" % {
-            "locals_dict"  : locals_dict_name,
+            "locals_dict"  : context.getLocalStorageName(locals_dict_name),
             "locals_value" : new_locals_name
         }
     )
@@ -63,9 +63,9 @@ def generateSetLocalsDictCode(statement, emit, context):
 
 
 def generateReleaseLocalsDictCode(statement, emit, context):
-    # The statement has it all, pylint: disable=unused-argument
-
-    locals_dict_name = statement.getLocalsScope().getCodeName()
+    locals_dict_name = context.getLocalStorageName(
+        statement.getLocalsScope().getCodeName()
+    )
 
     emit(
         """\
@@ -89,7 +89,7 @@ def generateLocalsDictSetCode(statement, emit, context):
 
     locals_scope = statement.getLocalsDictScope()
 
-    dict_arg_name = locals_scope.getCodeName()
+    dict_arg_name = context.getLocalStorageName(locals_scope.getCodeName())
     is_dict = locals_scope.getTypeShape() is ShapeTypeDict
 
     res_name = context.getIntResName()
@@ -130,7 +130,7 @@ def generateLocalsDictSetCode(statement, emit, context):
 def generateLocalsDictDelCode(statement, emit, context):
     locals_scope = statement.getLocalsDictScope()
 
-    dict_arg_name = locals_scope.getCodeName()
+    dict_arg_name = context.getLocalStorageName(locals_scope.getCodeName())
     is_dict = locals_scope.getTypeShape() is ShapeTypeDict
 
     context.setCurrentSourceCodeReference(statement.getSourceReference())
@@ -185,7 +185,7 @@ def generateLocalsDictVariableRefOrFallbackCode(to_name, expression, emit, conte
 
     locals_scope = expression.getLocalsDictScope()
 
-    dict_arg_name = locals_scope.getCodeName()
+    dict_arg_name = context.getLocalStorageName(locals_scope.getCodeName())
     is_dict = locals_scope.getTypeShape() is ShapeTypeDict
 
     if is_dict:
@@ -210,7 +210,7 @@ def generateLocalsDictVariableRefCode(to_name, expression, emit, context):
 
     locals_scope = expression.getLocalsDictScope()
 
-    dict_arg_name = locals_scope.getCodeName()
+    dict_arg_name = context.getLocalStorageName(locals_scope.getCodeName())
     is_dict = locals_scope.getTypeShape() is ShapeTypeDict
 
     # TODO: Be more special.
@@ -244,7 +244,9 @@ def generateLocalsDictVariableCheckCode(to_name, expression, emit, context):
 """
         emit(
             template % {
-                "locals_dict" : expression.getLocalsDictScope().getCodeName(),
+                "locals_dict" : context.getLocalStorageName(
+                    expression.getLocalsDictScope().getCodeName()
+                ),
                 "var_name"    : context.getConstantCode(
                     constant = variable_name
                 ),
@@ -260,7 +262,9 @@ def generateLocalsDictVariableCheckCode(to_name, expression, emit, context):
 
         emit(
             template % {
-                "locals_dict" : expression.getLocalsDictScope().getCodeName(),
+                "locals_dict" : context.getLocalStorageName(
+                    expression.getLocalsDictScope().getCodeName()
+                ),
                 "var_name"    : context.getConstantCode(
                     constant = variable_name
                 ),
@@ -23,6 +23,7 @@ from nuitka.Version import getNuitkaVersion, getNuitkaVersionYear
 
 from .CodeObjectCodes import getCodeObjectsDeclCode, getCodeObjectsInitCode
 from .ConstantCodes import allocateNestedConstants, getConstantInitCodes
+from .ErrorCodes import getSharedErrorExitsCode
 from .Indentation import indented
 from .templates.CodeTemplatesModules import (
     template_global_copyright,
@@ -31,6 +32,7 @@ from .templates.CodeTemplatesModules import (
     template_module_noexception_exit
 )
 from .VariableCodes import generateModuleVariableAccessCode
+from .VariableDeclarations import getCFunctionLevelDeclarations
 
 
 def getModuleAccessCode(context):
@@ -62,6 +64,14 @@ def getModuleValues(context, module_name, module_identifier, codes,
     else:
         module_exit = template_module_noexception_exit
 
+    # Not reached by control flow, only by the error exits.
+    shared_error_exits_code = getSharedErrorExitsCode(context)
+    if shared_error_exits_code:
+        module_exit = "%s\n%s" % (
+            indented(shared_error_exits_code),
+            module_exit
+        )
+
     module_body_template_values = {
         "module_name"              : module_name,
         "module_name_obj"          : context.getConstantCode(
@@ -72,7 +82,9 @@ def getModuleValues(context, module_name, module_identifier, codes,
         "module_identifier"        : module_identifier,
         "module_functions_decl"    : function_decl_codes,
         "module_functions_code"    : function_body_codes,
-        "temps_decl"               : indented(local_var_inits),
+        "temps_decl"               : indented(
+            getCFunctionLevelDeclarations(local_var_inits)
+        ),
         "module_code"              : indented(codes),
         "module_exit"              : module_exit,
         "module_code_objects_decl" : indented(
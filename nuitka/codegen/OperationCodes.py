@@ -22,12 +22,114 @@ of course types could play into it. Then there is also the added difficulty of
 in-place assignments, which have other operation variants.
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeList,
+    ShapeTypeLong,
+    ShapeTypeStr,
+    ShapeTypeTuple,
+    ShapeTypeUnicode
+)
+from nuitka.PythonVersions import python_version
+
 from . import OperatorCodes
 from .CodeHelpers import generateChildExpressionsCode
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCode
+from .VariableCodes import (
+    getCDoubleOperationCode,
+    isCDoubleOperation,
+    isCDoubleVariableRef
+)
+
+# Names of type shapes in the specialized helper names.
+_specialized_shape_names = {
+    ShapeTypeInt   : "INT",
+    ShapeTypeLong  : "LONG",
+    ShapeTypeFloat : "FLOAT",
+    ShapeTypeStr   : "STR",
+    ShapeTypeList  : "LIST",
+    ShapeTypeTuple : "TUPLE",
+}
+
+if python_version < 300:
+    _specialized_shape_names[ShapeTypeUnicode] = "UNICODE"
+
+# Specialized helpers for the operand shapes, in "operations_specialized.h".
+_specialized_helpers = set(
+    (
+        "BINARY_OPERATION_ADD_INT_INT",
+        "BINARY_OPERATION_ADD_LONG_LONG",
+        "BINARY_OPERATION_ADD_FLOAT_FLOAT",
+        "BINARY_OPERATION_ADD_STR_STR",
+        "BINARY_OPERATION_ADD_LIST_LIST",
+        "BINARY_OPERATION_ADD_TUPLE_TUPLE",
+        "BINARY_OPERATION_MUL_INT_INT",
+        "BINARY_OPERATION_MUL_LONG_LONG",
+        "BINARY_OPERATION_MUL_FLOAT_FLOAT",
+        "BINARY_OPERATION_TRUEDIV_INT_INT",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT",
+        "BINARY_OPERATION_REMAINDER_INT_INT",
+        "BINARY_OPERATION_REMAINDER_FLOAT_FLOAT",
+    )
+)
+
+if python_version < 300:
+    _specialized_helpers.add("BINARY_OPERATION_ADD_UNICODE_UNICODE")
+    _specialized_helpers.add("BINARY_OPERATION_DIV_FLOAT_FLOAT")
+
+
+def _getSpecializedHelper(helper, shapes):
+    shape_names = tuple(
+        _specialized_shape_names.get(shape)
+        for shape in
+        shapes
+    )
+
+    if None in shape_names:
+        return helper
+
+    specialized_helper = '_'.join((helper,) + shape_names)
+
+    if specialized_helper in _specialized_helpers:
+        return specialized_helper
+    else:
+        return helper
+
+
+def _generateOperationBinaryCDoubleCode(to_name, expression, emit, context):
+    emit(
+        "%s = PyFloat_FromDouble( %s );" % (
+            to_name,
+            getCDoubleOperationCode(expression, emit, context)
+        )
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
 
 
 def generateOperationBinaryCode(to_name, expression, emit, context):
+    # For operations on other operations or values, that are already C double
+    # values, only the result becomes an object.
+    if isCDoubleOperation(expression):
+        for operand in expression.getOperands():
+            if isCDoubleOperation(operand) or \
+               isCDoubleVariableRef(operand, context):
+                _generateOperationBinaryCDoubleCode(
+                    to_name    = to_name,
+                    expression = expression,
+                    emit       = emit,
+                    context    = context
+                )
+
+                return
+
     left_arg_name, right_arg_name = generateChildExpressionsCode(
         expression = expression,
         emit       = emit,
@@ -44,6 +146,10 @@ def generateOperationBinaryCode(to_name, expression, emit, context):
         operator  = expression.getOperator(),
         arg_names = (left_arg_name, right_arg_name),
         in_place  = inplace,
+        shapes    = (
+            expression.getLeft().getTypeShape(),
+            expression.getRight().getTypeShape()
+        ),
         emit      = emit,
         context   = context
     )
@@ -71,7 +177,8 @@ def generateOperationUnaryCode(to_name, expression, emit, context):
     )
 
 
-def getOperationCode(to_name, operator, arg_names, in_place, emit, context):
+def getOperationCode(to_name, operator, arg_names, in_place, emit, context,
+                     shapes = None):
     # This needs to have one case per operation of Python, and there are many
     # of these, # pylint: disable=too-many-branches,too-many-statements
 
@@ -171,6 +278,11 @@ def getOperationCode(to_name, operator, arg_names, in_place, emit, context):
             context.addCleanupTempName(to_name)
 
     else:
+        # With operand types known at compile time, a helper without the
+        # dispatch on types may exist.
+        if shapes is not None and not prefix_args:
+            helper = _getSpecializedHelper(helper, shapes)
+
         emit(
             "%s = %s( %s );" % (
                 to_name,
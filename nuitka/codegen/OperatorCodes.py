@@ -70,6 +70,7 @@ unary_operator_codes = {
     "USub"   : ("PyNumber_Negative", 1),
     "Invert" : ("PyNumber_Invert", 1),
     "Repr"   : ("PyObject_Repr", 1),
+    "Abs"    : ("PyNumber_Absolute", 1),
     "Not"    : ("UNARY_NOT", 0)
 }
 
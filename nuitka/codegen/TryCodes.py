@@ -27,8 +27,11 @@ from nuitka import Options
 from .CodeHelpers import generateExpressionCode, generateStatementSequenceCode
 from .ErrorCodes import getMustNotGetHereCode
 from .ExceptionCodes import getExceptionUnpublishedReleaseCode
-from .IteratorCodes import getBuiltinLoopBreakNextCode
-from .LabelCodes import getGotoCode, getLabelCode
+from .IteratorCodes import (
+    getBuiltinLoopBreakNextCode,
+    getRangeCounterCodeName
+)
+from .LabelCodes import getColdLabelCode, getGotoCode, getLabelCode
 from .VariableCodes import getVariableAssignmentCode
 
 
@@ -140,7 +143,7 @@ def generateTryCode(statement, emit, context):
 
     if tried_block_may_raise:
         emit("// Exception handler code:")
-        getLabelCode(tried_handler_escape, emit)
+        getColdLabelCode(tried_handler_escape, emit)
 
         # Need to preserve exception state.
         keeper_type, keeper_value, keeper_tb, keeper_lineno = \
@@ -294,15 +297,23 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
        not no_statements[0].isStatementReraiseException():
         return False
 
-    tmp_name = context.allocateTempName("next_source")
-
-    generateExpressionCode(
+    counter_code_name = getRangeCounterCodeName(
         expression = assign_source.getValue(),
-        to_name    = tmp_name,
-        emit       = emit,
         context    = context
     )
 
+    if counter_code_name is None:
+        tmp_name = context.allocateTempName("next_source")
+
+        generateExpressionCode(
+            expression = assign_source.getValue(),
+            to_name    = tmp_name,
+            emit       = emit,
+            context    = context
+        )
+    else:
+        tmp_name = None
+
     tmp_name2 = context.allocateTempName("assign_source")
 
     old_source_ref = context.setCurrentSourceCodeReference(
@@ -312,10 +323,11 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     )
 
     getBuiltinLoopBreakNextCode(
-        to_name = tmp_name2,
-        value   = tmp_name,
-        emit    = emit,
-        context = context
+        to_name           = tmp_name2,
+        value             = tmp_name,
+        counter_code_name = counter_code_name,
+        emit              = emit,
+        context           = context
     )
 
     getVariableAssignmentCode(
@@ -19,22 +19,71 @@
 
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeFloat, ShapeTypeInt
 from nuitka.Options import isExperimental
+from nuitka.PythonVersions import python_version
 
+from .c_types.CTypeCDoubles import CTypeCDouble
+from .c_types.CTypeCLongs import CTypeCLong
+from .c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from .c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
+from .c_types.CTypeNuitkaRangeCounters import CTypeNuitkaRangeCounter
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
     CTypePyObjectPtrPtr
 )
-from .CodeHelpers import generateExpressionCode
-from .ErrorCodes import getCheckObjectCode, getNameReferenceErrorCode
+from .CodeHelpers import generateChildExpressionsCode, generateExpressionCode
+from .ErrorCodes import (
+    getCheckObjectCode,
+    getErrorExitBoolCode,
+    getNameReferenceErrorCode,
+    getReleaseCode,
+    getReleaseCodes
+)
 from .templates.CodeTemplatesVariables import (
     template_del_global_unclear,
+    template_read_mvar_cached,
     template_read_mvar_unclear
 )
+from .VariableDeclarations import VariableDeclaration
 
 
 def generateAssignmentVariableCode(statement, emit, context):
+    variable = statement.getVariable()
+
+    if variable.isTempVariable():
+        variable_code_name, variable_c_type = getLocalVariableCodeType(
+            context  = context,
+            variable = variable,
+            version  = statement.getVariableVersion()
+        )
+
+        if variable_c_type is CTypeNuitkaRangeCounter:
+            _generateRangeCounterAssignmentCode(
+                variable_code_name = variable_code_name,
+                range_node         = statement.getAssignSource().getValue(),
+                emit               = emit,
+                context            = context
+            )
+
+            return
+
+        if variable_c_type is CTypeCDouble:
+            if isCDoubleOperation(statement.getAssignSource()):
+                emit(
+                    "%s = %s;" % (
+                        variable_code_name,
+                        getCDoubleOperationCode(
+                            expression = statement.getAssignSource(),
+                            emit       = emit,
+                            context    = context
+                        )
+                    )
+                )
+
+                return
+
     tmp_name = context.allocateTempName("assign_source")
 
     generateExpressionCode(
@@ -58,6 +107,152 @@ def generateAssignmentVariableCode(statement, emit, context):
     assert not context.needsCleanup(tmp_name)
 
 
+def _generateRangeCounterAssignmentCode(variable_code_name, range_node,
+                                        emit, context):
+    arg_names = generateChildExpressionsCode(
+        expression = range_node,
+        emit       = emit,
+        context    = context
+    )
+
+    # The single argument form is the upper bound, despite its name.
+    if len(arg_names) == 1:
+        low_name, high_name, step_name = "NULL", arg_names[0], "NULL"
+    elif len(arg_names) == 2:
+        low_name, high_name, step_name = arg_names[0], arg_names[1], "NULL"
+    else:
+        low_name, high_name, step_name = arg_names
+
+    res_name = context.allocateTempName("range_counter_res", "bool")
+
+    emit(
+        "%s = MAKE_RANGE_COUNTER( &%s, %s, %s, %s, %s );" % (
+            res_name,
+            variable_code_name,
+            "true" if _isXrangeNode(range_node) else "false",
+            low_name,
+            high_name,
+            step_name
+        )
+    )
+
+    getReleaseCodes(
+        release_names = arg_names,
+        emit          = emit,
+        context       = context
+    )
+
+    old_source_ref = context.setCurrentSourceCodeReference(
+        range_node.getCompatibleSourceReference()
+    )
+
+    getErrorExitBoolCode(
+        condition = "%s == false" % res_name,
+        emit      = emit,
+        context   = context
+    )
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
+
+# Operators of "float" values, that cannot raise or run any code. These are
+# done with C double values.
+_c_double_operators = {
+    "Add"  : '+',
+    "Sub"  : '-',
+    "Mult" : '*',
+}
+
+
+def isCDoubleOperation(expression):
+    """ Can the operation be done with C double values of its operands. """
+
+    return expression.isExpressionOperationBinary() and \
+           expression.getOperator() in _c_double_operators and \
+           not expression.isInplaceSuspect() and \
+           expression.getLeft().getTypeShape() is ShapeTypeFloat and \
+           expression.getRight().getTypeShape() is ShapeTypeFloat
+
+
+def isCDoubleVariableRef(expression, context):
+    """ Does the expression read a C double temporary variable. """
+
+    if not expression.isExpressionTempVariableRef():
+        return False
+
+    _variable_code_name, variable_c_type = getLocalVariableCodeType(
+        context  = context,
+        variable = expression.getVariable(),
+        version  = expression.getVariableVersion()
+    )
+
+    return variable_c_type is CTypeCDouble
+
+
+def _getCDoubleOperandCode(operand, emit, context):
+    if isCDoubleOperation(operand):
+        return getCDoubleOperationCode(operand, emit, context)
+
+    if isCDoubleVariableRef(operand, context):
+        variable_code_name, _variable_c_type = getLocalVariableCodeType(
+            context  = context,
+            variable = operand.getVariable(),
+            version  = operand.getVariableVersion()
+        )
+
+        return variable_code_name
+
+    if operand.isExpressionConstantRef():
+        constant = operand.getConstant()
+
+        # No C literals exist for "inf" and "nan" values.
+        if constant - constant == 0.0:
+            return "(%r)" % constant
+
+    arg_name = context.allocateTempName("float_arg")
+
+    generateExpressionCode(
+        to_name    = arg_name,
+        expression = operand,
+        emit       = emit,
+        context    = context
+    )
+
+    value_name = context.allocateTempName("float_value", "double")
+
+    emit(
+        "%s = PyFloat_AS_DOUBLE( %s );" % (
+            value_name,
+            arg_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = arg_name,
+        emit         = emit,
+        context      = context
+    )
+
+    return value_name
+
+
+def getCDoubleOperationCode(expression, emit, context):
+    """ C expression of type double for the value of the operation.
+
+    Operands are evaluated in order, and nested operations of "float"
+    values are done with C double values too, without creating objects.
+    """
+
+    left_code = _getCDoubleOperandCode(expression.getLeft(), emit, context)
+    right_code = _getCDoubleOperandCode(expression.getRight(), emit, context)
+
+    return "(%s %s %s)" % (
+        left_code,
+        _c_double_operators[expression.getOperator()],
+        right_code
+    )
+
+
 def generateDelVariableCode(statement, emit, context):
     old_source_ref = context.setCurrentSourceCodeReference(
         statement.getSourceReference()
@@ -80,7 +275,7 @@ def generateDelVariableCode(statement, emit, context):
 def generateVariableReleaseCode(statement, emit, context):
     variable = statement.getVariable()
 
-    if variable.isSharedTechnically():
+    if variable.isSharedTechnically() and not variable.isSharedByValue():
         # TODO: We might start to not allocate the cell object, then a check
         # would be due. But currently we always allocate it.
         needs_check = False
@@ -119,6 +314,65 @@ def getVariableCodeName(in_context, variable):
         return "var_" + variable.getCodeName()
 
 enable_bool_ctype = isExperimental("enable_bool_ctype")
+enable_number_ctypes = isExperimental("enable_number_ctypes")
+
+
+def _isXrangeNode(node):
+    return node.isExpressionBuiltinXrange1() or \
+           node.isExpressionBuiltinXrange2() or \
+           node.isExpressionBuiltinXrange3()
+
+
+def _isRangeNode(node):
+    return node.isExpressionBuiltinRange1() or \
+           node.isExpressionBuiltinRange2() or \
+           node.isExpressionBuiltinRange3() or \
+           _isXrangeNode(node)
+
+
+def _isRangeCounterVariable(variable):
+    # Temporary variables only assigned from "iter(range(...))" calls, as
+    # created for "for" loops, can count in C instead.
+    if not variable.isTempVariable():
+        return False
+
+    assign_sources = variable.getAssignSources()
+
+    if not assign_sources:
+        return False
+
+    for assign_source in assign_sources:
+        if not assign_source.isExpressionBuiltinIter1() or \
+           not _isRangeNode(assign_source.getValue()):
+            return False
+
+    return True
+
+
+def _getEnabledCType(variable, shape):
+    if enable_number_ctypes:
+        # Temporary variables are not visible in frames or locals, unless
+        # they replace locals of in-lined functions, and they are assigned
+        # before use, so plain C values can be used.
+        if variable.isTempVariable() and not variable.isFrameVisible():
+            if shape is ShapeTypeFloat:
+                return CTypeCDouble
+            elif shape is ShapeTypeInt and python_version < 300:
+                return CTypeCLong
+
+        c_type = shape.getCType()
+
+        if c_type is CTypeNuitkaIntOrLongStruct:
+            return c_type
+
+    if enable_bool_ctype:
+        c_type = shape.getCType()
+
+        if c_type is CTypeNuitkaBoolEnum:
+            return c_type
+
+    return CTypePyObjectPtr
+
 
 def getPickedCType(variable, version, context):
     """ Return type to use for specific context. """
@@ -127,10 +381,15 @@ def getPickedCType(variable, version, context):
     owner = variable.getEntryPoint()
 
     if owner is user:
-        if variable.isSharedTechnically():
+        if variable.isSharedByValue():
+            # Closures take the value, not a cell.
+            result = CTypePyObjectPtr
+        elif variable.isSharedTechnically():
             result = CTypeCellObject
+        elif _isRangeCounterVariable(variable):
+            result = CTypeNuitkaRangeCounter
         else:
-            if enable_bool_ctype:
+            if enable_bool_ctype or enable_number_ctypes:
                 shapes = variable.getTypeShapes()
 
                 if len(shapes) > 1:
@@ -139,35 +398,52 @@ def getPickedCType(variable, version, context):
                     # We are avoiding this for now.
                     assert shapes, (variable, version)
 
-                    return shapes.pop().getCType()
+                    return _getEnabledCType(variable, shapes.pop())
             else:
                 return CTypePyObjectPtr
     elif context.isForDirectCall():
-        if variable.isSharedTechnically():
+        if variable.isSharedTechnically() and not variable.isSharedByValue():
             result = CTypeCellObject
         else:
             result = CTypePyObjectPtrPtr
+    elif variable.isSharedByValue():
+        result = CTypePyObjectPtrPtr
     else:
         result = CTypeCellObject
 
     return result
 
 
-def getLocalVariableCodeType(context, variable, version):
-    # Now must be local or temporary variable.
-
-    user = context.getOwner()
-    owner = variable.getOwner()
+def _getClosureAccessCode(variable, closure_code):
+    # Values taken without cell are stored in the closure array directly.
+    if variable.isSharedByValue():
+        return "(PyObject **)&%s" % closure_code
+    else:
+        return closure_code
 
-    user = user.getEntryPoint()
 
-    prefix = ""
+def _getVariableOwnerAndPrefix(variable):
+    owner = variable.getOwner()
 
+    # Outlines and class bodies have their variables in the function they
+    # are part of.
     if owner.isExpressionOutlineFunction() or owner.isExpressionClassBody():
         entry_point = owner.getEntryPoint()
 
         prefix = "outline_%d_" % entry_point.getTraceCollection().getOutlineFunctions().index(owner)
-        owner = entry_point
+
+        return entry_point, prefix
+    else:
+        return owner, ""
+
+
+def getLocalVariableCodeType(context, variable, version):
+    # Now must be local or temporary variable.
+
+    user = context.getOwner()
+    user = user.getEntryPoint()
+
+    owner, prefix = _getVariableOwnerAndPrefix(variable)
 
     c_type = getPickedCType(variable, version, context)
 
@@ -177,21 +453,30 @@ def getLocalVariableCodeType(context, variable, version):
             variable   = variable
         )
 
-        result = prefix + result
+        result = context.getLocalStorageName(prefix + result)
     elif context.isForDirectCall():
 
         if user.isExpressionGeneratorObjectBody():
             closure_index = user.getClosureVariableIndex(variable)
 
-            result = "generator->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "generator->m_closure[%d]" % closure_index
+            )
         elif user.isExpressionCoroutineObjectBody():
             closure_index = user.getClosureVariableIndex(variable)
 
-            result = "coroutine->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "coroutine->m_closure[%d]" % closure_index
+            )
         elif user.isExpressionAsyncgenObjectBody():
             closure_index = user.getClosureVariableIndex(variable)
 
-            result = "asyncgen->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "asyncgen->m_closure[%d]" % closure_index
+            )
         else:
             result = getVariableCodeName(
                 in_context = True,
@@ -203,16 +488,28 @@ def getLocalVariableCodeType(context, variable, version):
         closure_index = user.getClosureVariableIndex(variable)
 
         if user.isExpressionGeneratorObjectBody():
-            result = "generator->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "generator->m_closure[%d]" % closure_index
+            )
         elif user.isExpressionCoroutineObjectBody():
-            result = "coroutine->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "coroutine->m_closure[%d]" % closure_index
+            )
         elif user.isExpressionAsyncgenObjectBody():
-            result = "asyncgen->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "asyncgen->m_closure[%d]" % closure_index
+            )
         else:
             # TODO: If this were context.getContextObjectName() this would be
             # a one liner.
 
-            result = "self->m_closure[%d]" % closure_index
+            result = _getClosureAccessCode(
+                variable     = variable,
+                closure_code = "self->m_closure[%d]" % closure_index
+            )
 
     return result, c_type
 
@@ -229,15 +526,24 @@ def getVariableCode(context, variable, version):
     return variable_code_name
 
 
-def getLocalVariableInitCode(context, variable, version, init_from):
+def getLocalVariableDeclaration(context, variable, version, init_from):
     assert not variable.isModuleVariable()
 
     variable_code_name, variable_c_type = getLocalVariableCodeType(context, variable, version)
 
-    if variable.isLocalVariable():
-        context.setVariableType(variable, variable_code_name, variable_c_type)
+    context.setVariableType(variable, variable_code_name, variable_c_type)
 
-    return variable_c_type.getVariableInitCode(variable_code_name, init_from)
+    _owner, prefix = _getVariableOwnerAndPrefix(variable)
+
+    return VariableDeclaration(
+        c_type     = variable_c_type.c_type,
+        code_name  = prefix + getVariableCodeName(
+            in_context = False,
+            variable   = variable
+        ),
+        init_value = variable_c_type.getInitValue(init_from),
+        heap_name  = context.getLocalHeapName()
+    )
 
 
 def getVariableAssignmentCode(context, emit, variable, version,
@@ -265,8 +571,7 @@ def getVariableAssignmentCode(context, emit, variable, version,
     else:
         variable_code_name, variable_c_type = getLocalVariableCodeType(context, variable, version)
 
-        if variable.isLocalVariable():
-            context.setVariableType(variable, variable_code_name, variable_c_type)
+        context.setVariableType(variable, variable_code_name, variable_c_type)
 
         # TODO: this was not handled previously, do not overlook when it
         # occurs.
@@ -288,8 +593,13 @@ def getVariableAssignmentCode(context, emit, variable, version,
 
 def generateModuleVariableAccessCode(to_name, variable_name, needs_check,
                                       emit, context):
+    if python_version >= 360:
+        template = template_read_mvar_cached
+    else:
+        template = template_read_mvar_unclear
+
     emit(
-        template_read_mvar_unclear % {
+        template % {
             "module_identifier" : context.getModuleCodeName(),
             "tmp_name"          : to_name,
             "var_name"          : context.getConstantCode(
@@ -376,12 +686,14 @@ def getVariableDelCode(variable, old_version, new_version, tolerant,
         )
     elif variable.isTempVariable():
         variable_code_name, variable_c_type = getLocalVariableCodeType(context, variable, old_version)
-        _variable_code_name, variable_c_new_type = getLocalVariableCodeType(context, variable, new_version)
+        variable_code_name_new, variable_c_new_type = getLocalVariableCodeType(context, variable, new_version)
 
         # TODO: We need to split this operation in two parts. Release and init
         # are not one thing.
         assert variable_c_type is variable_c_new_type
 
+        context.setVariableType(variable, variable_code_name_new, variable_c_new_type)
+
         variable_c_type.getDeleteObjectCode(
             variable_code_name = variable_code_name,
             tolerant           = tolerant,
@@ -0,0 +1,118 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Variable declarations of C functions.
+
+Local variables, temporary variables, and the like are declared with their
+C type, name and initial value, so they can become C locals, or members of
+the heap storage of generator objects, which they need to be to survive the
+return from the generator code at a yield.
+"""
+
+
+class VariableDeclaration(object):
+    __slots__ = ("c_type", "code_name", "init_value", "heap_name")
+
+    def __init__(self, c_type, code_name, init_value, heap_name):
+        self.c_type = c_type
+        self.code_name = code_name
+        self.init_value = init_value
+        self.heap_name = heap_name
+
+    def __repr__(self):
+        return "<VariableDeclaration %s %s = %s in %s>" % (
+            self.c_type,
+            self.code_name,
+            self.init_value,
+            self.heap_name
+        )
+
+    def isHeapDeclaration(self):
+        return self.heap_name is not None
+
+    def _getTypedName(self):
+        return "%s%s%s" % (
+            self.c_type,
+            ' ' if self.c_type[-1] != '*' else "",
+            self.code_name
+        )
+
+    def makeCFunctionLevelDeclaration(self):
+        if self.init_value is None:
+            return self._getTypedName() + ';'
+        else:
+            return "%s = %s;" % (
+                self._getTypedName(),
+                self.init_value
+            )
+
+    def makeCStructDeclaration(self):
+        return self._getTypedName() + ';'
+
+    def makeCStructInit(self):
+        if self.init_value is None:
+            return None
+
+        access_code = "%s->%s" % (self.heap_name, self.code_name)
+
+        if self.init_value.startswith('{'):
+            # Aggregate values can only be used to initialize declarations.
+            return "{ %s_init = %s; %s = %s_init; }" % (
+                self._getTypedName(),
+                self.init_value,
+                access_code,
+                self.code_name
+            )
+        else:
+            return "%s = %s;" % (
+                access_code,
+                self.init_value
+            )
+
+
+def getCFunctionLevelDeclarations(declarations):
+    """ Declarations of the C locals, i.e. not in heap storage. """
+
+    return [
+        declaration.makeCFunctionLevelDeclaration()
+        for declaration in
+        declarations
+        if not declaration.isHeapDeclaration()
+    ]
+
+
+def getCStructDeclarations(declarations):
+    """ Declarations of the members of the heap storage. """
+
+    return [
+        declaration.makeCStructDeclaration()
+        for declaration in
+        declarations
+        if declaration.isHeapDeclaration()
+    ]
+
+
+def getCStructInits(declarations):
+    """ Initializations of the members of the heap storage. """
+
+    return [
+        declaration.makeCStructInit()
+        for declaration in
+        declarations
+        if declaration.isHeapDeclaration()
+        if declaration.init_value is not None
+    ]
@@ -20,13 +20,94 @@
 The normal "yield", and the Python 3.3 or higher "yield from" variant.
 """
 
-from nuitka import Options
+from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import generateChildExpressionsCode
 from .ErrorCodes import getErrorExitCode, getReleaseCode
 from .PythonAPICodes import getReferenceExportCode
 
 
+def _getGeneratorYieldCode(to_name, yield_code, preserve_exception, emit,
+                           context):
+    """ Yield from the generator code, to be resumed at a label.
+
+    The generator code returns to its caller, which calls it again with the
+    label index set, and the value sent in, or NULL for an exception. This
+    is shared by generators, coroutines and asyncgens.
+    """
+
+    yield_return_label = context.allocateLabel("yield_return")
+    yield_return_index = yield_return_label.split('_')[-1]
+
+    context_object_name = context.getContextObjectName()
+
+    # In handlers, the exception of the frame is published while suspended.
+    preserve_exception = preserve_exception and python_version >= 300
+
+    emit(
+        "%s->m_yield_return_index = %s;" % (
+            context_object_name,
+            yield_return_index
+        )
+    )
+
+    if preserve_exception:
+        emit(
+            "SAVE_%s_EXCEPTION( %s );" % (
+                context_object_name.upper(),
+                context_object_name
+            )
+        )
+
+    emit(yield_code)
+    emit("%s:" % yield_return_label)
+
+    if preserve_exception:
+        emit(
+            "RESTORE_%s_EXCEPTION( %s );" % (
+                context_object_name.upper(),
+                context_object_name
+            )
+        )
+
+    emit(
+        "%s = yield_return_value;" % to_name
+    )
+
+
+def getYieldFromStartCode(to_name, start_code, preserve_exception, emit,
+                          context):
+    """ Start iterating the object of a "yield from" or "await".
+
+    The "start_code" hands the object to the generator, coroutine or asyncgen,
+    which then iterates it after the code returned, until the result value is
+    given back here as a new reference, or NULL for an exception.
+    """
+
+    emit(
+        """\
+if ( %s )
+{""" % start_code
+    )
+
+    _getGeneratorYieldCode(
+        to_name            = to_name,
+        yield_code         = "return NULL;",
+        preserve_exception = preserve_exception,
+        emit               = emit,
+        context            = context
+    )
+
+    emit(
+        """\
+}
+else
+{
+    %s = NULL;
+}""" % to_name
+    )
+
+
 def generateYieldCode(to_name, expression, emit, context):
     value_name, = generateChildExpressionsCode(
         expression = expression,
@@ -37,41 +118,22 @@ def generateYieldCode(to_name, expression, emit, context):
     # In handlers, we must preserve/restore the exception.
     preserve_exception = expression.isExceptionPreserving()
 
-    # This will produce GENERATOR_YIELD, COROUTINE_YIELD or ASYNCGEN_YIELD.
+    # The yielded value is given away by returning it, for asyncgens wrapped
+    # to tell it apart from the values of "await".
     getReferenceExportCode(value_name, emit, context)
 
-    if Options.isExperimental("generator_goto"):
-        yield_return_label = context.allocateLabel("yield_return")
-        yield_return_index = yield_return_label.split('_')[-1]
-
-
-        emit(
-            """
-%(context_object_name)s->m_yield_return_index = %(yield_return_index)s;
-return %(yielded_value)s;
-%(yield_return_label)s:
-%(to_name)s = yield_return_value;
-""" % {
-                "context_object_name" : context.getContextObjectName(),
-                "yield_return_index"  : yield_return_index,
-                "yielded_value"       : value_name,
-                "yield_return_label"  : yield_return_label,
-                "to_name"             : to_name
-    }
-        )
-
+    if context.getContextObjectName() == "asyncgen":
+        yield_code = "return Nuitka_AsyncGenValueWrapperNew( %s );" % value_name
     else:
-        emit(
-            "%s = %s_%s( %s, %s );" % (
-                to_name,
-                context.getContextObjectName().upper(),
-                "YIELD"
-                  if not preserve_exception else
-                "YIELD_IN_HANDLER",
-                context.getContextObjectName(),
-                value_name
-            )
-        )
+        yield_code = "return %s;" % value_name
+
+    _getGeneratorYieldCode(
+        to_name            = to_name,
+        yield_code         = yield_code,
+        preserve_exception = preserve_exception,
+        emit               = emit,
+        context            = context
+    )
 
     if context.needsCleanup(value_name):
         context.removeCleanupTempName(value_name)
@@ -96,20 +158,19 @@ def generateYieldFromCode(to_name, expression, emit, context):
     # In handlers, we must preserve/restore the exception.
     preserve_exception = expression.isExceptionPreserving()
 
-    # This will produce GENERATOR_YIELD_FROM, COROUTINE_YIELD_FROM or
-    # ASYNCGEN_YIELD_FROM.
+    # Only generators have "yield from", coroutines use "await" instead.
+    assert context.getContextObjectName() == "generator"
+
     getReferenceExportCode(value_name, emit, context)
 
-    emit(
-        "%s = %s_%s( %s, %s );" % (
-            to_name,
-            context.getContextObjectName().upper(),
-            "YIELD_FROM"
-              if not preserve_exception else
-            "YIELD_FROM_IN_HANDLER",
-            context.getContextObjectName(),
+    getYieldFromStartCode(
+        to_name            = to_name,
+        start_code         = "GENERATOR_YIELD_FROM_START( generator, %s )" % (
             value_name
-        )
+        ),
+        preserve_exception = preserve_exception,
+        emit               = emit,
+        context            = context
     )
 
     if not context.needsCleanup(value_name):
@@ -25,7 +25,8 @@ type_indicators = {
     "PyObject *" : 'o',
     "PyObject **" : 'O',
     "struct Nuitka_CellObject *" : 'c',
-    "nuitka_bool" : 'b'
+    "nuitka_bool" : 'b',
+    "nuitka_ilong" : 'L'
 }
 
 class CTypeBase(object):
@@ -36,6 +37,10 @@ class CTypeBase(object):
     def getTypeIndicator(cls):
         return type_indicators[cls.c_type]
 
+    @classmethod
+    def hasTypeIndicator(cls):
+        return cls.c_type in type_indicators
+
 
     @classmethod
     def getInitValue(cls, init_from):
@@ -44,17 +49,6 @@ class CTypeBase(object):
         # Need to overload this for each type it is used for, pylint: disable=unused-argument
         assert False, cls.c_type
 
-    @classmethod
-    def getVariableInitCode(cls, variable_code_name, init_from):
-        init_value = cls.getInitValue(init_from)
-
-        return "%s%s%s = %s;" % (
-            cls.c_type,
-            ' ' if cls.c_type[-1] not in '*' else "",
-            variable_code_name,
-            init_value
-        )
-
     @classmethod
     def getLocalVariableInitTestCode(cls, variable_code_name):
         """ Get code to test for uninitialized.
@@ -0,0 +1,88 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for C double, for float values.
+
+Only used for temporary variables, as it cannot represent an unassigned value,
+and boxes to an object, where that is needed.
+"""
+
+from nuitka.codegen.ErrorCodes import getErrorExitCode
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeCDouble(CTypeBase):
+    c_type = "double"
+
+    @classmethod
+    def getLocalVariableAssignCode(cls, variable_code_name, needs_release,
+                                   tmp_name, ref_count, in_place):
+        assert not in_place
+
+        result = "%s = PyFloat_AS_DOUBLE( %s );" % (
+            variable_code_name,
+            tmp_name
+        )
+
+        # Value was taken, the object is not kept.
+        if ref_count:
+            result += "\nPy_DECREF( %s );" % tmp_name
+
+        return result
+
+    @classmethod
+    def getVariableObjectAccessCode(cls, to_name, needs_check, variable_code_name,
+                                    variable, emit, context):
+        emit(
+            "%s = %s;" % (
+                to_name,
+                cls.getLocalVariableObjectAccessCode(variable_code_name)
+            )
+        )
+        getErrorExitCode(
+            check_name = to_name,
+            emit       = emit,
+            context    = context
+        )
+
+        context.addCleanupTempName(to_name)
+
+    @classmethod
+    def getLocalVariableObjectAccessCode(cls, variable_code_name):
+        """ Code to box the value, creates a new reference. """
+
+        return "PyFloat_FromDouble( %s )" % variable_code_name
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        if init_from is None:
+            return "0.0"
+        else:
+            return init_from
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        # Nothing to release for C values.
+        pass
+
+    @classmethod
+    def getDeleteObjectCode(cls, variable_code_name, needs_check, tolerant,
+                            variable, emit, context):
+        # Nothing to release for C values, temporary variables are known to
+        # be assigned, when deleted.
+        pass
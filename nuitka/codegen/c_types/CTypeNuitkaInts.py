@@ -0,0 +1,142 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_ilong, a struct to represent int and long values.
+
+It keeps the C long value next to the object, where the value fits, so code
+can use it directly. The object is only created when it is needed.
+"""
+
+from nuitka.codegen.ErrorCodes import (
+    getAssertionCode,
+    getErrorExitCode,
+    getLocalVariableReferenceErrorCode
+)
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeNuitkaIntOrLongStruct(CTypeBase):
+    c_type = "nuitka_ilong"
+
+    @classmethod
+    def getLocalVariableAssignCode(cls, variable_code_name, needs_release,
+                                   tmp_name, ref_count, in_place):
+        result = []
+
+        # For in-place operations, the old value reference was already dealt
+        # with by the operation, and the new one is owned.
+        if not in_place:
+            if not ref_count:
+                result.append("Py_INCREF( %s );" % tmp_name)
+
+            if needs_release is not False:
+                result.append("RELEASE_NILONG_VALUE( &%s );" % variable_code_name)
+
+        result.append(
+            "SET_NILONG_OBJECT_VALUE( &%s, %s );" % (
+                variable_code_name,
+                tmp_name
+            )
+        )
+
+        return '\n'.join(result)
+
+    @classmethod
+    def getVariableObjectAccessCode(cls, to_name, needs_check, variable_code_name,
+                                    variable, emit, context):
+        if needs_check:
+            getLocalVariableReferenceErrorCode(
+                variable  = variable,
+                condition = "%s.validity == NUITKA_ILONG_UNASSIGNED" % variable_code_name,
+                emit      = emit,
+                context   = context
+            )
+
+        emit(
+            "%s = %s;" % (
+                to_name,
+                cls.getLocalVariableObjectAccessCode(variable_code_name)
+            )
+        )
+
+        # Creating the object from the C value might fail.
+        getErrorExitCode(
+            check_name = to_name,
+            emit       = emit,
+            context    = context
+        )
+
+    @classmethod
+    def getLocalVariableInitTestCode(cls, variable_code_name):
+        return "%s.validity != NUITKA_ILONG_UNASSIGNED" % variable_code_name
+
+    @classmethod
+    def getLocalVariableObjectAccessCode(cls, variable_code_name):
+        return "ENFORCE_NILONG_OBJECT_VALUE( &%s )" % variable_code_name
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        # Only parameter variables are initialized, and have unknown shapes.
+        assert init_from is None, init_from
+
+        return "{ NUITKA_ILONG_UNASSIGNED, NULL, 0 }"
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        if not needs_check:
+            getAssertionCode(
+                check = "%s.validity != NUITKA_ILONG_UNASSIGNED" % variable_code_name,
+                emit  = emit
+            )
+
+        emit(
+            "RELEASE_NILONG_VALUE( &%s );" % variable_code_name
+        )
+
+    @classmethod
+    def getDeleteObjectCode(cls, variable_code_name, needs_check, tolerant,
+                            variable, emit, context):
+        if not needs_check or tolerant:
+            emit(
+                "RELEASE_NILONG_VALUE( &%s );" % variable_code_name
+            )
+        else:
+            res_name = context.getBoolResName()
+
+            emit(
+                "%s = %s.validity != NUITKA_ILONG_UNASSIGNED;" % (
+                    res_name,
+                    variable_code_name,
+                )
+            )
+            emit(
+                "RELEASE_NILONG_VALUE( &%s );" % variable_code_name
+            )
+
+            if variable.isLocalVariable():
+                getLocalVariableReferenceErrorCode(
+                    variable  = variable,
+                    condition = "%s == false" % res_name,
+                    emit      = emit,
+                    context   = context
+                )
+            else:
+                getAssertionCode(
+                    check = "%s != false" % res_name,
+                    emit  = emit
+                )
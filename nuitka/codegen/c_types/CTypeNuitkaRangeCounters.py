@@ -0,0 +1,81 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_range_counter, iterators over range objects.
+
+Only used for temporary variables that hold the iterator of "for" loops over
+"range" and "xrange" calls. These count with C long values, and only create
+an iterator object, if the values do not fit, or an object is needed. The
+values produced are still objects, for assignment to the loop variable.
+"""
+
+from nuitka.codegen.ErrorCodes import getErrorExitCode
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeNuitkaRangeCounter(CTypeBase):
+    c_type = "nuitka_range_counter"
+
+    @classmethod
+    def getLocalVariableAssignCode(cls, variable_code_name, needs_release,
+                                   tmp_name, ref_count, in_place):
+        # Assignments are only made from the range arguments, see
+        # "generateRangeCounterAssignmentCode".
+        assert False, variable_code_name
+
+    @classmethod
+    def getVariableObjectAccessCode(cls, to_name, needs_check, variable_code_name,
+                                    variable, emit, context):
+        emit(
+            "%s = %s;" % (
+                to_name,
+                cls.getLocalVariableObjectAccessCode(variable_code_name)
+            )
+        )
+
+        # Creating the iterator object might fail with a memory error.
+        getErrorExitCode(
+            check_name = to_name,
+            emit       = emit,
+            context    = context
+        )
+
+    @classmethod
+    def getLocalVariableObjectAccessCode(cls, variable_code_name):
+        """ Code to get the iterator object, a borrowed reference. """
+
+        return "RANGE_COUNTER_AS_ITERATOR( &%s )" % variable_code_name
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        assert init_from is None
+
+        return "{ 0, 0, 0, 0, NULL }"
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        emit(
+            "RELEASE_RANGE_COUNTER( &%s );" % variable_code_name
+        )
+
+    @classmethod
+    def getDeleteObjectCode(cls, variable_code_name, needs_check, tolerant,
+                            variable, emit, context):
+        emit(
+            "RELEASE_RANGE_COUNTER( &%s );" % variable_code_name
+        )
@@ -20,15 +20,27 @@
 """
 
 template_asyncgen_object_decl_template = """\
-static void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen );
+static PyObject *%(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen, PyObject *yield_return_value );
+"""
+
+template_asyncgen_object_heap_decl_template = """\
+struct %(function_identifier)s_locals {
+%(function_local_types)s
+};
 """
 
 template_asyncgen_object_body_template = """
-static void %(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen )
+static PyObject *%(function_identifier)s( struct Nuitka_AsyncgenObject *asyncgen, PyObject *yield_return_value )
 {
     CHECK_OBJECT( (PyObject *)asyncgen );
     assert( Nuitka_Asyncgen_Check( (PyObject *)asyncgen ) );
 
+    // Heap access if used.
+    NUITKA_MAY_BE_UNUSED struct %(function_identifier)s_locals *asyncgen_heap = (struct %(function_identifier)s_locals *)asyncgen->m_heap_storage;
+%(function_locals)s
+    // Dispatch to yield based on return label index:
+%(function_dispatch)s
+
     // Local variable initialization
 %(function_var_inits)s
 
@@ -43,12 +55,11 @@ template_asyncgen_exception_exit = """\
     // Return statement must be present.
     NUITKA_CANNOT_GET_HERE( %(function_identifier)s );
 
-    function_exception_exit:
+    function_exception_exit: NUITKA_COLD_LABEL;
 %(function_cleanup)s\
     assert( exception_type );
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
-    asyncgen->m_yielded = NULL;
-    return;
+    return NULL;
 """
 
 template_asyncgen_noexception_exit = """\
@@ -56,15 +67,12 @@ template_asyncgen_noexception_exit = """\
     NUITKA_CANNOT_GET_HERE( %(function_identifier)s );
 
 %(function_cleanup)s\
-    asyncgen->m_yielded = NULL;
-    return;
+    return NULL;
 """
 
 template_asyncgen_return_exit = """\
     function_return_exit:;
-    asyncgen->m_yielded = NULL;
-    asyncgen->m_status = status_Finished;
-    return;
+    return NULL;
 """
 
 
@@ -74,7 +82,8 @@ template_make_asyncgen_template = """
     %(asyncgen_name_obj)s,
     %(asyncgen_qualname_obj)s,
     %(code_identifier)s,
-    %(closure_count)d
+    %(closure_count)d,
+    sizeof(struct %(asyncgen_identifier)s_locals)
 );
 %(closure_copy)s
 """
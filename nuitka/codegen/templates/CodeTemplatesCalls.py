@@ -501,6 +501,24 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 
                 return result;
             }
+            else if ( func == PyFunction_Type.tp_descr_get )
+            {
+                // Call with "self" prepended, instead of creating a bound method.
+                PyObject *python_pars[ %(args_count)d + 1 ];
+
+                python_pars[ 0 ] = source;
+                memcpy( python_pars + 1, args, %(args_count)d * sizeof(PyObject *) );
+
+                PyObject *result = callPythonFunction(
+                    descr,
+                    python_pars,
+                    %(args_count)d + 1
+                );
+
+                Py_DECREF( descr );
+
+                return result;
+            }
             else
             {
                 PyObject *called_object = func( descr, source, (PyObject *)type );
@@ -592,6 +610,19 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
                     %(args_count)d
                 );
             }
+            else if ( descr_get == PyFunction_Type.tp_descr_get )
+            {
+                PyObject *python_pars[ %(args_count)d + 1 ];
+
+                python_pars[ 0 ] = source;
+                memcpy( python_pars + 1, args, %(args_count)d * sizeof(PyObject *) );
+
+                return callPythonFunction(
+                    called_object,
+                    python_pars,
+                    %(args_count)d + 1
+                );
+            }
             else if ( descr_get != NULL )
             {
                 PyObject *method = descr_get(
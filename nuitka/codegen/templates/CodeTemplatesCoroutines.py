@@ -20,15 +20,27 @@
 """
 
 template_coroutine_object_decl_template = """\
-static void %(function_identifier)s( struct Nuitka_CoroutineObject *coroutine );
+static PyObject *%(function_identifier)s( struct Nuitka_CoroutineObject *coroutine, PyObject *yield_return_value );
+"""
+
+template_coroutine_object_heap_decl_template = """\
+struct %(function_identifier)s_locals {
+%(function_local_types)s
+};
 """
 
 template_coroutine_object_body_template = """
-static void %(function_identifier)s( struct Nuitka_CoroutineObject *coroutine )
+static PyObject *%(function_identifier)s( struct Nuitka_CoroutineObject *coroutine, PyObject *yield_return_value )
 {
     CHECK_OBJECT( (PyObject *)coroutine );
     assert( Nuitka_Coroutine_Check( (PyObject *)coroutine ) );
 
+    // Heap access if used.
+    NUITKA_MAY_BE_UNUSED struct %(function_identifier)s_locals *coroutine_heap = (struct %(function_identifier)s_locals *)coroutine->m_heap_storage;
+%(function_locals)s
+    // Dispatch to yield based on return label index:
+%(function_dispatch)s
+
     // Local variable initialization
 %(function_var_inits)s
 
@@ -43,12 +55,11 @@ template_coroutine_exception_exit = """\
     // Return statement must be present.
     NUITKA_CANNOT_GET_HERE( %(function_identifier)s );
 
-    function_exception_exit:
+    function_exception_exit: NUITKA_COLD_LABEL;
 %(function_cleanup)s\
     assert( exception_type );
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
-    coroutine->m_yielded = NULL;
-    return;
+    return NULL;
 """
 
 template_coroutine_noexception_exit = """\
@@ -56,15 +67,13 @@ template_coroutine_noexception_exit = """\
     NUITKA_CANNOT_GET_HERE( %(function_identifier)s );
 
 %(function_cleanup)s\
-    coroutine->m_yielded = NULL;
-    return;
+    return NULL;
 """
 
 template_coroutine_return_exit = """\
     function_return_exit:;
-    coroutine->m_yielded = NULL;
-    coroutine->m_returned = tmp_return_value;
-    return;
+    coroutine->m_returned = %(return_value)s;
+    return NULL;
 """
 
 
@@ -74,7 +83,8 @@ template_make_coroutine_template = """
     self->m_name,
     self->m_qualname,
     %(code_identifier)s,
-    %(closure_count)d
+    %(closure_count)d,
+    sizeof(struct %(coroutine_identifier)s_locals)
 );
 %(closure_copy)s
 """
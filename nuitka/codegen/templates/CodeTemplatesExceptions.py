@@ -30,42 +30,40 @@ else if ( %(keeper_lineno)s != 0 )
 }
 """
 
-template_error_catch_quick_exception = """\
-if ( %(condition)s )
+template_error_catch_exception = """\
+if ( unlikely( %(condition)s ) )
 {
-    if ( !ERROR_OCCURRED() )
-    {
-        exception_type = %(quick_exception)s;
-        Py_INCREF( exception_type );
-        exception_value = NULL;
-        exception_tb = NULL;
-    }
-    else
-    {
-        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
-    }
-%(release_temps)s
-
-%(var_description_code)s
 %(line_number_code)s
-    goto %(exception_exit)s;
+    goto %(error_exit)s;
 }"""
 
-template_error_catch_exception = """\
-if ( %(condition)s )
+# The epilogues of error exits, shared by all exits with identical ones.
+template_error_exit_quick_exception = """\
+if ( !ERROR_OCCURRED() )
+{
+    exception_type = %(quick_exception)s;
+    Py_INCREF( exception_type );
+    exception_value = NULL;
+    exception_tb = NULL;
+}
+else
 {
-    assert( ERROR_OCCURRED() );
-
     FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+}
 %(release_temps)s
+%(var_description_code)s
+goto %(exception_exit)s;"""
 
-%(line_number_code)s
+template_error_exit_exception = """\
+assert( ERROR_OCCURRED() );
+
+FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+%(release_temps)s
 %(var_description_code)s
-    goto %(exception_exit)s;
-}"""
+goto %(exception_exit)s;"""
 
 template_error_format_string_exception = """\
-if ( %(condition)s )
+if ( unlikely( %(condition)s ) )
 {
 %(release_temps)s
 %(set_exception)s
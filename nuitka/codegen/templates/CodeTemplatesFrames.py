@@ -19,18 +19,10 @@
 
 """
 
-template_frame_guard_cache_decl = """\
-static struct Nuitka_FrameObject *cache_%(frame_identifier)s = NULL;
-"""
-
-template_frame_guard_frame_decl = """\
-struct Nuitka_FrameObject *%(frame_identifier)s;
-"""
-
 # Frame in a function
 template_frame_guard_full_block = """\
-MAKE_OR_REUSE_FRAME( cache_%(frame_identifier)s, %(code_identifier)s, %(module_identifier)s, %(locals_size)s );
-%(frame_identifier)s = cache_%(frame_identifier)s;
+MAKE_OR_REUSE_FRAME( %(frame_cache_identifier)s, %(code_identifier)s, %(module_identifier)s, %(locals_size)s );
+%(frame_identifier)s = %(frame_cache_identifier)s;
 
 // Push the new frame as the currently active one.
 pushFrameStack( %(frame_identifier)s );
@@ -71,7 +63,7 @@ Nuitka_Frame_AttachLocals(
 """
 
 template_frame_guard_full_exception_handler = """\
-%(frame_exception_exit)s:;
+%(frame_exception_exit)s: NUITKA_COLD_LABEL;
 
 #if %(needs_preserve)d
 RESTORE_FRAME_EXCEPTION( %(frame_identifier)s );
@@ -90,11 +82,11 @@ else if ( exception_tb->tb_frame != &%(frame_identifier)s->m_frame )
 %(attach_locals)s
 
 // Release cached frame.
-if ( %(frame_identifier)s == cache_%(frame_identifier)s )
+if ( %(frame_identifier)s == %(frame_cache_identifier)s )
 {
     Py_DECREF( %(frame_identifier)s );
 }
-cache_%(frame_identifier)s = NULL;
+%(frame_cache_identifier)s = NULL;
 
 assertFrameObject( %(frame_identifier)s );
 
@@ -128,7 +120,7 @@ popFrameStack();
 assertFrameObject( %(frame_identifier)s );
 
 goto %(no_exception_exit)s;
-%(frame_exception_exit)s:;
+%(frame_exception_exit)s: NUITKA_COLD_LABEL;
 #if %(needs_preserve)d
 RESTORE_FRAME_EXCEPTION( %(frame_identifier)s );
 #endif
@@ -175,16 +167,17 @@ Nuitka_Frame_MarkAsExecuting( %(context_identifier)s->m_frame );
 #if PYTHON_VERSION >= 300
 // Accept currently existing exception as the one to publish again when we
 // yield or yield from.
-
-PyThreadState *thread_state = PyThreadState_GET();
-
-%(context_identifier)s->m_frame->m_frame.f_exc_type = thread_state->exc_type;
-if ( %(context_identifier)s->m_frame->m_frame.f_exc_type == Py_None ) %(context_identifier)s->m_frame->m_frame.f_exc_type = NULL;
-Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_type );
-%(context_identifier)s->m_frame->m_frame.f_exc_value = thread_state->exc_value;
-Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_value );
-%(context_identifier)s->m_frame->m_frame.f_exc_traceback = thread_state->exc_traceback;
-Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_traceback );
+{
+    PyThreadState *thread_state = PyThreadState_GET();
+
+    %(context_identifier)s->m_frame->m_frame.f_exc_type = thread_state->exc_type;
+    if ( %(context_identifier)s->m_frame->m_frame.f_exc_type == Py_None ) %(context_identifier)s->m_frame->m_frame.f_exc_type = NULL;
+    Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_type );
+    %(context_identifier)s->m_frame->m_frame.f_exc_value = thread_state->exc_value;
+    Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_value );
+    %(context_identifier)s->m_frame->m_frame.f_exc_traceback = thread_state->exc_traceback;
+    Py_XINCREF( %(context_identifier)s->m_frame->m_frame.f_exc_traceback );
+}
 #endif
 
 // Framed code:
@@ -221,7 +214,7 @@ goto %(return_exit)s;
 
 
 template_frame_guard_generator_exception_handler = """\
-%(frame_exception_exit)s:;
+%(frame_exception_exit)s: NUITKA_COLD_LABEL;
 
 // If it's not an exit exception, consider and create a traceback for it.
 if ( !EXCEPTION_MATCH_GENERATOR( exception_type ) )
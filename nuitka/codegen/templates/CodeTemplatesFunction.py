@@ -70,7 +70,7 @@ static PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
 """
 
 template_function_exception_exit = """\
-function_exception_exit:
+function_exception_exit: NUITKA_COLD_LABEL;
 %(function_cleanup)s\
     assert( exception_type );
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
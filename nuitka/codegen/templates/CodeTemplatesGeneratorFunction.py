@@ -20,35 +20,30 @@
 """
 
 template_genfunc_yielder_decl_template = """\
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
 static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
-#else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator );
-#endif
 """
 
-template_genfunc_yielder_body_template = """
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+template_genfunc_yielder_heap_decl_template = """\
 struct %(function_identifier)s_locals {
 %(function_local_types)s
 };
-#endif
+"""
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
+template_genfunc_yielder_body_template = """
 static PyObject *%(function_identifier)s_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
-#else
-static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *generator )
-#endif
 {
     CHECK_OBJECT( (PyObject *)generator );
     assert( Nuitka_Generator_Check( (PyObject *)generator ) );
 
-    // Local variable initialization
-%(function_var_inits)s
-
+    // Heap access if used.
+    NUITKA_MAY_BE_UNUSED struct %(function_identifier)s_locals *generator_heap = (struct %(function_identifier)s_locals *)generator->m_heap_storage;
+%(function_locals)s
     // Dispatch to yield based on return label index:
 %(function_dispatch)s
 
+    // Local variable initialization
+%(function_var_inits)s
+
     // Actual function code.
 %(function_body)s
 
@@ -58,65 +53,45 @@ static void %(function_identifier)s_context( struct Nuitka_GeneratorObject *gene
 
 template_generator_exception_exit = """\
 %(function_cleanup)s\
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     return NULL;
-#else
-    generator->m_yielded = NULL;
-    return;
-#endif
 
-    function_exception_exit:
+    function_exception_exit: NUITKA_COLD_LABEL;
 %(function_cleanup)s\
     assert( exception_type );
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     return NULL;
-#else
-    generator->m_yielded = NULL;
-    return;
-#endif
 """
 
 template_generator_noexception_exit = """\
     // Return statement need not be present.
 %(function_cleanup)s\
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     return NULL;
-#else
-    generator->m_yielded = NULL;
-    return;
-#endif
 """
 
 template_generator_return_exit = """\
     // The above won't return, but we need to make it clear to the compiler
     // as well, or else it will complain and/or generate inferior code.
     assert(false);
-    return;
+    return NULL;
 
     function_return_exit:
 #if PYTHON_VERSION >= 330
-    if ( tmp_return_value != Py_None )
+    if ( %(return_value)s != Py_None )
     {
-        PyObject *args[1] = { tmp_return_value };
+        PyObject *args[1] = { %(return_value)s };
         PyObject *stop_value = CALL_FUNCTION_WITH_ARGS1( PyExc_StopIteration, args );
         RESTORE_ERROR_OCCURRED( PyExc_StopIteration, stop_value, NULL );
         Py_INCREF( PyExc_StopIteration );
     }
     else
     {
-        Py_DECREF( tmp_return_value );
+        Py_DECREF( %(return_value)s );
     }
 #endif
 
-#if _NUITKA_EXPERIMENTAL_GENERATOR_GOTO
     return NULL;
-#else
-    generator->m_yielded = NULL;
-    return;
-#endif
 """
 
 template_generator_making = """\
@@ -128,7 +103,8 @@ template_generator_making = """\
     %(generator_qualname_obj)s,
 #endif
     %(code_identifier)s,
-    %(closure_count)d
+    %(closure_count)d,
+    sizeof(struct %(generator_identifier)s_locals)
 );
 %(closure_copy)s
 """
@@ -196,6 +196,15 @@ if (unlikely( %(tmp_name)s == NULL ))
 }
 """
 
+# With dictionary versions, each access site caches the value, and only does
+# the lookup again, after a dictionary changed.
+template_read_mvar_cached = """\
+{
+    static struct Nuitka_ModuleVariableCache module_variable_cache = { 0, 0, 0, NULL };
+    %(tmp_name)s = GET_MODULE_VARIABLE_VALUE_CACHED( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, &module_variable_cache );
+}
+"""
+
 template_read_locals_dict_with_fallback = """\
 %(to_name)s = PyDict_GetItem( %(locals_dict)s, %(var_name)s );
 
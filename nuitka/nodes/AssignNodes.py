@@ -358,7 +358,10 @@ Removed assignment of %s from itself which is known to be defined.""" % variable
                         else:
                             propagated = False
 
-                        if not variable.isModuleVariable():
+                        # Values of variables in frames of in-lined functions
+                        # are still needed for their locals.
+                        if not variable.isModuleVariable() and \
+                           not (variable.isTempVariable() and variable.isFrameVisible()):
                             if not last_trace.hasPotentialUsages() and not last_trace.getNameUsageCount():
                                 if not last_trace.getPrevious().isUninitTrace():
                                     # TODO: We could well decide, if that's even necessary, but for now
@@ -512,8 +515,6 @@ class StatementDelVariable(NodeBase):
         return self.variable
 
     def setVariable(self, variable):
-        assert self.variable_version is None
-
         self.variable = variable
         self.variable_version = variable.allocateTargetNumber()
 
@@ -661,8 +662,11 @@ class StatementReleaseVariable(NodeBase):
 
         trace_collection.onVariableContentEscapes(self.variable)
 
-        # Any code could be run, note that.
-        trace_collection.onControlFlowEscape(self)
+        # Any code could be run, note that. Imported modules are still
+        # referenced from "sys.modules" though.
+        if not self.variable_trace.isAssignTrace() or \
+           not self.variable_trace.getAssignNode().getAssignSource().isExpressionBuiltinImport():
+            trace_collection.onControlFlowEscape(self)
 
         # TODO: We might be able to remove ourselves based on the trace
         # we belong to.
@@ -39,6 +39,7 @@ from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
 from .NodeMakingHelpers import wrapExpressionWithNodeSideEffects
+from .shapes.StandardShapes import ShapeUnknown
 
 
 class StatementAssignmentAttribute(StatementChildrenHavingBase):
@@ -212,12 +213,71 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
     )
 
     def computeExpression(self, trace_collection):
+        from nuitka.optimizations.StdlibComputations import computeStdlibLookup
+
+        result = computeStdlibLookup(self, trace_collection)
+
+        if result is not None:
+            return result
+
         return self.getLookupSource().computeExpressionAttribute(
             lookup_node      = self,
             attribute_name   = self.getAttributeName(),
             trace_collection = trace_collection
         )
 
+    def computeExpressionCall(self, call_node, call_args, call_kw,
+                              trace_collection):
+        from nuitka.optimizations.StdlibComputations import computeStdlibCall
+
+        result = computeStdlibCall(
+            called    = self,
+            call_node = call_node,
+            call_args = call_args,
+            call_kw   = call_kw
+        )
+
+        if result is not None:
+            return result
+
+        # The "join" of strings makes a list of a generator expression, which
+        # can be done without the generator.
+        if self.attribute_name == "join" and \
+           call_kw is None and \
+           call_args is not None and \
+           call_args.isExpressionMakeTuple() and \
+           len(call_args.getElements()) == 1 and \
+           self.getLookupSource().isExpressionConstantRef() and \
+           (self.getLookupSource().isStringConstant() or \
+            self.getLookupSource().isUnicodeConstant()):
+            from nuitka.optimizations.GeneratorExpressionFusion import makeFusedGeneratorExpression
+
+            value = call_args.getElements()[0]
+
+            result = makeFusedGeneratorExpression(
+                generator        = value,
+                consumer         = "list",
+                source_ref       = call_node.getSourceReference(),
+                trace_collection = trace_collection
+            )
+
+            if result is not None:
+                value.replaceWith(result)
+
+                return (
+                    call_node,
+                    "new_expression",
+                    "Generator expression fused into 'list' for string 'join'."
+                )
+
+        return ExpressionChildrenHavingBase.computeExpressionCall(
+            self,
+            call_node        = call_node,
+            call_args        = call_args,
+            call_kw          = call_kw,
+            trace_collection = trace_collection
+        )
+
     def mayRaiseException(self, exception_type):
         return self.getLookupSource().mayRaiseExceptionAttributeLookup(
             exception_type = exception_type,
@@ -229,6 +289,18 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
         # either return a new node, or a decision maker.
         return None
 
+    def getTruthValue(self):
+        from nuitka.optimizations.WholeProgram import getWholeProgramConstant
+        constant = getWholeProgramConstant(self)
+
+        return None if constant is None else constant.getTruthValue()
+
+    def getTypeShape(self):
+        from nuitka.optimizations.WholeProgram import getWholeProgramConstant
+        constant = getWholeProgramConstant(self)
+
+        return ShapeUnknown if constant is None else constant.getTypeShape()
+
 
 class ExpressionAttributeLookupSpecial(ExpressionAttributeLookup):
     """ Special lookup up an attribute of an object.
@@ -0,0 +1,182 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the built-ins that iterate over their argument.
+
+These are "any", "all", "min", "max", and "sorted". They run the iteration
+in C code, without creating the iterator and the items as objects visible
+to the compiled code, and can be computed for small constant arguments.
+"""
+
+from nuitka.optimizations import BuiltinOptimization
+
+from .ExpressionBases import (
+    ExpressionBuiltinSingleArgBase,
+    ExpressionChildrenHavingBase,
+    ExpressionSpecBasedComputationBase
+)
+from .shapes.BuiltinTypeShapes import ShapeTypeBool, ShapeTypeList
+
+# Constant arguments with up to this many items are iterated at compile time.
+compile_time_iteration_limit = 256
+
+
+class ExpressionBuiltinIteratingBase(ExpressionBuiltinSingleArgBase):
+    # Consumer name for fusion of generator expressions into it, if any.
+    fusion_consumer = None
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if self.fusion_consumer is not None:
+            from nuitka.optimizations.GeneratorExpressionFusion import makeFusedGeneratorExpression
+
+            result = makeFusedGeneratorExpression(
+                generator        = value,
+                consumer         = self.fusion_consumer,
+                source_ref       = self.getSourceReference(),
+                trace_collection = trace_collection
+            )
+
+            if result is not None:
+                return (
+                    result,
+                    "new_expression",
+                    "Generator expression fused into '%s' built-in." % self.fusion_consumer
+                )
+
+        if value.isCompileTimeConstant():
+            iteration_length = value.getIterationLength()
+
+            if iteration_length is not None and \
+               iteration_length <= compile_time_iteration_limit:
+                return self.computeBuiltinSpec(
+                    trace_collection = trace_collection,
+                    given_values     = (value,)
+                )
+
+        value.onContentEscapes(trace_collection)
+
+        # Iteration and comparison of the items can run any code.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionBuiltinAny(ExpressionBuiltinIteratingBase):
+    kind = "EXPRESSION_BUILTIN_ANY"
+
+    builtin_spec = BuiltinOptimization.builtin_any_spec
+
+    fusion_consumer = "any"
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+
+class ExpressionBuiltinAll(ExpressionBuiltinIteratingBase):
+    kind = "EXPRESSION_BUILTIN_ALL"
+
+    builtin_spec = BuiltinOptimization.builtin_all_spec
+
+    fusion_consumer = "all"
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+
+class ExpressionBuiltinMin1(ExpressionBuiltinIteratingBase):
+    kind = "EXPRESSION_BUILTIN_MIN1"
+
+    builtin_spec = BuiltinOptimization.builtin_min1_spec
+
+
+class ExpressionBuiltinMax1(ExpressionBuiltinIteratingBase):
+    kind = "EXPRESSION_BUILTIN_MAX1"
+
+    builtin_spec = BuiltinOptimization.builtin_max1_spec
+
+
+class ExpressionBuiltinSorted(ExpressionBuiltinIteratingBase):
+    kind = "EXPRESSION_BUILTIN_SORTED"
+
+    builtin_spec = BuiltinOptimization.builtin_sorted_spec
+
+    def getTypeShape(self):
+        return ShapeTypeList
+
+
+class ExpressionBuiltinMinMax2Base(ExpressionSpecBasedComputationBase):
+    named_children = (
+        "value1",
+        "value2"
+    )
+
+    def __init__(self, value1, value2, source_ref):
+        ExpressionSpecBasedComputationBase.__init__(
+            self,
+            values     = {
+                "value1" : value1,
+                "value2" : value2
+            },
+            source_ref = source_ref
+        )
+
+    getValue1 = ExpressionChildrenHavingBase.childGetter("value1")
+    getValue2 = ExpressionChildrenHavingBase.childGetter("value2")
+
+    def computeExpression(self, trace_collection):
+        value1 = self.getValue1()
+        value2 = self.getValue2()
+
+        if value1.isCompileTimeConstant() and value2.isCompileTimeConstant():
+            return self.computeBuiltinSpec(
+                trace_collection = trace_collection,
+                given_values     = (value1, value2)
+            )
+
+        # The comparison can run any code.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def getTypeShape(self):
+        # The result is one of the values, so their common shape is known.
+        shape = self.getValue1().getTypeShape()
+
+        if shape is self.getValue2().getTypeShape():
+            return shape
+        else:
+            return ExpressionSpecBasedComputationBase.getTypeShape(self)
+
+
+class ExpressionBuiltinMin2(ExpressionBuiltinMinMax2Base):
+    kind = "EXPRESSION_BUILTIN_MIN2"
+
+    builtin_spec = BuiltinOptimization.builtin_min2_spec
+
+
+class ExpressionBuiltinMax2(ExpressionBuiltinMinMax2Base):
+    kind = "EXPRESSION_BUILTIN_MAX2"
+
+    builtin_spec = BuiltinOptimization.builtin_max2_spec
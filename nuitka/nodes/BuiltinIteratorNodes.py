@@ -36,6 +36,11 @@ from .NodeMakingHelpers import (
     makeRaiseExceptionReplacementStatement,
     wrapExpressionWithSideEffects
 )
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeEnumerate,
+    ShapeTypeList,
+    ShapeTypeZip
+)
 from .shapes.StandardShapes import ShapeIterator
 
 
@@ -272,6 +277,120 @@ class ExpressionBuiltinIter2(ExpressionChildrenHavingBase):
         return self, "new_builtin", "Eliminated useless iterator creation."
 
 
+class ExpressionBuiltinIteratorMakingBase(ExpressionChildrenHavingBase):
+    """ Base for built-ins that make iterators from their arguments.
+
+        Their results are iterators already, so in "for" loops, the "iter"
+        call on them goes away.
+    """
+
+    def computeExpression(self, trace_collection):
+        # Making the iterators of the arguments can run any code.
+        trace_collection.onControlFlowEscape(self)
+
+        # Any exception may be raised.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        return self, "new_builtin", "Eliminated useless iterator creation."
+
+    def isKnownToBeIterable(self, count):
+        if count is None:
+            return True
+
+        return None
+
+
+class ExpressionBuiltinEnumerate(ExpressionBuiltinIteratorMakingBase):
+    kind = "EXPRESSION_BUILTIN_ENUMERATE"
+
+    named_children = (
+        "value",
+        "start"
+    )
+
+    def __init__(self, value, start, source_ref):
+        ExpressionBuiltinIteratorMakingBase.__init__(
+            self,
+            values     = {
+                "value" : value,
+                "start" : start
+            },
+            source_ref = source_ref
+        )
+
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+    getStart = ExpressionChildrenHavingBase.childGetter("start")
+
+    def getTypeShape(self):
+        return ShapeTypeEnumerate
+
+
+class ExpressionBuiltinReversed(ExpressionBuiltinIteratorMakingBase):
+    kind = "EXPRESSION_BUILTIN_REVERSED"
+
+    named_children = (
+        "value",
+    )
+
+    def __init__(self, value, source_ref):
+        ExpressionBuiltinIteratorMakingBase.__init__(
+            self,
+            values     = {
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def getTypeShape(self):
+        # TODO: This could be more specific, it depends on the value.
+        return ShapeIterator
+
+
+class ExpressionBuiltinZip(ExpressionBuiltinIteratorMakingBase):
+    kind = "EXPRESSION_BUILTIN_ZIP"
+
+    named_children = (
+        "values",
+    )
+
+    def __init__(self, values, source_ref):
+        ExpressionBuiltinIteratorMakingBase.__init__(
+            self,
+            values     = {
+                "values" : tuple(values)
+            },
+            source_ref = source_ref
+        )
+
+    getValues = ExpressionChildrenHavingBase.childGetter("values")
+
+    def getTypeShape(self):
+        # For Python2, this creates the list of tuples directly.
+        if python_version < 300:
+            return ShapeTypeList
+        else:
+            return ShapeTypeZip
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        # For Python2, the list still needs an iterator to be made.
+        if python_version < 300:
+            return ExpressionChildrenHavingBase.computeExpressionIter1(
+                self,
+                iter_node        = iter_node,
+                trace_collection = trace_collection
+            )
+        else:
+            return ExpressionBuiltinIteratorMakingBase.computeExpressionIter1(
+                self,
+                iter_node        = iter_node,
+                trace_collection = trace_collection
+            )
+
 
 class ExpressionAsyncIter(ExpressionBuiltinSingleArgBase):
     kind = "EXPRESSION_ASYNC_ITER"
@@ -59,3 +59,12 @@ class ExpressionBuiltinLen(ExpressionBuiltinSingleArgBase):
             return True
 
         return not value.getTypeShape().hasShapeSlotLen()
+
+    def mayHaveSideEffects(self):
+        value = self.getValue()
+
+        if value.mayHaveSideEffects():
+            return True
+
+        # Only built-in types are known to have the slot, these run no code.
+        return not value.getTypeShape().hasShapeSlotLen()
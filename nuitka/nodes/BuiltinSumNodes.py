@@ -82,6 +82,22 @@ class ExpressionBuiltinSum1(ExpressionBuiltinSumBase):
     def computeExpression(self, trace_collection):
         sequence  = self.getSequence()
 
+        from nuitka.optimizations.GeneratorExpressionFusion import makeFusedGeneratorExpression
+
+        result = makeFusedGeneratorExpression(
+            generator        = sequence,
+            consumer         = "sum",
+            source_ref       = self.getSourceReference(),
+            trace_collection = trace_collection
+        )
+
+        if result is not None:
+            return (
+                result,
+                "new_expression",
+                "Generator expression fused into 'sum' built-in."
+            )
+
         # TODO: Protect against large xrange constants
         return self.computeBuiltinSpec(
             trace_collection = trace_collection,
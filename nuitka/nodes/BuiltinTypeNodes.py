@@ -38,7 +38,11 @@ from .shapes.BuiltinTypeShapes import (
     ShapeTypeBytearray,
     ShapeTypeBytes,
     ShapeTypeFloat,
+    ShapeTypeFrozenset,
+    ShapeTypeList,
+    ShapeTypeSet,
     ShapeTypeStr,
+    ShapeTypeTuple,
     ShapeTypeUnicode
 )
 
@@ -51,6 +55,10 @@ class ExpressionBuiltinContainerBase(ExpressionSpecBasedComputationBase):
 
     builtin_spec = None
 
+    # Consumer name for fusion of generator expressions into it, the result
+    # of which is used, or converted, if it is not of our type.
+    fusion_consumer = None
+
     named_children = (
         "value",
     )
@@ -76,6 +84,38 @@ class ExpressionBuiltinContainerBase(ExpressionSpecBasedComputationBase):
                 trace_collection = trace_collection,
                 given_values     = ()
             )
+        elif value.isExpressionOutlineBody():
+            from nuitka.optimizations.GeneratorExpressionFusion import makeFusedGeneratorExpression
+
+            result = makeFusedGeneratorExpression(
+                generator        = value,
+                consumer         = self.fusion_consumer,
+                source_ref       = self.getSourceReference(),
+                trace_collection = trace_collection
+            )
+
+            if result is None:
+                return self.computeBuiltinSpec(
+                    trace_collection = trace_collection,
+                    given_values     = (value,)
+                )
+            elif self.builtin_spec.getName() == self.fusion_consumer:
+                return (
+                    result,
+                    "new_expression",
+                    "Generator expression fused into '%s' built-in." % self.fusion_consumer
+                )
+            else:
+                value.replaceWith(result)
+
+                return (
+                    self,
+                    "new_expression",
+                    "Generator expression fused into '%s' for '%s' built-in." % (
+                        self.fusion_consumer,
+                        self.builtin_spec.getName()
+                    )
+                )
         elif value.isExpressionConstantXrangeRef():
             if value.getIterationLength() <= 256:
                 return self.computeBuiltinSpec(
@@ -96,24 +136,44 @@ class ExpressionBuiltinTuple(ExpressionBuiltinContainerBase):
 
     builtin_spec = BuiltinOptimization.builtin_tuple_spec
 
+    fusion_consumer = "list"
+
+    def getTypeShape(self):
+        return ShapeTypeTuple
+
 
 class ExpressionBuiltinList(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_LIST"
 
     builtin_spec = BuiltinOptimization.builtin_list_spec
 
+    fusion_consumer = "list"
+
+    def getTypeShape(self):
+        return ShapeTypeList
+
 
 class ExpressionBuiltinSet(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_SET"
 
     builtin_spec = BuiltinOptimization.builtin_set_spec
 
+    fusion_consumer = "set"
+
+    def getTypeShape(self):
+        return ShapeTypeSet
+
 
 class ExpressionBuiltinFrozenset(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_FROZENSET"
 
     builtin_spec = BuiltinOptimization.builtin_frozenset_spec
 
+    fusion_consumer = "set"
+
+    def getTypeShape(self):
+        return ShapeTypeFrozenset
+
 
 class ExpressionBuiltinFloat(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_BUILTIN_FLOAT"
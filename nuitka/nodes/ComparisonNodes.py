@@ -163,6 +163,11 @@ class ExpressionComparisonIsIsNotBase(ExpressionComparisonBase):
     def mayRaiseExceptionBool(self, exception_type):
         return False
 
+    def mayHaveSideEffects(self):
+        # Identity checks run no code.
+        return self.getLeft().mayHaveSideEffects() or \
+               self.getRight().mayHaveSideEffects()
+
     def computeExpression(self, trace_collection):
         left, right = self.getOperands()
 
@@ -299,7 +304,11 @@ class ExpressionComparisonInNotInBase(ExpressionComparisonBase):
         return right.mayRaiseExceptionIn(exception_type, left)
 
     def mayRaiseExceptionBool(self, exception_type):
-        return False
+        # The result is a bool, but searching the container may raise.
+        return self.getRight().mayRaiseExceptionIn(
+            exception_type,
+            self.getLeft()
+        )
 
     def computeExpression(self, trace_collection):
         return self.getRight().computeExpressionComparisonIn(
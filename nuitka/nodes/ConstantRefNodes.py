@@ -364,6 +364,45 @@ Iteration over constant %s changed to tuple.""" % type(self.constant).__name__
 
         return iter_node, None, None
 
+    def computeExpressionComparisonIn(self, in_node, value_node, trace_collection):
+        constant_type = type(self.constant)
+
+        if constant_type in (list, set) and \
+           not value_node.isCompileTimeConstant():
+            # The container is only searched, so it need not be a mutable
+            # copy, checking a set and a frozenset gives the same result.
+            if constant_type is list:
+                constant = tuple(self.constant)
+            else:
+                constant = frozenset(self.constant)
+
+            result = makeConstantRefNode(
+                constant      = constant,
+                user_provided = self.user_provided,
+                source_ref    = self.getSourceReference()
+            )
+
+            self.replaceWith(result)
+
+            # Comparing to the elements may still raise.
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+            return (
+                in_node,
+                "new_constant", """\
+Membership test in constant %s changed to %s.""" % (
+                    constant_type.__name__,
+                    type(constant).__name__
+                )
+            )
+
+        return CompileTimeConstantExpressionBase.computeExpressionComparisonIn(
+            self,
+            in_node          = in_node,
+            value_node       = value_node,
+            trace_collection = trace_collection
+        )
+
 
 class ExpressionConstantNoneRef(ExpressionConstantRefBase):
     kind = "EXPRESSION_CONSTANT_NONE_REF"
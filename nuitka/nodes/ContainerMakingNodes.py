@@ -197,6 +197,21 @@ class ExpressionMakeList(ExpressionMakeSequenceBase):
         return iter_node, "new_expression", """\
 Iteration over list reduced to tuple."""
 
+    def computeExpressionComparisonIn(self, in_node, value_node, trace_collection):
+        result = ExpressionMakeTuple(
+            elements   = self.getElements(),
+            source_ref = self.source_ref
+        )
+
+        self.replaceWith(result)
+
+        # Comparing to the elements may run any code.
+        trace_collection.onControlFlowEscape(in_node)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return in_node, "new_expression", """\
+Membership test in list reduced to tuple."""
+
 
 class ExpressionMakeSet(ExpressionMakeSequenceBase):
     kind = "EXPRESSION_MAKE_SET"
@@ -162,6 +162,10 @@ class StatementSetOperationAdd(StatementChildrenHavingBase):
 
         trace_collection.removeKnowledge(self.getSet())
 
+        # Hashing the value may run any code, and raise.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
         return self, None, None
 
 
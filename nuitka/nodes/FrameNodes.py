@@ -71,9 +71,20 @@ class StatementsFrameBase(StatementsSequence):
 
         self.needs_frame_exception_preserve = False
 
+        # Variables for the names of the code object, if not the local
+        # variables of the provider, e.g. when in-lined into an outline.
+        self.frame_variables = None
+
     def isStatementsFrame(self):
         return True
 
+    def makeClone(self):
+        result = StatementsSequence.makeClone(self)
+
+        result.frame_variables = self.frame_variables
+
+        return result
+
     def getDetails(self):
         result = {
             "code_object" : self.code_object
@@ -124,6 +135,36 @@ class StatementsFrameBase(StatementsSequence):
     def getVarNames(self):
         return self.code_object.getVarNames()
 
+    def setFrameVariables(self, frame_variables):
+        """ Use these variables for the names of the code object.
+
+            The "frame_variables" is a dictionary of variable names and the
+            variables now used for them, which can be temporary variables.
+        """
+
+        self.frame_variables = dict(frame_variables)
+
+        for variable in self.frame_variables.values():
+            if variable.isTempVariable():
+                variable.markAsFrameVisible()
+
+    def getFrameVariables(self):
+        """ Variables for the names of the code object.
+
+            None if these are the local variables of the provider.
+        """
+
+        return self.frame_variables
+
+    def replaceFrameVariable(self, old_variable, new_variable):
+        if self.frame_variables is not None:
+            for variable_name, variable in self.frame_variables.items():
+                if variable is old_variable:
+                    self.frame_variables[variable_name] = new_variable
+
+                    if new_variable.isTempVariable():
+                        new_variable.markAsFrameVisible()
+
     def updateLocalNames(self):
         """ For use during variable closure phase. Finalize attributes.
 
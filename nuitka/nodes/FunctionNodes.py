@@ -58,6 +58,7 @@ from .NodeMakingHelpers import (
     wrapExpressionWithSideEffects
 )
 from .ParameterSpecs import ParameterSpec, TooManyArguments, matchCall
+from .shapes.BuiltinTypeShapes import ShapeTypeBool
 
 
 class MaybeLocalVariableUsage(Exception):
@@ -985,6 +986,55 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
         return self.variable_closure_traces
 
 
+class ExpressionFunctionCodeCheck(ExpressionChildrenHavingBase):
+    """ Check if a value is a compiled function of a given code object.
+
+        This is used to guard in-lined calls of module level functions, which
+        could be replaced from the outside at run time. Compiled functions do
+        not allow their "__code__" to be changed, so the code object
+        identifies the function body.
+    """
+
+    kind = "EXPRESSION_FUNCTION_CODE_CHECK"
+
+    named_children = (
+        "value",
+    )
+
+    def __init__(self, value, code_object, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "value" : value,
+            },
+            source_ref = source_ref
+        )
+
+        self.code_object = code_object
+
+    def getDetails(self):
+        return {
+            "code_object" : self.code_object
+        }
+
+    def getCodeObject(self):
+        return self.code_object
+
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+    def mayRaiseException(self, exception_type):
+        return self.getValue().mayRaiseException(exception_type)
+
+    def mayRaiseExceptionBool(self, exception_type):
+        return False
+
+
 # Needed for Python3.3 and higher
 class ExpressionFunctionQualnameRef(CompileTimeConstantExpressionBase):
     kind = "EXPRESSION_FUNCTION_QUALNAME_REF"
@@ -38,12 +38,14 @@ from nuitka.importing.Importing import (
     getModuleNameAndKindFromFilename
 )
 from nuitka.importing.Recursion import decideRecursion, recurseTo
+from nuitka.importing.StandardLibrary import isStandardLibraryPath
 from nuitka.importing.Whitelisting import getModuleWhiteList
 from nuitka.utils.FileOperations import relpath
 
 from .ExpressionBases import ExpressionBase, ExpressionChildrenHavingBase
 from .NodeBases import StatementChildrenHavingBase
 from .shapes.BuiltinTypeShapes import ShapeTypeBuiltinModule, ShapeTypeModule
+from .shapes.StandardShapes import ShapeUnknown
 
 
 class ExpressionImportModuleHard(ExpressionBase):
@@ -175,6 +177,9 @@ class ExpressionBuiltinImport(ExpressionChildrenHavingBase):
 
         self.finding = None
 
+        # Found as a built-in module, or in the standard library path.
+        self.standard_library = False
+
         self.type_shape = ShapeTypeModule
 
         self.builtin_module = None
@@ -213,6 +218,9 @@ class ExpressionBuiltinImport(ExpressionChildrenHavingBase):
                 )
 
                 if added_flag:
+                    from nuitka.optimizations.WholeProgram import onModuleAdded
+                    onModuleAdded()
+
                     trace_collection.signalChange(
                         "new_code",
                         imported_module.getSourceReference(),
@@ -273,6 +281,10 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
             warn           = True
         )
 
+        self.standard_library = self.finding == "built-in" or \
+          (self.finding == "absolute" and
+           isStandardLibraryPath(module_filename))
+
         if module_filename is not None:
             self.imported_module = self._consider(
                 trace_collection = trace_collection,
@@ -319,7 +331,7 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
             while '.' in module_name:
                 module_name = '.'.join(module_name.split('.')[:-1])
 
-                module_package, module_filename, _finding = findModule(
+                module_package, module_filename, package_finding = findModule(
                     importing      = self,
                     module_name    = module_name,
                     parent_package = parent_package,
@@ -328,6 +340,11 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
                 )
 
                 if module_filename is not None:
+                    # Modules like "os.path" are only created at run time
+                    # by their standard library package.
+                    self.standard_library = package_finding == "absolute" and \
+                                            isStandardLibraryPath(module_filename)
+
                     package_module = self._consider(
                         trace_collection = trace_collection,
                         module_filename  = module_filename,
@@ -423,6 +440,24 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
 
     # TODO: Add computeExpressionImportName
 
+    def getStandardLibraryModuleName(self):
+        """ Name of the standard library module this gives, or None. """
+
+        if not self.standard_library:
+            return None
+
+        module_name = self.getImportName().getCompileTimeConstant()
+        fromlist = self.getFromList()
+
+        if fromlist is not None and not fromlist.isCompileTimeConstant():
+            return None
+
+        # Without a "fromlist", the top level package is what we get.
+        if fromlist is None or not fromlist.getCompileTimeConstant():
+            module_name = module_name.split('.')[0]
+
+        return module_name
+
     def mayRaiseException(self, exception_type):
         return self.finding != "built-in"
 
@@ -515,14 +550,55 @@ class ExpressionImportName(ExpressionChildrenHavingBase):
     getModule = ExpressionChildrenHavingBase.childGetter("module")
 
     def computeExpression(self, trace_collection):
+        from nuitka.optimizations.StdlibComputations import computeStdlibLookup
+
+        result = computeStdlibLookup(self, trace_collection)
+
+        if result is not None:
+            return result
+
         return self.getModule().computeExpressionImportName(
             import_node      = self,
             import_name      = self.import_name,
             trace_collection = trace_collection
         )
 
+    def computeExpressionCall(self, call_node, call_args, call_kw,
+                              trace_collection):
+        from nuitka.optimizations.StdlibComputations import computeStdlibCall
+
+        result = computeStdlibCall(
+            called    = self,
+            call_node = call_node,
+            call_args = call_args,
+            call_kw   = call_kw
+        )
+
+        if result is not None:
+            return result
+
+        return ExpressionChildrenHavingBase.computeExpressionCall(
+            self,
+            call_node        = call_node,
+            call_args        = call_args,
+            call_kw          = call_kw,
+            trace_collection = trace_collection
+        )
+
     def mayRaiseException(self, exception_type):
         return self.getModule().mayRaiseExceptionImportName(
             exception_type = exception_type,
             import_name    = self.import_name
         )
+
+    def getTruthValue(self):
+        from nuitka.optimizations.WholeProgram import getWholeProgramConstant
+        constant = getWholeProgramConstant(self)
+
+        return None if constant is None else constant.getTruthValue()
+
+    def getTypeShape(self):
+        from nuitka.optimizations.WholeProgram import getWholeProgramConstant
+        constant = getWholeProgramConstant(self)
+
+        return ShapeUnknown if constant is None else constant.getTypeShape()
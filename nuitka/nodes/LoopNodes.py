@@ -27,6 +27,7 @@ from nuitka.tree.Extractions import getVariablesWritten
 
 from .Checkers import checkStatementsSequenceOrNone
 from .NodeBases import NodeBase, StatementChildrenHavingBase
+from .NodeMakingHelpers import makeStatementsSequenceReplacementNode
 
 
 class StatementLoop(StatementChildrenHavingBase):
@@ -217,6 +218,26 @@ Removed useless loop with immediate 'break' statement."""
         # global variables. It may also raise.
         outer_trace_collection.onExceptionRaiseExit(BaseException)
 
+        if loop_body is not None:
+            from nuitka.optimizations.LoopInvariants import (
+                getLoopInvariantExpressions,
+                makeLoopInvariantsHoisted
+            )
+
+            invariants = getLoopInvariantExpressions(loop_body)
+
+            if invariants:
+                result = makeStatementsSequenceReplacementNode(
+                    statements = makeLoopInvariantsHoisted(
+                        loop_node   = self,
+                        expressions = invariants
+                    ),
+                    node       = self
+                )
+
+                return result, "new_statements", """\
+Moved %d loop invariant expression(s) out of loop.""" % len(invariants)
+
         return self, None, None
 
 
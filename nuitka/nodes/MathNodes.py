@@ -0,0 +1,133 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for calls of "math" module functions.
+
+These use the C library function directly, after converting the argument
+to a C double the same way the "math" module does, without looking up the
+module attribute and calling it.
+"""
+
+import math
+
+from nuitka.PythonVersions import python_version
+
+from .ExpressionBases import ExpressionChildrenHavingBase
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong
+)
+
+math_functions = ("sqrt", "fabs", "floor", "ceil")
+
+# Python3 "floor" and "ceil" use special methods of the argument, and give an
+# "int" value, for "float" we know what that does.
+if python_version < 300:
+    math_float_only_functions = ()
+else:
+    math_float_only_functions = ("floor", "ceil")
+
+# Converting values of these shapes to a C double cannot raise or run code.
+_float_convertible_shapes = (
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeBool,
+)
+
+
+class ExpressionMathFunctionCall(ExpressionChildrenHavingBase):
+    """ Call of a "math" module function with a C implementation.
+
+        Typical code like this: math.sqrt(value)
+    """
+
+    kind = "EXPRESSION_MATH_FUNCTION_CALL"
+
+    named_children = ("value",)
+
+    def __init__(self, function_name, value, source_ref):
+        assert function_name in math_functions, function_name
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "value" : value
+            },
+            source_ref = source_ref
+        )
+
+        self.function_name = function_name
+
+    def getDetails(self):
+        return {
+            "function_name" : self.function_name
+        }
+
+    def getFunctionName(self):
+        return self.function_name
+
+    getValue = ExpressionChildrenHavingBase.childGetter("value")
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if value.isCompileTimeConstant():
+            constant = value.getCompileTimeConstant()
+            function = getattr(math, self.function_name)
+
+            return trace_collection.getCompileTimeComputationResult(
+                node        = self,
+                computation = lambda : function(constant),
+                description = "Call of 'math.%s' with constant argument." % (
+                    self.function_name
+                )
+            )
+
+        if self.mayRaiseException(BaseException):
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        # Converting to float may run "__float__" of the value.
+        if value.getTypeShape() not in _float_convertible_shapes:
+            trace_collection.onControlFlowEscape(self)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        value = self.getValue()
+
+        if value.mayRaiseException(exception_type):
+            return True
+
+        if value.getTypeShape() is not ShapeTypeFloat:
+            return True
+
+        # Negative values are a domain error, and "int" results of "inf" and
+        # "nan" do not exist.
+        if self.function_name == "fabs":
+            return False
+        elif self.function_name in ("floor", "ceil"):
+            return python_version >= 300
+        else:
+            return True
+
+    def getTypeShape(self):
+        if self.function_name in math_float_only_functions:
+            return ShapeTypeIntOrLong
+        else:
+            return ShapeTypeFloat
@@ -23,16 +23,39 @@ no real difference.
 
 import math
 
-from nuitka import PythonOperators
+from nuitka import Options, PythonOperators
 
 from .ExpressionBases import ExpressionChildrenHavingBase
-from .shapes.BuiltinTypeShapes import ShapeTypeTuple
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeTuple
+)
 from .shapes.StandardShapes import (
     ShapeLargeConstantValuePredictable,
     ShapeUnknown,
     vshape_unknown
 )
 
+# Operators, that give "float" values for a "float" operand and a number.
+_float_result_operators = frozenset(
+    (
+        "Add", "Sub", "Mult", "Div", "TrueDiv", "FloorDiv", "Mod",
+        "IAdd", "ISub", "IMult", "IDiv", "ITrueDiv", "IFloorDiv", "IMod",
+    )
+)
+
+_number_shapes = (
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeLong,
+    ShapeTypeIntOrLong,
+    ShapeTypeBool,
+)
+
 
 class ExpressionOperationBase(ExpressionChildrenHavingBase):
 
@@ -135,6 +158,25 @@ class ExpressionOperationBinary(ExpressionOperationBase):
 
         return self, None, None
 
+    def getTypeShape(self):
+        # Float shapes make nested operations compute with C double values,
+        # which is experimental still, like the C types of variables are.
+        if not Options.isExperimental("enable_number_ctypes"):
+            return ShapeUnknown
+
+        left_shape = self.subnode_left.getTypeShape()
+        right_shape = self.subnode_right.getTypeShape()
+
+        # The "float" operand decides, the other number is converted, and
+        # "float" has no in-place variants of these.
+        if self.getOperator() in _float_result_operators and \
+           ShapeTypeFloat in (left_shape, right_shape) and \
+           left_shape in _number_shapes and \
+           right_shape in _number_shapes:
+            return ShapeTypeFloat
+
+        return ShapeUnknown
+
     def getOperands(self):
         return (self.subnode_left, self.subnode_right)
 
@@ -226,7 +268,7 @@ class ExpressionOperationBinaryMult(ExpressionOperationBinary):
         if self.shape is not None:
             return self.shape.getTypeShape()
         else:
-            return ShapeUnknown
+            return ExpressionOperationBinary.getTypeShape(self)
 
     def getIterationLength(self):
         left_length = self.getLeft().getIterationLength()
@@ -496,6 +538,32 @@ class ExpressionOperationNOT(ExpressionOperationUnary):
         return (self,)
 
 
+class ExpressionOperationAbs(ExpressionOperationUnary):
+    kind = "EXPRESSION_OPERATION_ABS"
+
+    def __init__(self, operand, source_ref):
+        ExpressionOperationUnary.__init__(
+            self,
+            operator   = "Abs",
+            operand    = operand,
+            source_ref = source_ref
+        )
+
+    def getDetails(self):
+        return {}
+
+    def getTypeShape(self):
+        operand_shape = self.getOperand().getTypeShape()
+
+        if operand_shape in (ShapeTypeFloat, ShapeTypeLong):
+            return operand_shape
+        elif operand_shape in (ShapeTypeInt, ShapeTypeIntOrLong, ShapeTypeBool):
+            # The absolute value of the smallest "int" is a "long".
+            return ShapeTypeIntOrLong
+        else:
+            return ShapeUnknown
+
+
 class ExpressionOperationBinaryInplace(ExpressionOperationBinary):
     kind = "EXPRESSION_OPERATION_BINARY_INPLACE"
 
@@ -122,6 +122,11 @@ class ExpressionVariableRefBase(ExpressionBase):
     def getVariable(self):
         return self.variable
 
+    def setVariable(self, variable):
+        assert isinstance(variable, Variables.Variable), repr(variable)
+
+        self.variable = variable
+
     def getVariableVersion(self):
         return self.variable_version
 
@@ -182,17 +187,32 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
     def getVariable(self):
         return self.variable
 
-    def setVariable(self, variable):
-        assert isinstance(variable, Variables.Variable), repr(variable)
+    def _getWholeProgramConstant(self):
+        if not self.variable.isModuleVariable():
+            return None
 
-        self.variable = variable
+        from nuitka.optimizations.WholeProgram import getWholeProgramConstant
+        return getWholeProgramConstant(self)
 
     def getTypeShape(self):
         if self.variable_trace.isAssignTrace():
             return self.variable_trace.getAssignNode().getAssignSource().getTypeShape()
+
+        constant = self._getWholeProgramConstant()
+
+        if constant is not None:
+            return constant.getTypeShape()
         else:
             return ShapeUnknown
 
+    def getTruthValue(self):
+        if self.variable_trace is None or self.variable_trace.isAssignTrace():
+            return None
+
+        constant = self._getWholeProgramConstant()
+
+        return None if constant is None else constant.getTruthValue()
+
     def computeExpressionRaw(self, trace_collection):
         variable = self.variable
         assert variable is not None
@@ -319,6 +339,68 @@ local variable '%s' referenced before assignment""" % variable_name
 
     def computeExpressionCall(self, call_node, call_args, call_kw,
                               trace_collection):
+        from nuitka.optimizations.StdlibComputations import computeStdlibCall
+
+        result = computeStdlibCall(
+            called    = self,
+            call_node = call_node,
+            call_args = call_args,
+            call_kw   = call_kw
+        )
+
+        if result is not None:
+            return result
+
+        # Local functions are known from their assignment.
+        if self.variable_trace.isAssignTrace() and \
+           not self.variable.isModuleVariable():
+            assign_source = self.variable_trace.getAssignNode().getAssignSource()
+
+            if assign_source.isExpressionFunctionCreation():
+                from nuitka.optimizations.FunctionInlining import makeInlinedFunctionCall
+
+                result = makeInlinedFunctionCall(
+                    call_node         = call_node,
+                    function_creation = assign_source,
+                    call_args         = call_args,
+                    call_kw           = call_kw
+                )
+
+                if result is not None:
+                    # The outline is only computed in the next pass, until then
+                    # it must be traced like the call it replaces, or else the
+                    # variable usages seen by this pass would be too few.
+                    trace_collection.onExceptionRaiseExit(BaseException)
+                    trace_collection.onControlFlowEscape(self)
+
+                    return (
+                        result,
+                        "new_statements",
+                        "Function call to '%s' in-lined." % assign_source.getName()
+                    )
+
+        # Module level functions can be in-lined with a guard.
+        if self.variable.isModuleVariable() and \
+           self.variable.getOwner() is self.getParentModule():
+            from nuitka.optimizations.FunctionInlining import makeGuardedInlinedFunctionCall
+
+            result = makeGuardedInlinedFunctionCall(
+                call_node = call_node,
+                variable  = self.variable,
+                call_args = call_args,
+                call_kw   = call_kw
+            )
+
+            if result is not None:
+                # Traced like the call it replaces, see above.
+                trace_collection.onExceptionRaiseExit(BaseException)
+                trace_collection.onControlFlowEscape(self)
+
+                return (
+                    result,
+                    "new_statements",
+                    "Call of module function '%s' in-lined with guard." % self.variable.getName()
+                )
 
         trace_collection.onExceptionRaiseExit(BaseException)
 
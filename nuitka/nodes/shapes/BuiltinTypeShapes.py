@@ -20,6 +20,7 @@
 """
 
 from nuitka.codegen.c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from nuitka.codegen.c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
 from nuitka.PythonVersions import python_version
 
 from .StandardShapes import ShapeBase, ShapeIterator
@@ -103,6 +104,11 @@ class ShapeTypeInt(ShapeBase):
     def getTypeName():
         return "int"
 
+    @staticmethod
+    def getCType():
+        # struct: C long if it fits, object, and validity of these
+        return CTypeNuitkaIntOrLongStruct
+
     @staticmethod
     def hasShapeSlotLen():
         return False
@@ -137,6 +143,11 @@ class ShapeTypeLong(ShapeBase):
     def getTypeName():
         return "long"
 
+    @staticmethod
+    def getCType():
+        # struct: C long if it fits, object, and validity of these
+        return CTypeNuitkaIntOrLongStruct
+
     @staticmethod
     def hasShapeSlotLen():
         return False
@@ -168,6 +179,10 @@ class ShapeTypeLong(ShapeBase):
 
 if python_version < 300:
     class ShapeTypeIntOrLong(ShapeBase):
+        @staticmethod
+        def getCType():
+            return CTypeNuitkaIntOrLongStruct
+
         @staticmethod
         def hasShapeSlotLen():
             return False
@@ -987,3 +1002,23 @@ class ShapeTypeClassmethod(ShapeBase):
     @staticmethod
     def hasShapeSlotContains():
         return False
+
+
+class ShapeTypeEnumerate(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "enumerate"
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+
+class ShapeTypeZip(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "zip"
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
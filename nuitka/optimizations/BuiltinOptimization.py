@@ -323,6 +323,18 @@ builtin_format_spec = BuiltinParameterSpecNoKeywords("format", ("value", "format
 
 builtin_sum_spec = BuiltinParameterSpecNoKeywords("sum", ("sequence", "start"), 1)
 
+builtin_any_spec = BuiltinParameterSpecNoKeywords("any", ("iterable",), 0)
+builtin_all_spec = BuiltinParameterSpecNoKeywords("all", ("iterable",), 0)
+
+# Only the variants with one iterable, or two values, and without "key" are
+# built-in nodes.
+builtin_min1_spec = BuiltinParameterSpecNoKeywords("min", ("iterable",), 0)
+builtin_min2_spec = BuiltinParameterSpecNoKeywords("min", ("value1", "value2"), 0)
+builtin_max1_spec = BuiltinParameterSpecNoKeywords("max", ("iterable",), 0)
+builtin_max2_spec = BuiltinParameterSpecNoKeywords("max", ("value1", "value2"), 0)
+
+builtin_abs_spec = BuiltinParameterSpecNoKeywords("abs", ("number",), 0)
+
 builtin_staticmethod_spec = BuiltinParameterSpecNoKeywords("staticmethod", ("function",), 0)
 builtin_classmethod_spec = BuiltinParameterSpecNoKeywords("classmethod", ("function",), 0)
 
@@ -19,15 +19,533 @@
 
 Done by assigning the argument values to variables, and producing an outline
 from the in-lined function.
+
+Calls of functions are in-lined, if the called function is known, and the
+cost model says, that its body is small enough for the call overhead to be
+worth avoiding. Frames of in-lined functions are kept, with the variables
+that replace their locals, so tracebacks and frame locals are unchanged.
 """
 
-from nuitka.nodes.AssignNodes import StatementAssignmentVariable
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable
+)
+from nuitka.nodes.CallNodes import makeExpressionCall
+from nuitka.nodes.ConditionalNodes import StatementConditional
+from nuitka.nodes.FunctionNodes import (
+    ExpressionFunctionCodeCheck,
+    ExpressionFunctionRef
+)
 from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
+from nuitka.nodes.ParameterSpecs import TooManyArguments, matchCall
+from nuitka.nodes.ReturnNodes import StatementReturn
+from nuitka.nodes.TryNodes import StatementTry
+from nuitka.nodes.VariableRefNodes import (
+    ExpressionTempVariableRef,
+    ExpressionVariableRef
+)
+from nuitka.PythonVersions import python_version
 from nuitka.tree.Extractions import updateVariableUsage
-from nuitka.tree.TreeHelpers import makeStatementsSequence
+from nuitka.tree.ReformulationTryFinallyStatements import (
+    makeTryFinallyStatement
+)
+from nuitka.tree.TreeHelpers import (
+    makeReraiseExceptionStatement,
+    makeSequenceCreationOrConstant,
+    makeStatementsSequence,
+    makeStatementsSequenceFromStatement
+)
+
+# Node count of a function body, for which in-lining is considered worth it.
+# Calls from inside a loop are worth more, as they are executed often.
+inline_size_limit = 40
+inline_size_limit_loop = 80
+
+# Limit for in-lined functions calling in-lined functions.
+inline_depth_limit = 3
+
+# Nodes which access the frame locals, and cannot work on an outline, or
+# which cannot be cloned.
+_not_inlinable_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_LOCALS_COPY",
+        "EXPRESSION_BUILTIN_LOCALS_REF",
+        "EXPRESSION_BUILTIN_LOCALS_UPDATED",
+        "EXPRESSION_BUILTIN_VARS",
+        "EXPRESSION_BUILTIN_EVAL",
+        "EXPRESSION_BUILTIN_EXEC",
+        "EXPRESSION_BUILTIN_EXECFILE",
+        # These own variables or refer to a provider, which a clone would
+        # share.
+        "EXPRESSION_OUTLINE_FUNCTION",
+        "EXPRESSION_FUNCTION_REF",
+        # Exception handlers preserve the exception of the frame, which is
+        # not the one of the in-lined function.
+        "STATEMENT_PRESERVE_FRAME_EXCEPTION",
+        "STATEMENT_PUBLISH_EXCEPTION",
+        # These cannot be cloned, their child names do not match the
+        # arguments of their constructor.
+        "EXPRESSION_BUILTIN_COMPILE",
+        "EXPRESSION_BUILTIN_GETATTR",
+        "EXPRESSION_BUILTIN_HASATTR",
+        "EXPRESSION_BUILTIN_IMPORT",
+        "EXPRESSION_BUILTIN_ITER2",
+        "EXPRESSION_BUILTIN_SETATTR",
+        "EXPRESSION_BUILTIN_SUPER",
+        "EXPRESSION_BUILTIN_TYPE3",
+        "EXPRESSION_DICT_OPERATION_GET",
+        "EXPRESSION_DICT_OPERATION_IN",
+        "EXPRESSION_DICT_OPERATION_NOT_IN",
+        "EXPRESSION_LIST_OPERATION_EXTEND",
+        "EXPRESSION_LIST_OPERATION_POP",
+        "EXPRESSION_LOCALS_MAPPING_VARIABLE_REF_OR_FALLBACK",
+        "EXPRESSION_LOCALS_VARIABLE_REF_OR_FALLBACK",
+        "EXPRESSION_OPERATION_BINARY_DIVMOD",
+        "EXPRESSION_SET_OPERATION_UPDATE",
+        "STATEMENT_DICT_OPERATION_REMOVE",
+        "STATEMENT_DICT_OPERATION_SET",
+        "STATEMENT_DICT_OPERATION_UPDATE",
+        "STATEMENT_EXEC",
+        "STATEMENT_IMPORT_STAR",
+        "STATEMENT_LIST_OPERATION_APPEND",
+        "STATEMENT_LOCALS_DICT_SYNC",
+        "STATEMENT_SET_LOCALS_DICTIONARY",
+        "STATEMENT_SET_OPERATION_ADD",
+    )
+)
+
+# Built-ins, whose calls are not yet optimized, and which may use the frame
+# locals or arguments, once they are.
+_locals_using_builtin_names = frozenset(
+    (
+        "locals",
+        "dir",
+        "vars",
+        "eval",
+        "exec",
+        "execfile",
+        "super",
+    )
+)
+
+
+def _getNodeCount(node, global_name_errors, in_handler = False):
+    """ Size of a node tree, the measure for the cost of in-lining it.
+
+        Returns None for trees that cannot be in-lined at all, because they
+        use the locals of the frame, or cannot be cloned, or may access
+        unassigned local variables, or re-raise the exception of the caller.
+        Without "global_name_errors", the "NameError" for module variables
+        would be worded differently where in-lined, so these must not raise
+        it either.
+    """
+
+    if node.kind in _not_inlinable_kinds:
+        return None
+
+    if node.isExpressionVariableRef() or node.isStatementDelVariable():
+        variable = node.getVariable()
+
+        if variable.getName() in _locals_using_builtin_names:
+            return None
+
+        # Unassigned local variables become temporary variables, which
+        # cannot raise the "UnboundLocalError" for them.
+        if (not variable.isModuleVariable() or not global_name_errors) and \
+           node.mayRaiseException(BaseException):
+            return None
+    elif node.isExpressionBuiltinRef():
+        if node.getBuiltinName() in _locals_using_builtin_names:
+            return None
+    elif node.kind == "STATEMENT_RERAISE_EXCEPTION":
+        if not in_handler:
+            return None
+
+    result = 1
+
+    for child in node.getVisitableNodes():
+        child_count = _getNodeCount(
+            node               = child,
+            global_name_errors = global_name_errors,
+            in_handler         = in_handler or (
+                node.isStatementTry() and \
+                child is node.getBlockExceptHandler()
+            )
+        )
+
+        if child_count is None:
+            return None
+
+        result += child_count
+
+    return result
+
+
+def getInlinedBodySize(body, provider):
+    """ Size of a body to be in-lined into "provider", None if it cannot be.
+
+        See "_getNodeCount" for the bodies, that cannot be in-lined.
+    """
+
+    return _getNodeCount(
+        node               = body,
+        global_name_errors = python_version >= 340 or not (
+            provider.isCompiledPythonModule() or \
+            provider.isExpressionClassBody()
+        )
+    )
+
+
+def _isInlinableFunctionBody(function_body, provider):
+    if not function_body.isExpressionFunctionBody():
+        return False
+
+    if function_body.isUnoptimized() or function_body.getBody() is None:
+        return False
+
+    parameters = function_body.getParameters()
+
+    if parameters.getStarListArgumentName() is not None or \
+       parameters.getStarDictArgumentName() is not None or \
+       parameters.getKwOnlyParameterCount():
+        return False
+
+    for variable in function_body.getLocalVariables():
+        if variable.getOwner() is not function_body:
+            # Closure variables can only be used where they are local.
+            if variable.getOwner() is not provider.getEntryPoint():
+                return False
+        elif variable.isSharedTechnically() is not False:
+            # Closure variables of others cannot become temporary variables.
+            return False
+
+    for variable in function_body.getTempVariables():
+        if variable.isSharedTechnically() is not False:
+            return False
+
+    return True
+
+
+def _getInlineDepth(call_node, function_creation):
+    """ Count in-lined functions the call is in, None for recursion. """
+
+    code_object = function_creation.getCodeObject()
+
+    result = 0
+
+    node = call_node.getParent()
+
+    while not node.isExpressionFunctionBodyBase() and \
+          not node.isCompiledPythonModule():
+        if node.isStatementsFrame():
+            if node.getCodeObject() is code_object:
+                return None
+
+            result += 1
+
+        node = node.getParent()
+
+    if node is function_creation.getFunctionRef().getFunctionBody():
+        return None
+
+    return result
+
+
+def _isInLoop(call_node):
+    node = call_node.getParent()
+
+    while not node.isExpressionFunctionBodyBase() and \
+          not node.isCompiledPythonModule():
+        if node.isStatementLoop():
+            return True
+
+        node = node.getParent()
+
+    return False
+
+
+def getInlinedCallArgumentValues(function_creation, call_args, call_kw):
+    """ Argument values for an in-lined call, None if it cannot be done.
+
+        Only calls giving all arguments by position are considered, so it
+        does not matter, if "__defaults__" of the function gets changed.
+        Functions with keyword only arguments are therefore not considered.
+    """
+
+    if call_kw is not None and \
+       (not call_kw.isExpressionConstantRef() or call_kw.getConstant() != {}):
+        return None
+
+    if call_args is None:
+        args_tuple = ()
+    elif call_args.isExpressionConstantRef() or \
+         call_args.isExpressionMakeTuple():
+        args_tuple = call_args.getIterationValues()
+    else:
+        return None
+
+    function_body = function_creation.getFunctionRef().getFunctionBody()
+    call_spec = function_body.getParameters()
+
+    if len(args_tuple) != len(call_spec.getArgumentNames()):
+        return None
+
+    # Keyword only arguments cannot be given by position, and their defaults
+    # from "__kwdefaults__" can be changed too.
+    if call_spec.getKwOnlyParameterCount():
+        return None
+
+    try:
+        args_dict = matchCall(
+            func_name     = function_body.getName(),
+            args          = call_spec.getArgumentNames(),
+            star_list_arg = call_spec.getStarListArgumentName(),
+            star_dict_arg = call_spec.getStarDictArgumentName(),
+            num_defaults  = call_spec.getDefaultCount(),
+            positional    = args_tuple,
+            pairs         = ()
+        )
+    except TooManyArguments:
+        return None
+
+    return [
+        args_dict[name]
+        for name in
+        call_spec.getParameterNames()
+    ]
+
+
+def getFunctionCallInliningCost(call_node, function_creation, values):
+    """ Cost of in-lining a call, None if it must not be done.
+
+        The cost is the size of the function body, reduced for constant
+        argument values, as these are likely to allow more optimization of
+        the in-lined code. The result is to be compared with the limit
+        from "getFunctionCallInliningLimit".
+    """
+
+    function_body = function_creation.getFunctionRef().getFunctionBody()
+
+    if not _isInlinableFunctionBody(
+            function_body = function_body,
+            provider      = call_node.getParentVariableProvider()
+        ):
+        return None
+
+    depth = _getInlineDepth(call_node, function_creation)
+
+    if depth is None or depth >= inline_depth_limit:
+        return None
+
+    size = getInlinedBodySize(
+        body     = function_body.getBody(),
+        provider = call_node.getParentVariableProvider()
+    )
+
+    if size is None:
+        return None
+
+    for value in values:
+        if value.isExpressionConstantRef():
+            size -= 3
 
+    return size
+
+
+def getFunctionCallInliningLimit(call_node):
+    if _isInLoop(call_node):
+        return inline_size_limit_loop
+    else:
+        return inline_size_limit
+
+
+def makeInlinedFunctionCall(call_node, function_creation, call_args, call_kw):
+    """ Outline for a call of a known function, None if not worth it. """
+
+    values = getInlinedCallArgumentValues(
+        function_creation = function_creation,
+        call_args         = call_args,
+        call_kw           = call_kw
+    )
+
+    if values is None:
+        return None
+
+    cost = getFunctionCallInliningCost(
+        call_node         = call_node,
+        function_creation = function_creation,
+        values            = values
+    )
+
+    if cost is None or cost > getFunctionCallInliningLimit(call_node):
+        return None
+
+    return convertFunctionCallToOutline(
+        provider     = call_node.getParentVariableProvider(),
+        function_ref = ExpressionFunctionRef(
+            function_body = function_creation.getFunctionRef().getFunctionBody(),
+            source_ref    = call_node.getSourceReference()
+        ),
+        values       = values
+    )
+
+
+def _getModuleFunctionCreation(variable):
+    """ The function creation assigned to a module variable, if only one. """
+
+    result = None
+
+    for trace in variable.traces:
+        if trace.isAssignTrace():
+            assign_source = trace.getAssignNode().getAssignSource()
+
+            if not assign_source.isExpressionFunctionCreation():
+                return None
+
+            if result is not None and assign_source is not result:
+                return None
+
+            result = assign_source
+
+    return result
+
+
+def makeGuardedInlinedFunctionCall(call_node, variable, call_args, call_kw):
+    """ In-lined call of a module level function, None if not worth it.
+
+        Module variables can be changed from anywhere at run time, therefore
+        the in-lined code is only used if the variable still holds the
+        function object, otherwise the value is called normally.
+    """
+
+    function_creation = _getModuleFunctionCreation(variable)
+
+    # Lambdas can share a code object with others on the same line.
+    if function_creation is None or \
+       function_creation.getCodeObject() is None or \
+       function_creation.getFunctionRef().getFunctionBody().getFunctionName() == "<lambda>":
+        return None
+
+    values = getInlinedCallArgumentValues(
+        function_creation = function_creation,
+        call_args         = call_args,
+        call_kw           = call_kw
+    )
+
+    if values is None:
+        return None
+
+    cost = getFunctionCallInliningCost(
+        call_node         = call_node,
+        function_creation = function_creation,
+        values            = values
+    )
+
+    if cost is None or cost > getFunctionCallInliningLimit(call_node):
+        return None
+
+    return convertFunctionCallToOutline(
+        provider        = call_node.getParentVariableProvider(),
+        function_ref    = ExpressionFunctionRef(
+            function_body = function_creation.getFunctionRef().getFunctionBody(),
+            source_ref    = call_node.getSourceReference()
+        ),
+        values          = values,
+        called_variable = variable,
+        code_object     = function_creation.getCodeObject()
+    )
+
+
+def _setFrameVariables(body, frame_variables):
+    """ Make the frames of an in-lined body use the given variables.
+
+        Only the outermost frames are those of the in-lined body, others
+        are from outlines in it, that have their own variables.
+    """
+
+    nodes = [body]
+
+    while nodes:
+        node = nodes.pop()
+
+        if node.isStatementsFrame():
+            node.setFrameVariables(frame_variables)
+        else:
+            nodes.extend(node.getVisitableNodes())
+
+
+def _makeReleaseStatements(variables, source_ref):
+    return tuple(
+        StatementReleaseVariable(
+            variable   = variable,
+            source_ref = source_ref
+        )
+        for variable in
+        variables
+    )
+
+
+def _makeArgumentAssignments(variables, values, released, source_ref):
+    """ Assign the argument values to the parameter variables.
+
+        Should a value other than the first raise, the values assigned
+        before, and the "released" variables, are released. The in-lined
+        body only releases them, once it is running.
+    """
+
+    statements = [
+        StatementAssignmentVariable(
+            variable   = variable,
+            source     = value,
+            source_ref = source_ref,
+        )
+        for variable, value in
+        zip(variables, values)
+    ]
+
+    if not any(
+            value.mayRaiseException(BaseException)
+            for value in
+            values[1:]
+        ):
+        return statements
+
+    return [
+        StatementTry(
+            tried            = makeStatementsSequence(
+                statements = statements,
+                allow_none = False,
+                source_ref = source_ref
+            ),
+            except_handler   = makeStatementsSequence(
+                statements = (
+                    _makeReleaseStatements(
+                        variables  = tuple(released) + tuple(variables),
+                        source_ref = source_ref
+                    ),
+                    makeReraiseExceptionStatement(
+                        source_ref = source_ref
+                    )
+                ),
+                allow_none = False,
+                source_ref = source_ref
+            ),
+            break_handler    = None,
+            continue_handler = None,
+            return_handler   = None,
+            source_ref       = source_ref
+        )
+    ]
+
+
+def convertFunctionCallToOutline(provider, function_ref, values,
+                                 called_variable = None, code_object = None):
+    """ Outline for a call of a function with argument values.
+
+        With a "called_variable", the variable is checked to still hold a
+        function with the "code_object", and called normally otherwise.
+    """
 
-def convertFunctionCallToOutline(provider, function_ref, values):
     # This has got to have pretty man details, pylint: disable=too-many-locals
     function_body = function_ref.getFunctionBody()
 
@@ -37,7 +555,7 @@ def convertFunctionCallToOutline(provider, function_ref, values):
     outline_body = ExpressionOutlineBody(
         provider   = provider,
         name       = "inline",
-        source_ref = function_source_ref
+        source_ref = call_source_ref
     )
 
     clone = function_body.getBody().makeClone()
@@ -45,8 +563,14 @@ def convertFunctionCallToOutline(provider, function_ref, values):
     temp_scope = outline_body.getOutlineTempScope()
 
     translation = {}
+    frame_variables = {}
 
     for variable in function_body.getLocalVariables():
+        # Closure variables are used as they are.
+        if variable.getOwner() is not function_body:
+            frame_variables[variable.getName()] = variable
+            continue
+
         # TODO: Later we should be able to do that too.
         assert variable.isSharedTechnically() is False
 
@@ -64,26 +588,128 @@ def convertFunctionCallToOutline(provider, function_ref, values):
 
         translation[variable.getName()] = new_variable
 
-    statements = []
+    frame_variables.update(translation)
+
+    for variable in function_body.getTempVariables():
+        new_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = variable.getName()
+        )
+
+        updateVariableUsage(
+            clone,
+            old_variable = variable,
+            new_variable = new_variable
+        )
 
     if function_body.isExpressionClassBody():
         argument_names = ()
     else:
         argument_names = function_body.getParameters().getParameterNames()
 
+        # The frame shows the values of the variables as locals.
+        _setFrameVariables(clone, frame_variables)
+
     assert len(argument_names) == len(values), (argument_names, values)
 
-    for argument_name, value in zip(argument_names, values):
-        statements.append(
+    argument_variables = [
+        translation[argument_name]
+        for argument_name in
+        argument_names
+    ]
+
+    if called_variable is None:
+        statements = (
+            _makeArgumentAssignments(
+                variables  = argument_variables,
+                values     = values,
+                released   = (),
+                source_ref = call_source_ref
+            ),
+            clone
+        )
+    else:
+        # Own temp scope, the function may have a variable of that name.
+        called_temp = outline_body.allocateTempVariable(
+            temp_scope = outline_body.allocateTempScope("call"),
+            name       = "called"
+        )
+
+        # The called value is looked up first, to raise as the call would.
+        statements = (
             StatementAssignmentVariable(
-                variable   = translation[argument_name],
-                source     = value,
-                source_ref = call_source_ref,
+                variable   = called_temp,
+                source     = ExpressionVariableRef(
+                    variable   = called_variable,
+                    source_ref = call_source_ref
+                ),
+                source_ref = call_source_ref
+            ),
+            _makeArgumentAssignments(
+                variables  = argument_variables,
+                values     = values,
+                released   = (called_temp,),
+                source_ref = call_source_ref
+            ),
+            StatementConditional(
+                condition  = ExpressionFunctionCodeCheck(
+                    value       = ExpressionTempVariableRef(
+                        variable   = called_temp,
+                        source_ref = call_source_ref
+                    ),
+                    code_object = code_object,
+                    source_ref  = call_source_ref
+                ),
+                yes_branch = makeStatementsSequence(
+                    statements = (
+                        _makeReleaseStatements(
+                            variables  = (called_temp,),
+                            source_ref = call_source_ref
+                        ),
+                        clone
+                    ),
+                    allow_none = False,
+                    source_ref = function_source_ref
+                ),
+                no_branch  = makeStatementsSequenceFromStatement(
+                    statement = makeTryFinallyStatement(
+                        provider   = outline_body,
+                        tried      = StatementReturn(
+                            expression = makeExpressionCall(
+                                called     = ExpressionTempVariableRef(
+                                    variable   = called_temp,
+                                    source_ref = call_source_ref
+                                ),
+                                args       = makeSequenceCreationOrConstant(
+                                    sequence_kind = "tuple",
+                                    elements      = [
+                                        ExpressionTempVariableRef(
+                                            variable   = argument_variable,
+                                            source_ref = call_source_ref
+                                        )
+                                        for argument_variable in
+                                        argument_variables
+                                    ],
+                                    source_ref    = call_source_ref
+                                ),
+                                kw         = None,
+                                source_ref = call_source_ref
+                            ),
+                            source_ref = call_source_ref
+                        ),
+                        final      = _makeReleaseStatements(
+                            variables  = [called_temp] + argument_variables,
+                            source_ref = call_source_ref
+                        ),
+                        source_ref = call_source_ref
+                    )
+                ),
+                source_ref = call_source_ref
             )
         )
 
     body = makeStatementsSequence(
-        statements = (statements, clone),
+        statements = statements,
         allow_none = False,
         source_ref = function_source_ref
     )
@@ -0,0 +1,641 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Fusion of generator expressions into the built-ins consuming them.
+
+Generator expressions, that are directly given to e.g. "sum", "any", or
+"list", are replaced with an outline, that loops like the generator expression
+does, but instead of yielding a value, it does what the consuming built-in
+would do with it. That avoids creating the generator object, and resuming it
+for every value.
+
+The frame of the generator expression is kept, so tracebacks of exceptions
+from the generator expression are unchanged. Exceptions from the consuming
+operation are raised again outside of that frame, with its traceback entry
+removed, as they would be from the built-in. Just like for the generator, a
+"StopIteration" from the generator expression ends the iteration.
+"""
+
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable
+)
+from nuitka.nodes.AttributeNodes import ExpressionAttributeLookup
+from nuitka.nodes.BuiltinRefNodes import ExpressionBuiltinExceptionRef
+from nuitka.nodes.ComparisonNodes import ExpressionComparisonExceptionMatch
+from nuitka.nodes.ConditionalNodes import StatementConditional
+from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ContainerOperationNodes import (
+    StatementListOperationAppend,
+    StatementSetOperationAdd
+)
+from nuitka.nodes.ExceptionNodes import (
+    ExpressionCaughtExceptionTracebackRef,
+    ExpressionCaughtExceptionTypeRef,
+    ExpressionCaughtExceptionValueRef,
+    StatementRaiseException
+)
+from nuitka.nodes.FrameNodes import StatementsFrameFunction
+from nuitka.nodes.OperatorNodes import makeBinaryOperationNode
+from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
+from nuitka.nodes.ReturnNodes import StatementReturn
+from nuitka.nodes.TryNodes import StatementTry
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.tree.Extractions import updateVariableUsage
+from nuitka.tree.ReformulationTryFinallyStatements import (
+    makeTryFinallyStatement
+)
+from nuitka.tree.TreeHelpers import (
+    makeConditionalStatement,
+    makeReraiseExceptionStatement,
+    makeStatementsSequence,
+    makeStatementsSequenceFromStatement
+)
+
+from .FunctionInlining import getInlinedBodySize
+
+# Nodes in the outline of a generator expression, besides the creation of
+# the iterator.
+_generator_outline_kinds = frozenset(
+    (
+        "STATEMENTS_SEQUENCE",
+        "STATEMENT_TRY",
+        "STATEMENT_RETURN",
+        "STATEMENT_RELEASE_VARIABLE",
+        "EXPRESSION_RETURNED_VALUE_REF",
+        "EXPRESSION_MAKE_GENERATOR_OBJECT",
+        "EXPRESSION_FUNCTION_REF",
+    )
+)
+
+# Nodes in the generator expression body, that do not work in an outline.
+_not_fusable_kinds = frozenset(
+    (
+        "EXPRESSION_YIELD_FROM",
+        "EXPRESSION_ASYNC_WAIT",
+        # These refer to the generator body as their provider.
+        "EXPRESSION_OUTLINE_BODY",
+    )
+)
+
+# Start values of the accumulating variable of the consumers.
+_consumer_start_values = {
+    "list" : [],
+    "set"  : set(),
+    "sum"  : 0,
+}
+
+# Consumers, that do not call anything for a value.
+_consumers_not_raising = ("list",)
+
+
+def _getGeneratorObjectCreation(generator):
+    """ The generator object creation of a generator expression outline.
+
+        Returns None, if the outline does anything else than creating the
+        iterator, and then returning the generator object.
+    """
+
+    result = None
+
+    for statement in generator.getBody().getStatements()[1:]:
+        nodes = [statement]
+
+        while nodes:
+            node = nodes.pop()
+
+            if node.kind not in _generator_outline_kinds:
+                return None
+
+            if node.isExpressionMakeGeneratorObject():
+                if result is not None:
+                    return None
+
+                result = node
+
+            nodes.extend(node.getVisitableNodes())
+
+    return result
+
+
+def _getYieldStatements(node):
+    """ Statements doing the "yield" in a generator expression body.
+
+        Returns None, if there are nodes, that cannot be in an outline, or
+        yields that are not statements of their own.
+    """
+
+    result = []
+
+    nodes = [node]
+
+    while nodes:
+        node = nodes.pop()
+
+        if node.kind in _not_fusable_kinds:
+            return None
+
+        if node.isExpressionYield():
+            statement = node.getParent()
+
+            if not statement.isStatementExpressionOnly() or \
+               not statement.getParent().isStatementsSequence():
+                return None
+
+            result.append(statement)
+
+        nodes.extend(node.getVisitableNodes())
+
+    return result
+
+
+def _getGeneratorExpressionBody(generator):
+    """ The generator body of a generator expression to fuse, or None. """
+
+    if not generator.isExpressionOutlineBody():
+        return None
+
+    statements = generator.getBody().getStatements()
+
+    iter_assignment = statements[0]
+
+    if not iter_assignment.isStatementAssignmentVariable() or \
+       not iter_assignment.getVariable().isTempVariable():
+        return None
+
+    generator_creation = _getGeneratorObjectCreation(generator)
+
+    if generator_creation is None:
+        return None
+
+    # With the "generator_stop" future, a "StopIteration" becomes an error.
+    if generator_creation.getCodeObject().getFutureSpec().isGeneratorStop():
+        return None
+
+    generator_body = generator_creation.getGeneratorRef().getFunctionBody()
+
+    if generator_body.getBody() is None:
+        return None
+
+    provider = generator.getParentVariableProvider()
+
+    for variable in generator_body.getLocalVariables():
+        if variable.getOwner() is not generator_body:
+            # Closure variables can only be used where they are local.
+            if variable.getOwner() is not provider.getEntryPoint():
+                return None
+        elif variable.isSharedTechnically() is not False:
+            return None
+
+    for variable in generator_body.getTempVariables():
+        if variable.isSharedTechnically() is not False:
+            return None
+
+    if getInlinedBodySize(
+            body     = generator_body.getBody(),
+            provider = provider
+        ) is None:
+        return None
+
+    return generator_body
+
+
+def _makeConsumerStatement(consumer, value, accumulator, source_ref):
+    if consumer == "list":
+        return StatementListOperationAppend(
+            list_arg   = ExpressionTempVariableRef(
+                variable   = accumulator,
+                source_ref = source_ref
+            ),
+            value      = value,
+            source_ref = source_ref
+        )
+    elif consumer == "set":
+        return StatementSetOperationAdd(
+            set_arg    = ExpressionTempVariableRef(
+                variable   = accumulator,
+                source_ref = source_ref
+            ),
+            value      = value,
+            source_ref = source_ref
+        )
+    elif consumer == "sum":
+        return StatementAssignmentVariable(
+            variable   = accumulator,
+            source     = makeBinaryOperationNode(
+                operator   = "Add",
+                left       = ExpressionTempVariableRef(
+                    variable   = accumulator,
+                    source_ref = source_ref
+                ),
+                right      = value,
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+    elif consumer == "any":
+        return makeConditionalStatement(
+            condition  = value,
+            yes_branch = StatementReturn(
+                expression = makeConstantRefNode(
+                    constant   = True,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+            no_branch  = None,
+            source_ref = source_ref
+        )
+    elif consumer == "all":
+        return makeConditionalStatement(
+            condition  = value,
+            yes_branch = None,
+            no_branch  = StatementReturn(
+                expression = makeConstantRefNode(
+                    constant   = False,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+            source_ref = source_ref
+        )
+    else:
+        assert False, consumer
+
+
+def _makeConsumerResult(consumer, accumulator, source_ref):
+    if consumer in _consumer_start_values:
+        return ExpressionTempVariableRef(
+            variable   = accumulator,
+            source_ref = source_ref
+        )
+    else:
+        return makeConstantRefNode(
+            constant   = consumer == "all",
+            source_ref = source_ref
+        )
+
+
+def _makeReleaseStatements(variables, source_ref):
+    return tuple(
+        StatementReleaseVariable(
+            variable   = variable,
+            source_ref = source_ref
+        )
+        for variable in
+        variables
+    )
+
+
+def makeFusedGeneratorExpression(generator, consumer, source_ref,
+                                 trace_collection):
+    """ Outline doing what "consumer" does with a generator expression.
+
+        The "consumer" is one of "list", "set", "sum", "any", or "all", and
+        "source_ref" is where it is called. Returns None, if "generator" is
+        not a generator expression that can be fused.
+    """
+
+    # Many details to consider, pylint: disable=too-many-locals
+    generator_body = _getGeneratorExpressionBody(generator)
+
+    if generator_body is None:
+        return None
+
+    clone = generator_body.getBody().makeClone()
+
+    yield_statements = _getYieldStatements(clone)
+
+    if not yield_statements:
+        return None
+
+    generator_source_ref = generator.getSourceReference()
+
+    outline_body = ExpressionOutlineBody(
+        provider   = generator.getParentVariableProvider(),
+        name       = "genexpr_fusion",
+        source_ref = generator_source_ref
+    )
+
+    temp_scope = outline_body.getOutlineTempScope()
+
+    iter_assignment = generator.getBody().getStatements()[0]
+
+    iter_variable = outline_body.allocateTempVariable(
+        temp_scope = temp_scope,
+        name       = "iter"
+    )
+
+    updateVariableUsage(
+        clone,
+        old_variable = iter_assignment.getVariable(),
+        new_variable = iter_variable
+    )
+
+    fused_variables = [iter_variable]
+    frame_variables = {}
+
+    for variable in generator_body.getLocalVariables():
+        # Closure variables are used as they are.
+        if variable.getOwner() is not generator_body:
+            frame_variables[variable.getName()] = variable
+            continue
+
+        new_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = variable.getName()
+        )
+
+        updateVariableUsage(
+            clone,
+            old_variable = variable,
+            new_variable = new_variable
+        )
+
+        fused_variables.append(new_variable)
+        frame_variables[variable.getName()] = new_variable
+
+    for variable in generator_body.getTempVariables():
+        new_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = variable.getName()
+        )
+
+        updateVariableUsage(
+            clone,
+            old_variable = variable,
+            new_variable = new_variable
+        )
+
+        fused_variables.append(new_variable)
+
+    statements = [
+        StatementAssignmentVariable(
+            variable   = iter_variable,
+            source     = iter_assignment.getAssignSource().makeClone(),
+            source_ref = generator_source_ref
+        )
+    ]
+
+    if consumer in _consumer_start_values:
+        accumulator = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "accumulator"
+        )
+
+        fused_variables.append(accumulator)
+
+        statements.append(
+            StatementAssignmentVariable(
+                variable   = accumulator,
+                source     = makeConstantRefNode(
+                    constant   = _consumer_start_values[consumer],
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+    else:
+        accumulator = None
+
+    # Exceptions of the consumer are raised outside of the frame of the
+    # generator expression, and are not a "StopIteration" of it.
+    if consumer in _consumers_not_raising:
+        consumer_raised = None
+    else:
+        consumer_raised = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "consumer_raised"
+        )
+
+        value_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "value"
+        )
+
+        fused_variables += [consumer_raised, value_variable]
+
+        statements.append(
+            StatementAssignmentVariable(
+                variable   = consumer_raised,
+                source     = makeConstantRefNode(
+                    constant   = False,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+
+    for yield_statement in yield_statements:
+        value = yield_statement.getExpression().getExpression()
+
+        if consumer_raised is None:
+            new_statements = (
+                _makeConsumerStatement(
+                    consumer    = consumer,
+                    value       = value,
+                    accumulator = accumulator,
+                    source_ref  = source_ref
+                ),
+            )
+        else:
+            new_statements = (
+                StatementAssignmentVariable(
+                    variable   = value_variable,
+                    source     = value,
+                    source_ref = value.getSourceReference()
+                ),
+                StatementTry(
+                    tried            = makeStatementsSequenceFromStatement(
+                        statement = _makeConsumerStatement(
+                            consumer    = consumer,
+                            value       = ExpressionTempVariableRef(
+                                variable   = value_variable,
+                                source_ref = source_ref
+                            ),
+                            accumulator = accumulator,
+                            source_ref  = source_ref
+                        )
+                    ),
+                    except_handler   = makeStatementsSequence(
+                        statements = (
+                            StatementAssignmentVariable(
+                                variable   = consumer_raised,
+                                source     = makeConstantRefNode(
+                                    constant   = True,
+                                    source_ref = source_ref
+                                ),
+                                source_ref = source_ref
+                            ),
+                            makeReraiseExceptionStatement(
+                                source_ref = source_ref
+                            )
+                        ),
+                        allow_none = False,
+                        source_ref = source_ref
+                    ),
+                    break_handler    = None,
+                    continue_handler = None,
+                    return_handler   = None,
+                    source_ref       = source_ref
+                ),
+                StatementReleaseVariable(
+                    variable   = value_variable,
+                    source_ref = source_ref
+                )
+            )
+
+        parent = yield_statement.getParent()
+
+        parent_statements = list(parent.getStatements())
+        index = parent_statements.index(yield_statement)
+        parent_statements[index:index+1] = new_statements
+
+        parent.setStatements(parent_statements)
+
+    # The generator frame becomes a frame of the outline.
+    nodes = [clone]
+
+    while nodes:
+        node = nodes.pop()
+
+        if node.kind == "STATEMENTS_FRAME_GENERATOR":
+            frame = StatementsFrameFunction(
+                statements  = node.getStatements(),
+                code_object = node.getCodeObject(),
+                source_ref  = node.getSourceReference()
+            )
+
+            if node.needsFrameExceptionPreserving():
+                frame.markAsFrameExceptionPreserving()
+
+            frame.setFrameVariables(frame_variables)
+
+            node.replaceWith(frame)
+        else:
+            nodes.extend(node.getVisitableNodes())
+
+    handler_statements = []
+
+    if consumer_raised is not None:
+        handler_statements.append(
+            makeConditionalStatement(
+                condition  = ExpressionTempVariableRef(
+                    variable   = consumer_raised,
+                    source_ref = source_ref
+                ),
+                yes_branch = StatementRaiseException(
+                    exception_type  = ExpressionCaughtExceptionTypeRef(
+                        source_ref = source_ref
+                    ),
+                    exception_value = ExpressionCaughtExceptionValueRef(
+                        source_ref = source_ref
+                    ),
+                    # The traceback without the entry of the generator
+                    # expression frame, which was added leaving it.
+                    exception_trace = ExpressionAttributeLookup(
+                        source         = ExpressionCaughtExceptionTracebackRef(
+                            source_ref = source_ref
+                        ),
+                        attribute_name = "tb_next",
+                        source_ref     = source_ref
+                    ),
+                    exception_cause = None,
+                    source_ref      = source_ref
+                ),
+                no_branch  = None,
+                source_ref = source_ref
+            )
+        )
+
+    handler_statements.append(
+        StatementConditional(
+            condition  = ExpressionComparisonExceptionMatch(
+                left       = ExpressionCaughtExceptionTypeRef(
+                    source_ref = generator_source_ref
+                ),
+                right      = ExpressionBuiltinExceptionRef(
+                    exception_name = "StopIteration",
+                    source_ref     = generator_source_ref
+                ),
+                source_ref = generator_source_ref
+            ),
+            yes_branch = makeStatementsSequenceFromStatement(
+                statement = StatementReturn(
+                    expression = _makeConsumerResult(
+                        consumer    = consumer,
+                        accumulator = accumulator,
+                        source_ref  = source_ref
+                    ),
+                    source_ref = source_ref
+                )
+            ),
+            no_branch  = makeStatementsSequenceFromStatement(
+                statement = makeReraiseExceptionStatement(
+                    source_ref = generator_source_ref
+                )
+            ),
+            source_ref = generator_source_ref
+        )
+    )
+
+    statements.append(
+        makeTryFinallyStatement(
+            provider   = outline_body,
+            tried      = (
+                StatementTry(
+                    tried            = clone,
+                    except_handler   = makeStatementsSequence(
+                        statements = handler_statements,
+                        allow_none = False,
+                        source_ref = generator_source_ref
+                    ),
+                    break_handler    = None,
+                    continue_handler = None,
+                    return_handler   = None,
+                    source_ref       = generator_source_ref
+                ),
+                StatementReturn(
+                    expression = _makeConsumerResult(
+                        consumer    = consumer,
+                        accumulator = accumulator,
+                        source_ref  = source_ref
+                    ),
+                    source_ref = source_ref
+                )
+            ),
+            final      = _makeReleaseStatements(
+                variables  = fused_variables,
+                source_ref = generator_source_ref
+            ),
+            source_ref = generator_source_ref.atInternal()
+        )
+    )
+
+    outline_body.setBody(
+        makeStatementsSequence(
+            statements = statements,
+            allow_none = False,
+            source_ref = generator_source_ref
+        )
+    )
+
+    # The loop runs arbitrary code.
+    trace_collection.onControlFlowEscape(generator)
+    trace_collection.onExceptionRaiseExit(BaseException)
+
+    return outline_body
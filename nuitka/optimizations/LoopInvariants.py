@@ -0,0 +1,260 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loop invariant code motion.
+
+Expressions in a loop body, that give the same value in every iteration, are
+computed once before the loop, and the loop uses a temporary variable holding
+the value instead.
+
+Only expressions that can neither raise nor have side effects are candidates,
+so computing them earlier, and even if the loop body would not reach them,
+cannot be observed. The variables they use must not be written in the loop,
+nor be shared with other functions, that could write them. Except for identity
+checks, their values must be immutable, so the loop cannot change what they
+compute.
+
+Attribute lookups on objects of unknown type and reads of module variables
+are not candidates. These can run code, and any code run by the loop can
+change their result.
+"""
+
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable
+)
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeBytes,
+    ShapeTypeEllipsisType,
+    ShapeTypeFloat,
+    ShapeTypeFrozenset,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeNoneType,
+    ShapeTypeSlice,
+    ShapeTypeStr,
+    ShapeTypeStrOrUnicode,
+    ShapeTypeTuple,
+    ShapeTypeUnicode
+)
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.tree.Extractions import getVariablesWritten
+from nuitka.tree.ReformulationTryFinallyStatements import (
+    makeTryFinallyStatement
+)
+
+# Expressions, that can be moved out of loops, if their operands allow it.
+_invariant_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_REF",
+        "EXPRESSION_ATTRIBUTE_LOOKUP",
+        "EXPRESSION_SUBSCRIPT_LOOKUP",
+        "EXPRESSION_SLICE_LOOKUP",
+        "EXPRESSION_BUILTIN_LEN",
+        "EXPRESSION_OPERATION_BINARY",
+        "EXPRESSION_OPERATION_BINARY_ADD",
+        "EXPRESSION_OPERATION_BINARY_MULT",
+        "EXPRESSION_OPERATION_UNARY",
+        "EXPRESSION_OPERATION_NOT",
+        "EXPRESSION_OPERATION_ABS",
+        "EXPRESSION_COMPARISON",
+        "EXPRESSION_COMPARISON_IS",
+        "EXPRESSION_COMPARISON_IS_NOT",
+    )
+)
+
+# These only look at the identity of their operands, not at their contents.
+_identity_kinds = frozenset(
+    (
+        "EXPRESSION_COMPARISON_IS",
+        "EXPRESSION_COMPARISON_IS_NOT",
+    )
+)
+
+_immutable_shapes = frozenset(
+    (
+        ShapeTypeNoneType,
+        ShapeTypeBool,
+        ShapeTypeInt,
+        ShapeTypeLong,
+        ShapeTypeIntOrLong,
+        ShapeTypeFloat,
+        ShapeTypeTuple,
+        ShapeTypeFrozenset,
+        ShapeTypeStr,
+        ShapeTypeUnicode,
+        ShapeTypeStrOrUnicode,
+        ShapeTypeBytes,
+        ShapeTypeEllipsisType,
+        ShapeTypeSlice,
+    )
+)
+
+
+def _hasImmutableValue(node):
+    if node.isExpressionConstantRef():
+        return not node.isMutable()
+    elif node.isExpressionBuiltinRef():
+        return True
+    else:
+        return node.getTypeShape() in _immutable_shapes
+
+
+def _isInvariantVariableRef(node, variables_written):
+    variable = node.getVariable()
+
+    if node.getVariableTrace() is None:
+        return False
+
+    if not variable.isLocalVariable() and not variable.isTempVariable():
+        return False
+
+    if variable in variables_written:
+        return False
+
+    # Other functions may write shared variables at any time.
+    if variable.isSharedTechnically() is not False:
+        return False
+
+    return not node.mayRaiseException(BaseException)
+
+
+def _isInvariantExpression(node, variables_written):
+    if node.isExpressionVariableRef() or node.isExpressionTempVariableRef():
+        return _isInvariantVariableRef(node, variables_written)
+
+    if node.isExpressionConstantRef():
+        return not node.isMutable()
+
+    if node.kind not in _invariant_kinds:
+        return False
+
+    for child in node.getVisitableNodes():
+        if not _isInvariantExpression(child, variables_written):
+            return False
+
+        if node.kind not in _identity_kinds and \
+           not _hasImmutableValue(child):
+            return False
+
+    return not node.mayHaveSideEffects() and \
+           not node.mayRaiseException(BaseException)
+
+
+def _isHoistable(node, variables_written):
+    # Nothing to gain for these, they are as cheap as a temporary variable.
+    # Compile time constants, e.g. built-in references, would also be
+    # propagated into the loop again.
+    if node.isExpressionVariableRef() or \
+       node.isExpressionTempVariableRef() or \
+       node.isCompileTimeConstant():
+        return False
+
+    return _isInvariantExpression(node, variables_written)
+
+
+def _isCalledOfCall(node):
+    # The called expression is kept, calls of e.g. built-ins or methods are
+    # specialized by looking at it.
+    parent = node.parent
+
+    return parent.kind.startswith("EXPRESSION_CALL") and \
+           parent.getCalled() is node
+
+
+def _getLoopInvariantExpressions(node, variables_written, result):
+    for child in node.getVisitableNodes():
+        if child.isExpression() and \
+           not _isCalledOfCall(child) and \
+           _isHoistable(child, variables_written):
+            result.append(child)
+
+        # The fallback of a locals dictionary lookup must remain visible.
+        elif not child.kind.startswith("EXPRESSION_LOCALS_"):
+            _getLoopInvariantExpressions(child, variables_written, result)
+
+
+def getLoopInvariantExpressions(loop_body):
+    """ Expressions in a loop body, that can be computed before the loop. """
+
+    result = []
+
+    _getLoopInvariantExpressions(
+        node              = loop_body,
+        variables_written = getVariablesWritten(loop_body),
+        result            = result
+    )
+
+    return result
+
+
+def makeLoopInvariantsHoisted(loop_node, expressions):
+    """ Move loop invariant expressions out of the loop.
+
+    The expressions are assigned to temporary variables before the loop,
+    which are released after it, and the loop body refers to these.
+    """
+
+    provider = loop_node.getParentVariableProvider()
+    source_ref = loop_node.getSourceReference()
+
+    temp_scope = provider.allocateTempScope("loop_invariant")
+
+    statements = []
+    variables = []
+
+    for count, expression in enumerate(expressions):
+        variable = provider.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "value_%d" % (count + 1)
+        )
+        variables.append(variable)
+
+        expression.replaceWith(
+            ExpressionTempVariableRef(
+                variable   = variable,
+                source_ref = expression.getSourceReference()
+            )
+        )
+
+        statements.append(
+            StatementAssignmentVariable(
+                variable   = variable,
+                source     = expression,
+                source_ref = expression.getSourceReference()
+            )
+        )
+
+    statements.append(
+        makeTryFinallyStatement(
+            provider   = provider,
+            tried      = (loop_node,),
+            final      = tuple(
+                StatementReleaseVariable(
+                    variable   = variable,
+                    source_ref = source_ref
+                )
+                for variable in
+                variables
+            ),
+            source_ref = source_ref
+        )
+    )
+
+    return statements
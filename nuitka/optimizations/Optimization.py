@@ -32,7 +32,7 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
 from nuitka.utils import MemoryUsage
 
-from . import Graphs, TraceCollections
+from . import Graphs, TraceCollections, WholeProgram
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
 
@@ -355,7 +355,7 @@ def makeOptimizationPass(initial_pass):
     """
     # Controls complex optimization, pylint: disable=too-many-branches
 
-    finished = True
+    finished = not WholeProgram.onOptimizationPassStart()
 
     ModuleRegistry.startTraversal()
 
@@ -56,9 +56,21 @@ from nuitka.nodes.BuiltinIntegerNodes import (
     ExpressionBuiltinInt1,
     ExpressionBuiltinInt2
 )
+from nuitka.nodes.BuiltinIteratingNodes import (
+    ExpressionBuiltinAll,
+    ExpressionBuiltinAny,
+    ExpressionBuiltinMax1,
+    ExpressionBuiltinMax2,
+    ExpressionBuiltinMin1,
+    ExpressionBuiltinMin2,
+    ExpressionBuiltinSorted
+)
 from nuitka.nodes.BuiltinIteratorNodes import (
+    ExpressionBuiltinEnumerate,
     ExpressionBuiltinIter1,
-    ExpressionBuiltinIter2
+    ExpressionBuiltinIter2,
+    ExpressionBuiltinReversed,
+    ExpressionBuiltinZip
 )
 from nuitka.nodes.BuiltinLenNodes import ExpressionBuiltinLen
 from nuitka.nodes.BuiltinNextNodes import (
@@ -120,6 +132,7 @@ from nuitka.nodes.NodeMakingHelpers import (
     wrapExpressionWithSideEffects
 )
 from nuitka.nodes.OperatorNodes import (
+    ExpressionOperationAbs,
     ExpressionOperationBinaryDivmod,
     ExpressionOperationNOT,
     ExpressionOperationUnary
@@ -313,6 +326,171 @@ def sum_extractor(node):
     )
 
 
+def _getPositionalCallArgs(node):
+    """ Positional argument values of a call, None if there is more to it.
+
+        Used for built-ins, of which only some forms are optimized, the
+        others remain calls.
+    """
+
+    kw = node.getCallKw()
+
+    if kw is not None and \
+       (not kw.isExpressionConstantRef() or kw.getConstant() != {}):
+        return None
+
+    args = node.getCallArgs()
+
+    if args is None:
+        return ()
+    elif args.canPredictIterationValues():
+        return args.getIterationValues()
+    else:
+        return None
+
+
+def any_extractor(node):
+    return BuiltinOptimization.extractBuiltinArgs(
+        node          = node,
+        builtin_class = ExpressionBuiltinAny,
+        builtin_spec  = BuiltinOptimization.builtin_any_spec
+    )
+
+
+def all_extractor(node):
+    return BuiltinOptimization.extractBuiltinArgs(
+        node          = node,
+        builtin_class = ExpressionBuiltinAll,
+        builtin_spec  = BuiltinOptimization.builtin_all_spec
+    )
+
+
+def _extractMinMaxArgs(node, builtin_class1, builtin_class2):
+    values = _getPositionalCallArgs(node)
+
+    # The "key" argument is not handled, and neither is the error for no
+    # arguments at all.
+    if not values:
+        return None
+
+    source_ref = node.getSourceReference()
+
+    if len(values) == 1:
+        result = builtin_class1(
+            value      = values[0],
+            source_ref = source_ref
+        )
+    elif len(values) == 2:
+        result = builtin_class2(
+            value1     = values[0],
+            value2     = values[1],
+            source_ref = source_ref
+        )
+    else:
+        result = builtin_class1(
+            value      = makeSequenceCreationOrConstant(
+                sequence_kind = "tuple",
+                elements      = values,
+                source_ref    = source_ref
+            ),
+            source_ref = source_ref
+        )
+
+    result.setCompatibleSourceReference(node.getCompatibleSourceReference())
+
+    return result
+
+
+def min_extractor(node):
+    return _extractMinMaxArgs(
+        node           = node,
+        builtin_class1 = ExpressionBuiltinMin1,
+        builtin_class2 = ExpressionBuiltinMin2
+    )
+
+
+def max_extractor(node):
+    return _extractMinMaxArgs(
+        node           = node,
+        builtin_class1 = ExpressionBuiltinMax1,
+        builtin_class2 = ExpressionBuiltinMax2
+    )
+
+
+def abs_extractor(node):
+    return BuiltinOptimization.extractBuiltinArgs(
+        node          = node,
+        builtin_class = ExpressionOperationAbs,
+        builtin_spec  = BuiltinOptimization.builtin_abs_spec
+    )
+
+
+def sorted_extractor(node):
+    values = _getPositionalCallArgs(node)
+
+    # Only sorting without "cmp", "key" and "reverse" is handled.
+    if values is None or len(values) != 1:
+        return None
+
+    result = ExpressionBuiltinSorted(
+        value      = values[0],
+        source_ref = node.getSourceReference()
+    )
+
+    result.setCompatibleSourceReference(node.getCompatibleSourceReference())
+
+    return result
+
+
+def reversed_extractor(node):
+    values = _getPositionalCallArgs(node)
+
+    if values is None or len(values) != 1:
+        return None
+
+    result = ExpressionBuiltinReversed(
+        value      = values[0],
+        source_ref = node.getSourceReference()
+    )
+
+    result.setCompatibleSourceReference(node.getCompatibleSourceReference())
+
+    return result
+
+
+def enumerate_extractor(node):
+    values = _getPositionalCallArgs(node)
+
+    if values is None or len(values) not in (1, 2):
+        return None
+
+    result = ExpressionBuiltinEnumerate(
+        value      = values[0],
+        start      = values[1] if len(values) == 2 else None,
+        source_ref = node.getSourceReference()
+    )
+
+    result.setCompatibleSourceReference(node.getCompatibleSourceReference())
+
+    return result
+
+
+def zip_extractor(node):
+    values = _getPositionalCallArgs(node)
+
+    if values is None:
+        return None
+
+    result = ExpressionBuiltinZip(
+        values     = values,
+        source_ref = node.getSourceReference()
+    )
+
+    result.setCompatibleSourceReference(node.getCompatibleSourceReference())
+
+    return result
+
+
 def dict_extractor(node):
     # The "dict" built-in is a bit strange in that it accepts a position
     # parameter, or not, but won't have a default value.
@@ -1357,7 +1535,16 @@ _dispatch_dict = {
     "open"         : open_extractor,
     "staticmethod" : staticmethod_extractor,
     "classmethod"  : classmethod_extractor,
-    "divmod"       : divmod_extractor
+    "divmod"       : divmod_extractor,
+    "any"          : any_extractor,
+    "all"          : all_extractor,
+    "min"          : min_extractor,
+    "max"          : max_extractor,
+    "abs"          : abs_extractor,
+    "sorted"       : sorted_extractor,
+    "reversed"     : reversed_extractor,
+    "enumerate"    : enumerate_extractor,
+    "zip"          : zip_extractor
 }
 
 if python_version < 300:
@@ -1390,20 +1577,6 @@ _builtin_white_list = (
     # worth the effort yet.
     "print",
 
-    # TODO: This could, and should be supported, as we could e.g. lower
-    # types easily for it.
-    "sorted",
-
-    # TODO: This would be very worthwhile, as it could easily optimize
-    # its iteration away.
-    "zip",
-
-    # TODO: This would be most precious due to the type hint it gives
-    "enumerate",
-
-    # TODO: Also worthwhile for known values.
-    "reversed",
-
     # TODO: Not sure what this really is about.
     "memoryview",
 )
@@ -1475,7 +1648,10 @@ def computeBuiltinCall(builtin_name, call_node):
         new_node = _dispatch_dict[builtin_name](call_node)
 
         assert new_node is not call_node, builtin_name
-        assert new_node is not None, builtin_name
+
+        # Some forms of calls to built-ins are not handled.
+        if new_node is None:
+            return call_node, None, None
 
         # For traces, we are going to ignore side effects, and output traces
         # only based on the basis of it.
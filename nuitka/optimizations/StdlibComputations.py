@@ -0,0 +1,515 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compile time computation of standard library values and calls.
+
+Like for built-ins, the standard library modules are assumed to not be
+changed by the program. Their values listed here never change, and their
+functions listed here have no side effects and give the same result for the
+same constant arguments. The compiling Python is the one the result runs
+with, so the values are computed with it.
+
+Modules are recognized from imports that found them as built-in modules or
+in the standard library path, and through the variables these are assigned
+to. Only results that can be constants are used.
+
+Calls of "operator" module functions with values that are not constant,
+become the operations they do, and some "math" module functions become
+direct calls of the C library function.
+"""
+
+from nuitka.Builtins import builtin_exception_values
+from nuitka.nodes.BuiltinTypeNodes import ExpressionBuiltinBool
+from nuitka.nodes.MathNodes import (
+    ExpressionMathFunctionCall,
+    math_float_only_functions,
+    math_functions
+)
+from nuitka.nodes.NodeMakingHelpers import (
+    getComputationResult,
+    makeComparisonNode,
+    makeConstantReplacementNode,
+    wrapExpressionWithNodeSideEffects
+)
+from nuitka.nodes.OperatorNodes import (
+    ExpressionOperationAbs,
+    ExpressionOperationNOT,
+    ExpressionOperationUnary,
+    makeBinaryOperationNode
+)
+from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeFloat
+from nuitka.nodes.SubscriptNodes import ExpressionSubscriptLookup
+from nuitka.PythonVersions import python_version
+from nuitka.tree.TreeHelpers import getSequenceCreationElements
+
+from .WholeProgram import getWholeProgramVariableSource
+
+# Standard library modules, and the modules found as their attributes.
+_stdlib_modules = set(
+    (
+        "math",
+        "operator",
+        "os",
+        "os.path",
+        "string",
+        "struct",
+        "sys",
+    )
+)
+
+# Values that never change.
+_stdlib_values = set(
+    (
+        "math.pi",
+        "math.e",
+        "os.sep",
+        "os.altsep",
+        "os.curdir",
+        "os.pardir",
+        "os.extsep",
+        "os.pathsep",
+        "os.linesep",
+        "os.devnull",
+        "os.name",
+        "os.path.sep",
+        "os.path.altsep",
+        "os.path.curdir",
+        "os.path.pardir",
+        "os.path.extsep",
+        "os.path.pathsep",
+        "os.path.devnull",
+        "string.ascii_letters",
+        "string.ascii_lowercase",
+        "string.ascii_uppercase",
+        "string.digits",
+        "string.hexdigits",
+        "string.octdigits",
+        "string.punctuation",
+        "string.whitespace",
+        "sys.byteorder",
+        "sys.maxsize",
+        "sys.maxunicode",
+        "sys.platform",
+    )
+)
+
+# Functions without side effects, that give the same result for the same
+# constant arguments.
+_stdlib_pure_functions = set(
+    (
+        "math.acos",
+        "math.asin",
+        "math.atan",
+        "math.atan2",
+        "math.ceil",
+        "math.copysign",
+        "math.cos",
+        "math.cosh",
+        "math.degrees",
+        "math.exp",
+        "math.fabs",
+        "math.floor",
+        "math.fmod",
+        "math.frexp",
+        "math.hypot",
+        "math.isinf",
+        "math.isnan",
+        "math.ldexp",
+        "math.log",
+        "math.log10",
+        "math.modf",
+        "math.pow",
+        "math.radians",
+        "math.sin",
+        "math.sinh",
+        "math.sqrt",
+        "math.tan",
+        "math.tanh",
+        "math.trunc",
+        "os.path.basename",
+        "os.path.dirname",
+        "os.path.isabs",
+        "os.path.join",
+        "os.path.normcase",
+        "os.path.normpath",
+        "os.path.split",
+        "os.path.splitext",
+        "struct.calcsize",
+    )
+)
+
+# Functions of the "operator" module, that do what an operation does.
+_operator_binary_functions = {
+    "operator.add"      : "Add",
+    "operator.sub"      : "Sub",
+    "operator.mul"      : "Mult",
+    "operator.truediv"  : "TrueDiv",
+    "operator.floordiv" : "FloorDiv",
+    "operator.mod"      : "Mod",
+    "operator.pow"      : "Pow",
+    "operator.lshift"   : "LShift",
+    "operator.rshift"   : "RShift",
+    "operator.and_"     : "BitAnd",
+    "operator.or_"      : "BitOr",
+    "operator.xor"      : "BitXor",
+}
+
+_operator_unary_functions = {
+    "operator.neg"    : "USub",
+    "operator.pos"    : "UAdd",
+    "operator.invert" : "Invert",
+    "operator.inv"    : "Invert",
+}
+
+_operator_comparison_functions = {
+    "operator.lt"     : "Lt",
+    "operator.le"     : "LtE",
+    "operator.eq"     : "Eq",
+    "operator.ne"     : "NotEq",
+    "operator.gt"     : "Gt",
+    "operator.ge"     : "GtE",
+    "operator.is_"    : "Is",
+    "operator.is_not" : "IsNot",
+}
+
+# Functions, that have their own nodes.
+_direct_call_functions = set(
+    (
+        "operator.abs",
+        "operator.getitem",
+        "operator.not_",
+        "operator.truth",
+    )
+)
+
+_direct_call_functions.update(_operator_binary_functions)
+_direct_call_functions.update(_operator_unary_functions)
+_direct_call_functions.update(_operator_comparison_functions)
+_direct_call_functions.update(
+    "math." + function_name
+    for function_name in
+    math_functions
+)
+
+if python_version < 300:
+    _operator_binary_functions["operator.div"] = "Div"
+    _direct_call_functions.add("operator.div")
+
+if python_version >= 300:
+    # For Python2 this depends on the locale.
+    _stdlib_values.add("string.printable")
+
+if python_version >= 320:
+    _stdlib_pure_functions.add("math.isfinite")
+
+if python_version >= 350:
+    _stdlib_pure_functions.add("math.gcd")
+    _operator_binary_functions["operator.matmul"] = "MatMult"
+    _direct_call_functions.add("operator.matmul")
+
+if python_version >= 360:
+    _stdlib_values.add("math.tau")
+
+
+def _getStdlibName(node, visited):
+    # Return driven, pylint: disable=too-many-return-statements
+
+    if node in visited:
+        return None
+
+    visited.add(node)
+
+    if node.isExpressionBuiltinImport():
+        module_name = node.getStandardLibraryModuleName()
+
+        return module_name if module_name in _stdlib_modules else None
+    elif node.isExpressionTempVariableRef() or \
+         node.isExpressionVariableRef():
+        variable_trace = node.variable_trace
+
+        if variable_trace is not None and variable_trace.isAssignTrace():
+            source = variable_trace.getAssignNode().getAssignSource()
+        elif node.getVariable().isModuleVariable():
+            source = getWholeProgramVariableSource(node.getVariable())
+        else:
+            source = None
+
+        return None if source is None else _getStdlibName(source, visited)
+    elif node.isExpressionImportName() or \
+         node.kind == "EXPRESSION_ATTRIBUTE_LOOKUP":
+        if node.isExpressionImportName():
+            module_name = _getStdlibName(node.getModule(), visited)
+            attribute_name = node.getImportName()
+        else:
+            module_name = _getStdlibName(node.getLookupSource(), visited)
+            attribute_name = node.getAttributeName()
+
+        if module_name not in _stdlib_modules:
+            return None
+
+        name = module_name + '.' + attribute_name
+
+        if name in _stdlib_modules or \
+           name in _stdlib_values or \
+           name in _stdlib_pure_functions or \
+           name in _direct_call_functions:
+            return name
+        else:
+            return None
+    else:
+        return None
+
+
+def getStdlibName(node):
+    """ Qualified name of a standard library module, value or function.
+
+    Only the ones registered here are given, otherwise None.
+    """
+
+    return _getStdlibName(node, set())
+
+
+def _getStdlibObject(name):
+    parts = name.split('.')
+
+    result = __import__(parts[0])
+
+    for part in parts[1:]:
+        result = getattr(result, part)
+
+    return result
+
+
+def _getSideEffectsNode(node):
+    # The lookups of known names have no side effects, only the module source
+    # they start from may.
+    while True:
+        if node.isExpressionImportName():
+            node = node.getModule()
+        elif node.kind == "EXPRESSION_ATTRIBUTE_LOOKUP":
+            node = node.getLookupSource()
+        else:
+            return node
+
+
+def computeStdlibLookup(node, trace_collection):
+    """ Compute a lookup of a standard library value, function or module.
+
+    Values become constants, and the others are known to run no code.
+    Returns None if not a registered one.
+    """
+
+    name = getStdlibName(node)
+
+    if name is None:
+        return None
+
+    if name not in _stdlib_values:
+        if node.mayRaiseException(BaseException):
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return node, None, None
+
+    new_node = makeConstantReplacementNode(
+        constant = _getStdlibObject(name),
+        node     = node
+    )
+
+    return (
+        wrapExpressionWithNodeSideEffects(
+            new_node = new_node,
+            old_node = _getSideEffectsNode(node)
+        ),
+        "new_constant",
+        "Standard library value '%s' predicted." % name
+    )
+
+
+def _computeStdlibCallConstant(name, call_node, call_args, call_kw):
+    if name not in _stdlib_pure_functions:
+        return None
+
+    if call_args is not None and not call_args.isCompileTimeConstant():
+        return None
+
+    if call_kw is not None and not call_kw.isCompileTimeConstant():
+        return None
+
+    function = _getStdlibObject(name)
+    args = () if call_args is None else call_args.getCompileTimeConstant()
+    kw = {} if call_kw is None else call_kw.getCompileTimeConstant()
+
+    # Exceptions of the modules, e.g. "struct.error", cannot be raised by
+    # replacement nodes, so these calls are left to run time.
+    try:
+        function(*args, **kw)
+    except Exception as e: # Catching all, pylint: disable=broad-except
+        exception_type = type(e)
+
+        if builtin_exception_values.get(exception_type.__name__) is not exception_type:
+            return None
+
+    result = getComputationResult(
+        node        = call_node,
+        computation = lambda : function(*args, **kw),
+        description = "Call to standard library function '%s' computed." % name
+    )
+
+    if result[0] is call_node:
+        return None
+
+    return result
+
+
+def _makeDirectCallNode(name, args, source_ref):
+    # Dispatching on the function kind, pylint: disable=too-many-return-statements
+
+    if name in _operator_binary_functions:
+        if len(args) != 2:
+            return None
+
+        return makeBinaryOperationNode(
+            operator   = _operator_binary_functions[name],
+            left       = args[0],
+            right      = args[1],
+            source_ref = source_ref
+        )
+    elif name in _operator_comparison_functions:
+        if len(args) != 2:
+            return None
+
+        return makeComparisonNode(
+            left       = args[0],
+            right      = args[1],
+            comparator = _operator_comparison_functions[name],
+            source_ref = source_ref
+        )
+    elif name == "operator.getitem":
+        if len(args) != 2:
+            return None
+
+        return ExpressionSubscriptLookup(
+            subscribed = args[0],
+            subscript  = args[1],
+            source_ref = source_ref
+        )
+
+    # The others take one argument.
+    if len(args) != 1:
+        return None
+
+    if name in _operator_unary_functions:
+        return ExpressionOperationUnary(
+            operator   = _operator_unary_functions[name],
+            operand    = args[0],
+            source_ref = source_ref
+        )
+    elif name == "operator.not_":
+        return ExpressionOperationNOT(
+            operand    = args[0],
+            source_ref = source_ref
+        )
+    elif name == "operator.abs":
+        return ExpressionOperationAbs(
+            operand    = args[0],
+            source_ref = source_ref
+        )
+    elif name == "operator.truth":
+        return ExpressionBuiltinBool(
+            value      = args[0],
+            source_ref = source_ref
+        )
+    else:
+        function_name = name.split('.')[1]
+
+        if function_name in math_float_only_functions and \
+           args[0].getTypeShape() is not ShapeTypeFloat:
+            return None
+
+        return ExpressionMathFunctionCall(
+            function_name = function_name,
+            value         = args[0],
+            source_ref    = source_ref
+        )
+
+
+def _computeStdlibCallDirect(name, call_node, call_args, call_kw):
+    if name not in _direct_call_functions:
+        return None
+
+    # None of these take keyword arguments.
+    if call_kw is not None and \
+       (not call_kw.isExpressionConstantRef() or call_kw.getConstant()):
+        return None
+
+    if call_args is None:
+        args = ()
+    else:
+        args = getSequenceCreationElements(call_args)
+
+        if args is None:
+            return None
+
+    new_node = _makeDirectCallNode(
+        name       = name,
+        args       = args,
+        source_ref = call_node.getSourceReference()
+    )
+
+    if new_node is None:
+        return None
+
+    return (
+        new_node,
+        "new_expression",
+        "Call to standard library function '%s' replaced with direct code." % (
+            name
+        )
+    )
+
+
+def computeStdlibCall(called, call_node, call_args, call_kw):
+    """ Compute a call of a standard library function at compile time.
+
+    With constant arguments, pure functions are computed. Functions with
+    equivalent operations or C implementations become these. Returns None
+    if not possible.
+    """
+
+    name = getStdlibName(called)
+
+    if name is None:
+        return None
+
+    result = _computeStdlibCallConstant(name, call_node, call_args, call_kw)
+
+    if result is None:
+        result = _computeStdlibCallDirect(name, call_node, call_args, call_kw)
+
+        if result is None:
+            return None
+
+    new_node, change_tags, change_desc = result
+
+    return (
+        wrapExpressionWithNodeSideEffects(
+            new_node = new_node,
+            old_node = _getSideEffectsNode(called)
+        ),
+        change_tags,
+        change_desc
+    )
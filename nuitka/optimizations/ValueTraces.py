@@ -73,6 +73,9 @@ class ValueTraceBase(object):
         self.addUsage()
         self.closure_usages = True
 
+    def hasClosureUsages(self):
+        return self.closure_usages
+
     def addUsage(self):
         self.usage_count += 1
 
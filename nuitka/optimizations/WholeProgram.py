@@ -0,0 +1,363 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Whole program knowledge about module variables.
+
+With "--whole-program" the compiled modules are assumed to be the whole
+program. A module variable, that is assigned exactly once, by the module
+itself, is then known to have that value, whenever reading it does not
+raise, as long as nothing else can change it.
+
+Other modules can only do that by writing attributes of the module, by
+using its dictionary, or by executing code we cannot see. These are found
+by scanning all compiled modules at the start of an optimization pass. Any
+use of e.g. "setattr" or "getattr" with non-constant names, "__dict__", or
+"exec", makes everything unknown.
+
+The reads are not replaced, because they can still raise, e.g. for circular
+imports, but their truth values and type shapes are used, so conditional
+code e.g. for "from config import DEBUG" can be removed.
+"""
+
+from nuitka import ModuleRegistry, Options, Variables
+from nuitka.Builtins import builtin_all_names
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+
+_builtin_names = frozenset(builtin_all_names)
+
+# Attribute names written anywhere in the program, None if not known.
+_written_attribute_names = None
+
+# Modules with variables that may be changed without assignments to them.
+_dynamic_modules = None
+
+# The compiled modules scanned, these are expected to be stable.
+_scanned_modules = None
+
+# Built-ins that can write attributes or module dictionaries of any module,
+# "getattr" can give the dictionary with a name we cannot see.
+_dynamic_builtin_names = frozenset(
+    (
+        "getattr",
+        "setattr",
+        "delattr",
+        "vars",
+        "globals",
+        "locals",
+        "eval",
+        "exec",
+        "execfile",
+    )
+)
+
+# Attributes that give access to the dictionary of a module.
+_dynamic_attribute_names = frozenset(
+    (
+        "__dict__",
+        "__setattr__",
+        "__delattr__",
+        "__globals__",
+        "func_globals",
+        "f_globals",
+    )
+)
+
+# Code executed by these could change anything.
+_dynamic_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_EVAL",
+        "EXPRESSION_BUILTIN_EXEC",
+        "EXPRESSION_BUILTIN_EXECFILE",
+        "EXPRESSION_BUILTIN_VARS",
+        "STATEMENT_EXEC",
+    )
+)
+
+# These expose the variables of the module they are used in. The "locals"
+# of module level code are its "globals", others are those of functions and
+# class bodies.
+_dynamic_module_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_GLOBALS",
+        "STATEMENT_IMPORT_STAR",
+    )
+)
+
+
+class _DynamicProgram(Exception):
+    pass
+
+
+class _ModuleScanner(VisitorNoopMixin):
+    def __init__(self, module, written_attribute_names, dynamic_modules):
+        self.module = module
+        self.written_attribute_names = written_attribute_names
+        self.dynamic_modules = dynamic_modules
+
+    def onEnterNode(self, node):
+        kind = node.kind
+
+        if kind in ("STATEMENT_ASSIGNMENT_ATTRIBUTE",
+                    "STATEMENT_DEL_ATTRIBUTE"):
+            self.written_attribute_names.add(node.getAttributeName())
+        elif kind == "EXPRESSION_BUILTIN_SETATTR":
+            attribute = node.getAttribute()
+
+            if not attribute.isExpressionConstantRef():
+                raise _DynamicProgram
+
+            self.written_attribute_names.add(attribute.getConstant())
+        elif kind == "EXPRESSION_BUILTIN_GETATTR":
+            attribute = node.getAttribute()
+
+            if not attribute.isExpressionConstantRef() or \
+               attribute.getConstant() in _dynamic_attribute_names:
+                raise _DynamicProgram
+        elif kind == "EXPRESSION_BUILTIN_REF":
+            if node.getBuiltinName() in _dynamic_builtin_names:
+                raise _DynamicProgram
+        elif kind.startswith("EXPRESSION_ATTRIBUTE_LOOKUP"):
+            if node.getAttributeName() in _dynamic_attribute_names:
+                raise _DynamicProgram
+        elif kind in _dynamic_kinds:
+            raise _DynamicProgram
+        elif kind in _dynamic_module_kinds:
+            parent = node.parent
+
+            # Imports all get the module globals, but do not change them.
+            if kind != "EXPRESSION_BUILTIN_GLOBALS" or \
+               not parent.isExpressionBuiltinImport() or \
+               parent.getGlobals() is not node:
+                self.dynamic_modules.add(self.module)
+
+
+def onOptimizationPassStart():
+    """ Scan the compiled modules of the last pass, if whole program mode.
+
+    Returns True, if the modules changed, and another pass is needed to make
+    use of their scan.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _written_attribute_names, _dynamic_modules, _scanned_modules
+
+    if not Options.isWholeProgramMode() or not Variables.complete:
+        return False
+
+    modules = frozenset(
+        module
+        for module in
+        ModuleRegistry.getDoneModules()
+        if module.isCompiledPythonModule()
+    )
+
+    # Only trust a set of modules, that the last pass did not add to, and not
+    # if uncompiled code can do anything it wants.
+    if modules != _scanned_modules or \
+       ModuleRegistry.getUncompiledNonTechnicalModules():
+        changed = modules != _scanned_modules
+
+        _scanned_modules = modules
+        _written_attribute_names = None
+        _dynamic_modules = None
+
+        return changed
+
+    written_attribute_names = set()
+    dynamic_modules = set()
+
+    try:
+        for module in modules:
+            visitTree(
+                module,
+                _ModuleScanner(
+                    module                  = module,
+                    written_attribute_names = written_attribute_names,
+                    dynamic_modules         = dynamic_modules
+                )
+            )
+    except _DynamicProgram:
+        _written_attribute_names = None
+        _dynamic_modules = None
+    else:
+        _written_attribute_names = written_attribute_names
+        _dynamic_modules = dynamic_modules
+
+    return False
+
+
+def onModuleAdded():
+    """ A module was added, other modules may now be written by it. """
+
+    # Singleton, pylint: disable=global-statement
+    global _written_attribute_names, _dynamic_modules
+
+    _written_attribute_names = None
+    _dynamic_modules = None
+
+
+def _isKnownModule(module):
+    return module is not None and \
+           module in _scanned_modules and \
+           module not in _dynamic_modules and \
+           not module.isCompiledPythonPackage()
+
+
+def _getModuleVariableSource(variable):
+    """ The only value ever assigned to a module variable, or None. """
+
+    variable_name = variable.getName()
+
+    # Dunder names are set by the import machinery, and unassigned names
+    # fall back to built-ins.
+    if variable_name.startswith("__") or \
+       variable_name in _builtin_names or \
+       variable_name in _written_attribute_names:
+        return None
+
+    module = variable.getModule()
+
+    if not _isKnownModule(module):
+        return None
+
+    if variable.hasWritesOutsideOf(module) is not False:
+        return None
+
+    assign_trace = None
+
+    for trace in variable.traces:
+        if trace.isAssignTrace():
+            if assign_trace is not None:
+                return None
+
+            assign_trace = trace
+        # Deleting it, unassigns it, either at module level or via "global".
+        elif trace.isUninitTrace() and trace.getPrevious() is not None:
+            return None
+
+    if assign_trace is None:
+        return None
+
+    return assign_trace.getAssignNode().getAssignSource()
+
+
+def _getImportedModule(node):
+    if node.isExpressionTempVariableRef():
+        variable_trace = node.variable_trace
+
+        if variable_trace is None or not variable_trace.isAssignTrace():
+            return None
+
+        node = variable_trace.getAssignNode().getAssignSource()
+    elif node.isExpressionVariableRef():
+        if not node.getVariable().isModuleVariable():
+            return None
+
+        node = _getModuleVariableSource(node.getVariable())
+
+        if node is None:
+            return None
+
+    if not node.isExpressionBuiltinImport():
+        return None
+
+    module_name = node.getImportName()
+    fromlist = node.getFromList()
+
+    if not module_name.isExpressionConstantRef():
+        return None
+
+    # Without a "fromlist", the top level package is what we get.
+    if fromlist is None or \
+       not fromlist.isExpressionConstantRef() or \
+       not fromlist.getConstant():
+        if '.' in module_name.getConstant():
+            return None
+
+    imported_module = node.imported_module
+
+    if imported_module is None or \
+       not imported_module.isCompiledPythonModule() or \
+       not _isKnownModule(imported_module):
+        return None
+
+    return imported_module
+
+
+def _getModuleAttributeSource(module, attribute_name):
+    if not module.hasProvidedVariable(attribute_name):
+        return None
+
+    return _getModuleVariableSource(
+        module.getProvidedVariable(attribute_name)
+    )
+
+
+def _getConstantValue(node, visited):
+    while node is not None and node not in visited:
+        visited.add(node)
+
+        if node.isExpressionConstantRef():
+            return None if node.isMutable() else node
+
+        if node.isExpressionVariableRef():
+            variable = node.getVariable()
+
+            if not variable.isModuleVariable():
+                return None
+
+            node = _getModuleVariableSource(variable)
+        elif node.isExpressionImportName() or \
+             node.kind == "EXPRESSION_ATTRIBUTE_LOOKUP":
+            if node.isExpressionImportName():
+                module = _getImportedModule(node.getModule())
+                attribute_name = node.getImportName()
+            else:
+                module = _getImportedModule(node.getLookupSource())
+                attribute_name = node.getAttributeName()
+
+            if module is None:
+                return None
+
+            node = _getModuleAttributeSource(module, attribute_name)
+        else:
+            return None
+
+    return None
+
+
+def getWholeProgramConstant(node):
+    """ Constant value of a module variable read, if it is known.
+
+    Variable references, imported names, and attributes of imported modules
+    are considered. Reading them may still raise, if the variable is not yet
+    assigned, but otherwise the value is the returned constant node.
+    """
+
+    if _written_attribute_names is None:
+        return None
+
+    return _getConstantValue(node, set())
+
+
+def getWholeProgramVariableSource(variable):
+    """ The only value ever assigned to a module variable, if it is known. """
+
+    if _written_attribute_names is None:
+        return None
+
+    return _getModuleVariableSource(variable)
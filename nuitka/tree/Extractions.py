@@ -56,9 +56,16 @@ class VariableUsageUpdater(VisitorNoopMixin):
     def onEnterNode(self, node):
         if node.isStatementAssignmentVariable() or \
            node.isStatementDelVariable() or \
-           node.isStatementReleaseVariable():
+           node.isStatementReleaseVariable() or \
+           node.isExpressionVariableRef() or \
+           node.isExpressionTempVariableRef():
             if node.getVariable() is self.old_variable:
                 node.setVariable(self.new_variable)
+        elif node.isStatementsFrame():
+            node.replaceFrameVariable(
+                old_variable = self.old_variable,
+                new_variable = self.new_variable
+            )
 
 
 def updateVariableUsage(provider, old_variable, new_variable):
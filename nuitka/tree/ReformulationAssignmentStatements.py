@@ -68,6 +68,7 @@ from .SyntaxErrors import raiseSyntaxError
 from .TreeHelpers import (
     buildNode,
     getKind,
+    getSequenceCreationElements,
     makeConstantRefNode,
     makeSequenceCreationOrConstant,
     makeStatementsSequence,
@@ -118,6 +119,25 @@ def buildExtSliceNode(provider, node, source_ref):
     )
 
 
+def _getUnpackedSourceElements(source, detail):
+    """ Elements of a tuple or list display being unpacked, or None.
+
+    Only if the number of elements matches, and nothing is starred, the
+    container need not exist.
+    """
+
+    for element in detail:
+        if element[0] == "Starred":
+            return None
+
+    elements = getSequenceCreationElements(source)
+
+    if elements is None or len(elements) != len(detail):
+        return None
+
+    return elements
+
+
 def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
                                          source_ref):
     # This is using many variable names on purpose, so as to give names to the
@@ -181,11 +201,6 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
     elif kind == "Tuple":
         temp_scope = provider.allocateTempScope("tuple_unpack")
 
-        source_iter_var = provider.allocateTempVariable(
-            temp_scope = temp_scope,
-            name       = "source_iter"
-        )
-
         element_vars = [
             provider.allocateTempVariable(
                 temp_scope = temp_scope,
@@ -197,103 +212,125 @@ def buildAssignmentStatementsFromDecoded(provider, kind, detail, source,
             range(len(detail))
         ]
 
-        starred_list_var = None
-        starred_index = None
-
-        statements = []
+        source_elements = _getUnpackedSourceElements(
+            source = source,
+            detail = detail
+        )
 
-        for element_index, element in enumerate(detail):
-            element_var = element_vars[element_index]
+        if source_elements is not None:
+            # The source container would only be created to be unpacked, so
+            # assign its elements directly, in the same order.
+            statements = [
+                StatementAssignmentVariable(
+                    variable   = element_var,
+                    source     = source_element,
+                    source_ref = source_ref
+                )
+                for element_var, source_element in
+                zip(element_vars, source_elements)
+            ]
+        else:
+            source_iter_var = provider.allocateTempVariable(
+                temp_scope = temp_scope,
+                name       = "source_iter"
+            )
 
-            if starred_list_var is not None:
-                if element[0] == "Starred":
-                    raiseSyntaxError(
-                        "two starred expressions in assignment",
-                        source_ref.atColumnNumber(0)
+            starred_list_var = None
+            starred_index = None
+
+            statements = []
+
+            for element_index, element in enumerate(detail):
+                element_var = element_vars[element_index]
+
+                if starred_list_var is not None:
+                    if element[0] == "Starred":
+                        raiseSyntaxError(
+                            "two starred expressions in assignment",
+                            source_ref.atColumnNumber(0)
+                        )
+
+                    statements.insert(
+                        starred_index+1,
+                        StatementAssignmentVariable(
+                            variable   = element_var,
+                            source     = ExpressionListOperationPop(
+                                list_arg   = ExpressionTempVariableRef(
+                                    variable   = starred_list_var,
+                                    source_ref = source_ref
+                                ),
+                                source_ref = source_ref
+                            ),
+                            source_ref = source_ref
+                        )
                     )
-
-                statements.insert(
-                    starred_index+1,
-                    StatementAssignmentVariable(
-                        variable   = element_var,
-                        source     = ExpressionListOperationPop(
-                            list_arg   = ExpressionTempVariableRef(
-                                variable   = starred_list_var,
+                elif element[0] != "Starred":
+                    statements.append(
+                        StatementAssignmentVariable(
+                            variable   = element_var,
+                            source     = ExpressionSpecialUnpack(
+                                value      = ExpressionTempVariableRef(
+                                    variable   = source_iter_var,
+                                    source_ref = source_ref
+                                ),
+                                count      = element_index + 1,
+                                expected   = len(detail),
                                 source_ref = source_ref
                             ),
                             source_ref = source_ref
-                        ),
-                        source_ref = source_ref
+                        )
                     )
-                )
-            elif element[0] != "Starred":
-                statements.append(
-                    StatementAssignmentVariable(
-                        variable   = element_var,
-                        source     = ExpressionSpecialUnpack(
-                            value      = ExpressionTempVariableRef(
-                                variable   = source_iter_var,
+                else:
+                    starred_index = element_index
+                    starred_list_var = element_var
+
+                    statements.append(
+                        StatementAssignmentVariable(
+                            variable   = element_var,
+                            source     = ExpressionBuiltinList(
+                                value      = ExpressionTempVariableRef(
+                                    variable   = source_iter_var,
+                                    source_ref = source_ref
+                                ),
                                 source_ref = source_ref
                             ),
-                            count      = element_index + 1,
-                            expected   = len(detail),
                             source_ref = source_ref
-                        ),
-                        source_ref = source_ref
+                        )
                     )
-                )
-            else:
-                starred_index = element_index
-                starred_list_var = element_var
 
+            if starred_list_var is None:
                 statements.append(
-                    StatementAssignmentVariable(
-                        variable   = element_var,
-                        source     = ExpressionBuiltinList(
-                            value      = ExpressionTempVariableRef(
-                                variable   = source_iter_var,
-                                source_ref = source_ref
-                            ),
+                    StatementSpecialUnpackCheck(
+                        iterator   = ExpressionTempVariableRef(
+                            variable   = source_iter_var,
                             source_ref = source_ref
                         ),
+                        count      = len(detail),
                         source_ref = source_ref
                     )
                 )
 
-        if starred_list_var is None:
-            statements.append(
-                StatementSpecialUnpackCheck(
-                    iterator   = ExpressionTempVariableRef(
-                        variable   = source_iter_var,
+            statements = [
+                StatementAssignmentVariable(
+                    variable   = source_iter_var,
+                    source     = ExpressionBuiltinIter1(
+                        value      = source,
                         source_ref = source_ref
                     ),
-                    count      = len(detail),
-                    source_ref = source_ref
-                )
-            )
-
-
-        statements = [
-            StatementAssignmentVariable(
-                variable   = source_iter_var,
-                source     = ExpressionBuiltinIter1(
-                    value      = source,
                     source_ref = source_ref
                 ),
-                source_ref = source_ref
-            ),
-            makeTryFinallyStatement(
-                provider   = provider,
-                tried      = statements,
-                final      = (
-                    StatementReleaseVariable(
-                        variable   = source_iter_var,
-                        source_ref = source_ref
+                makeTryFinallyStatement(
+                    provider   = provider,
+                    tried      = statements,
+                    final      = (
+                        StatementReleaseVariable(
+                            variable   = source_iter_var,
+                            source_ref = source_ref
+                        ),
                     ),
-                ),
-                source_ref = source_ref
-            )
-        ]
+                    source_ref = source_ref
+                )
+            ]
 
         # When all is done, copy over to the actual assignment targets, starred
         # or not makes no difference here anymore.
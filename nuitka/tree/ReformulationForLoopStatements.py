@@ -22,6 +22,8 @@ source code comments with developer manual sections.
 
 """
 
+import ast
+
 from nuitka.nodes.AssignNodes import (
     StatementAssignmentVariable,
     StatementReleaseVariable
@@ -45,12 +47,132 @@ from .ReformulationTryFinallyStatements import makeTryFinallyStatement
 from .TreeHelpers import (
     buildNode,
     buildStatementsNode,
+    getKind,
+    getSequenceCreationElements,
     makeStatementsSequence,
     makeStatementsSequenceFromStatements,
     popBuildContext,
     pushBuildContext
 )
 
+# Loops over small tuple or list displays are unrolled, if their body is small
+# too. The limits are in elements, and in AST nodes of the body.
+_unroll_max_elements = 4
+_unroll_max_body_size = 50
+
+# These cannot be copied for every element of an unrolled loop.
+_unroll_forbidden_kinds = frozenset(
+    (
+        "Break",
+        "Continue",
+        # These create code objects, which must exist only once.
+        "FunctionDef",
+        "AsyncFunctionDef",
+        "ClassDef",
+        "Lambda",
+        "GeneratorExp",
+        "ListComp",
+        "SetComp",
+        "DictComp",
+        # These would warn about their placement once per copy.
+        "Global",
+        "Nonlocal",
+    )
+)
+
+
+def _isUnrollableLoopBody(nodes):
+    size = 0
+
+    for node in nodes:
+        for sub_node in ast.walk(node):
+            if getKind(sub_node) in _unroll_forbidden_kinds:
+                return False
+
+            size += 1
+
+    return size <= _unroll_max_body_size
+
+
+def _buildUnrolledForLoopNode(provider, node, elements, source_ref):
+    # Without "break" and "continue" the loop body is simply run for every
+    # element, and the else block always follows. The elements are all
+    # evaluated first, as they would be for the container.
+
+    temp_scope = provider.allocateTempScope("for_unrolled")
+
+    element_variables = [
+        provider.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "element_%d" % (element_index + 1)
+        )
+        for element_index in
+        range(len(elements))
+    ]
+
+    statements = [
+        StatementAssignmentVariable(
+            variable   = element_variable,
+            source     = element,
+            source_ref = source_ref
+        )
+        for element_variable, element in
+        zip(element_variables, elements)
+    ]
+
+    pushBuildContext("loop_body")
+    for element_variable in element_variables:
+        statements.append(
+            buildAssignmentStatements(
+                provider   = provider,
+                node       = node.target,
+                source     = ExpressionTempVariableRef(
+                    variable   = element_variable,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+
+        loop_body = buildStatementsNode(
+            provider   = provider,
+            nodes      = node.body,
+            source_ref = source_ref
+        )
+
+        if loop_body is not None:
+            statements.append(loop_body)
+    popBuildContext()
+
+    statements = [
+        makeTryFinallyStatement(
+            provider   = provider,
+            tried      = statements,
+            final      = tuple(
+                StatementReleaseVariable(
+                    variable   = element_variable,
+                    source_ref = source_ref
+                )
+                for element_variable in
+                element_variables
+            ),
+            source_ref = source_ref
+        )
+    ]
+
+    else_block = buildStatementsNode(
+        provider   = provider,
+        nodes      = node.orelse if node.orelse else None,
+        source_ref = source_ref
+    )
+
+    if else_block is not None:
+        statements.append(else_block)
+
+    return makeStatementsSequenceFromStatements(
+        *statements
+    )
+
 
 def _buildForLoopNode(provider, node, sync, source_ref):
     # The for loop is re-formulated according to developer manual. An iterator
@@ -62,6 +184,19 @@ def _buildForLoopNode(provider, node, sync, source_ref):
 
     source = buildNode(provider, node.iter, source_ref)
 
+    if sync:
+        elements = getSequenceCreationElements(source)
+
+        if elements and \
+           len(elements) <= _unroll_max_elements and \
+           _isUnrollableLoopBody(node.body):
+            return _buildUnrolledForLoopNode(
+                provider   = provider,
+                node       = node,
+                elements   = elements,
+                source_ref = source_ref
+            )
+
     # Temporary variables, we need one for the iterator, and one for the current
     # value.
     temp_scope = provider.allocateTempScope("for_loop")
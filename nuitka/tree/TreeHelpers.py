@@ -538,6 +538,29 @@ def makeSequenceCreationOrConstant(sequence_kind, elements, source_ref):
     return result
 
 
+def getSequenceCreationElements(node):
+    """ Elements of a tuple or list creation, or None for other nodes.
+
+    For constant sequences, the elements are given as constant references.
+    """
+
+    if node.isExpressionMakeTuple() or node.isExpressionMakeList():
+        return node.getElements()
+    elif node.isExpressionConstantTupleRef() or \
+         node.isExpressionConstantListRef():
+        return tuple(
+            makeConstantRefNode(
+                constant      = element,
+                source_ref    = node.getSourceReference(),
+                user_provided = True
+            )
+            for element in
+            node.getConstant()
+        )
+    else:
+        return None
+
+
 def makeDictCreationOrConstant(keys, values, source_ref):
     # Create dictionary node. Tries to avoid it for constant values that are not
     # mutable.
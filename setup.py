@@ -279,10 +279,6 @@ setup(
         "nuitka.build" : [
             "SingleExe.scons",
             "static_src/*.c",
-            "static_src/*/*.c",
-            "static_src/*/*.h",
-            "static_src/*/*.asm",
-            "static_src/*/*.S",
             "include/*.h",
             "include/*/*.h",
             "include/*/*/*.h",
@@ -0,0 +1,182 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Calls of small functions, that get in-lined.
+
+The in-lined code must behave like the call, also when the called function
+gets replaced at run time, and exceptions must have the same tracebacks and
+frame locals.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def printTraceback():
+    tb = sys.exc_info()[2]
+
+    entries = []
+
+    while tb is not None:
+        entries.append(
+            (
+                tb.tb_frame.f_code.co_name,
+                tb.tb_lineno,
+                sorted(
+                    (name, value)
+                    for name, value in
+                    tb.tb_frame.f_locals.items()
+                    if not name.startswith("__")
+                    if not callable(value)
+                )
+            )
+        )
+
+        tb = tb.tb_next
+
+    print(sys.exc_info()[0].__name__, entries[1:])
+
+
+def add(a, b):
+    return a + b
+
+def divide(a, b):
+    return a / (b - 2)
+
+def replacement(a, b):
+    return "replaced", a, b
+
+def callAdd(x):
+    return add(x, 2)
+
+print("Module function:", callAdd(1))
+
+add_original = add
+add = replacement
+
+print("Replaced module function:", callAdd(1))
+
+add = add_original
+
+print("Restored module function:", callAdd(1))
+
+del add
+
+try:
+    callAdd(1)
+except NameError as e:
+    print("Deleted module function:", e)
+
+add = add_original
+
+print("Exceptions from in-lined function:")
+
+def callDivide():
+    return divide(1, 2)
+
+try:
+    callDivide()
+except ZeroDivisionError:
+    printTraceback()
+
+def callDivideLocal(c):
+    def divideLocal(a, b):
+        return a / (b - c)
+
+    return divideLocal(1, 2)
+
+try:
+    callDivideLocal(2)
+except ZeroDivisionError:
+    printTraceback()
+
+def callDivideSameNames(a, b):
+    return divide(b, a)
+
+try:
+    callDivideSameNames(2, 3)
+except ZeroDivisionError:
+    printTraceback()
+
+def withDefault(a, b = 3):
+    return a * b
+
+def callWithDefault():
+    return withDefault(2), withDefault(2, 4)
+
+print("Defaults:", callWithDefault())
+
+withDefault.__defaults__ = (5,)
+
+print("Changed defaults:", callWithDefault())
+
+def withClosure():
+    values = []
+
+    def append(value):
+        values.append(value)
+        return len(values)
+
+    return append(1), append(2), values
+
+print("Closure:", withClosure())
+
+def recursive(n):
+    if n <= 0:
+        return 0
+
+    return n + recursive(n - 1)
+
+def callRecursive():
+    return recursive(4)
+
+print("Recursion:", callRecursive())
+
+def mutual1(n):
+    return 0 if n <= 0 else mutual2(n - 1) + 1
+
+def mutual2(n):
+    return 0 if n <= 0 else mutual1(n - 1) + 2
+
+print("Mutual recursion:", mutual1(5))
+
+def inLoop():
+    result = 0
+
+    for i in range(5):
+        result += add(i, i)
+
+    return result
+
+print("In loop:", inLoop())
+
+def argumentRaising():
+    return add(1, 1 / 0)
+
+try:
+    argumentRaising()
+except ZeroDivisionError:
+    printTraceback()
+
+def withCalledArgument(called):
+    return called + 1
+
+def callWithCalledArgument(x):
+    return withCalledArgument(x)
+
+print("Argument named like call temporary:", callWithCalledArgument(1))
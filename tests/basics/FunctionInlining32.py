@@ -0,0 +1,45 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Calls of small functions with keyword only arguments.
+
+These are not in-lined, but calls of them must still work when the defaults
+are changed at run time.
+"""
+
+def withKeywordOnly(a, *, b = 3):
+    return a * b
+
+def callWithKeywordOnly():
+    return withKeywordOnly(2), withKeywordOnly(2, b = 4)
+
+print("Keyword only:", callWithKeywordOnly())
+
+withKeywordOnly.__kwdefaults__ = {"b" : 5}
+
+print("Changed keyword only defaults:", callWithKeywordOnly())
+
+def withRequiredKeywordOnly(a, *, b):
+    return a, b
+
+def callWithRequiredKeywordOnly():
+    return withRequiredKeywordOnly(1)
+
+try:
+    callWithRequiredKeywordOnly()
+except TypeError as e:
+    print("Missing keyword only argument:", e)
@@ -0,0 +1,188 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Generator expressions given to built-ins consuming them.
+
+These are fused into the consuming built-in, which must not change when the
+iteration stops, nor the exceptions and their tracebacks.
+"""
+
+from __future__ import print_function
+
+import sys
+import traceback
+
+
+def printTraceback():
+    tb = sys.exc_info()[2]
+
+    print(
+        sys.exc_info()[0].__name__,
+        [
+            (entry[2], entry[1])
+            for entry in
+            traceback.extract_tb(tb)
+        ]
+    )
+
+
+def producer(count):
+    for value in range(count):
+        print("Producing", value)
+        yield value
+
+
+class BoolRaising(object):
+    def __bool__(self):
+        raise KeyError("from __bool__")
+
+    __nonzero__ = __bool__
+
+
+class BoolStopping(object):
+    def __bool__(self):
+        raise StopIteration
+
+    __nonzero__ = __bool__
+
+
+class AddRaising(object):
+    def __radd__(self, other):
+        raise KeyError("from __radd__")
+
+
+class LessRaising(object):
+    def __lt__(self, other):
+        raise KeyError("from __lt__")
+
+    __gt__ = __lt__
+
+
+def anyEarlyExit():
+    return any(x > 1 for x in producer(5))
+
+def allEarlyExit():
+    return all(x < 1 for x in producer(5))
+
+def anyNoExit():
+    return any(x > 10 for x in producer(3))
+
+def allNoExit():
+    return all(x < 10 for x in producer(3))
+
+print("Early exits:")
+print("any", anyEarlyExit())
+print("all", allEarlyExit())
+print("any", anyNoExit())
+print("all", allNoExit())
+
+def sumValues():
+    return sum(x * 2 for x in producer(4))
+
+def minValues():
+    return min(x - 2 for x in producer(4))
+
+def maxValues():
+    return max(-x for x in producer(4))
+
+def emptyValues():
+    return sum(x for x in ()), any(x for x in ()), all(x for x in ())
+
+print("Values:")
+print("sum", sumValues())
+print("min", minValues())
+print("max", maxValues())
+print("empty", emptyValues())
+
+def anyConsumerRaising():
+    return any(x for x in [BoolRaising()])
+
+def allConsumerRaising():
+    return all(x for x in [BoolRaising()])
+
+def sumConsumerRaising():
+    return sum(x for x in [AddRaising()])
+
+def sumConsumerTypeError():
+    return sum(x for x in [1, "a"])
+
+def minConsumerRaising():
+    return min(x for x in [LessRaising(), LessRaising()])
+
+def maxConsumerRaising():
+    return max(x for x in [LessRaising(), LessRaising()])
+
+def anyConsumerStopping():
+    return any(x for x in [BoolStopping()])
+
+print("Exceptions in the consumer:")
+
+for consumer_raising in (anyConsumerRaising, allConsumerRaising,
+                         sumConsumerRaising, sumConsumerTypeError,
+                         minConsumerRaising, maxConsumerRaising,
+                         anyConsumerStopping):
+    try:
+        consumer_raising()
+    except Exception:
+        printTraceback()
+
+def anyProducerRaising():
+    return any(1 / x > 1 for x in (1, 0))
+
+def allProducerRaising():
+    return all(1 / x for x in (1, 0))
+
+def sumProducerRaising():
+    return sum(1 / x for x in (1, 0))
+
+def minProducerRaising():
+    return min(1 / x for x in (1, 0))
+
+def maxProducerRaising():
+    return max(1 / x for x in (1, 0))
+
+def sumIterationRaising():
+    return sum(x for x in 1)
+
+print("Exceptions in the producer:")
+
+for producer_raising in (anyProducerRaising, allProducerRaising,
+                         sumProducerRaising, minProducerRaising,
+                         maxProducerRaising, sumIterationRaising):
+    try:
+        producer_raising()
+    except Exception:
+        printTraceback()
+
+def producerLocals():
+    try:
+        return sum(y // x for x in (2, 0) for y in (4,))
+    except ZeroDivisionError:
+        tb = sys.exc_info()[2]
+
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+
+        # The iterator argument ".0" is not a local variable for Nuitka.
+        return sorted(
+            name
+            for name in
+            tb.tb_frame.f_locals
+            if name != ".0"
+        )
+
+print("Locals of the generator expression frame:", producerLocals())
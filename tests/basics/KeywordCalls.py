@@ -0,0 +1,87 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Calls with keyword arguments of known names.
+
+Compiled functions and methods take these without an argument tuple and
+dictionary, other callables get them created, or the constant ones. For all
+of them, duplicate and unexpected keyword arguments must give the same errors,
+and extra ones must be collected in "**kw" the same.
+"""
+
+from __future__ import print_function
+
+
+def function(a, b = 2, **kw):
+    return a, b, sorted(kw.items())
+
+def strict(a, b = 2):
+    return a, b
+
+class Class(object):
+    def method(self, a, b = 2, **kw):
+        return a, b, sorted(kw.items())
+
+    def strictMethod(self, a, b = 2):
+        return a, b
+
+# Created by "eval", these are not compiled.
+uncompiled_function = eval("lambda a, b = 2, **kw: (a, b, sorted(kw.items()))")
+uncompiled_strict = eval("lambda a, b = 2: (a, b)")
+
+def constantKeywords(called):
+    return called(1, b = 3, c = 4, d = 5)
+
+def variableKeywords(called, x, y):
+    return called(x, b = y, c = x + y)
+
+def onlyKeywords(called):
+    return called(a = 1, c = 2)
+
+def duplicateKeyword(called):
+    return called(1, a = 2)
+
+def duplicateVariableKeyword(called, x):
+    return called(x, 3, b = x)
+
+def unexpectedKeyword(called):
+    return called(1, c = 2)
+
+def unexpectedVariableKeyword(called, x):
+    return called(x, b = x, c = x)
+
+for called in (function, Class().method, uncompiled_function):
+    print("Collecting:", constantKeywords(called))
+    print("Collecting:", variableKeywords(called, 1, 2))
+    print("Collecting:", onlyKeywords(called))
+
+print("Collecting by type:", sorted(onlyKeywords(dict).items()))
+
+for called in (function, strict, Class().method, Class().strictMethod,
+               uncompiled_function, uncompiled_strict, dict):
+    for duplicate in (duplicateKeyword, lambda called: duplicateVariableKeyword(called, 1)):
+        try:
+            duplicate(called)
+        except TypeError as e:
+            print("Duplicate:", e)
+
+for called in (strict, Class().strictMethod, uncompiled_strict):
+    for unexpected in (unexpectedKeyword, lambda called: unexpectedVariableKeyword(called, 1)):
+        try:
+            unexpected(called)
+        except TypeError as e:
+            print("Unexpected:", e)
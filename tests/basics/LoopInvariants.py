@@ -0,0 +1,151 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loops with expressions that give the same value in every iteration.
+
+These may be computed once before the loop, which must not change the values
+seen, also when the loop rebinds variables they use, and not when or if the
+exceptions are raised.
+"""
+
+from __future__ import print_function
+
+
+class LenRaising(object):
+    def __len__(self):
+        raise KeyError("from __len__")
+
+
+def invariant(count, value):
+    result = []
+
+    for i in range(count):
+        result.append((value * 2, value + 1, i))
+
+    return result
+
+print("Invariant:", invariant(3, 5))
+
+def reboundInBody(count, value):
+    result = []
+
+    for _i in range(count):
+        result.append(value * 2)
+        value = value + 1
+
+    return result
+
+print("Rebound in body:", reboundInBody(3, 5))
+
+def reboundConditionally(count, value):
+    result = []
+
+    for i in range(count):
+        result.append(value + (1,))
+
+        if i == 1:
+            value = ("changed",)
+
+    return result
+
+print("Rebound conditionally:", reboundConditionally(4, ("initial",)))
+
+def reboundInWhile(value):
+    result = []
+
+    while len(value) < 4:
+        result.append(len(value))
+        value = value + "x"
+
+    return result
+
+print("Rebound in while:", reboundInWhile(""))
+
+def reboundByLoopVariable(values):
+    result = []
+    value = values[0]
+
+    for value in values:
+        result.append(value * 2)
+
+    return result
+
+print("Rebound by loop variable:", reboundByLoopVariable((1, 2, 3)))
+
+def reboundByDel(count, value):
+    result = []
+
+    for _i in range(count):
+        try:
+            result.append(value * 2)
+            del value
+        except NameError as e:
+            result.append(type(e).__name__)
+            value = 7
+
+    return result
+
+print("Rebound by del:", reboundByDel(4, 5))
+
+def lenRaising(count, value):
+    for i in range(count):
+        print("Iteration", i)
+
+        if i == 1:
+            print("Length", len(value))
+
+try:
+    lenRaising(3, LenRaising())
+except KeyError as e:
+    print("Length raising:", repr(e))
+
+def lenRaisingNotReached(count, value):
+    for i in range(count):
+        print("Iteration", i)
+
+    return len(value) if count > 5 else "not reached"
+
+print("Length not reached:", lenRaisingNotReached(2, LenRaising()))
+
+def lenRaisingEmptyLoop(value):
+    for _i in range(0):
+        print("Length", len(value))
+
+    return "empty loop"
+
+print("Length in empty loop:", lenRaisingEmptyLoop(LenRaising()))
+
+def lenOfKnownShape(count, value):
+    value = tuple(value)
+    result = []
+
+    for _i in range(count):
+        result.append(len(value))
+
+    return result
+
+print("Length of tuple:", lenOfKnownShape(2, "abc"))
+
+def lenOfNonSized(count, value):
+    for i in range(count):
+        print("Iteration", i)
+        print("Length", len(value))
+
+try:
+    lenOfNonSized(2, 5)
+except TypeError as e:
+    print("Length of int:", e)
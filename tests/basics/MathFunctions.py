@@ -0,0 +1,103 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Errors raised by calls of standard library functions.
+
+These are computed at compile time for constant arguments, and done with
+direct C code for others, either way the exceptions must be the same.
+"""
+
+from __future__ import print_function
+
+import math
+import struct
+
+
+def printError(description, called, *args):
+    try:
+        result = called(*args)
+    except Exception as e:
+        print(description, "raised", type(e).__name__, e)
+    else:
+        print(description, "gave", result)
+
+
+class FloatNonFloat(object):
+    def __float__(self):
+        return "not a float"
+
+
+class FloatRaising(object):
+    def __float__(self):
+        raise KeyError("from __float__")
+
+
+class FloatGood(object):
+    def __float__(self):
+        return 2.5
+
+
+print("Constant arguments:")
+
+try:
+    math.sqrt(-1)
+except ValueError as e:
+    print("math.sqrt(-1) raised", e)
+
+try:
+    math.fabs("a")
+except TypeError as e:
+    print("math.fabs('a') raised", e)
+
+try:
+    math.sqrt(10**400)
+except OverflowError as e:
+    print("math.sqrt(10**400) raised", e)
+
+try:
+    struct.calcsize("<Z")
+except struct.error as e:
+    print("struct.calcsize('<Z') raised", e)
+
+print("Values not known at compile time:")
+
+for value in (-1, -1.5, "a", 10**400, 4, FloatNonFloat(), FloatRaising(), FloatGood()):
+    try:
+        print("math.sqrt", math.sqrt(value))
+    except Exception as e:
+        print("math.sqrt raised", type(e).__name__, e)
+
+    try:
+        print("math.fabs", math.fabs(value))
+    except Exception as e:
+        print("math.fabs raised", type(e).__name__, e)
+
+    try:
+        print("math.floor", math.floor(value))
+    except Exception as e:
+        print("math.floor raised", type(e).__name__, e)
+
+    try:
+        print("math.ceil", math.ceil(value))
+    except Exception as e:
+        print("math.ceil raised", type(e).__name__, e)
+
+print("Called indirectly:")
+
+printError("math.sqrt(-1)", math.sqrt, -1)
+printError("math.floor(FloatNonFloat())", math.floor, FloatNonFloat())
+printError("struct.calcsize('<Z')", struct.calcsize, "<Z")
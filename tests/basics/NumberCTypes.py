@@ -0,0 +1,177 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Variables and operations of int, long and float values.
+
+With C types for numbers, these become C values, and must behave the same,
+also for locals, frames, deletions and values not fitting into C values.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def intLocals(values):
+    a = len(values)
+    b = 2
+
+    c = a + b
+    d = c * 3
+
+    return a, b, c, d
+
+print("Int locals:", intLocals("a"))
+
+def intOverflow():
+    a = sys.maxsize
+    b = a + 1
+    c = -a - 2
+
+    return a, b, c, type(b) is type(a)
+
+print("Int overflow:", intOverflow())
+
+def intInplace(values):
+    a = len(values)
+    a += 2
+    a *= 3
+    a -= 1
+
+    return a
+
+print("Int in-place:", intInplace("abcde"))
+
+def intDeleted(values):
+    a = len(values)
+    del a
+
+    try:
+        return a
+    except NameError as e:
+        return repr(e)
+
+print("Int deleted:", intDeleted(()))
+
+def intLocalsDict(values):
+    a = len(values)
+    b = a + 1
+
+    return sorted(locals().items())
+
+print("Int locals dict:", intLocalsDict([0]))
+
+def printFrameLocals(func, *args):
+    try:
+        func(*args)
+    except ZeroDivisionError:
+        frame = sys.exc_info()[2].tb_next.tb_frame
+
+        print(
+            func.__name__,
+            sorted(
+                (name, value)
+                for name, value in
+                frame.f_locals.items()
+                if name in ("a", "b")
+            )
+        )
+
+def intFrameLocals(values):
+    a = len(values)
+    b = a + 1
+
+    return b / (a - 1)
+
+printFrameLocals(intFrameLocals, [0])
+
+
+def intClosure(values):
+    a = len(values)
+
+    def inner():
+        return a + 1
+
+    return inner()
+
+print("Int closure:", intClosure("abc"))
+
+def intGenerator(values):
+    a = len(values)
+
+    yield a
+
+    a = a + 1
+
+    yield a
+
+print("Int generator:", list(intGenerator("a")))
+
+def floatOperations(x, y):
+    a = float(x)
+    b = float(y)
+
+    return a * b + a - b, (a + b) * (a - b), a * 2.5 - b * 0.5
+
+print("Float operations:", floatOperations(3, 4), floatOperations(-1, 0.5))
+
+def floatWithInts(x):
+    a = float(x)
+
+    return a + 1, 2 * a, a - True, a / 2, a // 2, a % 2
+
+print("Float with ints:", floatWithInts(7))
+
+def floatSpecialValues(x):
+    a = float(x)
+    inf = float("inf")
+
+    return a * 1e308 * 10, a + inf, (a + inf) - inf
+
+print("Float special values:", floatSpecialValues(2))
+
+def floatFrameLocals(x):
+    a = float(x)
+    b = a * a + a
+
+    return b / (a - x)
+
+printFrameLocals(floatFrameLocals, 3)
+
+
+def floatTemporaries(values):
+    result = 0.0
+
+    for value in values:
+        result += float(value) * 2.0 + 1.0
+
+    return result
+
+print("Float temporaries:", floatTemporaries(range(5)))
+
+class FloatSubclass(float):
+    def __add__(self, other):
+        return "added"
+
+    __radd__ = __add__
+
+def floatSubclass():
+    a = FloatSubclass(1.5)
+
+    return a + 1.0, 1.0 + a
+
+print("Float subclass:", floatSubclass())
@@ -0,0 +1,51 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compiled with profile guided optimization.
+
+The training run is given "--training" as argument, and must not print, as
+its output would be mixed with the output of the compilation.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def classify(value):
+    if value % 15 == 0:
+        return "both"
+    elif value % 5 == 0:
+        return "five"
+    elif value % 3 == 0:
+        return "three"
+    else:
+        return "none"
+
+def countClasses(count):
+    counts = {}
+
+    for value in range(count):
+        kind = classify(value)
+        counts[kind] = counts.get(kind, 0) + 1
+
+    return sorted(counts.items())
+
+if "--training" in sys.argv:
+    countClasses(10000)
+else:
+    print("Counts:", countClasses(100))
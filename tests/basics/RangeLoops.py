@@ -0,0 +1,169 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loops over range calls, these count with C values where possible.
+
+The values must be the same as the ones of the built-in, also near the limits
+of the C values, and arguments that do not fit must work too.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def loopValues(*args):
+    result = []
+
+    for value in range(*args):
+        result.append(value)
+
+    return result
+
+def loopOne(stop):
+    return [value for value in range(stop)]
+
+def loopTwo(start, stop):
+    result = []
+
+    for value in range(start, stop):
+        result.append(value)
+
+    return result
+
+def loopThree(start, stop, step):
+    result = []
+
+    for value in range(start, stop, step):
+        result.append(value)
+
+    return result
+
+print("Steps:")
+print(loopThree(0, 10, 3), loopThree(10, 0, -3), loopThree(-5, 5, 2))
+print(loopThree(5, -5, -1), loopThree(0, 1, 100), loopThree(0, -1, -100))
+
+print("Empty ranges:")
+print(loopOne(0), loopOne(-3), loopTwo(5, 5), loopTwo(5, 2))
+print(loopThree(0, 10, -1), loopThree(10, 0, 1), loopThree(3, 3, -1))
+
+print("Values near the limits:")
+maxsize = sys.maxsize
+minsize = -sys.maxsize - 1
+
+print(loopTwo(maxsize - 3, maxsize))
+print(loopThree(maxsize, maxsize - 3, -1))
+print(loopTwo(minsize, minsize + 3))
+print(loopThree(minsize + 2, minsize - 1, -1))
+print(loopThree(minsize, maxsize, maxsize))
+print(loopThree(maxsize, minsize, minsize))
+print(loopThree(maxsize - 1, maxsize, maxsize))
+
+print("Values not fitting:")
+print(loopTwo(maxsize - 1, maxsize + 2))
+print(loopThree(maxsize + 2, maxsize - 1, -1))
+print(loopThree(0, 2 ** 70, 2 ** 69))
+
+class MyInt(int):
+    pass
+
+print("Int subclass:", loopTwo(MyInt(1), MyInt(4)))
+
+print("Errors:")
+
+for args in ((0, 5, 0), (1.0,), ("5",), (1, 2, 3, 4), ()):
+    try:
+        loopValues(*args)
+    except (TypeError, ValueError) as e:
+        print(type(e).__name__)
+
+def rebindingInBody(count):
+    result = []
+
+    for value in range(count):
+        result.append(value)
+        value = value * 10
+        result.append(value)
+
+    return result, value
+
+print("Rebinding in body:", rebindingInBody(5))
+
+def deletingInBody(count):
+    for value in range(count):
+        del value
+
+    try:
+        return value
+    except NameError:
+        return "deleted"
+
+print("Deleting in body:", deletingInBody(3))
+
+def breakingAndContinuing(count):
+    result = []
+
+    for value in range(count):
+        if value % 2:
+            continue
+
+        if value > 6:
+            break
+
+        result.append(value)
+    else:
+        result.append("not reached")
+
+    return result, value
+
+print("Break and continue:", breakingAndContinuing(10))
+
+def nestedLoops(count):
+    result = 0
+
+    for i in range(count):
+        for j in range(i, count):
+            result += i * j
+
+    return result
+
+print("Nested:", nestedLoops(10))
+
+def generatorLoop(count):
+    for value in range(count, 0, -2):
+        yield value
+
+print("Generator:", list(generatorLoop(7)))
+
+def raisingInBody(count):
+    result = []
+
+    try:
+        for value in range(count):
+            result.append(value)
+
+            if value == 2:
+                raise KeyError(value)
+    except KeyError as e:
+        result.append(e.args)
+
+    for value in range(count - 3):
+        result.append(value)
+
+    return result
+
+print("Raising in body:", raisingInBody(5))
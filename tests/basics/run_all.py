@@ -46,6 +46,8 @@ python_version = setup(needs_io_encoding = True)
 
 search_mode = createSearchMode()
 
+extra_options = os.environ.get("NUITKA_EXTRA_OPTIONS", "")
+
 # Create large constants test on the fly, if it's not there, not going to
 # add it to release archives for no good reason.
 if not os.path.exists("BigConstants.py"):
@@ -105,6 +107,21 @@ for filename in sorted(os.listdir('.')):
     if filename == "BuiltinOverload.py":
         extra_flags.append("ignore_warnings")
 
+    # Standard library functions called in loops and functions are only known
+    # with whole program mode, and this tests their direct code.
+    if filename == "MathFunctions.py":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + " --whole-program"
+    # The C types for numbers are experimental, and only tested here.
+    elif filename == "NumberCTypes.py":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --experimental=enable_number_ctypes"
+    # Smoke test of the build with a training run.
+    elif filename == "ProfileGuidedOptimization.py":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --pgo --pgo-args=--training"
+    else:
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
+
     active = search_mode.consider(
         dirname  = None,
         filename = filename
@@ -115,6 +132,11 @@ for filename in sorted(os.listdir('.')):
             my_print("Skipped (no debug Python)")
             continue
 
+        if filename == "ProfileGuidedOptimization.py" and \
+           not sys.platform.startswith("linux"):
+            my_print("Skipped (PGO needs gcc)")
+            continue
+
         needs_2to3 = python_version.startswith('3') and \
                      not filename.endswith("32.py") and \
                      not filename.endswith("33.py")
@@ -0,0 +1,46 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+from __future__ import print_function
+
+module_value1 = 5
+module_value2 = 3
+
+def compiled_func(a, b):
+    if a > b:
+        return a - b
+    return b - a
+
+def calledRepeatedly():
+    a = module_value1
+    b = module_value2
+
+    # This is supposed to make a call to a small compiled function, which
+    # will be in-lined.
+# construct_begin
+    compiled_func(a, b)
+    compiled_func(b, a)
+    compiled_func(a, a)
+# construct_alternative
+    pass
+# construct_end
+
+import itertools
+for x in itertools.repeat(None, 50000):
+    calledRepeatedly()
+
+print("OK.")
@@ -0,0 +1,47 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+value1 = "abcdefghij"
+
+def calledRepeatedly(value, default = None):
+    x = str(value)
+    i = 0
+
+    # This is supposed to compute the "len" and "is" only once.
+# construct_begin
+    while i < len(x):
+        if default is None:
+            i += 1
+# construct_alternative
+    n = len(x)
+    flag = default is None
+
+    while i < n:
+        if flag:
+            i += 1
+# construct_end
+
+    return x, i
+
+import itertools
+for x in itertools.repeat(None, 50000):
+    calledRepeatedly(value1)
+
+print("OK.")
@@ -96,6 +96,9 @@ for filename in sorted(os.listdir('.')):
     if filename == "plugin_import":
         os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
           " --include-package=some_package"
+    elif filename == "whole_program":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --whole-program"
     elif filename == "reimport_main_dynamic":
         if python_version < '3':
             os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
@@ -0,0 +1,43 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Whole program mode must not assume module variables that can be changed.
+
+The dictionary of the module is looked up with a name that is not known at
+compile time, and then written.
+"""
+
+from __future__ import print_function
+
+import sys
+
+import config
+
+
+def f():
+    if config.DEBUG:
+        return "debug"
+    else:
+        return "release"
+
+print("Before change:", f())
+
+d = getattr(sys.modules["config"], "__di" + sys.argv[0][:0] + "ct__")
+d["DEBUG"] = 7
+
+print("After change:", f())
+print("Attribute:", config.DEBUG)